@@ -1,12 +1,14 @@
 from django.apps import AppConfig
-from django.db.models.signals import post_delete
+from django.db.models.signals import m2m_changed, post_delete, post_save
 
 
 class AccountAppConfig(AppConfig):
     name = "saleor.account"
 
     def ready(self):
-        from .models import User
+        from ..permission.models import Permission
+        from .models import Group, User
+        from .permission_cache import invalidate_user_permissions_handler
         from .signals import delete_avatar
 
         post_delete.connect(
@@ -14,3 +16,29 @@ class AccountAppConfig(AppConfig):
             sender=User,
             dispatch_uid="delete_user_avatar",
         )
+        # New permissions are granted to superusers.
+        post_save.connect(
+            invalidate_user_permissions_handler,
+            sender=Permission,
+            dispatch_uid="invalidate_user_permissions_on_permission_save",
+        )
+        for sender in (Group, Permission):
+            post_delete.connect(
+                invalidate_user_permissions_handler,
+                sender=sender,
+                dispatch_uid=(
+                    f"invalidate_user_permissions_on_{sender.__name__.lower()}_delete"
+                ),
+            )
+        for sender in (
+            Group.permissions.through,
+            User.groups.through,
+            User.user_permissions.through,
+        ):
+            m2m_changed.connect(
+                invalidate_user_permissions_handler,
+                sender=sender,
+                dispatch_uid=(
+                    f"invalidate_user_permissions_on_{sender.__name__.lower()}_change"
+                ),
+            )
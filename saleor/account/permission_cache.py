@@ -0,0 +1,112 @@
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from .models import User
+
+logger = logging.getLogger(__name__)
+
+USER_PERMISSIONS_VERSION_KEY = "user-permissions-version"
+USER_PERMISSIONS_KEY_PREFIX = "user-permissions"
+
+
+def get_user_permissions_version() -> int:
+    try:
+        return cache.get(USER_PERMISSIONS_VERSION_KEY, 0)
+    except Exception:
+        logger.warning("Unable to fetch user permissions version.", exc_info=True)
+        return -1
+
+
+def _bump_user_permissions_version():
+    try:
+        cache.incr(USER_PERMISSIONS_VERSION_KEY)
+    except ValueError:
+        cache.set(USER_PERMISSIONS_VERSION_KEY, 1, timeout=None)
+    except Exception:
+        logger.warning("Unable to invalidate user permissions.", exc_info=True)
+
+
+def invalidate_user_permissions():
+    """Mark the cached permissions of all users as stale.
+
+    The version is bumped after the transaction is committed, so other processes
+    can't store the old permissions under the new version.
+    """
+    user_permissions_version.clear()
+    transaction.on_commit(_bump_user_permissions_version)
+
+
+def invalidate_user_permissions_handler(sender, **kwargs):
+    action = kwargs.get("action")
+    if action is None or action in ("post_add", "post_remove", "post_clear"):
+        invalidate_user_permissions()
+
+
+@dataclass
+class UserPermissionsVersion:
+    """The permissions version, fetched from the cache at most once per interval."""
+
+    version: int = -1
+    checked_at: float = 0.0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def get(self) -> int:
+        now = time.monotonic()
+        check_interval = settings.USER_PERMISSIONS_VERSION_CHECK_INTERVAL
+        with self.lock:
+            if self.version >= 0 and now - self.checked_at < check_interval:
+                return self.version
+        version = get_user_permissions_version()
+        with self.lock:
+            self.version = version
+            self.checked_at = now
+        return version
+
+    def clear(self):
+        with self.lock:
+            self.version = -1
+
+
+user_permissions_version = UserPermissionsVersion()
+
+
+def get_user_permissions_key(user: User, version: int) -> str:
+    superuser = int(user.is_superuser)
+    return f"{USER_PERMISSIONS_KEY_PREFIX}-{version}-{user.pk}-{superuser}"
+
+
+def get_user_permissions(user: User, load: Callable[[], set[str]]) -> set[str]:
+    """Return the effective permissions of the user, as `app_label.codename`.
+
+    The permissions are loaded with `load` and cached for
+    `USER_PERMISSIONS_CACHE_TIMEOUT` seconds, until any user or group permissions
+    are changed.
+    """
+    if not settings.USER_PERMISSIONS_CACHE_TIMEOUT:
+        return load()
+    version = user_permissions_version.get()
+    if version < 0:
+        return load()
+
+    key = get_user_permissions_key(user, version)
+    try:
+        permissions = cache.get(key)
+    except Exception:
+        logger.warning("Unable to fetch cached user permissions.", exc_info=True)
+        return load()
+    if permissions is not None:
+        return permissions
+
+    permissions = load()
+    try:
+        cache.set(key, permissions, timeout=settings.USER_PERMISSIONS_CACHE_TIMEOUT)
+    except Exception:
+        logger.warning("Unable to cache user permissions.", exc_info=True)
+    return permissions
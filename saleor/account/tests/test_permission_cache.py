@@ -0,0 +1,85 @@
+from unittest.mock import MagicMock
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+
+from ...permission.models import Permission
+from ..models import Group
+from ..permission_cache import get_user_permissions, user_permissions_version
+
+
+def _clear_cache():
+    cache.clear()
+    user_permissions_version.clear()
+
+
+def test_get_user_permissions_cached(staff_user, settings):
+    # given
+    settings.USER_PERMISSIONS_CACHE_TIMEOUT = 60
+    _clear_cache()
+    get_user_permissions(staff_user, lambda: {"account.manage_users"})
+    load = MagicMock(return_value=set())
+
+    # when
+    permissions = get_user_permissions(staff_user, load)
+
+    # then
+    load.assert_not_called()
+    assert permissions == {"account.manage_users"}
+
+
+def test_get_user_permissions_invalidated_on_group_change(
+    staff_user, permission_manage_users, settings, django_capture_on_commit_callbacks
+):
+    # given
+    settings.USER_PERMISSIONS_CACHE_TIMEOUT = 60
+    settings.USER_PERMISSIONS_VERSION_CHECK_INTERVAL = 0
+    _clear_cache()
+    get_user_permissions(staff_user, set)
+    group = Group.objects.create(name="Managers")
+    group.permissions.add(permission_manage_users)
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        group.user_set.add(staff_user)
+    permissions = get_user_permissions(staff_user, lambda: {"account.manage_users"})
+
+    # then
+    assert permissions == {"account.manage_users"}
+
+
+def test_get_user_permissions_invalidated_on_permission_create(
+    admin_user, settings, django_capture_on_commit_callbacks
+):
+    # given
+    settings.USER_PERMISSIONS_CACHE_TIMEOUT = 60
+    settings.USER_PERMISSIONS_VERSION_CHECK_INTERVAL = 0
+    _clear_cache()
+    get_user_permissions(admin_user, set)
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        Permission.objects.create(
+            name="Manage tests",
+            codename="manage_tests",
+            content_type=ContentType.objects.get_for_model(Group),
+        )
+    permissions = get_user_permissions(admin_user, lambda: {"account.manage_tests"})
+
+    # then
+    assert permissions == {"account.manage_tests"}
+
+
+def test_get_user_permissions_disabled(staff_user, settings):
+    # given
+    settings.USER_PERMISSIONS_CACHE_TIMEOUT = 0
+    _clear_cache()
+    get_user_permissions(staff_user, set)
+    load = MagicMock(return_value={"account.manage_users"})
+
+    # when
+    permissions = get_user_permissions(staff_user, load)
+
+    # then
+    load.assert_called_once_with()
+    assert permissions == {"account.manage_users"}
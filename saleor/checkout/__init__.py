@@ -67,3 +67,31 @@ class CheckoutAuthorizeStatus:
         (PARTIAL, "The checkout is partially authorized"),
         (FULL, "The checkout is fully authorized"),
     ]
+
+
+class CheckoutPriceChange:
+    """Changes of a checkout that require the prices to be recalculated.
+
+    LINES - lines were added, removed or their quantity was changed
+    SHIPPING_ADDRESS - the shipping address was changed
+    BILLING_ADDRESS - the billing address was changed
+    DELIVERY_METHOD - the shipping method or the collection point was changed
+    VOUCHER - a voucher code was added or removed
+    TAX_EXEMPTION - the tax exemption was changed
+    """
+
+    LINES = "lines"
+    SHIPPING_ADDRESS = "shipping_address"
+    BILLING_ADDRESS = "billing_address"
+    DELIVERY_METHOD = "delivery_method"
+    VOUCHER = "voucher"
+    TAX_EXEMPTION = "tax_exemption"
+
+    CHOICES = [
+        (LINES, "Lines were changed"),
+        (SHIPPING_ADDRESS, "Shipping address was changed"),
+        (BILLING_ADDRESS, "Billing address was changed"),
+        (DELIVERY_METHOD, "Delivery method was changed"),
+        (VOUCHER, "Voucher was changed"),
+        (TAX_EXEMPTION, "Tax exemption was changed"),
+    ]
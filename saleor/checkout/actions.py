@@ -96,7 +96,10 @@ def call_checkout_event_for_checkout_info(
     # valid prices. Triggered only when we have active sync tax webhook
     if (
         WebhookEventSyncType.CHECKOUT_CALCULATE_TAXES in webhook_event_map
-        and checkout.price_expiration < timezone.now() + timedelta(seconds=10)
+        and (
+            checkout.price_expiration < timezone.now() + timedelta(seconds=10)
+            or checkout.price_changes
+        )
     ):
         fetch_checkout_data(
             checkout_info=checkout_info,
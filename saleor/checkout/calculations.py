@@ -1,7 +1,9 @@
 import logging
 from collections.abc import Iterable
+from dataclasses import dataclass
 from decimal import Decimal
 from typing import TYPE_CHECKING, Optional, cast
+from uuid import UUID
 
 from django.conf import settings
 from django.utils import timezone
@@ -24,7 +26,7 @@ from ..tax.utils import (
     get_tax_calculation_strategy_for_checkout,
     normalize_tax_rate_for_db,
 )
-from .fetch import find_checkout_line_info
+from . import CheckoutPriceChange
 from .models import Checkout
 from .payment_utils import update_checkout_payment_statuses
 
@@ -36,6 +38,15 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class CheckoutLinePrices:
+    unit_price: TaxedMoney
+    total_price: TaxedMoney
+    undiscounted_unit_price: Money
+    undiscounted_total_price: Money
+    tax_rate: Decimal
+
+
 def checkout_shipping_price(
     *,
     manager: "PluginsManager",
@@ -160,17 +171,14 @@ def checkout_line_total(
 
     It takes in account all plugins.
     """
-    currency = checkout_info.checkout.currency
-    address = checkout_info.shipping_address or checkout_info.billing_address
-    _, lines = fetch_checkout_data(
-        checkout_info,
+    line_prices = checkout_line_prices(
         manager=manager,
+        checkout_info=checkout_info,
         lines=lines,
-        address=address,
+        line_id=checkout_line_info.line.pk,
         database_connection_name=database_connection_name,
     )
-    checkout_line = find_checkout_line_info(lines, checkout_line_info.line.id).line
-    return quantize_price(checkout_line.total_price, currency)
+    return _get_line_prices_or_raise(line_prices, checkout_line_info).total_price
 
 
 def checkout_line_unit_price(
@@ -185,18 +193,14 @@ def checkout_line_unit_price(
 
     It takes in account all plugins.
     """
-    currency = checkout_info.checkout.currency
-    address = checkout_info.shipping_address or checkout_info.billing_address
-    _, lines = fetch_checkout_data(
-        checkout_info,
+    line_prices = checkout_line_prices(
         manager=manager,
+        checkout_info=checkout_info,
         lines=lines,
-        address=address,
+        line_id=checkout_line_info.line.pk,
         database_connection_name=database_connection_name,
     )
-    checkout_line = find_checkout_line_info(lines, checkout_line_info.line.id).line
-    unit_price = checkout_line.total_price / checkout_line.quantity
-    return quantize_price(unit_price, currency)
+    return _get_line_prices_or_raise(line_prices, checkout_line_info).unit_price
 
 
 def checkout_line_tax_rate(
@@ -211,16 +215,90 @@ def checkout_line_tax_rate(
 
     It takes in account all plugins.
     """
+    line_prices = checkout_line_prices(
+        manager=manager,
+        checkout_info=checkout_info,
+        lines=lines,
+        line_id=checkout_line_info.line.pk,
+        database_connection_name=database_connection_name,
+    )
+    return _get_line_prices_or_raise(line_prices, checkout_line_info).tax_rate
+
+
+def _get_line_prices_or_raise(
+    line_prices: Optional[CheckoutLinePrices], checkout_line_info: "CheckoutLineInfo"
+) -> CheckoutLinePrices:
+    if line_prices is None:
+        raise ValueError(
+            f"Line {checkout_line_info.line.pk} doesn't belong to the checkout."
+        )
+    return line_prices
+
+
+def get_checkout_line_prices(
+    checkout_info: "CheckoutInfo", lines: Iterable["CheckoutLineInfo"], line_id: UUID
+) -> Optional[CheckoutLinePrices]:
+    """Return the current prices of the checkout line.
+
+    Prices of all lines are computed at once and stored on the checkout info, indexed
+    by the line id, until the checkout prices are recalculated. The prices are not
+    refreshed when they have expired; use `checkout_line_prices` for that.
+    """
+    lines_prices = checkout_info.lines_prices
+    if lines_prices is None or line_id not in lines_prices:
+        lines_prices = _get_checkout_lines_prices(checkout_info, lines)
+        checkout_info.lines_prices = lines_prices
+    return lines_prices.get(line_id)
+
+
+def _get_checkout_lines_prices(
+    checkout_info: "CheckoutInfo", lines: Iterable["CheckoutLineInfo"]
+) -> dict[UUID, CheckoutLinePrices]:
+    currency = checkout_info.checkout.currency
+    channel = checkout_info.channel
+    lines_prices: dict[UUID, CheckoutLinePrices] = {}
+    for line_info in lines:
+        line = line_info.line
+        lines_prices[line.pk] = CheckoutLinePrices(
+            unit_price=quantize_price(line.total_price / line.quantity, currency),
+            total_price=quantize_price(line.total_price, currency),
+            undiscounted_unit_price=(
+                base_calculations.calculate_undiscounted_base_line_unit_price(
+                    line_info, channel
+                )
+            ),
+            undiscounted_total_price=(
+                base_calculations.calculate_undiscounted_base_line_total_price(
+                    line_info, channel
+                )
+            ),
+            tax_rate=line.tax_rate,
+        )
+    return lines_prices
+
+
+def checkout_line_prices(
+    *,
+    manager: "PluginsManager",
+    checkout_info: "CheckoutInfo",
+    lines: Iterable["CheckoutLineInfo"],
+    line_id: UUID,
+    database_connection_name: str = settings.DATABASE_CONNECTION_DEFAULT_NAME,
+) -> Optional[CheckoutLinePrices]:
+    """Return the prices of the line with the given id, taxes included.
+
+    It takes in account all plugins. Return `None` if the line doesn't belong to
+    the checkout.
+    """
     address = checkout_info.shipping_address or checkout_info.billing_address
-    _, lines = fetch_checkout_data(
+    checkout_info, lines = fetch_checkout_data(
         checkout_info,
         manager=manager,
         lines=lines,
         address=address,
         database_connection_name=database_connection_name,
     )
-    checkout_line_info = find_checkout_line_info(lines, checkout_line_info.line.id)
-    return checkout_line_info.line.tax_rate
+    return get_checkout_line_prices(checkout_info, lines, line_id)
 
 
 def _fetch_checkout_prices_if_expired(
@@ -238,11 +316,24 @@ def _fetch_checkout_prices_if_expired(
 
     Prices can be updated only if force_update == True, or if time elapsed from the
     last price update is greater than settings.CHECKOUT_PRICES_TTL.
+
+    With `CHECKOUT_INCREMENTAL_PRICES_ENABLED` the prices are also updated when
+    the checkout has recorded price changes; then only the prices affected by
+    the changes are recalculated and the expiration time is kept.
     """
     checkout = checkout_info.checkout
 
-    if not force_update and checkout.price_expiration > timezone.now():
+    is_expired = force_update or checkout.price_expiration <= timezone.now()
+    if not is_expired and not checkout.price_changes:
         return checkout_info, lines
+    checkout_info.lines_prices = None
+
+    changes = None
+    if not is_expired and settings.CHECKOUT_INCREMENTAL_PRICES_ENABLED:
+        changes = set(checkout.price_changes)
+    recalculate_discounts, recalculate_taxes = _get_price_recalculation_scope(
+        checkout_info, changes
+    )
 
     tax_configuration = checkout_info.tax_configuration
     tax_calculation_strategy = get_tax_calculation_strategy_for_checkout(
@@ -258,40 +349,29 @@ def _fetch_checkout_prices_if_expired(
     )
 
     lines = cast(list, lines)
-    create_or_update_discount_objects_from_promotion_for_checkout(
-        checkout_info, lines, database_connection_name
-    )
-
-    checkout.tax_error = None
-    if prices_entered_with_tax:
-        # If prices are entered with tax, we need to always calculate it anyway, to
-        # display the tax rate to the user.
-        try:
-            _calculate_and_add_tax(
-                tax_calculation_strategy,
-                tax_app_identifier,
-                checkout,
-                manager,
-                checkout_info,
-                lines,
-                prices_entered_with_tax,
-                address,
-                database_connection_name=database_connection_name,
-            )
-        except TaxEmptyData as e:
-            _set_checkout_base_prices(checkout, checkout_info, lines)
-            checkout.tax_error = str(e)
-
-        if not should_charge_tax:
-            # If charge_taxes is disabled or checkout is exempt from taxes, remove the
-            # tax from the original gross prices.
-            _remove_tax(checkout, lines)
+    if recalculate_discounts:
+        create_or_update_discount_objects_from_promotion_for_checkout(
+            checkout_info, lines, database_connection_name
+        )
 
-    else:
-        # Prices are entered without taxes.
-        if should_charge_tax:
-            # Calculate taxes if charge_taxes is enabled and checkout is not exempt
-            # from taxes.
+    line_ids = None
+    if changes is not None:
+        line_ids = _get_lines_to_recalculate(checkout_info, lines, changes)
+        if tax_calculation_strategy == TaxCalculationStrategy.TAX_APP and (
+            prices_entered_with_tax or should_charge_tax
+        ):
+            # Tax apps and plugins calculate taxes for the whole checkout.
+            line_ids = None
+    previous_line_prices = {
+        line_info.line.pk: _get_line_prices(line_info.line) for line_info in lines
+    }
+
+    # Prices are kept when none of the changes affects them.
+    if recalculate_taxes:
+        checkout.tax_error = None
+        if prices_entered_with_tax:
+            # If prices are entered with tax, we need to always calculate it anyway,
+            # to display the tax rate to the user.
             try:
                 _calculate_and_add_tax(
                     tax_calculation_strategy,
@@ -303,13 +383,41 @@ def _fetch_checkout_prices_if_expired(
                     prices_entered_with_tax,
                     address,
                     database_connection_name=database_connection_name,
+                    line_ids=line_ids,
                 )
             except TaxEmptyData as e:
                 _set_checkout_base_prices(checkout, checkout_info, lines)
                 checkout.tax_error = str(e)
+
+            if not should_charge_tax:
+                # If charge_taxes is disabled or checkout is exempt from taxes, remove
+                # the tax from the original gross prices.
+                _remove_tax(checkout, lines)
+
         else:
-            # Calculate net prices without taxes.
-            _set_checkout_base_prices(checkout, checkout_info, lines)
+            # Prices are entered without taxes.
+            if should_charge_tax:
+                # Calculate taxes if charge_taxes is enabled and checkout is not exempt
+                # from taxes.
+                try:
+                    _calculate_and_add_tax(
+                        tax_calculation_strategy,
+                        tax_app_identifier,
+                        checkout,
+                        manager,
+                        checkout_info,
+                        lines,
+                        prices_entered_with_tax,
+                        address,
+                        database_connection_name=database_connection_name,
+                        line_ids=line_ids,
+                    )
+                except TaxEmptyData as e:
+                    _set_checkout_base_prices(checkout, checkout_info, lines)
+                    checkout.tax_error = str(e)
+            else:
+                # Calculate net prices without taxes.
+                _set_checkout_base_prices(checkout, checkout_info, lines, line_ids)
 
     checkout_update_fields = [
         "voucher_code",
@@ -329,24 +437,103 @@ def _fetch_checkout_prices_if_expired(
         "tax_error",
     ]
 
-    checkout.price_expiration = timezone.now() + settings.CHECKOUT_PRICES_TTL
+    if changes is None:
+        checkout.price_expiration = timezone.now() + settings.CHECKOUT_PRICES_TTL
+
+    lines_to_update = [line_info.line for line_info in lines]
+    if changes is not None:
+        lines_to_update = [
+            line
+            for line in lines_to_update
+            if _get_line_prices(line) != previous_line_prices.get(line.pk)
+        ]
 
     with allow_writer():
+        # The recorded changes have to be cleared before `last_change` is saved.
+        _clear_checkout_price_changes(checkout)
         checkout.save(
             update_fields=checkout_update_fields,
             using=settings.DATABASE_CONNECTION_DEFAULT_NAME,
         )
-        checkout.lines.bulk_update(
-            [line_info.line for line_info in lines],
-            [
-                "total_price_net_amount",
-                "total_price_gross_amount",
-                "tax_rate",
-            ],
-        )
+        if lines_to_update:
+            checkout.lines.bulk_update(
+                lines_to_update,
+                [
+                    "total_price_net_amount",
+                    "total_price_gross_amount",
+                    "tax_rate",
+                ],
+            )
     return checkout_info, lines
 
 
+def _get_price_recalculation_scope(
+    checkout_info: "CheckoutInfo", changes: Optional[set[str]]
+) -> tuple[bool, bool]:
+    """Return whether the discounts and the taxed prices have to be recalculated.
+
+    All prices are recalculated when the changes are unknown. The billing address
+    matters only when the checkout doesn't have a shipping address.
+    """
+    if changes is None:
+        return True, True
+    changes = set(changes)
+    if CheckoutPriceChange.BILLING_ADDRESS in changes:
+        changes.discard(CheckoutPriceChange.BILLING_ADDRESS)
+        if not checkout_info.shipping_address:
+            changes.add(CheckoutPriceChange.SHIPPING_ADDRESS)
+    recalculate_discounts = bool(changes - {CheckoutPriceChange.TAX_EXEMPTION})
+    return recalculate_discounts, bool(changes)
+
+
+def _clear_checkout_price_changes(checkout: "Checkout"):
+    """Clear the recorded changes, unless the checkout was changed in the meantime.
+
+    Changes recorded by concurrent requests after the checkout was fetched update
+    `last_change`; they are kept, so the next fetch recalculates them.
+    """
+    if not checkout.price_changes and not checkout.price_changed_line_ids:
+        return
+    cleared = (
+        Checkout.objects.using(settings.DATABASE_CONNECTION_DEFAULT_NAME)
+        .filter(pk=checkout.pk, last_change=checkout.last_change)
+        .update(price_changes=[], price_changed_line_ids=[])
+    )
+    if cleared:
+        checkout.price_changes = []
+        checkout.price_changed_line_ids = []
+
+
+def _get_lines_to_recalculate(
+    checkout_info: "CheckoutInfo",
+    lines: Iterable["CheckoutLineInfo"],
+    changes: set[str],
+) -> Optional[set]:
+    """Return ids of the lines which prices have to be recalculated.
+
+    Return `None` when all lines have to be recalculated: when the change affects
+    the whole checkout or the checkout has a discount or a voucher. Vouchers applied
+    once per order move to the cheapest line, so adding or removing any line may
+    change the prices of the other lines.
+    """
+    if changes != {CheckoutPriceChange.LINES}:
+        return None
+    if checkout_info.discounts or checkout_info.voucher:
+        return None
+    line_ids = set(checkout_info.checkout.price_changed_line_ids)
+    # The gift lines may be created when the promotions are recalculated.
+    line_ids.update(line_info.line.pk for line_info in lines if line_info.line.is_gift)
+    return line_ids
+
+
+def _get_line_prices(line) -> tuple:
+    return (
+        line.total_price_net_amount,
+        line.total_price_gross_amount,
+        line.tax_rate,
+    )
+
+
 def _calculate_and_add_tax(
     tax_calculation_strategy: str,
     tax_app_identifier: Optional[str],
@@ -357,6 +544,7 @@ def _calculate_and_add_tax(
     prices_entered_with_tax: bool,
     address: Optional["Address"] = None,
     database_connection_name: str = settings.DATABASE_CONNECTION_DEFAULT_NAME,
+    line_ids: Optional[set] = None,
 ):
     from .utils import log_address_if_validation_skipped_for_checkout
 
@@ -394,6 +582,7 @@ def _calculate_and_add_tax(
             prices_entered_with_tax,
             address,
             database_connection_name=database_connection_name,
+            line_ids=line_ids,
         )
 
 
@@ -548,12 +737,21 @@ def _set_checkout_base_prices(
     checkout: "Checkout",
     checkout_info: "CheckoutInfo",
     lines: Iterable["CheckoutLineInfo"],
+    line_ids: Optional[set] = None,
 ) -> None:
+    """Set checkout prices without taxes.
+
+    When `line_ids` are given, only prices of these lines are calculated; other
+    lines keep their stored prices.
+    """
     currency = checkout_info.checkout.currency
     subtotal = zero_money(currency)
 
     for line_info in lines:
         line = line_info.line
+        if line_ids is not None and line.pk not in line_ids:
+            subtotal += line.total_price.net
+            continue
         quantity = line.quantity
 
         unit_price = base_calculations.calculate_base_line_unit_price(line_info)
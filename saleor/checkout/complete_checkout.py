@@ -59,7 +59,10 @@ from ..tax.utils import (
 from ..warehouse.availability import check_stock_and_preorder_quantity_bulk
 from ..warehouse.management import allocate_preorders, allocate_stocks
 from ..warehouse.models import Reservation, Stock
-from ..warehouse.reservations import is_reservation_enabled
+from ..warehouse.reservations import (
+    increase_stocks_quantity_reserved,
+    is_reservation_enabled,
+)
 from . import AddressType
 from .base_calculations import (
     base_checkout_delivery_price,
@@ -1749,6 +1752,7 @@ def _reserve_stocks_without_availability_check(
                 )
             )
     Reservation.objects.bulk_create(reservations)
+    increase_stocks_quantity_reserved(reservations)
     return reservations
 
 
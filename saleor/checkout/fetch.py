@@ -44,6 +44,7 @@ if TYPE_CHECKING:
         ProductVariantChannelListing,
     )
     from ..tax.models import TaxClass, TaxConfiguration
+    from .calculations import CheckoutLinePrices
     from .models import Checkout
 
 
@@ -74,6 +75,11 @@ class CheckoutInfo:
     voucher: Optional["Voucher"] = None
     voucher_code: Optional["VoucherCode"] = None
     database_connection_name: str = settings.DATABASE_CONNECTION_DEFAULT_NAME
+    # Prices of the checkout lines indexed by the line id; dropped whenever the
+    # checkout prices are recalculated.
+    lines_prices: Optional[dict[UUID, "CheckoutLinePrices"]] = field(
+        default=None, compare=False, repr=False
+    )
 
     @cached_property
     def all_shipping_methods(self) -> list["ShippingMethodData"]:
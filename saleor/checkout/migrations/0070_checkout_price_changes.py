@@ -0,0 +1,43 @@
+# Generated by Django 3.2.25 on 2026-10-17 12:00
+
+import django.contrib.postgres.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("checkout", "0069_merge_20240514_1008"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="checkout",
+            name="price_changes",
+            field=django.contrib.postgres.fields.ArrayField(
+                base_field=models.CharField(
+                    choices=[
+                        ("lines", "Lines were changed"),
+                        ("shipping_address", "Shipping address was changed"),
+                        ("billing_address", "Billing address was changed"),
+                        ("delivery_method", "Delivery method was changed"),
+                        ("voucher", "Voucher was changed"),
+                        ("tax_exemption", "Tax exemption was changed"),
+                    ],
+                    max_length=32,
+                ),
+                blank=True,
+                default=list,
+                size=None,
+            ),
+        ),
+        migrations.AddField(
+            model_name="checkout",
+            name="price_changed_line_ids",
+            field=django.contrib.postgres.fields.ArrayField(
+                base_field=models.UUIDField(),
+                blank=True,
+                default=list,
+                size=None,
+            ),
+        ),
+    ]
@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING, Optional
 from uuid import uuid4
 
 from django.conf import settings
+from django.contrib.postgres.fields import ArrayField
 from django.core.validators import MinValueValidator
 from django.db import models
 from django.utils import timezone
@@ -21,7 +22,7 @@ from ..core.taxes import zero_money
 from ..giftcard.models import GiftCard
 from ..permission.enums import CheckoutPermissions
 from ..shipping.models import ShippingMethod
-from . import CheckoutAuthorizeStatus, CheckoutChargeStatus
+from . import CheckoutAuthorizeStatus, CheckoutChargeStatus, CheckoutPriceChange
 
 if TYPE_CHECKING:
     from ..payment.models import Payment
@@ -172,6 +173,14 @@ class Checkout(models.Model):
     )
 
     price_expiration = models.DateTimeField(default=timezone.now)
+    # Changes made since the prices were calculated, used to recalculate only
+    # the affected prices when `CHECKOUT_INCREMENTAL_PRICES_ENABLED` is set.
+    price_changes = ArrayField(
+        models.CharField(max_length=32, choices=CheckoutPriceChange.CHOICES),
+        blank=True,
+        default=list,
+    )
+    price_changed_line_ids = ArrayField(models.UUIDField(), blank=True, default=list)
 
     discount_amount = models.DecimalField(
         max_digits=settings.DEFAULT_MAX_DIGITS,
@@ -1,3 +1,5 @@
+import uuid
+from datetime import timedelta
 from decimal import Decimal
 from typing import Literal, Union
 from unittest.mock import Mock, patch
@@ -9,7 +11,12 @@ from freezegun import freeze_time
 from graphene import Node
 from prices import Money, TaxedMoney
 
-from ...checkout.utils import add_promo_code_to_checkout, set_external_shipping_id
+from ...checkout import CheckoutPriceChange
+from ...checkout.utils import (
+    add_promo_code_to_checkout,
+    invalidate_checkout_prices,
+    set_external_shipping_id,
+)
 from ...core.prices import quantize_price
 from ...core.taxes import TaxData, TaxLineData, zero_taxed_money
 from ...plugins import PLUGIN_IDENTIFIER_PREFIX
@@ -20,14 +27,23 @@ from ...tax.calculations.checkout import update_checkout_prices_with_flat_rates
 from ..base_calculations import (
     base_checkout_delivery_price,
     calculate_base_line_total_price,
+    calculate_undiscounted_base_line_total_price,
 )
 from ..calculations import (
     _apply_tax_data,
     _calculate_and_add_tax,
+    _get_checkout_lines_prices,
     _set_checkout_base_prices,
+    checkout_line_prices,
     fetch_checkout_data,
 )
-from ..fetch import CheckoutLineInfo, fetch_checkout_info, fetch_checkout_lines
+from ..fetch import (
+    CheckoutLineInfo,
+    fetch_checkout_info,
+    fetch_checkout_lines,
+    find_checkout_line_info,
+)
+from ..models import Checkout
 
 
 @pytest.fixture
@@ -752,3 +768,369 @@ def test_calculate_and_add_tax_empty_tax_data_logging_address(
         f"Fetching tax data for checkout with address validation skipped. "
         f"Address ID: {address.pk}" in caplog.text
     )
+
+
+def _set_flat_rates(checkout):
+    tc = checkout.channel.tax_configuration
+    tc.country_exceptions.all().delete()
+    tc.prices_entered_with_tax = False
+    tc.charge_taxes = True
+    tc.tax_calculation_strategy = TaxCalculationStrategy.FLAT_RATES
+    tc.save()
+
+    country_code = checkout.shipping_address.country.code
+    for line in checkout.lines.all():
+        line.variant.product.tax_class.country_rates.update_or_create(
+            country=country_code, rate=23
+        )
+
+
+def _get_fetch_kwargs(checkout, manager):
+    lines, _ = fetch_checkout_lines(checkout)
+    return {
+        "checkout_info": fetch_checkout_info(checkout, lines, manager),
+        "manager": manager,
+        "lines": lines,
+        "address": checkout.shipping_address or checkout.billing_address,
+    }
+
+
+def test_invalidate_checkout_prices_records_changes(
+    settings, checkout_with_items, plugins_manager
+):
+    # given
+    settings.CHECKOUT_INCREMENTAL_PRICES_ENABLED = True
+    checkout = checkout_with_items
+    price_expiration = timezone.now() + timedelta(hours=1)
+    checkout.price_expiration = price_expiration
+    checkout.save(update_fields=["price_expiration"])
+    line = checkout.lines.first()
+    checkout_info = fetch_checkout_info(checkout, [], plugins_manager)
+
+    # when
+    invalidate_checkout_prices(
+        checkout_info,
+        save=True,
+        changes=[CheckoutPriceChange.LINES],
+        changed_lines=[line],
+    )
+
+    # then
+    checkout.refresh_from_db()
+    assert checkout.price_expiration == price_expiration
+    assert checkout.price_changes == [CheckoutPriceChange.LINES]
+    assert checkout.price_changed_line_ids == [line.pk]
+
+
+def test_invalidate_checkout_prices_keeps_concurrently_recorded_changes(
+    settings, checkout_with_items, plugins_manager
+):
+    # given
+    settings.CHECKOUT_INCREMENTAL_PRICES_ENABLED = True
+    checkout = checkout_with_items
+    checkout.price_expiration = timezone.now() + timedelta(hours=1)
+    checkout.save(update_fields=["price_expiration"])
+    first_line, second_line = checkout.lines.all()[:2]
+    other_checkout = Checkout.objects.get(pk=checkout.pk)
+
+    # when
+    invalidate_checkout_prices(
+        fetch_checkout_info(checkout, [], plugins_manager),
+        save=True,
+        changes=[CheckoutPriceChange.LINES],
+        changed_lines=[first_line],
+    )
+    invalidate_checkout_prices(
+        fetch_checkout_info(other_checkout, [], plugins_manager),
+        save=True,
+        changes=[CheckoutPriceChange.LINES],
+        changed_lines=[second_line],
+    )
+
+    # then
+    checkout.refresh_from_db()
+    assert checkout.price_changes == [CheckoutPriceChange.LINES]
+    assert set(checkout.price_changed_line_ids) == {first_line.pk, second_line.pk}
+
+
+def test_invalidate_checkout_prices_expires_already_expired_prices(
+    settings, checkout_with_items, plugins_manager
+):
+    # given
+    settings.CHECKOUT_INCREMENTAL_PRICES_ENABLED = True
+    checkout = checkout_with_items
+    checkout.price_expiration = timezone.now() - timedelta(hours=1)
+    checkout.save(update_fields=["price_expiration"])
+    checkout_info = fetch_checkout_info(checkout, [], plugins_manager)
+
+    # when
+    invalidate_checkout_prices(
+        checkout_info, save=True, changes=[CheckoutPriceChange.VOUCHER]
+    )
+
+    # then
+    checkout.refresh_from_db()
+    assert checkout.price_changes == []
+    assert checkout.price_expiration > timezone.now() - timedelta(minutes=1)
+
+
+@patch(
+    "saleor.checkout.calculations.update_checkout_prices_with_flat_rates",
+    wraps=update_checkout_prices_with_flat_rates,
+)
+def test_fetch_checkout_data_incremental_keeps_prices_on_billing_address_change(
+    mocked_update_checkout_prices_with_flat_rates,
+    settings,
+    checkout_with_items_and_shipping,
+    plugins_manager,
+):
+    # given
+    settings.CHECKOUT_INCREMENTAL_PRICES_ENABLED = True
+    checkout = checkout_with_items_and_shipping
+    _set_flat_rates(checkout)
+    price_expiration = timezone.now() + timedelta(hours=1)
+    checkout.price_expiration = price_expiration
+    checkout.price_changes = [CheckoutPriceChange.BILLING_ADDRESS]
+    checkout.save(update_fields=["price_expiration", "price_changes"])
+
+    # when
+    fetch_checkout_data(**_get_fetch_kwargs(checkout, plugins_manager))
+
+    # then
+    mocked_update_checkout_prices_with_flat_rates.assert_not_called()
+    checkout.refresh_from_db()
+    assert checkout.price_changes == []
+    assert checkout.price_expiration == price_expiration
+
+
+def test_fetch_checkout_data_incremental_recalculates_changed_lines(
+    settings, checkout_with_items_and_shipping, plugins_manager
+):
+    # given
+    settings.CHECKOUT_INCREMENTAL_PRICES_ENABLED = True
+    checkout = checkout_with_items_and_shipping
+    _set_flat_rates(checkout)
+    fetch_checkout_data(
+        **_get_fetch_kwargs(checkout, plugins_manager), force_update=True
+    )
+
+    changed_line, unchanged_line = checkout.lines.all()[:2]
+    changed_line.quantity += 1
+    changed_line.save(update_fields=["quantity"])
+    stored_price = Money("1.00", checkout.currency)
+    unchanged_line.total_price = TaxedMoney(stored_price, stored_price)
+    unchanged_line.save(
+        update_fields=["total_price_net_amount", "total_price_gross_amount"]
+    )
+    checkout.price_changes = [CheckoutPriceChange.LINES]
+    checkout.price_changed_line_ids = [changed_line.pk]
+    checkout.save(update_fields=["price_changes", "price_changed_line_ids"])
+    fetch_kwargs = _get_fetch_kwargs(checkout, plugins_manager)
+    changed_line_info = find_checkout_line_info(fetch_kwargs["lines"], changed_line.pk)
+    expected_net = quantize_price(
+        calculate_base_line_total_price(changed_line_info), checkout.currency
+    )
+
+    # when
+    fetch_checkout_data(**fetch_kwargs)
+
+    # then
+    changed_line.refresh_from_db()
+    unchanged_line.refresh_from_db()
+    checkout.refresh_from_db()
+    assert changed_line.total_price.net == expected_net
+    assert changed_line.tax_rate == Decimal("0.2300")
+    assert unchanged_line.total_price.net == stored_price
+    assert checkout.price_changes == []
+    assert checkout.price_changed_line_ids == []
+
+
+def test_fetch_checkout_data_incremental_keeps_changes_recorded_concurrently(
+    settings, checkout_with_items_and_shipping, plugins_manager
+):
+    # given
+    settings.CHECKOUT_INCREMENTAL_PRICES_ENABLED = True
+    checkout = checkout_with_items_and_shipping
+    _set_flat_rates(checkout)
+    fetch_checkout_data(
+        **_get_fetch_kwargs(checkout, plugins_manager), force_update=True
+    )
+    first_line, second_line = checkout.lines.all()[:2]
+    invalidate_checkout_prices(
+        fetch_checkout_info(checkout, [], plugins_manager),
+        save=True,
+        changes=[CheckoutPriceChange.LINES],
+        changed_lines=[first_line],
+    )
+    fetch_kwargs = _get_fetch_kwargs(checkout, plugins_manager)
+    other_checkout = Checkout.objects.get(pk=checkout.pk)
+    invalidate_checkout_prices(
+        fetch_checkout_info(other_checkout, [], plugins_manager),
+        save=True,
+        changes=[CheckoutPriceChange.LINES],
+        changed_lines=[second_line],
+    )
+
+    # when
+    fetch_checkout_data(**fetch_kwargs)
+
+    # then
+    checkout.refresh_from_db()
+    assert checkout.price_changes == [CheckoutPriceChange.LINES]
+    assert second_line.pk in checkout.price_changed_line_ids
+
+
+def _set_voucher_applied_once_per_order(checkout, voucher):
+    voucher.apply_once_per_order = True
+    voucher.save(update_fields=["apply_once_per_order"])
+    checkout.voucher_code = voucher.code
+    checkout.save(update_fields=["voucher_code"])
+
+
+def _get_line_totals(checkout):
+    return {line.pk: line.total_price for line in checkout.lines.all()}
+
+
+def _record_line_changes(checkout, line_ids):
+    checkout.price_changes = [CheckoutPriceChange.LINES]
+    checkout.price_changed_line_ids = line_ids
+    checkout.save(update_fields=["price_changes", "price_changed_line_ids"])
+
+
+def test_fetch_checkout_data_incremental_voucher_once_per_order_cheaper_line_added(
+    settings,
+    checkout_with_items_and_shipping,
+    voucher_percentage,
+    product_with_single_variant,
+    plugins_manager,
+):
+    # given
+    settings.CHECKOUT_INCREMENTAL_PRICES_ENABLED = True
+    checkout = checkout_with_items_and_shipping
+    _set_flat_rates(checkout)
+    _set_voucher_applied_once_per_order(checkout, voucher_percentage)
+    fetch_checkout_data(
+        **_get_fetch_kwargs(checkout, plugins_manager), force_update=True
+    )
+    cheaper_line = checkout.lines.create(
+        variant=product_with_single_variant.variants.get(), quantity=1
+    )
+    _record_line_changes(checkout, [cheaper_line.pk])
+
+    # when
+    fetch_checkout_data(**_get_fetch_kwargs(checkout, plugins_manager))
+
+    # then
+    line_totals = _get_line_totals(checkout)
+    fetch_checkout_data(
+        **_get_fetch_kwargs(checkout, plugins_manager), force_update=True
+    )
+    assert line_totals == _get_line_totals(checkout)
+
+
+def test_fetch_checkout_data_incremental_voucher_once_per_order_cheapest_line_deleted(
+    settings,
+    checkout_with_items_and_shipping,
+    voucher_percentage,
+    product_with_single_variant,
+    plugins_manager,
+):
+    # given
+    settings.CHECKOUT_INCREMENTAL_PRICES_ENABLED = True
+    checkout = checkout_with_items_and_shipping
+    _set_flat_rates(checkout)
+    _set_voucher_applied_once_per_order(checkout, voucher_percentage)
+    cheapest_line = checkout.lines.create(
+        variant=product_with_single_variant.variants.get(), quantity=1
+    )
+    fetch_checkout_data(
+        **_get_fetch_kwargs(checkout, plugins_manager), force_update=True
+    )
+    cheapest_line.delete()
+    _record_line_changes(checkout, [])
+
+    # when
+    fetch_checkout_data(**_get_fetch_kwargs(checkout, plugins_manager))
+
+    # then
+    line_totals = _get_line_totals(checkout)
+    fetch_checkout_data(
+        **_get_fetch_kwargs(checkout, plugins_manager), force_update=True
+    )
+    assert line_totals == _get_line_totals(checkout)
+
+
+def test_checkout_line_prices_computed_once(
+    checkout_with_items_and_shipping, plugins_manager
+):
+    # given
+    checkout = checkout_with_items_and_shipping
+    _set_flat_rates(checkout)
+    fetch_checkout_data(
+        **_get_fetch_kwargs(checkout, plugins_manager), force_update=True
+    )
+    fetch_kwargs = _get_fetch_kwargs(checkout, plugins_manager)
+    fetch_kwargs.pop("address")
+    lines = fetch_kwargs["lines"]
+
+    # when
+    with patch(
+        "saleor.checkout.calculations._get_checkout_lines_prices",
+        wraps=_get_checkout_lines_prices,
+    ) as mocked_get_checkout_lines_prices:
+        lines_prices = [
+            checkout_line_prices(**fetch_kwargs, line_id=line_info.line.pk)
+            for line_info in lines
+        ]
+
+    # then
+    mocked_get_checkout_lines_prices.assert_called_once()
+    for line_info, line_prices in zip(lines, lines_prices):
+        line = line_info.line
+        line.refresh_from_db()
+        assert line_prices.total_price == line.total_price
+        assert line_prices.unit_price == quantize_price(
+            line.total_price / line.quantity, checkout.currency
+        )
+        assert line_prices.tax_rate == line.tax_rate
+        assert line_prices.undiscounted_total_price == (
+            calculate_undiscounted_base_line_total_price(line_info, checkout.channel)
+        )
+
+
+def test_checkout_line_prices_dropped_on_price_recalculation(
+    checkout_with_items_and_shipping, plugins_manager
+):
+    # given
+    checkout = checkout_with_items_and_shipping
+    _set_flat_rates(checkout)
+    fetch_kwargs = _get_fetch_kwargs(checkout, plugins_manager)
+    fetch_kwargs.pop("address")
+    checkout_info = fetch_kwargs["checkout_info"]
+    line_id = fetch_kwargs["lines"][0].line.pk
+    checkout.price_expiration = timezone.now() + timedelta(hours=1)
+    checkout.save(update_fields=["price_expiration"])
+    initial_prices = checkout_line_prices(**fetch_kwargs, line_id=line_id)
+
+    # when
+    invalidate_checkout_prices(checkout_info, save=True)
+    line_prices = checkout_line_prices(**fetch_kwargs, line_id=line_id)
+
+    # then
+    assert line_prices is not initial_prices
+    assert line_prices.tax_rate == Decimal("0.2300")
+    assert checkout_info.lines_prices[line_id] is line_prices
+
+
+def test_checkout_line_prices_line_not_in_checkout(
+    checkout_with_items, plugins_manager
+):
+    # given
+    fetch_kwargs = _get_fetch_kwargs(checkout_with_items, plugins_manager)
+    fetch_kwargs.pop("address")
+
+    # when
+    line_prices = checkout_line_prices(**fetch_kwargs, line_id=uuid.uuid4())
+
+    # then
+    assert line_prices is None
@@ -9,6 +9,7 @@ from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.db import transaction
 from django.db.models import prefetch_related_objects
+from django.db.models.expressions import RawSQL
 from django.utils import timezone
 from prices import Money
 
@@ -81,12 +82,16 @@ def invalidate_checkout(
     *,
     recalculate_discount: bool = True,
     save: bool,
+    changes: Optional[Iterable[str]] = None,
+    changed_lines: Optional[Iterable["CheckoutLine"]] = None,
 ) -> list[str]:
     """Mark checkout as ready for prices recalculation."""
     if recalculate_discount:
         recalculate_checkout_discounts(checkout_info, lines, manager)
 
-    updated_fields = invalidate_checkout_prices(checkout_info, save=save)
+    updated_fields = invalidate_checkout_prices(
+        checkout_info, save=save, changes=changes, changed_lines=changed_lines
+    )
     return updated_fields
 
 
@@ -108,19 +113,67 @@ def invalidate_checkout_prices(
     checkout_info: "CheckoutInfo",
     *,
     save: bool,
+    changes: Optional[Iterable[str]] = None,
+    changed_lines: Optional[Iterable["CheckoutLine"]] = None,
 ) -> list[str]:
-    """Mark checkout as ready for prices recalculation."""
+    """Mark checkout as ready for prices recalculation.
+
+    With `CHECKOUT_INCREMENTAL_PRICES_ENABLED` the given changes are recorded
+    instead of expiring the prices, so only the affected prices are recalculated.
+    Changed lines narrow down the `CheckoutPriceChange.LINES` change; lines that
+    were removed don't have to be passed.
+    """
     checkout = checkout_info.checkout
 
+    if (
+        settings.CHECKOUT_INCREMENTAL_PRICES_ENABLED
+        and changes
+        and checkout.price_expiration > timezone.now()
+    ):
+        _record_checkout_price_changes(checkout, changes, changed_lines or [])
+        return ["last_change"]
+
     checkout.price_expiration = timezone.now()
     updated_fields = ["price_expiration", "last_change"]
-
     if save:
         checkout.save(update_fields=updated_fields)
 
     return updated_fields
 
 
+def _record_checkout_price_changes(
+    checkout: Checkout,
+    changes: Iterable[str],
+    changed_lines: Iterable["CheckoutLine"],
+):
+    """Append the changes to the recorded ones in a single update.
+
+    Concurrent requests record their own changes, so the recorded changes are
+    merged in the database instead of being overwritten with the in-memory ones.
+    The changes are recorded even when the checkout isn't saved by the caller.
+    """
+    changes = sorted(set(changes))
+    line_ids = [line.pk for line in changed_lines]
+    checkout.price_changes = sorted(set(checkout.price_changes).union(changes))
+    checkout.price_changed_line_ids = list(
+        set(checkout.price_changed_line_ids).union(line_ids)
+    )
+    checkout.last_change = timezone.now()
+    Checkout.objects.filter(pk=checkout.pk).update(
+        price_changes=RawSQL(
+            "ARRAY(SELECT DISTINCT change FROM unnest("
+            "array_cat(price_changes, %s::varchar[])) AS change ORDER BY change)",
+            (changes,),
+        ),
+        price_changed_line_ids=RawSQL(
+            "ARRAY(SELECT DISTINCT unnest("
+            "array_cat(price_changed_line_ids, %s::uuid[])))",
+            ([str(line_id) for line_id in line_ids],),
+        ),
+        last_change=checkout.last_change,
+    )
+
+
 def get_user_checkout(
     user: User,
     checkout_queryset=None,
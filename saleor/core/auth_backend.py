@@ -1,7 +1,10 @@
+from functools import partial
+
 import jwt
 from django.conf import settings
 
 from ..account.models import User
+from ..account.permission_cache import get_user_permissions
 from ..graphql.account.dataloaders import UserByEmailLoader
 from ..graphql.plugins.dataloaders import AnonymousPluginManagerLoader
 from ..permission.enums import (
@@ -10,6 +13,7 @@ from ..permission.enums import (
 )
 from ..plugins.manager import get_plugins_manager
 from .auth import get_token_from_request
+from .db.connection import allow_writer
 from .jwt import (
     JWT_ACCESS_TYPE,
     JWT_THIRDPARTY_ACCESS_TYPE,
@@ -72,12 +76,36 @@ class JSONWebTokenBackend(BaseBackend):
 
         perm_cache_name = "_effective_permissions_cache"
         if not getattr(user_obj, perm_cache_name, None):
-            perms = getattr(self, f"_get_{from_name}_permissions")(user_obj)
-            perms = perms.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
-            perms = perms.values_list("content_type__app_label", "codename").order_by()
-            setattr(user_obj, perm_cache_name, {f"{ct}.{name}" for ct, name in perms})
+            # Permissions limited by the token are not shared between requests.
+            if (
+                settings.USER_PERMISSIONS_CACHE_TIMEOUT
+                and getattr(user_obj, "_effective_permissions", None) is None
+            ):
+                perms = get_user_permissions(
+                    user_obj,
+                    partial(self._load_shared_permissions, user_obj, from_name),
+                )
+            else:
+                perms = self._load_permissions(
+                    user_obj, from_name, settings.DATABASE_CONNECTION_REPLICA_NAME
+                )
+            setattr(user_obj, perm_cache_name, perms)
         return getattr(user_obj, perm_cache_name)
 
+    def _load_permissions(self, user_obj, from_name, database_name) -> set[str]:
+        perms = getattr(self, f"_get_{from_name}_permissions")(user_obj)
+        perms = perms.using(database_name)
+        perms = perms.values_list("content_type__app_label", "codename").order_by()
+        return {f"{ct}.{name}" for ct, name in perms}
+
+    def _load_shared_permissions(self, user_obj, from_name) -> set[str]:
+        # The replica may lag behind the invalidation of the shared permissions, so
+        # they are loaded from the writer.
+        with allow_writer():
+            return self._load_permissions(
+                user_obj, from_name, settings.DATABASE_CONNECTION_DEFAULT_NAME
+            )
+
     # Moved from `django.contrib.auth.backends.ModelBackend`
     def get_user_permissions(self, user_obj, obj=None):  # noqa: D205, D212, D400, D415
         """Return a set of permissions the user `user_obj` holds directly."""
@@ -1,3 +1,7 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
 from collections.abc import Iterable
 from datetime import datetime, timedelta
 from typing import Any, Optional
@@ -79,11 +83,63 @@ def jwt_decode_with_exception_handler(
         return None
 
 
+class JWTDecodeCache:
+    """Payloads of verified tokens, kept until the tokens expire.
+
+    Keyed by the hash of the token, so the signature of a token used by many requests
+    is verified once per process. Tokens without an expiration time are not cached.
+    """
+
+    def __init__(self):
+        self.payloads: OrderedDict[tuple, tuple[float, dict[str, Any]]] = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key: tuple) -> Optional[dict[str, Any]]:
+        with self.lock:
+            entry = self.payloads.get(key)
+            if entry is None:
+                return None
+            expires_at, payload = entry
+            if expires_at <= time.time():
+                del self.payloads[key]
+                return None
+            self.payloads.move_to_end(key)
+        return dict(payload)
+
+    def set(self, key: tuple, payload: dict[str, Any]):
+        expires_at = payload.get("exp")
+        if not isinstance(expires_at, (int, float)):
+            return
+        with self.lock:
+            self.payloads[key] = (expires_at, dict(payload))
+            self.payloads.move_to_end(key)
+            while len(self.payloads) > settings.JWT_DECODE_CACHE_SIZE:
+                self.payloads.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.payloads.clear()
+
+
+jwt_decode_cache = JWTDecodeCache()
+
+
 def jwt_decode(
     token: str, verify_expiration=settings.JWT_EXPIRE, verify_aud: bool = False
 ) -> dict[str, Any]:
+    use_cache = settings.JWT_DECODE_CACHE_SIZE > 0 and verify_expiration
+    if use_cache:
+        token_hash = hashlib.sha256(token.encode("utf-8")).hexdigest()
+        key = (token_hash, verify_aud)
+        payload = jwt_decode_cache.get(key)
+        if payload is not None:
+            return payload
+
     jwt_manager = get_jwt_manager()
-    return jwt_manager.decode(token, verify_expiration, verify_aud=verify_aud)
+    payload = jwt_manager.decode(token, verify_expiration, verify_aud=verify_aud)
+    if use_cache:
+        jwt_decode_cache.set(key, payload)
+    return payload
 
 
 def create_token(payload: dict[str, Any], exp_delta: timedelta) -> str:
@@ -0,0 +1,94 @@
+import logging
+import time
+from typing import Optional
+
+from celery import Task
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+SEARCH_INDEX_UPDATE_KEY_PREFIX = "search-index-update"
+# Keep the schedule marker a bit longer than the debounce window, so a task
+# delayed in the queue doesn't let another one be scheduled in the meantime.
+SEARCH_INDEX_UPDATE_GRACE_SEC = 60
+
+
+def get_search_index_update_key(task: Task) -> str:
+    return f"{SEARCH_INDEX_UPDATE_KEY_PREFIX}-{task.name}"
+
+
+def _schedule_search_index_update(task: Task, countdown: int):
+    debounce = settings.SEARCH_INDEX_UPDATE_DEBOUNCE_SEC
+    try:
+        scheduled = cache.add(
+            get_search_index_update_key(task),
+            time.time(),
+            timeout=debounce + SEARCH_INDEX_UPDATE_GRACE_SEC,
+        )
+    except Exception:
+        logger.warning("Unable to schedule the search index update.", exc_info=True)
+        return
+    if scheduled:
+        # The periodic runs of the task expire quickly; the scheduled one has to
+        # outlive its countdown.
+        task.apply_async(
+            countdown=countdown, expires=countdown + SEARCH_INDEX_UPDATE_GRACE_SEC
+        )
+
+
+def schedule_search_index_update(task: Task, countdown: Optional[int] = None):
+    """Schedule the task updating the search index of objects marked as dirty.
+
+    The task runs `SEARCH_INDEX_UPDATE_DEBOUNCE_SEC` seconds after the first change,
+    so all the changes made in the meantime are indexed in a single batch. Only one
+    task is scheduled at a time. Nothing is scheduled when the debounce is not set;
+    the dirty objects are indexed by the periodic task then.
+    """
+    debounce = settings.SEARCH_INDEX_UPDATE_DEBOUNCE_SEC
+    if not debounce:
+        return
+    if countdown is None:
+        countdown = debounce
+    transaction.on_commit(lambda: _schedule_search_index_update(task, countdown))
+
+
+def pop_search_index_update_schedule(task: Task) -> Optional[float]:
+    """Return the time the search index update was scheduled at and clear it.
+
+    Clearing it allows the changes made while the task runs to schedule the next
+    update.
+    """
+    key = get_search_index_update_key(task)
+    try:
+        scheduled_at = cache.get(key)
+        if scheduled_at is not None:
+            cache.delete(key)
+    except Exception:
+        logger.warning("Unable to fetch the search index update.", exc_info=True)
+        return None
+    return scheduled_at
+
+
+def log_search_index_update(
+    task_logger: logging.Logger,
+    name: str,
+    updated_count: int,
+    dirty_count: int,
+    scheduled_at: Optional[float],
+):
+    """Log the number of objects still waiting for indexing and the indexing lag."""
+    lag = time.time() - scheduled_at if scheduled_at is not None else None
+    task_logger.info(
+        "Updated search index of %s %s, %s still dirty, lag: %s seconds.",
+        updated_count,
+        name,
+        dirty_count,
+        f"{lag:.1f}" if lag is not None else "unknown",
+        extra={
+            "updated_count": updated_count,
+            "dirty_count": dirty_count,
+            "lag": lag,
+        },
+    )
@@ -1,12 +1,18 @@
+from unittest.mock import patch
+
 import graphene
 import jwt
+import pytest
 from cryptography.hazmat.primitives import serialization
 from django.urls import reverse
+from freezegun import freeze_time
 
 from ..jwt import (
+    create_access_token,
     create_access_token_for_app,
     create_access_token_for_app_extension,
     jwt_decode,
+    jwt_decode_cache,
     jwt_encode,
 )
 from ..utils import build_absolute_uri
@@ -187,3 +193,32 @@ def test_jwt_encode_creates_token_signed_with_rs256(settings):
     # then
     headers = jwt.get_unverified_header(token)
     assert headers.get("alg") == "RS256"
+
+
+def test_jwt_decode_caches_verified_token(staff_user, settings):
+    # given
+    settings.JWT_DECODE_CACHE_SIZE = 10
+    jwt_decode_cache.clear()
+    access_token = create_access_token(staff_user)
+    payload = jwt_decode(access_token)
+
+    # when
+    with patch("saleor.core.jwt.get_jwt_manager") as mocked_get_jwt_manager:
+        cached_payload = jwt_decode(access_token)
+
+    # then
+    mocked_get_jwt_manager.assert_not_called()
+    assert cached_payload == payload
+
+
+def test_jwt_decode_cache_verifies_expired_token(staff_user, settings):
+    # given
+    settings.JWT_DECODE_CACHE_SIZE = 10
+    jwt_decode_cache.clear()
+    with freeze_time("2024-01-01 12:00:00"):
+        access_token = create_access_token(staff_user)
+        jwt_decode(access_token)
+
+    # when & then
+    with freeze_time("2024-01-02 12:00:00"), pytest.raises(jwt.ExpiredSignatureError):
+        jwt_decode(access_token)
@@ -0,0 +1,75 @@
+from unittest.mock import MagicMock
+
+from django.core.cache import cache
+
+from ..search_index import (
+    SEARCH_INDEX_UPDATE_GRACE_SEC,
+    get_search_index_update_key,
+    pop_search_index_update_schedule,
+    schedule_search_index_update,
+)
+
+
+def _get_task():
+    task = MagicMock()
+    task.name = "test-search-index-update"
+    return task
+
+
+def test_schedule_search_index_update(settings, django_capture_on_commit_callbacks):
+    # given
+    settings.SEARCH_INDEX_UPDATE_DEBOUNCE_SEC = 5
+    cache.clear()
+    task = _get_task()
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        schedule_search_index_update(task)
+        schedule_search_index_update(task)
+
+    # then
+    task.apply_async.assert_called_once_with(
+        countdown=5, expires=5 + SEARCH_INDEX_UPDATE_GRACE_SEC
+    )
+    assert cache.get(get_search_index_update_key(task)) is not None
+
+
+def test_schedule_search_index_update_after_pop(
+    settings, django_capture_on_commit_callbacks
+):
+    # given
+    settings.SEARCH_INDEX_UPDATE_DEBOUNCE_SEC = 5
+    cache.clear()
+    task = _get_task()
+    with django_capture_on_commit_callbacks(execute=True):
+        schedule_search_index_update(task)
+
+    # when
+    scheduled_at = pop_search_index_update_schedule(task)
+    with django_capture_on_commit_callbacks(execute=True):
+        schedule_search_index_update(task, countdown=0)
+
+    # then
+    assert scheduled_at is not None
+    assert task.apply_async.call_count == 2
+    task.apply_async.assert_called_with(
+        countdown=0, expires=SEARCH_INDEX_UPDATE_GRACE_SEC
+    )
+
+
+def test_schedule_search_index_update_disabled(
+    settings, django_capture_on_commit_callbacks
+):
+    # given
+    settings.SEARCH_INDEX_UPDATE_DEBOUNCE_SEC = 0
+    cache.clear()
+    task = _get_task()
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        schedule_search_index_update(task)
+
+    # then
+    assert not callbacks
+    task.apply_async.assert_not_called()
+    assert pop_search_index_update_schedule(task) is None
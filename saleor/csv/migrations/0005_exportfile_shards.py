@@ -0,0 +1,22 @@
+# Generated by Django 3.2.25 on 2026-10-17 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("csv", "0004_auto_20210709_1043"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="exportfile",
+            name="exported_shards",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="exportfile",
+            name="total_shards",
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
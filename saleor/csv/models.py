@@ -17,6 +17,8 @@ class ExportFile(Job):
         App, related_name="export_files", on_delete=models.CASCADE, null=True
     )
     content_file = models.FileField(upload_to="export_files", null=True)
+    total_shards = models.PositiveIntegerField(default=0)
+    exported_shards = models.PositiveIntegerField(default=0)
 
 
 class ExportEvent(models.Model):
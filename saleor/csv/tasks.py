@@ -1,5 +1,6 @@
 from typing import Optional, Union
 
+from celery import chord
 from celery.utils.log import get_task_logger
 from django.conf import settings
 from django.core.files.storage import default_storage
@@ -14,10 +15,21 @@ from ..core.tasks import RestrictWriterDBTask
 from . import events
 from .models import ExportEvent, ExportFile
 from .notifications import send_export_failed_info
-from .utils.export import export_gift_cards, export_products, export_voucher_codes
+from .utils.export import (
+    delete_export_shard_files,
+    export_gift_cards,
+    export_products,
+    export_products_shard,
+    export_voucher_codes,
+    get_product_pk_ranges,
+    merge_products_shards,
+)
 
 task_logger = get_task_logger(__name__)
 
+# Returned by the export tasks which only dispatched the export shards.
+EXPORT_SHARDS_DISPATCHED = "export-shards-dispatched"
+
 
 class ExportTask(RestrictWriterDBTask):
     # should be updated when new export task is added
@@ -25,6 +37,8 @@ class ExportTask(RestrictWriterDBTask):
         "export-products": "products",
         "export-gift-cards": "gift cards",
         "export-voucher-codes": "voucher codes",
+        "export-products-shard": "products",
+        "merge-export-products-shards": "products",
     }
 
     def on_failure(self, exc, task_id, args, kwargs, einfo):
@@ -49,6 +63,9 @@ class ExportTask(RestrictWriterDBTask):
         send_export_failed_info(export_file, data_type)
 
     def on_success(self, retval, task_id, args, kwargs):
+        if retval == EXPORT_SHARDS_DISPATCHED:
+            # The export file is completed by the task merging the shards.
+            return
         export_file_id = args[0]
 
         export_file = ExportFile.objects.get(pk=export_file_id)
@@ -73,9 +90,108 @@ def export_products_task(
         export_file = ExportFile.objects.select_related("app", "user").get(
             pk=export_file_id
         )
+    shard_size = settings.EXPORT_PRODUCTS_SHARD_SIZE
+    if shard_size:
+        pk_ranges = get_product_pk_ranges(scope, shard_size)
+        if len(pk_ranges) > 1:
+            dispatch_export_products_shards(
+                export_file, pk_ranges, scope, export_info, file_type, delimiter
+            )
+            return EXPORT_SHARDS_DISPATCHED
     export_products(export_file, scope, export_info, file_type, delimiter)
 
 
+def dispatch_export_products_shards(
+    export_file: ExportFile,
+    pk_ranges: list[tuple[int, int]],
+    scope: dict[str, Union[str, dict]],
+    export_info: dict[str, list],
+    file_type: str,
+    delimiter: str,
+):
+    with allow_writer():
+        export_file.total_shards = len(pk_ranges)
+        export_file.exported_shards = 0
+        export_file.save(
+            update_fields=["total_shards", "exported_shards", "updated_at"]
+        )
+    shard_tasks = [
+        export_products_shard_task.si(
+            export_file.pk,
+            scope,
+            export_info,
+            file_type,
+            delimiter,
+            shard_index,
+            start_pk,
+            end_pk,
+        )
+        for shard_index, (start_pk, end_pk) in enumerate(pk_ranges)
+    ]
+    merge_task = merge_export_products_shards_task.si(
+        export_file.pk, export_info, file_type, delimiter
+    )
+    chord(shard_tasks)(merge_task)
+
+
+class ExportShardTask(ExportTask):
+    """Export a part of the data; the export file is completed by the merge task."""
+
+    def on_failure(self, exc, task_id, args, kwargs, einfo):
+        # Only the first failed shard of the export reports the failure.
+        with allow_writer():
+            marked_failed = (
+                ExportFile.objects.filter(pk=args[0])
+                .exclude(status=JobStatus.FAILED)
+                .update(status=JobStatus.FAILED, updated_at=timezone.now())
+            )
+        if not marked_failed:
+            return
+        export_file = ExportFile.objects.get(pk=args[0])
+        delete_export_shard_files(export_file, args[3])
+        super().on_failure(exc, task_id, args, kwargs, einfo)
+
+    def on_success(self, retval, task_id, args, kwargs):
+        pass
+
+
+@app.task(name="export-products-shard", base=ExportShardTask)
+def export_products_shard_task(
+    export_file_id: int,
+    scope: dict[str, Union[str, dict]],
+    export_info: dict[str, list],
+    file_type: str,
+    delimiter: str,
+    shard_index: int,
+    start_pk: int,
+    end_pk: int,
+):
+    export_products_shard(
+        export_file_id,
+        scope,
+        export_info,
+        file_type,
+        delimiter,
+        shard_index,
+        start_pk,
+        end_pk,
+    )
+
+
+@app.task(name="merge-export-products-shards", base=ExportTask)
+def merge_export_products_shards_task(
+    export_file_id: int,
+    export_info: dict[str, list],
+    file_type: str,
+    delimiter: str = ",",
+):
+    with allow_writer():
+        export_file = ExportFile.objects.select_related("app", "user").get(
+            pk=export_file_id
+        )
+    merge_products_shards(export_file, export_info, file_type, delimiter)
+
+
 @app.task(name="export-gift-cards", base=ExportTask)
 def export_gift_cards_task(
     export_file_id: int,
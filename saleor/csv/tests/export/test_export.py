@@ -1,12 +1,10 @@
 import datetime
 import json
 import shutil
-from tempfile import NamedTemporaryFile
 from unittest.mock import ANY, MagicMock, patch
 
 import graphene
 import openpyxl
-import petl as etl
 import pytest
 from django.core.files import File
 from freezegun import freeze_time
@@ -19,7 +17,7 @@ from ....graphql.product.filters import ProductFilter
 from ....product.models import Product, ProductChannelListing
 from ... import FileTypes
 from ...utils.export import (
-    append_to_file,
+    ExportFileWriter,
     create_file_with_headers,
     export_gift_cards,
     export_gift_cards_in_batches,
@@ -63,8 +61,8 @@ def test_export_products(
         "channels": [],
     }
 
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock(spec=ExportFileWriter)
+    create_file_with_headers_mock.return_value = mock_writer
 
     product_list[0].variants.update(sku=None)
 
@@ -84,12 +82,12 @@ def test_export_products(
         export_info,
         {"id", "name", "variants__id", "variants__sku"},
         ["id", "name", "variants__id", "variants__sku"],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
     )
     send_email_mock.assert_called_once_with(user_export_file, "products")
-    save_file_mock.assert_called_once_with(user_export_file, mock_file, ANY)
+    save_file_mock.assert_called_once_with(
+        user_export_file, mock_writer.finish.return_value, ANY
+    )
 
 
 @patch("saleor.csv.utils.export.create_file_with_headers")
@@ -112,8 +110,8 @@ def test_export_products_ids(
     assert user_export_file.status == JobStatus.PENDING
     assert not user_export_file.content_file
 
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock(spec=ExportFileWriter)
+    create_file_with_headers_mock.return_value = mock_writer
 
     # when
     export_products(user_export_file, {"ids": pks}, export_info, file_type)
@@ -131,12 +129,12 @@ def test_export_products_ids(
         export_info,
         {"id"},
         ["id"],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
     )
     send_email_mock.assert_called_once_with(user_export_file, "products")
-    save_file_mock.assert_called_once_with(user_export_file, mock_file, ANY)
+    save_file_mock.assert_called_once_with(
+        user_export_file, mock_writer.finish.return_value, ANY
+    )
 
 
 @patch("saleor.csv.utils.export.create_file_with_headers")
@@ -163,8 +161,8 @@ def test_export_products_filter_is_published(
     assert user_export_file.status == JobStatus.PENDING
     assert not user_export_file.content_file
 
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock(spec=ExportFileWriter)
+    create_file_with_headers_mock.return_value = mock_writer
 
     # when
     export_products(
@@ -188,12 +186,12 @@ def test_export_products_filter_is_published(
         export_info,
         {"id"},
         ["id"],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
     )
     send_email_mock.assert_called_once_with(user_export_file, "products")
-    save_file_mock.assert_called_once_with(user_export_file, mock_file, ANY)
+    save_file_mock.assert_called_once_with(
+        user_export_file, mock_writer.finish.return_value, ANY
+    )
 
 
 @patch("saleor.csv.utils.export.create_file_with_headers")
@@ -219,8 +217,8 @@ def test_export_products_filter_collections(
     assert user_export_file.status == JobStatus.PENDING
     assert not user_export_file.content_file
 
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock(spec=ExportFileWriter)
+    create_file_with_headers_mock.return_value = mock_writer
 
     # when
     export_products(
@@ -240,9 +238,11 @@ def test_export_products_filter_collections(
     assert export_products_in_batches_mock.call_count == 1
     batch_args, _ = export_products_in_batches_mock.call_args
     assert set(batch_args[0].values_list("pk", flat=True)) == {product_list[-1].pk}
-    assert batch_args[1:] == (export_info, {"id"}, ["id"], ",", mock_file, file_type)
+    assert batch_args[1:] == (export_info, {"id"}, ["id"], mock_writer)
     send_email_mock.assert_called_once_with(user_export_file, "products")
-    save_file_mock.assert_called_once_with(user_export_file, mock_file, ANY)
+    save_file_mock.assert_called_once_with(
+        user_export_file, mock_writer.finish.return_value, ANY
+    )
 
 
 @patch("saleor.csv.utils.export.create_file_with_headers")
@@ -266,8 +266,8 @@ def test_export_products_by_app(
     }
     file_type = FileTypes.CSV
 
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock(spec=ExportFileWriter)
+    create_file_with_headers_mock.return_value = mock_writer
 
     # when
     export_products(app_export_file, {"all": ""}, export_info, file_type)
@@ -286,14 +286,14 @@ def test_export_products_by_app(
         export_info,
         {"id", "name"},
         ["id", "name"],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
     )
 
     send_email_mock.assert_called_once_with(app_export_file, "products")
 
-    save_file_mock.assert_called_once_with(app_export_file, mock_file, ANY)
+    save_file_mock.assert_called_once_with(
+        app_export_file, mock_writer.finish.return_value, ANY
+    )
 
 
 @patch("saleor.plugins.manager.PluginsManager.product_export_completed")
@@ -330,8 +330,8 @@ def test_export_gift_cards(
     # given
     file_type = FileTypes.CSV
 
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock(spec=ExportFileWriter)
+    create_file_with_headers_mock.return_value = mock_writer
 
     # when
     export_gift_cards(user_export_file, {"all": ""}, file_type)
@@ -346,14 +346,14 @@ def test_export_gift_cards(
     )
     assert args[1:] == (
         ["code"],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
     )
 
     send_email_mock.assert_called_once_with(user_export_file, "gift cards")
 
-    save_file_mock.assert_called_once_with(user_export_file, mock_file, ANY)
+    save_file_mock.assert_called_once_with(
+        user_export_file, mock_writer.finish.return_value, ANY
+    )
 
 
 @patch("saleor.csv.utils.export.create_file_with_headers")
@@ -372,8 +372,8 @@ def test_export_gift_cards_by_app(
 ):
     file_type = FileTypes.CSV
 
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock(spec=ExportFileWriter)
+    create_file_with_headers_mock.return_value = mock_writer
 
     # when
     export_gift_cards(app_export_file, {"all": ""}, file_type)
@@ -388,14 +388,14 @@ def test_export_gift_cards_by_app(
     )
     assert args[1:] == (
         ["code"],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
     )
 
     send_email_mock.assert_called_once_with(app_export_file, "gift cards")
 
-    save_file_mock.assert_called_once_with(app_export_file, mock_file, ANY)
+    save_file_mock.assert_called_once_with(
+        app_export_file, mock_writer.finish.return_value, ANY
+    )
 
 
 @patch("saleor.csv.utils.export.create_file_with_headers")
@@ -414,8 +414,8 @@ def test_export_gift_cards_ids(
 ):
     file_type = FileTypes.CSV
 
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock(spec=ExportFileWriter)
+    create_file_with_headers_mock.return_value = mock_writer
     pks = [gift_card.pk]
 
     # when
@@ -429,14 +429,14 @@ def test_export_gift_cards_ids(
     assert set(args[0].values_list("pk", flat=True)) == set(pks)
     assert args[1:] == (
         ["code"],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
     )
 
     send_email_mock.assert_called_once_with(user_export_file, "gift cards")
 
-    save_file_mock.assert_called_once_with(user_export_file, mock_file, ANY)
+    save_file_mock.assert_called_once_with(
+        user_export_file, mock_writer.finish.return_value, ANY
+    )
 
 
 @patch("saleor.csv.utils.export.create_file_with_headers")
@@ -456,8 +456,8 @@ def test_export_gift_cards_with_filter(
 ):
     file_type = FileTypes.CSV
 
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock(spec=ExportFileWriter)
+    create_file_with_headers_mock.return_value = mock_writer
 
     gift_card_expiry_date.product = shippable_gift_card_product
     gift_card_used.product = shippable_gift_card_product
@@ -486,14 +486,14 @@ def test_export_gift_cards_with_filter(
     assert set(args[0].values_list("pk", flat=True)) == {gift_card_expiry_date.pk}
     assert args[1:] == (
         ["code"],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
     )
 
     send_email_mock.assert_called_once_with(user_export_file, "gift cards")
 
-    save_file_mock.assert_called_once_with(user_export_file, mock_file, ANY)
+    save_file_mock.assert_called_once_with(
+        user_export_file, mock_writer.finish.return_value, ANY
+    )
 
 
 @patch("saleor.plugins.manager.PluginsManager.gift_card_export_completed")
@@ -561,7 +561,8 @@ def test_create_file_with_headers_csv(user_export_file, tmpdir, media_root):
     assert not user_export_file.content_file
 
     # when
-    csv_file = create_file_with_headers(file_headers, ",", FileTypes.CSV)
+    writer = create_file_with_headers(file_headers, ",", FileTypes.CSV)
+    csv_file = writer.finish()
 
     # then
     assert csv_file
@@ -580,7 +581,8 @@ def test_create_file_with_headers_xlsx(user_export_file, tmpdir, media_root):
     assert not user_export_file.content_file
 
     # when
-    xlsx_file = create_file_with_headers(file_headers, ",", FileTypes.XLSX)
+    writer = create_file_with_headers(file_headers, ",", FileTypes.XLSX)
+    xlsx_file = writer.finish()
 
     # then
     assert xlsx_file
@@ -611,7 +613,7 @@ def test_save_csv_file_in_export_file(user_export_file, tmpdir, media_root):
     shutil.rmtree(tmpdir)
 
 
-def test_append_to_file_for_csv(user_export_file, tmpdir, media_root):
+def test_export_file_writer_write_rows_for_csv(user_export_file, tmpdir, media_root):
     # given
     export_data = [
         {"id": "123", "name": "test1", "collections": "coll1"},
@@ -620,16 +622,14 @@ def test_append_to_file_for_csv(user_export_file, tmpdir, media_root):
     headers = ["id", "name", "collections"]
     delimiter = ","
 
-    table = etl.fromdicts([{"id": "1", "name": "A"}], header=headers, missing="")
-
-    temp_file = NamedTemporaryFile()
-    etl.tocsv(table, temp_file.name, delimiter=delimiter)
+    writer = ExportFileWriter(headers, delimiter, FileTypes.CSV)
+    writer.write_rows([{"id": "1", "name": "A"}], headers)
 
     # when
-    append_to_file(export_data, headers, temp_file, FileTypes.CSV, delimiter)
+    writer.write_rows(export_data, headers)
 
     # then
-    user_export_file.refresh_from_db()
+    temp_file = writer.finish()
 
     file_content = temp_file.read().decode().split("\r\n")
     assert ",".join(headers) in file_content
@@ -640,7 +640,7 @@ def test_append_to_file_for_csv(user_export_file, tmpdir, media_root):
     shutil.rmtree(tmpdir)
 
 
-def test_append_to_file_for_xlsx(user_export_file, tmpdir, media_root):
+def test_export_file_writer_write_rows_for_xlsx(user_export_file, tmpdir, media_root):
     # given
     export_data = [
         {"id": "123", "name": "test1", "collections": "coll1"},
@@ -648,18 +648,14 @@ def test_append_to_file_for_xlsx(user_export_file, tmpdir, media_root):
     ]
     expected_headers = ["id", "name", "collections"]
 
-    table = etl.fromdicts(
-        [{"id": "1", "name": "A"}], header=expected_headers, missing=""
-    )
-
-    temp_file = NamedTemporaryFile(suffix=".xlsx")
-    etl.io.xlsx.toxlsx(table, temp_file.name)
+    writer = ExportFileWriter(expected_headers, ",", FileTypes.XLSX)
+    writer.write_rows([{"id": "1", "name": "A"}], expected_headers)
 
     # when
-    append_to_file(export_data, expected_headers, temp_file, FileTypes.XLSX, ",")
+    writer.write_rows(export_data, expected_headers)
 
     # then
-    user_export_file.refresh_from_db()
+    temp_file = writer.finish()
 
     workbook = openpyxl.load_workbook(temp_file)
 
@@ -700,10 +696,7 @@ def test_export_products_in_batches_for_csv(
     export_fields = ["id", "name", "variants__sku"]
     expected_headers = ["id", "name", "variant sku"]
 
-    table = etl.wrap([expected_headers])
-
-    temp_file = NamedTemporaryFile()
-    etl.tocsv(table, temp_file.name, delimiter=",")
+    writer = create_file_with_headers(expected_headers, ",", FileTypes.CSV)
 
     # when
     export_products_in_batches(
@@ -711,12 +704,11 @@ def test_export_products_in_batches_for_csv(
         export_info,
         set(export_fields),
         export_fields,
-        ",",
-        temp_file,
-        FileTypes.CSV,
+        writer,
     )
 
     # then
+    temp_file = writer.finish()
 
     expected_data = []
     for product in qs.order_by("pk"):
@@ -770,10 +762,7 @@ def test_export_products_in_batches_for_xlsx(
     export_fields = ["id", "name", "description_as_str", "variants__sku"]
     expected_headers = ["id", "name", "description", "variant sku"]
 
-    table = etl.wrap([expected_headers])
-
-    temp_file = NamedTemporaryFile(suffix=".xlsx")
-    etl.io.xlsx.toxlsx(table, temp_file.name)
+    writer = create_file_with_headers(expected_headers, ",", FileTypes.XLSX)
 
     # when
     export_products_in_batches(
@@ -781,12 +770,11 @@ def test_export_products_in_batches_for_xlsx(
         export_info,
         set(export_fields),
         export_fields,
-        ",",
-        temp_file,
-        FileTypes.XLSX,
+        writer,
     )
 
     # then
+    temp_file = writer.finish()
     expected_data = []
     for product in qs:
         product_data = []
@@ -829,20 +817,17 @@ def test_export_gift_cards_in_batches_to_csv(
     # given
     gift_cards = GiftCard.objects.exclude(id=gift_card_used.id).order_by("pk")
 
-    table = etl.wrap([["code"]])
-    temp_file = NamedTemporaryFile()
-    etl.tocsv(table, temp_file.name, delimiter=",")
+    writer = create_file_with_headers(["code"], ",", "csv")
 
     # when
     export_gift_cards_in_batches(
         gift_cards,
         ["code"],
-        ",",
-        temp_file,
-        "csv",
+        writer,
     )
 
     # then
+    temp_file = writer.finish()
     file_content = temp_file.read().decode().split("\r\n")
 
     # ensure headers are in the file
@@ -864,20 +849,17 @@ def test_export_gift_cards_in_batches_to_xlsx(
     # given
     gift_cards = GiftCard.objects.exclude(id=gift_card_used.id).order_by("pk")
 
-    table = etl.wrap([["code"]])
-    temp_file = NamedTemporaryFile(suffix=".xlsx")
-    etl.io.xlsx.toxlsx(table, temp_file.name)
+    writer = create_file_with_headers(["code"], ",", "xlsx")
 
     # when
     export_gift_cards_in_batches(
         gift_cards,
         ["code"],
-        ",",
-        temp_file,
-        "xlsx",
+        writer,
     )
 
     # then
+    temp_file = writer.finish()
     wb_obj = openpyxl.load_workbook(temp_file)
 
     sheet_obj = wb_obj.active
@@ -950,8 +932,8 @@ def test_export_voucher_codes_by_voucher_id(
     voucher_with_many_codes,
     voucher_percentage,
 ):
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock(spec=ExportFileWriter)
+    create_file_with_headers_mock.return_value = mock_writer
     file_type = FileTypes.CSV
     voucher = voucher_with_many_codes
 
@@ -968,14 +950,14 @@ def test_export_voucher_codes_by_voucher_id(
     )
     assert args[1:] == (
         ["code"],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
     )
 
     send_email_mock.assert_called_once_with(user_export_file, "voucher codes")
 
-    save_file_mock.assert_called_once_with(user_export_file, mock_file, ANY)
+    save_file_mock.assert_called_once_with(
+        user_export_file, mock_writer.finish.return_value, ANY
+    )
 
 
 @patch("saleor.csv.utils.export.create_file_with_headers")
@@ -991,8 +973,8 @@ def test_export_voucher_codes_by_ids(
     voucher_with_many_codes,
     voucher_percentage,
 ):
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock(spec=ExportFileWriter)
+    create_file_with_headers_mock.return_value = mock_writer
     file_type = FileTypes.CSV
     voucher = voucher_with_many_codes
     code_ids = [code.id for code in voucher.codes.all()]
@@ -1010,14 +992,14 @@ def test_export_voucher_codes_by_ids(
     )
     assert args[1:] == (
         ["code"],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
     )
 
     send_email_mock.assert_called_once_with(user_export_file, "voucher codes")
 
-    save_file_mock.assert_called_once_with(user_export_file, mock_file, ANY)
+    save_file_mock.assert_called_once_with(
+        user_export_file, mock_writer.finish.return_value, ANY
+    )
 
 
 @patch("saleor.csv.utils.export.create_file_with_headers")
@@ -1032,8 +1014,8 @@ def test_export_voucher_codes_by_app(
     app_export_file,
     voucher_with_many_codes,
 ):
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock(spec=ExportFileWriter)
+    create_file_with_headers_mock.return_value = mock_writer
     file_type = FileTypes.CSV
     voucher = voucher_with_many_codes
 
@@ -1050,14 +1032,14 @@ def test_export_voucher_codes_by_app(
     )
     assert args[1:] == (
         ["code"],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
     )
 
     send_email_mock.assert_called_once_with(app_export_file, "voucher codes")
 
-    save_file_mock.assert_called_once_with(app_export_file, mock_file, ANY)
+    save_file_mock.assert_called_once_with(
+        app_export_file, mock_writer.finish.return_value, ANY
+    )
 
 
 @patch("saleor.plugins.manager.PluginsManager.voucher_code_export_completed")
@@ -1085,20 +1067,17 @@ def test_export_voucher_codes_in_batches_to_csv(
     # given
     voucher_codes = voucher_with_many_codes.codes.all()
 
-    table = etl.wrap([["code"]])
-    temp_file = NamedTemporaryFile()
-    etl.tocsv(table, temp_file.name, delimiter=",")
+    writer = create_file_with_headers(["code"], ",", "csv")
 
     # when
     export_voucher_codes_in_batches(
         voucher_codes,
         ["code"],
-        ",",
-        temp_file,
-        "csv",
+        writer,
     )
 
     # then
+    temp_file = writer.finish()
     file_content = temp_file.read().decode().split("\r\n")
 
     # ensure headers are in the file
@@ -1118,20 +1097,17 @@ def test_export_voucher_codes_in_batches_to_xlsx(
     # given
     voucher_codes = voucher_with_many_codes.codes.all()
 
-    table = etl.wrap([["code"]])
-    temp_file = NamedTemporaryFile(suffix=".xlsx")
-    etl.io.xlsx.toxlsx(table, temp_file.name)
+    writer = create_file_with_headers(["code"], ",", "xlsx")
 
     # when
     export_voucher_codes_in_batches(
         voucher_codes,
         ["code"],
-        ",",
-        temp_file,
-        "xlsx",
+        writer,
     )
 
     # then
+    temp_file = writer.finish()
     wb_obj = openpyxl.load_workbook(temp_file)
 
     sheet_obj = wb_obj.active
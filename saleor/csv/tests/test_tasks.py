@@ -1,21 +1,26 @@
 import datetime
 from unittest.mock import ANY, MagicMock, Mock, patch
 
+import graphene
 import pytz
 from django.core.files import File
+from django.core.files.storage import default_storage
 from django.test import override_settings
 from django.utils import timezone
 from freezegun import freeze_time
 
 from ...core import JobStatus
+from ...graphql.csv.enums import ProductFieldEnum
 from .. import ExportEvents, FileTypes
 from ..models import ExportEvent, ExportFile
 from ..tasks import (
     ExportTask,
     delete_old_export_files,
     export_gift_cards_task,
+    export_products_shard_task,
     export_products_task,
 )
+from ..utils.export import get_export_shard_file_path
 
 
 @patch("saleor.csv.tasks.export_products")
@@ -58,6 +63,90 @@ def test_export_products_task_failed(
     send_export_failed_info_mock.assert_called_once_with(user_export_file, "products")
 
 
+@patch("saleor.csv.utils.export.send_export_download_link_notification")
+def test_export_products_task_in_shards(
+    send_notification_mock, product_list, user_export_file, media_root, settings
+):
+    # given
+    settings.EXPORT_PRODUCTS_SHARD_SIZE = 2
+    export_info = {"fields": [ProductFieldEnum.NAME.value]}
+
+    # when
+    export_products_task.delay(
+        user_export_file.id, {"all": ""}, export_info, FileTypes.CSV
+    )
+
+    # then
+    user_export_file.refresh_from_db()
+    assert user_export_file.status == JobStatus.SUCCESS
+    assert user_export_file.total_shards == 2
+    assert user_export_file.exported_shards == 2
+
+    file_content = user_export_file.content_file.read().decode().split("\r\n")
+    assert file_content[0] == "id,name"
+    assert file_content[1:-1] == [
+        f"{graphene.Node.to_global_id('Product', product.pk)},{product.name}"
+        for product in sorted(product_list, key=lambda product: product.pk)
+    ]
+    assert not default_storage.exists(
+        get_export_shard_file_path(user_export_file.pk, 0, FileTypes.CSV)
+    )
+    send_notification_mock.assert_called_once_with(user_export_file, "products")
+
+
+@patch("saleor.csv.tasks.send_export_failed_info")
+@patch("saleor.csv.tasks.export_products_shard")
+def test_export_products_task_in_shards_failed(
+    export_products_shard_mock,
+    send_export_failed_info_mock,
+    product_list,
+    user_export_file,
+    settings,
+):
+    # given
+    settings.EXPORT_PRODUCTS_SHARD_SIZE = 1
+    export_products_shard_mock.side_effect = Exception("Test error")
+
+    # when
+    export_products_task.delay(
+        user_export_file.id, {"all": ""}, {"fields": "name"}, FileTypes.CSV
+    )
+
+    # then
+    user_export_file.refresh_from_db()
+    assert user_export_file.status == JobStatus.FAILED
+    send_export_failed_info_mock.assert_called_once_with(user_export_file, "products")
+
+
+def test_export_products_shard_task_when_export_failed(
+    product_list, user_export_file, media_root
+):
+    # given
+    user_export_file.status = JobStatus.FAILED
+    user_export_file.total_shards = 1
+    user_export_file.save(update_fields=["status", "total_shards"])
+    pks = [product.pk for product in product_list]
+
+    # when
+    export_products_shard_task(
+        user_export_file.id,
+        {"all": ""},
+        {"fields": [ProductFieldEnum.NAME.value]},
+        FileTypes.CSV,
+        ",",
+        0,
+        min(pks),
+        max(pks),
+    )
+
+    # then
+    user_export_file.refresh_from_db()
+    assert user_export_file.exported_shards == 0
+    assert not default_storage.exists(
+        get_export_shard_file_path(user_export_file.pk, 0, FileTypes.CSV)
+    )
+
+
 @patch("saleor.csv.tasks.export_gift_cards")
 def test_export_gift_cards_task(export_gift_cards_mock, user_export_file):
     # given
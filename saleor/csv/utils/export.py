@@ -1,17 +1,26 @@
+import csv
+import io
+import shutil
 import uuid
+from collections.abc import Iterable
 from datetime import date, datetime
+from itertools import islice
 from tempfile import NamedTemporaryFile
 from typing import IO, TYPE_CHECKING, Any, Optional, Union
 
-import petl as etl
+import openpyxl
 from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db.models import F
 from django.utils import timezone
 
+from ...core import JobStatus
 from ...core.db.connection import allow_writer
 from ...discount.models import VoucherCode
 from ...giftcard.models import GiftCard
 from ...product.models import Product
 from .. import FileTypes
+from ..models import ExportFile
 from ..notifications import send_export_download_link_notification
 from .product_headers import get_product_export_fields_and_headers_info
 from .products_data import get_products_data
@@ -19,8 +28,6 @@ from .products_data import get_products_data
 if TYPE_CHECKING:
     from django.db.models import QuerySet
 
-    from ..models import ExportFile
-
 
 BATCH_SIZE = 10000
 
@@ -43,23 +50,148 @@ def export_products(
         data_headers,
     ) = get_product_export_fields_and_headers_info(export_info)
 
-    temporary_file = create_file_with_headers(file_headers, delimiter, file_type)
+    writer = create_file_with_headers(file_headers, delimiter, file_type)
 
     export_products_in_batches(
         queryset,
         export_info,
         set(export_fields),
         data_headers,
-        delimiter,
-        temporary_file,
-        file_type,
+        writer,
     )
 
+    temporary_file = writer.finish()
     save_csv_file_in_export_file(export_file, temporary_file, file_name)
     temporary_file.close()
     send_export_download_link_notification(export_file, "products")
 
 
+def get_product_pk_ranges(
+    scope: dict[str, Union[str, dict]], shard_size: int
+) -> list[tuple[int, int]]:
+    from ...graphql.product.filters import ProductFilter
+
+    queryset = get_queryset(Product, ProductFilter, scope)
+    return get_queryset_pk_ranges(queryset, shard_size)
+
+
+def get_queryset_pk_ranges(
+    queryset: "QuerySet", shard_size: int
+) -> list[tuple[int, int]]:
+    """Split a queryset into inclusive pk ranges of at most `shard_size` objects."""
+    pks = (
+        queryset.order_by("pk")
+        .values_list("pk", flat=True)
+        .iterator(chunk_size=BATCH_SIZE)
+    )
+    pk_ranges = []
+    while shard_pks := list(islice(pks, shard_size)):
+        pk_ranges.append((shard_pks[0], shard_pks[-1]))
+    return pk_ranges
+
+
+def get_export_shard_file_path(
+    export_file_id: int, shard_index: int, file_type: str
+) -> str:
+    return f"export_files/shards/{export_file_id}/{shard_index}.{file_type}"
+
+
+def export_products_shard(
+    export_file_id: int,
+    scope: dict[str, Union[str, dict]],
+    export_info: dict[str, list],
+    file_type: str,
+    delimiter: str,
+    shard_index: int,
+    start_pk: int,
+    end_pk: int,
+):
+    """Export the products from the given pk range to a shard file in the storage.
+
+    The shard file is written without headers; the shards are combined into
+    the final file by `merge_products_shards`. Nothing is left in the storage
+    when another shard of the export has already failed.
+    """
+    from ...graphql.product.filters import ProductFilter
+
+    if _is_export_failed(export_file_id):
+        return
+
+    queryset = get_queryset(Product, ProductFilter, scope).filter(
+        pk__range=(start_pk, end_pk)
+    )
+    (
+        export_fields,
+        _file_headers,
+        data_headers,
+    ) = get_product_export_fields_and_headers_info(export_info)
+
+    writer = ExportFileWriter(None, delimiter, file_type)
+    export_products_in_batches(
+        queryset,
+        export_info,
+        set(export_fields),
+        data_headers,
+        writer,
+    )
+
+    temporary_file = writer.finish()
+    path = get_export_shard_file_path(export_file_id, shard_index, file_type)
+    if default_storage.exists(path):
+        default_storage.delete(path)
+    default_storage.save(path, temporary_file)
+    temporary_file.close()
+
+    # The failed shard deletes the shard files after marking the export as failed,
+    # so the file saved after that is deleted here.
+    if _is_export_failed(export_file_id):
+        default_storage.delete(path)
+        return
+
+    with allow_writer():
+        ExportFile.objects.filter(pk=export_file_id).update(
+            exported_shards=F("exported_shards") + 1, updated_at=timezone.now()
+        )
+
+
+def _is_export_failed(export_file_id: int) -> bool:
+    with allow_writer():
+        return ExportFile.objects.filter(
+            pk=export_file_id, status=JobStatus.FAILED
+        ).exists()
+
+
+def merge_products_shards(
+    export_file: "ExportFile",
+    export_info: dict[str, list],
+    file_type: str,
+    delimiter: str = ",",
+):
+    file_name = get_filename("product", file_type)
+    _, file_headers, _ = get_product_export_fields_and_headers_info(export_info)
+
+    writer = create_file_with_headers(file_headers, delimiter, file_type)
+    try:
+        for shard_index in range(export_file.total_shards):
+            path = get_export_shard_file_path(export_file.pk, shard_index, file_type)
+            with default_storage.open(path, "rb") as shard_file:
+                writer.write_file(shard_file)
+    finally:
+        delete_export_shard_files(export_file, file_type)
+
+    temporary_file = writer.finish()
+    save_csv_file_in_export_file(export_file, temporary_file, file_name)
+    temporary_file.close()
+    send_export_download_link_notification(export_file, "products")
+
+
+def delete_export_shard_files(export_file: "ExportFile", file_type: str):
+    for shard_index in range(export_file.total_shards):
+        path = get_export_shard_file_path(export_file.pk, shard_index, file_type)
+        if default_storage.exists(path):
+            default_storage.delete(path)
+
+
 def export_gift_cards(
     export_file: "ExportFile",
     scope: dict[str, Union[str, dict]],
@@ -75,16 +207,15 @@ def export_gift_cards(
     queryset = queryset.filter(used_by_email__isnull=True)
 
     export_fields = ["code"]
-    temporary_file = create_file_with_headers(export_fields, delimiter, file_type)
+    writer = create_file_with_headers(export_fields, delimiter, file_type)
 
     export_gift_cards_in_batches(
         queryset,
         export_fields,
-        delimiter,
-        temporary_file,
-        file_type,
+        writer,
     )
 
+    temporary_file = writer.finish()
     save_csv_file_in_export_file(export_file, temporary_file, file_name)
     temporary_file.close()
     send_export_download_link_notification(export_file, "gift cards")
@@ -110,16 +241,15 @@ def export_voucher_codes(
         ).filter(id__in=ids)
 
     export_fields = ["code"]
-    temporary_file = create_file_with_headers(export_fields, delimiter, file_type)
+    writer = create_file_with_headers(export_fields, delimiter, file_type)
 
     export_voucher_codes_in_batches(
         qs,
         export_fields,
-        delimiter,
-        temporary_file,
-        file_type,
+        writer,
     )
 
+    temporary_file = writer.finish()
     save_csv_file_in_export_file(export_file, temporary_file, file_name)
     temporary_file.close()
     send_export_download_link_notification(export_file, "voucher codes")
@@ -175,17 +305,71 @@ def parse_input(data: Any) -> dict[str, Union[str, dict]]:
     return data
 
 
-def create_file_with_headers(file_headers: list[str], delimiter: str, file_type: str):
-    table = etl.wrap([file_headers])
+class ExportFileWriter:
+    """Stream export rows into a temporary file.
 
-    if file_type == FileTypes.CSV:
-        temp_file = NamedTemporaryFile("ab+", suffix=".csv")
-        etl.tocsv(table, temp_file.name, delimiter=delimiter)
-    else:
-        temp_file = NamedTemporaryFile("ab+", suffix=".xlsx")
-        etl.io.xlsx.toxlsx(table, temp_file.name)
+    The file stays open until `finish` is called, so every batch is appended
+    without re-reading the file. CSV rows are written with a single csv writer;
+    XLSX rows are written to an openpyxl write-only workbook, which keeps a
+    constant memory footprint and is saved once at the end.
+    """
 
-    return temp_file
+    def __init__(
+        self, file_headers: Optional[list[str]], delimiter: str, file_type: str
+    ):
+        self.file_type = file_type
+        self.temporary_file = NamedTemporaryFile("w+b", suffix=f".{file_type}")
+        if file_type == FileTypes.CSV:
+            self._text_file = io.TextIOWrapper(
+                self.temporary_file.file, encoding="utf-8", newline=""
+            )
+            self._csv_writer = csv.writer(self._text_file, delimiter=delimiter)
+        else:
+            self._workbook = openpyxl.Workbook(write_only=True)
+            self._worksheet = self._workbook.create_sheet()
+        if file_headers:
+            self._write_row(file_headers)
+
+    def write_rows(
+        self, export_data: Iterable[dict[str, Union[str, bool]]], headers: list[str]
+    ):
+        for data in export_data:
+            self._write_row([data.get(header, "") for header in headers])
+
+    def write_file(self, file: IO[bytes]):
+        """Append the rows of an export file written without headers."""
+        if self.file_type == FileTypes.CSV:
+            self._text_file.flush()
+            shutil.copyfileobj(file, self.temporary_file.file)
+        else:
+            workbook = openpyxl.load_workbook(file, read_only=True)
+            for row in workbook.active.iter_rows(values_only=True):
+                if any(value is not None for value in row):
+                    self._worksheet.append(row)
+            workbook.close()
+
+    def finish(self) -> IO[bytes]:
+        """Flush the written rows and return the file rewound to the beginning."""
+        if self.file_type == FileTypes.CSV:
+            self._text_file.flush()
+            self._text_file.detach()
+        else:
+            self._workbook.save(self.temporary_file)
+        self.temporary_file.flush()
+        self.temporary_file.seek(0)
+        return self.temporary_file
+
+    def _write_row(self, row: list):
+        if self.file_type == FileTypes.CSV:
+            self._csv_writer.writerow(row)
+        else:
+            self._worksheet.append(row)
+
+
+def create_file_with_headers(
+    file_headers: list[str], delimiter: str, file_type: str
+) -> ExportFileWriter:
+    return ExportFileWriter(file_headers, delimiter, file_type)
 
 
 def export_products_in_batches(
@@ -193,101 +377,55 @@ def export_products_in_batches(
     export_info: dict[str, list],
     export_fields: set[str],
     headers: list[str],
-    delimiter: str,
-    temporary_file: Any,
-    file_type: str,
+    writer: ExportFileWriter,
 ):
     warehouses = export_info.get("warehouses")
     attributes = export_info.get("attributes")
     channels = export_info.get("channels")
 
     for batch_pks in queryset_in_batches(queryset):
-        product_batch = (
-            Product.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
-            .filter(pk__in=batch_pks)
-            .prefetch_related(
-                "attributevalues",
-                "variants",
-                "collections",
-                "media",
-                "product_type",
-                "category",
-            )
-        )
+        product_batch = Product.objects.using(
+            settings.DATABASE_CONNECTION_REPLICA_NAME
+        ).filter(pk__in=batch_pks)
 
         export_data = get_products_data(
             product_batch, export_fields, attributes, warehouses, channels
         )
 
-        append_to_file(export_data, headers, temporary_file, file_type, delimiter)
+        writer.write_rows(export_data, headers)
 
 
 def export_gift_cards_in_batches(
     queryset: "QuerySet",
     export_fields: list[str],
-    delimiter: str,
-    temporary_file: Any,
-    file_type: str,
+    writer: ExportFileWriter,
 ):
-    for batch_pks in queryset_in_batches(queryset):
-        gift_card_batch = GiftCard.objects.using(
-            settings.DATABASE_CONNECTION_REPLICA_NAME
-        ).filter(pk__in=batch_pks)
-
-        export_data = list(gift_card_batch.values(*export_fields))
-
-        append_to_file(export_data, export_fields, temporary_file, file_type, delimiter)
+    export_data = queryset.order_by("pk").values(*export_fields)
+    writer.write_rows(export_data.iterator(chunk_size=BATCH_SIZE), export_fields)
 
 
 def export_voucher_codes_in_batches(
     queryset: "QuerySet",
     export_fields: list[str],
-    delimiter: str,
-    temporary_file: Any,
-    file_type: str,
+    writer: ExportFileWriter,
 ):
-    for batch_pks in queryset_in_batches(queryset):
-        voucher_codes_batch = VoucherCode.objects.using(
-            settings.DATABASE_CONNECTION_REPLICA_NAME
-        ).filter(pk__in=batch_pks)
-
-        export_data = list(voucher_codes_batch.values(*export_fields))
-
-        append_to_file(export_data, export_fields, temporary_file, file_type, delimiter)
+    export_data = queryset.order_by("pk").values(*export_fields)
+    writer.write_rows(export_data.iterator(chunk_size=BATCH_SIZE), export_fields)
 
 
 def queryset_in_batches(queryset):
-    """Slice a queryset into batches.
+    """Slice the pks of a queryset into batches.
 
-    Input queryset should be sorted be pk.
+    The pks are streamed with a single query, so the queryset filters are
+    evaluated once instead of once per batch.
     """
-    start_pk = 0
-
-    while True:
-        qs = queryset.order_by("pk").filter(pk__gt=start_pk)[:BATCH_SIZE]
-        pks = list(qs.values_list("pk", flat=True))
-
-        if not pks:
-            break
-
-        yield pks
-
-        start_pk = pks[-1]
-
-
-def append_to_file(
-    export_data: list[dict[str, Union[str, bool]]],
-    headers: list[str],
-    temporary_file: Any,
-    file_type: str,
-    delimiter: str,
-):
-    table = etl.fromdicts(export_data, header=headers, missing="")
-
-    if file_type == FileTypes.CSV:
-        etl.io.csv.appendcsv(table, temporary_file.name, delimiter=delimiter)
-    else:
-        etl.io.xlsx.appendxlsx(table, temporary_file.name)
+    pks = (
+        queryset.order_by("pk")
+        .values_list("pk", flat=True)
+        .iterator(chunk_size=BATCH_SIZE)
+    )
+    while batch_pks := list(islice(pks, BATCH_SIZE)):
+        yield batch_pks
 
 
 @allow_writer()
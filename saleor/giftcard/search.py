@@ -35,9 +35,13 @@ def prepare_gift_card_search_vector_value(
 
 
 def mark_gift_cards_search_index_as_dirty(gift_cards: Union[list[GiftCard], QuerySet]):
+    # Imported here, as the tasks module depends on this one.
+    from .tasks import schedule_gift_cards_search_vector_update
+
     for gift_card in gift_cards:
         gift_card.search_index_dirty = True
     GiftCard.objects.bulk_update(gift_cards, ["search_index_dirty"])
+    schedule_gift_cards_search_vector_update()
 
 
 def mark_gift_cards_search_index_as_dirty_by_users(users: list[User]):
@@ -4,6 +4,11 @@ from django.utils import timezone
 
 from ..celeryconf import app
 from ..core.db.connection import allow_writer
+from ..core.search_index import (
+    log_search_index_update,
+    pop_search_index_update_schedule,
+    schedule_search_index_update,
+)
 from .events import gift_cards_deactivated_event
 from .models import GiftCard
 from .search import update_gift_cards_search_vector
@@ -30,10 +35,31 @@ def deactivate_expired_cards_task():
     expires=settings.BEAT_UPDATE_SEARCH_EXPIRE_AFTER_SEC,
 )
 def update_gift_cards_search_vector_task():
+    scheduled_at = pop_search_index_update_schedule(
+        update_gift_cards_search_vector_task
+    )
     gift_cards = GiftCard.objects.using(
         settings.DATABASE_CONNECTION_REPLICA_NAME
     ).filter(search_index_dirty=True)
-    if not gift_cards:
-        return
     gift_cards_batch = list(gift_cards[:GIFT_CARD_BATCH_SIZE])
+    if not gift_cards_batch:
+        return
     update_gift_cards_search_vector(gift_cards_batch)
+
+    if settings.SEARCH_INDEX_UPDATE_DEBOUNCE_SEC:
+        log_search_index_update(
+            task_logger,
+            "gift cards",
+            len(gift_cards_batch),
+            gift_cards.count(),
+            scheduled_at,
+        )
+        if len(gift_cards_batch) == GIFT_CARD_BATCH_SIZE:
+            # Keep the debounce, so the replica catches up with the indexed batch
+            # before the remaining gift cards are read from it.
+            schedule_search_index_update(update_gift_cards_search_vector_task)
+
+
+def schedule_gift_cards_search_vector_update():
+    """Schedule indexing of the gift cards marked as dirty."""
+    schedule_search_index_update(update_gift_cards_search_vector_task)
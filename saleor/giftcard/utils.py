@@ -22,6 +22,7 @@ from ..site import GiftCardSettingsExpiryType
 from . import GiftCardEvents, GiftCardLineData, events
 from .models import GiftCard, GiftCardEvent
 from .notifications import send_gift_card_notification
+from .tasks import schedule_gift_cards_search_vector_update
 
 if TYPE_CHECKING:
     from django.db.models import QuerySet
@@ -194,6 +195,7 @@ def gift_cards_create(
             non_shippable_gift_cards.extend(line_gift_cards)
 
     gift_cards = GiftCard.objects.bulk_create(gift_cards)
+    schedule_gift_cards_search_vector_update()
     events.gift_cards_bought_event(gift_cards, order, requestor_user, app)
 
     for gift_card in gift_cards:
@@ -4,7 +4,6 @@ import graphql
 from django.urls import reverse
 from django.utils.functional import SimpleLazyObject
 from graphql import (
-    GraphQLCachedBackend,
     GraphQLCoreBackend,
     GraphQLScalarType,
     GraphQLSchema,
@@ -15,7 +14,6 @@ from graphql import (
 from graphql.backend.base import GraphQLDocument
 from graphql.execution import ExecutionResult
 
-from ..core.utils.cache import CacheDict
 from ..graphql.notifications.schema import ExternalNotificationMutations
 from .account.schema import AccountMutations, AccountQueries
 from .app.schema import AppMutations, AppQueries
@@ -27,6 +25,7 @@ from .core.federation.schema import build_federated_schema
 from .core.schema import CoreMutations, CoreQueries
 from .csv.schema import CsvMutations, CsvQueries
 from .discount.schema import DiscountMutations, DiscountQueries
+from .document_cache import get_document_cache_backend
 from .giftcard.schema import GiftCardMutations, GiftCardQueries
 from .invoice.schema import InvoiceMutations
 from .menu.schema import MenuMutations, MenuQueries
@@ -194,8 +193,24 @@ class SaleorGraphQLBackend(GraphQLCoreBackend):
         document_string: str,  # type: ignore[override]
     ) -> GraphQLDocument:
         # validate eagerly so we can cache the result
+        document_ast, validation_errors = self.parse_and_validate(
+            schema, document_string
+        )
+        return self.document_from_ast(
+            schema, document_string, document_ast, validation_errors
+        )
+
+    def parse_and_validate(self, schema: GraphQLSchema, document_string: str):
         document_ast = parse(document_string)
-        validation_errors = validate(schema, document_ast)
+        return document_ast, validate(schema, document_ast)
+
+    def document_from_ast(
+        self,
+        schema: GraphQLSchema,
+        document_string: str,
+        document_ast,
+        validation_errors,
+    ) -> GraphQLDocument:
         if validation_errors:
             return GraphQLDocument(
                 schema=schema,
@@ -212,4 +227,4 @@ class SaleorGraphQLBackend(GraphQLCoreBackend):
         )
 
 
-backend = GraphQLCachedBackend(SaleorGraphQLBackend(), cache_map=CacheDict(1000))
+backend = get_document_cache_backend(SaleorGraphQLBackend())
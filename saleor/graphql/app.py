@@ -0,0 +1,29 @@
+from django.apps import AppConfig, apps
+from django.db.models.signals import post_delete, post_save
+
+
+class GraphQLAppConfig(AppConfig):
+    name = "saleor.graphql"
+
+    def ready(self):
+        from .core.dataloader_cache import (
+            DATALOADER_CACHES,
+            invalidate_dataloader_cache_handler,
+        )
+
+        model_labels = {
+            label for _, labels in DATALOADER_CACHES.values() for label in labels
+        }
+        for label in model_labels:
+            sender = apps.get_model(label)
+            name = sender.__name__.lower()
+            post_save.connect(
+                invalidate_dataloader_cache_handler,
+                sender=sender,
+                dispatch_uid=f"invalidate_dataloader_cache_on_{name}_save",
+            )
+            post_delete.connect(
+                invalidate_dataloader_cache_handler,
+                sender=sender,
+                dispatch_uid=f"invalidate_dataloader_cache_on_{name}_delete",
+            )
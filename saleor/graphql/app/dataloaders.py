@@ -1,8 +1,12 @@
+import logging
 from collections import defaultdict
 from functools import partial, wraps
 from typing import Optional
 
+from django.conf import settings
 from django.contrib.auth.hashers import check_password
+from django.core.cache import cache
+from django.utils.crypto import salted_hmac
 from django.utils.functional import LazyObject
 from promise import Promise
 
@@ -12,6 +16,10 @@ from ...core.utils.lazyobjects import unwrap_lazy
 from ..core import SaleorContext
 from ..core.dataloaders import BaseThumbnailBySizeAndFormatLoader, DataLoader
 
+logger = logging.getLogger(__name__)
+
+APP_TOKEN_CACHE_KEY_PREFIX = "app-token"
+
 
 class AppByIdLoader(DataLoader):
     context_key = "app_by_id"
@@ -76,24 +84,77 @@ class AppTokensByAppIdLoader(DataLoader):
         return [tokens_by_app_map.get(app_id, []) for app_id in keys]
 
 
+def get_app_token_cache_key(raw_token: str) -> str:
+    token_hash = salted_hmac(
+        APP_TOKEN_CACHE_KEY_PREFIX, raw_token, algorithm="sha256"
+    ).hexdigest()
+    return f"{APP_TOKEN_CACHE_KEY_PREFIX}-{token_hash}"
+
+
+def get_verified_app_tokens(raw_tokens) -> dict[str, int]:
+    """Return the IDs of the tokens verified recently, by the raw token."""
+    if not settings.APP_TOKEN_CACHE_TIMEOUT:
+        return {}
+    keys = {get_app_token_cache_key(raw_token): raw_token for raw_token in raw_tokens}
+    try:
+        token_ids = cache.get_many(keys.keys())
+    except Exception:
+        logger.warning("Unable to fetch verified app tokens.", exc_info=True)
+        return {}
+    return {keys[key]: token_id for key, token_id in token_ids.items()}
+
+
+def cache_verified_app_tokens(token_ids: dict[str, int]):
+    if not settings.APP_TOKEN_CACHE_TIMEOUT or not token_ids:
+        return
+    try:
+        cache.set_many(
+            {
+                get_app_token_cache_key(raw_token): token_id
+                for raw_token, token_id in token_ids.items()
+            },
+            timeout=settings.APP_TOKEN_CACHE_TIMEOUT,
+        )
+    except Exception:
+        logger.warning("Unable to cache verified app tokens.", exc_info=True)
+
+
 class AppByTokenLoader(DataLoader):
     context_key = "app_by_token"
 
     def batch_load(self, keys):
+        authed_apps = {}
+        # Tokens verified by recent requests skip the password hashing; the cached
+        # token IDs are looked up again, so deleted tokens stop working immediately.
+        verified_token_ids = get_verified_app_tokens(keys)
+        if verified_token_ids:
+            app_id_by_token_id = dict(
+                AppToken.objects.using(self.database_connection_name)
+                .filter(id__in=verified_token_ids.values())
+                .values_list("id", "app_id")
+            )
+            for raw_token, token_id in verified_token_ids.items():
+                if token_id in app_id_by_token_id:
+                    authed_apps[raw_token] = app_id_by_token_id[token_id]
+
         last_4s_to_raw_token_map = defaultdict(list)
         for raw_token in keys:
-            last_4s_to_raw_token_map[raw_token[-4:]].append(raw_token)
-
-        tokens = (
-            AppToken.objects.using(self.database_connection_name)
-            .filter(token_last_4__in=last_4s_to_raw_token_map.keys())
-            .values_list("auth_token", "token_last_4", "app_id")
-        )
-        authed_apps = {}
-        for auth_token, token_last_4, app_id in tokens:
-            for raw_token in last_4s_to_raw_token_map[token_last_4]:
-                if check_password(raw_token, auth_token):
-                    authed_apps[raw_token] = app_id
+            if raw_token not in authed_apps:
+                last_4s_to_raw_token_map[raw_token[-4:]].append(raw_token)
+
+        if last_4s_to_raw_token_map:
+            tokens = (
+                AppToken.objects.using(self.database_connection_name)
+                .filter(token_last_4__in=last_4s_to_raw_token_map.keys())
+                .values_list("id", "auth_token", "token_last_4", "app_id")
+            )
+            newly_verified_token_ids = {}
+            for token_id, auth_token, token_last_4, app_id in tokens:
+                for raw_token in last_4s_to_raw_token_map[token_last_4]:
+                    if check_password(raw_token, auth_token):
+                        authed_apps[raw_token] = app_id
+                        newly_verified_token_ids[raw_token] = token_id
+            cache_verified_app_tokens(newly_verified_token_ids)
 
         apps = (
             App.objects.using(self.database_connection_name)
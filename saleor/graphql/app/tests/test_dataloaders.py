@@ -0,0 +1,63 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+
+from ....app.models import AppToken
+from ..dataloaders import AppByTokenLoader
+
+
+def _get_context(rf):
+    context = rf.request()
+    context.dataloaders = {}
+    return context
+
+
+def _load_app(rf, raw_token):
+    return AppByTokenLoader(_get_context(rf)).load(raw_token).get()
+
+
+def test_app_by_token_loader_skips_hashing_of_verified_token(app, rf, settings):
+    # given
+    settings.APP_TOKEN_CACHE_TIMEOUT = 60
+    cache.clear()
+    _, raw_token = AppToken.objects.create_with_token(app=app)
+    assert _load_app(rf, raw_token) == app
+
+    # when
+    with patch(
+        "saleor.graphql.app.dataloaders.check_password"
+    ) as mocked_check_password:
+        loaded_app = _load_app(rf, raw_token)
+
+    # then
+    mocked_check_password.assert_not_called()
+    assert loaded_app == app
+
+
+def test_app_by_token_loader_rejects_deleted_verified_token(app, rf, settings):
+    # given
+    settings.APP_TOKEN_CACHE_TIMEOUT = 60
+    cache.clear()
+    app_token, raw_token = AppToken.objects.create_with_token(app=app)
+    assert _load_app(rf, raw_token) == app
+
+    # when
+    app_token.delete()
+
+    # then
+    assert _load_app(rf, raw_token) is None
+
+
+def test_app_by_token_loader_rejects_deactivated_app(app, rf, settings):
+    # given
+    settings.APP_TOKEN_CACHE_TIMEOUT = 60
+    cache.clear()
+    _, raw_token = AppToken.objects.create_with_token(app=app)
+    assert _load_app(rf, raw_token) == app
+
+    # when
+    app.is_active = False
+    app.save(update_fields=["is_active"])
+
+    # then
+    assert _load_app(rf, raw_token) is None
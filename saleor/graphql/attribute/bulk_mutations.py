@@ -4,6 +4,7 @@ from django.db.models import Exists, OuterRef, Q
 from ...attribute import models
 from ...permission.enums import PageTypePermissions
 from ...product import models as product_models
+from ...product.tasks import schedule_products_search_vector_update
 from ...webhook.event_types import WebhookEventAsyncType
 from ...webhook.utils import get_webhooks_for_event
 from ..core import ResolveInfo
@@ -47,6 +48,7 @@ class AttributeBulkDelete(ModelBulkDeleteMutation):
         product_models.Product.objects.filter(id__in=product_ids).update(
             search_index_dirty=True
         )
+        schedule_products_search_vector_update()
         return response
 
     @classmethod
@@ -121,6 +123,7 @@ class AttributeValueBulkDelete(ModelBulkDeleteMutation):
         product_models.Product.objects.filter(id__in=product_ids).update(
             search_index_dirty=True
         )
+        schedule_products_search_vector_update()
         return response
 
     @classmethod
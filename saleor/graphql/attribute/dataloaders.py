@@ -6,6 +6,7 @@ from ..core.dataloaders import DataLoader
 
 class AttributeValuesByAttributeIdLoader(DataLoader):
     context_key = "attributevalues_by_attribute"
+    cache_name = "attribute"
 
     def batch_load(self, keys):
         attribute_values = AttributeValue.objects.using(
@@ -21,6 +22,7 @@ class AttributeValuesByAttributeIdLoader(DataLoader):
 
 class AttributesByAttributeId(DataLoader):
     context_key = "attributes_by_id"
+    cache_name = "attribute"
 
     def batch_load(self, keys):
         attributes = Attribute.objects.using(self.database_connection_name).in_bulk(
@@ -4,6 +4,7 @@ from django.db.models import Exists, OuterRef, Q
 from ....attribute import models as models
 from ....permission.enums import ProductTypePermissions
 from ....product import models as product_models
+from ....product.tasks import schedule_products_search_vector_update
 from ....webhook.event_types import WebhookEventAsyncType
 from ...core import ResolveInfo
 from ...core.descriptions import ADDED_IN_310
@@ -54,6 +55,7 @@ class AttributeValueDelete(ModelDeleteMutation, ModelWithExtRefMutation):
         product_models.Product.objects.filter(id__in=product_ids).update(
             search_index_dirty=True
         )
+        schedule_products_search_vector_update()
         manager = get_plugin_manager_promise(info.context).get()
         cls.call_event(manager.attribute_value_deleted, instance)
         cls.call_event(manager.attribute_updated, instance.attribute)
@@ -5,6 +5,7 @@ from django.db.models import Exists, OuterRef, Q
 from ....attribute import models as models
 from ....permission.enums import ProductTypePermissions
 from ....product import models as product_models
+from ....product.tasks import schedule_products_search_vector_update
 from ....webhook.event_types import WebhookEventAsyncType
 from ...core import ResolveInfo
 from ...core.descriptions import ADDED_IN_310
@@ -121,6 +122,7 @@ class AttributeValueUpdate(AttributeValueCreate, ModelWithExtRefMutation):
                 product_models.Product.objects.filter(pk__in=batch_pks).update(
                     search_index_dirty=True
                 )
+            schedule_products_search_vector_update()
 
         manager = get_plugin_manager_promise(info.context).get()
         cls.call_event(manager.attribute_value_updated, instance)
@@ -6,6 +6,7 @@ from django.core.exceptions import ValidationError
 from ....channel.error_codes import ChannelErrorCode
 from ....core.tracing import traced_atomic_transaction
 from ....permission.enums import ChannelPermissions
+from ....warehouse.routing import invalidate_warehouse_routing
 from ...core import ResolveInfo
 from ...core.descriptions import ADDED_IN_37
 from ...core.doc_category import DOC_CATEGORY_CHANNELS
@@ -54,6 +55,7 @@ class ChannelReorderWarehouses(BaseMutation):
 
         with traced_atomic_transaction():
             perform_reordering(warehouses_m2m, operations)
+            invalidate_warehouse_routing()
 
         return ChannelReorderWarehouses(channel=channel)
 
@@ -1,6 +1,7 @@
 import graphene
 from django.core.exceptions import ValidationError
 
+from ....checkout import CheckoutPriceChange
 from ....checkout.actions import call_checkout_event_for_checkout_info
 from ....checkout.error_codes import CheckoutErrorCode
 from ....checkout.fetch import (
@@ -120,6 +121,7 @@ class CheckoutAddPromoCode(BaseMutation):
             manager,
             recalculate_discount=False,
             save=True,
+            changes=[CheckoutPriceChange.VOUCHER],
         )
         call_checkout_event_for_checkout_info(
             manager=manager,
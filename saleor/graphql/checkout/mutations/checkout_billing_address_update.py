@@ -1,6 +1,6 @@
 import graphene
 
-from ....checkout import AddressType
+from ....checkout import AddressType, CheckoutPriceChange
 from ....checkout.actions import call_checkout_event_for_checkout_info
 from ....checkout.fetch import fetch_checkout_info, fetch_checkout_lines
 from ....checkout.utils import change_billing_address_in_checkout, invalidate_checkout
@@ -102,6 +102,7 @@ class CheckoutBillingAddressUpdate(CheckoutShippingAddressUpdate):
                 manager,
                 recalculate_discount=False,
                 save=False,
+                changes=[CheckoutPriceChange.BILLING_ADDRESS],
             )
             checkout.save(
                 update_fields=change_address_updated_fields
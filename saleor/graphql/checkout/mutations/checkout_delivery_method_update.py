@@ -4,6 +4,7 @@ from typing import Optional
 import graphene
 from django.core.exceptions import ValidationError
 
+from ....checkout import CheckoutPriceChange
 from ....checkout.actions import call_checkout_event_for_checkout_info
 from ....checkout.error_codes import CheckoutErrorCode
 from ....checkout.fetch import (
@@ -264,7 +265,14 @@ class CheckoutDeliveryMethodUpdate(BaseMutation):
             checkout_info.shipping_address = checkout.shipping_address
             checkout_fields_to_update += ["shipping_address"]
         invalidate_prices_updated_fields = invalidate_checkout(
-            checkout_info, lines, manager, save=False
+            checkout_info,
+            lines,
+            manager,
+            save=False,
+            changes=[
+                CheckoutPriceChange.DELIVERY_METHOD,
+                CheckoutPriceChange.SHIPPING_ADDRESS,
+            ],
         )
         checkout.save(
             update_fields=checkout_fields_to_update + invalidate_prices_updated_fields
@@ -1,5 +1,6 @@
 import graphene
 
+from ....checkout import CheckoutPriceChange
 from ....checkout.actions import call_checkout_event_for_checkout_info
 from ....checkout.error_codes import CheckoutErrorCode
 from ....checkout.fetch import fetch_checkout_info, fetch_checkout_lines
@@ -81,7 +82,13 @@ class CheckoutLineDelete(BaseMutation):
         lines, _ = fetch_checkout_lines(checkout)
         checkout_info = fetch_checkout_info(checkout, lines, manager)
         update_checkout_shipping_method_if_invalid(checkout_info, lines)
-        invalidate_checkout(checkout_info, lines, manager, save=True)
+        invalidate_checkout(
+            checkout_info,
+            lines,
+            manager,
+            save=True,
+            changes=[CheckoutPriceChange.LINES],
+        )
         call_checkout_event_for_checkout_info(
             manager,
             event_func=manager.checkout_updated,
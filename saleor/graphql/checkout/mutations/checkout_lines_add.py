@@ -1,5 +1,6 @@
 import graphene
 
+from ....checkout import CheckoutPriceChange
 from ....checkout.actions import call_checkout_event_for_checkout_info
 from ....checkout.error_codes import CheckoutErrorCode
 from ....checkout.fetch import (
@@ -215,7 +216,19 @@ class CheckoutLinesAdd(BaseMutation):
 
         update_checkout_external_shipping_method_if_invalid(checkout_info, lines)
         update_checkout_shipping_method_if_invalid(checkout_info, lines)
-        invalidate_checkout(checkout_info, lines, manager, save=True)
+        variant_ids = {variant.id for variant in variants}
+        invalidate_checkout(
+            checkout_info,
+            lines,
+            manager,
+            save=True,
+            changes=[CheckoutPriceChange.LINES],
+            changed_lines=[
+                line_info.line
+                for line_info in lines
+                if line_info.line.variant_id in variant_ids
+            ],
+        )
         call_checkout_event_for_checkout_info(
             manager,
             event_func=manager.checkout_updated,
@@ -1,6 +1,7 @@
 import graphene
 from django.core.exceptions import ValidationError
 
+from ....checkout import CheckoutPriceChange
 from ....checkout.actions import call_checkout_event_for_checkout_info
 from ....checkout.error_codes import CheckoutErrorCode
 from ....checkout.fetch import fetch_checkout_info, fetch_checkout_lines
@@ -100,7 +101,13 @@ class CheckoutLinesDelete(BaseMutation):
         manager = get_plugin_manager_promise(info.context).get()
         checkout_info = fetch_checkout_info(checkout, lines, manager)
         update_checkout_shipping_method_if_invalid(checkout_info, lines)
-        invalidate_checkout(checkout_info, lines, manager, save=True)
+        invalidate_checkout(
+            checkout_info,
+            lines,
+            manager,
+            save=True,
+            changes=[CheckoutPriceChange.LINES],
+        )
         call_checkout_event_for_checkout_info(
             manager,
             event_func=manager.checkout_updated,
@@ -4,7 +4,7 @@ import graphene
 from django.core.exceptions import ValidationError
 from graphql.error import GraphQLError
 
-from ....checkout import models
+from ....checkout import CheckoutPriceChange, models
 from ....checkout.actions import call_checkout_event_for_checkout_info
 from ....checkout.error_codes import CheckoutErrorCode
 from ....checkout.fetch import fetch_checkout_info, fetch_checkout_lines
@@ -108,6 +108,7 @@ class CheckoutRemovePromoCode(BaseMutation):
             manager,
             recalculate_discount=True,
             save=True,
+            changes=[CheckoutPriceChange.VOUCHER],
         )
         call_checkout_event_for_checkout_info(
             manager,
@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING
 import graphene
 from django.core.exceptions import ValidationError
 
-from ....checkout import AddressType, models
+from ....checkout import AddressType, CheckoutPriceChange, models
 from ....checkout.actions import call_checkout_event_for_checkout_info
 from ....checkout.error_codes import CheckoutErrorCode
 from ....checkout.fetch import (
@@ -209,7 +209,11 @@ class CheckoutShippingAddressUpdate(AddressMetadataMixin, BaseMutation, I18nMixi
                 shipping_channel_listings,
             )
         invalidate_prices_updated_fields = invalidate_checkout(
-            checkout_info, lines, manager, save=False
+            checkout_info,
+            lines,
+            manager,
+            save=False,
+            changes=[CheckoutPriceChange.SHIPPING_ADDRESS],
         )
         checkout.save(
             update_fields=shipping_address_updated_fields
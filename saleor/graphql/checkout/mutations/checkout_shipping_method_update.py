@@ -3,6 +3,7 @@ from typing import Optional
 import graphene
 from django.core.exceptions import ValidationError
 
+from ....checkout import CheckoutPriceChange
 from ....checkout.actions import call_checkout_event_for_checkout_info
 from ....checkout.error_codes import CheckoutErrorCode
 from ....checkout.fetch import fetch_checkout_info, fetch_checkout_lines
@@ -214,7 +215,11 @@ class CheckoutShippingMethodUpdate(BaseMutation):
         delete_external_shipping_id(checkout=checkout)
         checkout.shipping_method = shipping_method
         invalidate_prices_updated_fields = invalidate_checkout(
-            checkout_info, lines, manager, save=False
+            checkout_info,
+            lines,
+            manager,
+            save=False,
+            changes=[CheckoutPriceChange.DELIVERY_METHOD],
         )
         checkout.save(
             update_fields=[
@@ -256,7 +261,11 @@ class CheckoutShippingMethodUpdate(BaseMutation):
         set_external_shipping_id(checkout=checkout, app_shipping_id=delivery_method.id)
         checkout.shipping_method = None
         invalidate_prices_updated_fields = invalidate_checkout(
-            checkout_info, lines, manager, save=False
+            checkout_info,
+            lines,
+            manager,
+            save=False,
+            changes=[CheckoutPriceChange.DELIVERY_METHOD],
         )
         checkout.save(
             update_fields=[
@@ -280,7 +289,11 @@ class CheckoutShippingMethodUpdate(BaseMutation):
         checkout.shipping_method = None
         delete_external_shipping_id(checkout=checkout)
         invalidate_prices_updated_fields = invalidate_checkout(
-            checkout_info, lines, manager, save=False
+            checkout_info,
+            lines,
+            manager,
+            save=False,
+            changes=[CheckoutPriceChange.DELIVERY_METHOD],
         )
         checkout.save(
             update_fields=[
@@ -6,10 +6,6 @@ from promise import Promise
 
 from ...account.models import User
 from ...checkout import calculations, models, problems
-from ...checkout.base_calculations import (
-    calculate_undiscounted_base_line_total_price,
-    calculate_undiscounted_base_line_unit_price,
-)
 from ...checkout.calculations import fetch_checkout_data
 from ...checkout.utils import get_valid_collection_points_for_checkout
 from ...core.db.connection import allow_writer_in_context
@@ -293,16 +289,14 @@ class CheckoutLine(ModelObjectType[models.CheckoutLine]):
             def calculate_line_unit_price(data):
                 checkout_info, lines = data
                 database_connection_name = get_database_connection_name(info.context)
-                for line_info in lines:
-                    if line_info.line.pk == root.pk:
-                        return calculations.checkout_line_unit_price(
-                            manager=manager,
-                            checkout_info=checkout_info,
-                            lines=lines,
-                            checkout_line_info=line_info,
-                            database_connection_name=database_connection_name,
-                        )
-                return None
+                line_prices = calculations.checkout_line_prices(
+                    manager=manager,
+                    checkout_info=checkout_info,
+                    lines=lines,
+                    line_id=root.pk,
+                    database_connection_name=database_connection_name,
+                )
+                return line_prices.unit_price if line_prices else None
 
             return Promise.all(
                 [
@@ -333,13 +327,10 @@ class CheckoutLine(ModelObjectType[models.CheckoutLine]):
                     checkout_info,
                     lines,
                 ) = data
-                for line_info in lines:
-                    if line_info.line.pk == root.pk:
-                        return calculate_undiscounted_base_line_unit_price(
-                            line_info, checkout_info.channel
-                        )
-
-                return None
+                line_prices = calculations.get_checkout_line_prices(
+                    checkout_info, lines, root.pk
+                )
+                return line_prices.undiscounted_unit_price if line_prices else None
 
             return Promise.all(
                 [
@@ -371,16 +362,14 @@ class CheckoutLine(ModelObjectType[models.CheckoutLine]):
             def calculate_line_total_price(data):
                 (checkout_info, lines) = data
                 database_connection_name = get_database_connection_name(info.context)
-                for line_info in lines:
-                    if line_info.line.pk == root.pk:
-                        return calculations.checkout_line_total(
-                            manager=manager,
-                            checkout_info=checkout_info,
-                            lines=lines,
-                            checkout_line_info=line_info,
-                            database_connection_name=database_connection_name,
-                        )
-                return None
+                line_prices = calculations.checkout_line_prices(
+                    manager=manager,
+                    checkout_info=checkout_info,
+                    lines=lines,
+                    line_id=root.pk,
+                    database_connection_name=database_connection_name,
+                )
+                return line_prices.total_price if line_prices else None
 
             return Promise.all([checkout_info, lines]).then(calculate_line_total_price)
 
@@ -406,12 +395,10 @@ class CheckoutLine(ModelObjectType[models.CheckoutLine]):
                     checkout_info,
                     lines,
                 ) = data
-                for line_info in lines:
-                    if line_info.line.pk == root.pk:
-                        return calculate_undiscounted_base_line_total_price(
-                            line_info, checkout_info.channel
-                        )
-                return None
+                line_prices = calculations.get_checkout_line_prices(
+                    checkout_info, lines, root.pk
+                )
+                return line_prices.undiscounted_total_price if line_prices else None
 
             return Promise.all(
                 [
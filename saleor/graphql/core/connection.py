@@ -10,7 +10,9 @@ from typing import (
 )
 
 import graphene
+import opentracing
 from django.conf import settings
+from django.db import connections
 from django.db.models import Model as DjangoModel
 from django.db.models import Q, QuerySet
 from graphene.relay import Connection
@@ -245,6 +247,49 @@ def _get_edges_for_connection(edge_type, qs, args, sorting_fields):
     return edges, page_info
 
 
+class TotalCountMode:
+    """Strategies of computing `totalCount` of a connection.
+
+    `EXACT` counts all matching rows. `ESTIMATED` counts rows exactly up to
+    `GRAPHQL_TOTAL_COUNT_EXACT_LIMIT` and above that uses the row estimate from
+    the PostgreSQL query planner, avoiding full scans of large tables. It falls
+    back to `EXACT` unless the limit is set.
+    """
+
+    EXACT = "exact"
+    ESTIMATED = "estimated"
+
+
+def _get_planner_row_estimate(qs: QuerySet) -> Optional[int]:
+    sql, params = qs.query.sql_with_params()
+    with connections[qs.db].cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    try:
+        return int(plan[0]["Plan"]["Plan Rows"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+def get_total_count(qs: QuerySet, mode: str = TotalCountMode.EXACT) -> tuple[int, str]:
+    """Return the number of rows in the queryset and the mode used to compute it."""
+    exact_limit = settings.GRAPHQL_TOTAL_COUNT_EXACT_LIMIT
+    if mode == TotalCountMode.EXACT or not exact_limit:
+        return qs.count(), TotalCountMode.EXACT
+
+    # Counting a limited subquery stops scanning after exceeding the limit.
+    count = qs[: exact_limit + 1].count()
+    if count <= exact_limit:
+        return count, TotalCountMode.EXACT
+
+    estimate = _get_planner_row_estimate(qs)
+    if estimate is None:
+        return qs.count(), TotalCountMode.EXACT
+    return max(estimate, count), TotalCountMode.ESTIMATED
+
+
 def _get_id_coercion(qs: QuerySet) -> Callable[[str], Any]:
     return qs.model.id.field.to_python if hasattr(qs.model, "id") else int
 
@@ -255,6 +300,7 @@ def connection_from_queryset_slice(
     connection_type: Any = Connection,
     edge_type: Any = Edge,
     pageinfo_type: Any = PageInfo,
+    total_count_mode: str = TotalCountMode.EXACT,
 ) -> Connection:
     """Create a connection object from a QuerySet."""
     args = args or {}
@@ -298,15 +344,19 @@ def connection_from_queryset_slice(
     )
 
     if "total_count" in connection_type._meta.fields:
+        connection = connection_type(edges=edges, page_info=pageinfo_type(**page_info))
 
-        def get_total_count():
-            return qs.count()
+        def resolve_total_count():
+            with opentracing.global_tracer().start_active_span(
+                "connection.total_count"
+            ) as scope:
+                total_count, mode = get_total_count(qs, total_count_mode)
+                scope.span.set_tag("graphql.total_count_mode", mode)
+            connection.total_count_mode = mode
+            return total_count
 
-        return connection_type(
-            edges=edges,
-            page_info=pageinfo_type(**page_info),
-            total_count=get_total_count,
-        )
+        connection.total_count = resolve_total_count
+        return connection
 
     return connection_type(
         edges=edges,
@@ -322,6 +372,7 @@ def create_connection_slice(
     edge_type=None,
     pageinfo_type=graphene.relay.PageInfo,
     max_limit: Optional[int] = None,
+    total_count_mode: str = TotalCountMode.EXACT,
 ):
     _validate_slice_args(info, args, max_limit)
 
@@ -354,6 +405,7 @@ def create_connection_slice(
             connection_type,
             edge_type or connection_type.Edge,
             pageinfo_type or graphene.relay.PageInfo,
+            total_count_mode,
         )
 
     if isinstance(iterable, ChannelQsContext):
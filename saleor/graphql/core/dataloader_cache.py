@@ -0,0 +1,191 @@
+import hashlib
+import logging
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from typing import Any, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+DATALOADER_CACHE_KEY_PREFIX = "dataloader"
+
+# Caches shared by data loaders of slow-changing objects, with the timeout of the
+# cached values and the models invalidating them on save and delete. Queryset updates
+# and bulk creates don't send signals, so the timeout bounds the staleness of values
+# changed that way.
+DATALOADER_CACHES: dict[str, tuple[int, tuple[str, ...]]] = {
+    "attribute": (300, ("attribute.Attribute", "attribute.AttributeValue")),
+    "category": (300, ("product.Category",)),
+    "channel": (300, ("channel.Channel",)),
+    "menu": (300, ("menu.Menu", "menu.MenuItem")),
+    "translation": (
+        300,
+        (
+            "attribute.AttributeTranslation",
+            "attribute.AttributeValueTranslation",
+            "discount.PromotionRuleTranslation",
+            "discount.PromotionTranslation",
+            "discount.VoucherTranslation",
+            "menu.MenuItemTranslation",
+            "page.PageTranslation",
+            "product.CategoryTranslation",
+            "product.CollectionTranslation",
+            "product.ProductTranslation",
+            "product.ProductVariantTranslation",
+            "shipping.ShippingMethodTranslation",
+            "site.SiteSettingsTranslation",
+        ),
+    ),
+    "warehouse": (300, ("warehouse.Warehouse",)),
+}
+
+
+class DataLoaderCache:
+    """Values loaded by a data loader, shared between requests.
+
+    Values are stored pickled, so every request gets its own copy, in a per-process
+    LRU cache and in the Django cache. Both are keyed by a version stored in the
+    cache, bumped by `invalidate`; the version is checked at most once per
+    `DATALOADER_CACHE_VERSION_CHECK_INTERVAL` seconds.
+    """
+
+    def __init__(self, name: str, timeout: int):
+        self.name = name
+        self.timeout = timeout
+        self.version_key = f"{DATALOADER_CACHE_KEY_PREFIX}-{name}-version"
+        self.version: Optional[int] = None
+        self.checked_at = 0.0
+        self.entries: OrderedDict[Any, tuple[float, bytes]] = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get_many(self, keys: Iterable[Any]) -> dict[Any, Any]:
+        """Return the cached values of the given keys; missing keys are skipped."""
+        version = self._get_version()
+        if version < 0:
+            return {}
+        now = time.monotonic()
+        found: dict[Any, bytes] = {}
+        missing = []
+        with self.lock:
+            for key in keys:
+                entry = self.entries.get(key)
+                if entry and entry[0] > now:
+                    self.entries.move_to_end(key)
+                    found[key] = entry[1]
+                else:
+                    missing.append(key)
+
+        if missing:
+            cache_keys = {self._get_cache_key(version, key): key for key in missing}
+            try:
+                cached = cache.get_many(cache_keys.keys())
+            except Exception:
+                logger.warning(
+                    "Unable to fetch cached data loader values.", exc_info=True
+                )
+                cached = {}
+            fetched = {
+                cache_keys[cache_key]: value for cache_key, value in cached.items()
+            }
+            self._store_locally(version, fetched)
+            found.update(fetched)
+        return {key: pickle.loads(value) for key, value in found.items()}
+
+    def set_many(self, values: dict[Any, Any]):
+        version = self._get_version()
+        if version < 0:
+            return
+        pickled = {key: pickle.dumps(value) for key, value in values.items()}
+        self._store_locally(version, pickled)
+        try:
+            cache.set_many(
+                {
+                    self._get_cache_key(version, key): value
+                    for key, value in pickled.items()
+                },
+                timeout=self.timeout,
+            )
+        except Exception:
+            logger.warning("Unable to cache data loader values.", exc_info=True)
+
+    def clear(self):
+        with self.lock:
+            self.version = None
+            self.entries = OrderedDict()
+
+    def invalidate(self):
+        """Drop the cached values in all processes.
+
+        The version is bumped after the transaction is committed, so other processes
+        can't store the old values under the new version.
+        """
+        self.clear()
+        transaction.on_commit(self._bump_version)
+
+    def _bump_version(self):
+        try:
+            cache.incr(self.version_key)
+        except ValueError:
+            cache.set(self.version_key, 1, timeout=None)
+        except Exception:
+            logger.warning("Unable to invalidate data loader cache.", exc_info=True)
+
+    def _get_version(self) -> int:
+        now = time.monotonic()
+        check_interval = settings.DATALOADER_CACHE_VERSION_CHECK_INTERVAL
+        with self.lock:
+            if self.version is not None and now - self.checked_at < check_interval:
+                return self.version
+        try:
+            version = cache.get(self.version_key, 0)
+        except Exception:
+            logger.warning("Unable to fetch data loader cache version.", exc_info=True)
+            return -1
+        with self.lock:
+            if self.version != version:
+                self.version = version
+                self.entries = OrderedDict()
+            self.checked_at = now
+        return version
+
+    def _get_cache_key(self, version: int, key: Any) -> str:
+        key_hash = hashlib.md5(repr(key).encode("utf-8")).hexdigest()
+        return f"{DATALOADER_CACHE_KEY_PREFIX}-{self.name}-{version}-{key_hash}"
+
+    def _store_locally(self, version: int, values: dict[Any, bytes]):
+        if not values:
+            return
+        expires_at = time.monotonic() + self.timeout
+        max_size = settings.DATALOADER_CACHE_LOCAL_SIZE
+        with self.lock:
+            if self.version != version:
+                return
+            for key, value in values.items():
+                self.entries[key] = (expires_at, value)
+                self.entries.move_to_end(key)
+            while len(self.entries) > max_size:
+                self.entries.popitem(last=False)
+
+
+_dataloader_caches: dict[str, DataLoaderCache] = {}
+_dataloader_caches_lock = threading.Lock()
+
+
+def get_dataloader_cache(name: str) -> DataLoaderCache:
+    with _dataloader_caches_lock:
+        if name not in _dataloader_caches:
+            timeout, _ = DATALOADER_CACHES[name]
+            _dataloader_caches[name] = DataLoaderCache(name, timeout)
+        return _dataloader_caches[name]
+
+
+def invalidate_dataloader_cache_handler(sender, **kwargs):
+    for name, (_, model_labels) in DATALOADER_CACHES.items():
+        if sender._meta.label in model_labels:
+            get_dataloader_cache(name).invalidate()
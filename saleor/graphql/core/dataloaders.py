@@ -4,14 +4,16 @@ from typing import Generic, Optional, TypeVar, Union
 
 import opentracing
 import opentracing.tags
+from django.conf import settings
 from promise import Promise
 from promise.dataloader import DataLoader as BaseLoader
 
-from ...core.db.connection import allow_writer_in_context
+from ...core.db.connection import allow_writer, allow_writer_in_context
 from ...thumbnail.models import Thumbnail
 from ...thumbnail.utils import get_thumbnail_format
 from . import SaleorContext
 from .context import get_database_connection_name
+from .dataloader_cache import get_dataloader_cache
 
 K = TypeVar("K")
 R = TypeVar("R")
@@ -21,6 +23,11 @@ class DataLoader(BaseLoader, Generic[K, R]):
     context_key: str
     context: SaleorContext
     database_connection_name: str
+    # Name of the cache in `DATALOADER_CACHES` sharing the loaded values between
+    # requests. It is used only by requests reading from the replica, but the
+    # missing values are loaded from the writer, so a lagging replica can't put
+    # stale rows back in the cache right after it is invalidated.
+    cache_name: Optional[str] = None
 
     def __new__(cls, context: SaleorContext):
         key = cls.context_key
@@ -49,6 +56,9 @@ class DataLoader(BaseLoader, Generic[K, R]):
             span = scope.span
             span.set_tag(opentracing.tags.COMPONENT, "dataloaders")
 
+            if self.is_cache_enabled():
+                return self.batch_load_cached(list(keys))
+
             with allow_writer_in_context(self.context):
                 results = self.batch_load(keys)
 
@@ -56,6 +66,47 @@ class DataLoader(BaseLoader, Generic[K, R]):
                 return Promise.resolve(results)
             return results
 
+    def is_cache_enabled(self) -> bool:
+        return (
+            settings.DATALOADER_CACHE_ENABLED
+            and self.cache_name is not None
+            and self.database_connection_name
+            == settings.DATABASE_CONNECTION_REPLICA_NAME
+        )
+
+    def batch_load_cached(self, keys: list[K]) -> Promise[list[R]]:
+        assert self.cache_name is not None
+        shared_cache = get_dataloader_cache(self.cache_name)
+        # Loaders sharing a cache load different objects by the same keys.
+        cached = {
+            key: value
+            for (_, key), value in shared_cache.get_many(
+                (self.context_key, key) for key in keys
+            ).items()
+        }
+        missing_keys = [key for key in keys if key not in cached]
+        if not missing_keys:
+            return Promise.resolve([cached[key] for key in keys])
+
+        def with_missing_values(results):
+            values = dict(zip(missing_keys, results))
+            shared_cache.set_many(
+                {(self.context_key, key): value for key, value in values.items()}
+            )
+            values.update(cached)
+            return [values[key] for key in keys]
+
+        self.database_connection_name = settings.DATABASE_CONNECTION_DEFAULT_NAME
+        try:
+            with allow_writer():
+                results = self.batch_load(missing_keys)
+        finally:
+            self.database_connection_name = settings.DATABASE_CONNECTION_REPLICA_NAME
+
+        if not isinstance(results, Promise):
+            return Promise.resolve(with_missing_values(results))
+        return results.then(with_missing_values)
+
     def batch_load(self, keys: Iterable[K]) -> Union[Promise[list[R]], list[R]]:
         raise NotImplementedError()
 
@@ -0,0 +1,93 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+
+from ...product.dataloaders import CategoryByIdLoader
+from ..dataloader_cache import get_dataloader_cache
+
+
+def _get_context(rf, allow_replica=True):
+    context = rf.request()
+    context.dataloaders = {}
+    context.allow_replica = allow_replica
+    return context
+
+
+def _clear_cache():
+    cache.clear()
+    get_dataloader_cache("category").clear()
+
+
+def _load_category(context, category_id):
+    return CategoryByIdLoader(context).load(category_id).get()
+
+
+def test_dataloader_cache_shares_values_between_requests(category, rf, settings):
+    # given
+    settings.DATALOADER_CACHE_ENABLED = True
+    _clear_cache()
+    _load_category(_get_context(rf), category.pk)
+
+    # when
+    with patch.object(CategoryByIdLoader, "batch_load") as mocked_batch_load:
+        loaded_category = _load_category(_get_context(rf), category.pk)
+
+    # then
+    mocked_batch_load.assert_not_called()
+    assert loaded_category == category
+    assert loaded_category.name == category.name
+
+
+def test_dataloader_cache_invalidated_on_save(
+    category, rf, settings, django_capture_on_commit_callbacks
+):
+    # given
+    settings.DATALOADER_CACHE_ENABLED = True
+    settings.DATALOADER_CACHE_VERSION_CHECK_INTERVAL = 0
+    _clear_cache()
+    _load_category(_get_context(rf), category.pk)
+
+    # when
+    category.name = "New name"
+    with django_capture_on_commit_callbacks(execute=True):
+        category.save(update_fields=["name"])
+    loaded_category = _load_category(_get_context(rf), category.pk)
+
+    # then
+    assert loaded_category.name == "New name"
+
+
+def test_dataloader_cache_not_used_for_writer(category, rf, settings):
+    # given
+    settings.DATALOADER_CACHE_ENABLED = True
+    _clear_cache()
+    _load_category(_get_context(rf), category.pk)
+
+    # when
+    with patch.object(
+        CategoryByIdLoader, "batch_load", return_value=[category]
+    ) as mocked_batch_load:
+        _load_category(_get_context(rf, allow_replica=False), category.pk)
+
+    # then
+    mocked_batch_load.assert_called_once_with([category.pk])
+
+
+def test_dataloader_cache_loads_missing_values_from_writer(category, rf, settings):
+    # given
+    settings.DATALOADER_CACHE_ENABLED = True
+    _clear_cache()
+    loader = CategoryByIdLoader(_get_context(rf))
+    database_connection_names = []
+
+    def batch_load(keys):
+        database_connection_names.append(loader.database_connection_name)
+        return [category]
+
+    # when
+    with patch.object(loader, "batch_load", side_effect=batch_load):
+        loader.load(category.pk).get()
+
+    # then
+    assert database_connection_names == [settings.DATABASE_CONNECTION_DEFAULT_NAME]
+    assert loader.database_connection_name == settings.DATABASE_CONNECTION_REPLICA_NAME
@@ -0,0 +1,82 @@
+from unittest import mock
+
+import pytest
+
+from ....tests.models import Book
+from ..connection import TotalCountMode, get_total_count
+
+
+@pytest.fixture
+def books(db):
+    books = [Book(name=f"Book{index}") for index in range(24)]
+    return Book.objects.bulk_create(books)
+
+
+def test_get_total_count_exact(books, settings):
+    # given
+    settings.GRAPHQL_TOTAL_COUNT_EXACT_LIMIT = 10
+
+    # when
+    total_count, mode = get_total_count(Book.objects.all(), TotalCountMode.EXACT)
+
+    # then
+    assert total_count == 24
+    assert mode == TotalCountMode.EXACT
+
+
+def test_get_total_count_estimated_below_limit(books, settings):
+    # given
+    settings.GRAPHQL_TOTAL_COUNT_EXACT_LIMIT = 100
+
+    # when
+    total_count, mode = get_total_count(Book.objects.all(), TotalCountMode.ESTIMATED)
+
+    # then
+    assert total_count == 24
+    assert mode == TotalCountMode.EXACT
+
+
+@mock.patch(
+    "saleor.graphql.core.connection._get_planner_row_estimate", return_value=1000
+)
+def test_get_total_count_estimated_above_limit(
+    get_planner_row_estimate_mock, books, settings
+):
+    # given
+    settings.GRAPHQL_TOTAL_COUNT_EXACT_LIMIT = 10
+    qs = Book.objects.all()
+
+    # when
+    total_count, mode = get_total_count(qs, TotalCountMode.ESTIMATED)
+
+    # then
+    assert total_count == 1000
+    assert mode == TotalCountMode.ESTIMATED
+    get_planner_row_estimate_mock.assert_called_once_with(qs)
+
+
+def test_get_total_count_estimated_uses_planner(books, settings):
+    # given
+    settings.GRAPHQL_TOTAL_COUNT_EXACT_LIMIT = 10
+
+    # when
+    total_count, mode = get_total_count(
+        Book.objects.filter(name__startswith="Book"), TotalCountMode.ESTIMATED
+    )
+
+    # then
+    assert mode == TotalCountMode.ESTIMATED
+    # the planner estimate is never lower than the exactly counted rows
+    assert total_count >= 11
+
+
+def test_get_total_count_estimation_disabled(books, settings):
+    # given
+    settings.GRAPHQL_TOTAL_COUNT_EXACT_LIMIT = 0
+
+    # when
+    total_count, mode = get_total_count(Book.objects.all(), TotalCountMode.ESTIMATED)
+
+    # then
+    assert total_count == 24
+    assert mode == TotalCountMode.EXACT
@@ -9,6 +9,7 @@ from graphql.execution.base import ExecutionResult
 from .... import __version__ as saleor_version
 from ....graphql.api import backend, schema
 from ....graphql.utils import INTERNAL_ERROR_MESSAGE
+from ...context import clear_context
 from ...tests.fixtures import API_PATH
 from ...tests.utils import get_graphql_content, get_graphql_content_from_response
 from ...views import GraphQLView, generate_cache_key
@@ -350,3 +351,114 @@ def test_graphql_view_clears_context(rf, staff_user, product, channel_USD):
     assert json_data["data"]["product"]["category"]["name"] == product.category.name
     assert response.status_code == 200
     assert request.dataloaders == {}
+
+
+def test_batch_queries_share_dataloaders(api_client, category, channel_USD):
+    # given
+    query = """
+        query GetCategory($id: ID!) {
+            category(id: $id) {
+                name
+            }
+        }
+    """
+    variables = {"id": graphene.Node.to_global_id("Category", category.pk)}
+    data = [
+        {"query": query, "variables": variables},
+        {"query": query, "variables": variables},
+    ]
+
+    # when
+    with mock.patch(
+        "saleor.graphql.views.clear_context", wraps=clear_context
+    ) as clear_context_mock:
+        response = api_client.post(data)
+
+    # then
+    batch_content = get_graphql_content(response)
+    assert [content["data"]["category"]["name"] for content in batch_content] == [
+        category.name,
+        category.name,
+    ]
+    clear_context_mock.assert_called_once()
+
+
+def test_batch_with_mutation_does_not_share_dataloaders(api_client, category):
+    # given
+    query = """
+        query GetCategory($id: ID!) {
+            category(id: $id) {
+                name
+            }
+        }
+    """
+    mutation = """
+        mutation {
+            tokenVerify(token: "invalid") {
+                isValid
+            }
+        }
+    """
+    variables = {"id": graphene.Node.to_global_id("Category", category.pk)}
+    data = [
+        {"query": query, "variables": variables},
+        {"query": mutation},
+        {"query": query, "variables": variables},
+    ]
+
+    # when
+    with mock.patch(
+        "saleor.graphql.views.clear_context", wraps=clear_context
+    ) as clear_context_mock:
+        response = api_client.post(data)
+
+    # then
+    batch_content = get_graphql_content_from_response(response)
+    assert len(batch_content) == 3
+    # before and after the mutation and at the end of the batch
+    assert clear_context_mock.call_count == 3
+
+
+def test_batch_queries_executed_in_parallel(api_client, settings):
+    # given
+    settings.GRAPHQL_BATCH_MAX_WORKERS = 2
+    data = [
+        {"query": "query First { __typename }"},
+        {"query": "query Second { __typename }"},
+    ]
+
+    # when
+    with mock.patch.object(
+        GraphQLView,
+        "get_parallel_batch_responses",
+        wraps=GraphQLView.get_parallel_batch_responses,
+        autospec=True,
+    ) as parallel_responses_mock:
+        response = api_client.post(data)
+
+    # then
+    batch_content = get_graphql_content(response)
+    assert batch_content == [
+        {"data": {"__typename": "Query"}},
+        {"data": {"__typename": "Query"}},
+    ]
+    parallel_responses_mock.assert_called_once()
+
+
+def test_batch_with_mutation_is_not_executed_in_parallel(api_client, settings):
+    # given
+    settings.GRAPHQL_BATCH_MAX_WORKERS = 2
+    data = [
+        {"query": "query { __typename }"},
+        {"query": 'mutation { tokenVerify(token: "invalid") { isValid } }'},
+    ]
+
+    # when
+    with mock.patch.object(
+        GraphQLView, "get_parallel_batch_responses"
+    ) as parallel_responses_mock:
+        response = api_client.post(data)
+
+    # then
+    assert len(get_graphql_content_from_response(response)) == 2
+    parallel_responses_mock.assert_not_called()
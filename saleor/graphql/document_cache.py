@@ -0,0 +1,209 @@
+import hashlib
+import json
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from graphql import GraphQLBackend, GraphQLDocument, GraphQLSchema
+
+from .. import __version__ as saleor_version
+from ..core.utils.cache import CacheDict
+from .core.validators.query_cost import validate_query_cost
+
+logger = logging.getLogger(__name__)
+
+# Number of variable sets for which the query cost is remembered per document.
+QUERY_COST_CACHE_SIZE = 32
+
+
+@dataclass
+class DocumentCacheStats:
+    local_hits: int = 0
+    shared_hits: int = 0
+    misses: int = 0
+    cost_hits: int = 0
+    cost_misses: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return {
+            "local_hits": self.local_hits,
+            "shared_hits": self.shared_hits,
+            "misses": self.misses,
+            "cost_hits": self.cost_hits,
+            "cost_misses": self.cost_misses,
+        }
+
+
+@dataclass
+class DocumentCacheEntry:
+    document: GraphQLDocument
+    query_hash: str
+    valid: bool
+    query_costs: CacheDict = field(
+        default_factory=lambda: CacheDict(QUERY_COST_CACHE_SIZE)
+    )
+
+
+def get_query_hash(document_string: str) -> str:
+    return hashlib.sha256(document_string.encode("utf-8")).hexdigest()
+
+
+def get_variables_hash(variables: Optional[dict]) -> str:
+    if not variables:
+        return ""
+    serialized = json.dumps(variables, sort_keys=True, default=str)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+class GraphQLDocumentCacheBackend(GraphQLBackend):
+    """Cache parsed and validated documents together with their query cost.
+
+    Documents are kept in a bounded LRU in every process. When `shared` is enabled
+    the parsed AST of valid documents and their computed costs are also stored in
+    the Django cache, so other workers can skip parsing, validation and cost
+    analysis for queries already seen by any process.
+
+    The wrapped backend needs to implement `parse_and_validate` and
+    `document_from_ast`, see `SaleorGraphQLBackend`. The backend is shared by the
+    threads executing batched operations, so the LRU caches are guarded by a lock.
+    """
+
+    def __init__(
+        self,
+        backend,
+        capacity: int = 1000,
+        shared: bool = False,
+        timeout: Optional[int] = None,
+    ):
+        self.backend = backend
+        self.cache_map = CacheDict(capacity)
+        self.shared = shared
+        self.timeout = timeout
+        self.stats = DocumentCacheStats()
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def get_shared_key(query_hash: str) -> str:
+        return f"{saleor_version}-graphql-document-{query_hash}"
+
+    def document_from_string(  # type: ignore[override]
+        self, schema: GraphQLSchema, document_string: str
+    ) -> GraphQLDocument:
+        return self.get_entry(schema, document_string).document
+
+    def get_entry(
+        self, schema: GraphQLSchema, document_string: str
+    ) -> DocumentCacheEntry:
+        query_hash = get_query_hash(document_string)
+        key = (schema, query_hash)
+        with self.lock:
+            if key in self.cache_map:
+                self.stats.local_hits += 1
+                return self.cache_map[key]
+
+        entry = self._get_shared_entry(schema, document_string, query_hash)
+        if entry is not None:
+            with self.lock:
+                self.stats.shared_hits += 1
+        else:
+            with self.lock:
+                self.stats.misses += 1
+            document_ast, validation_errors = self.backend.parse_and_validate(
+                schema, document_string
+            )
+            document = self.backend.document_from_ast(
+                schema, document_string, document_ast, validation_errors
+            )
+            entry = DocumentCacheEntry(
+                document=document,
+                query_hash=query_hash,
+                valid=not validation_errors,
+            )
+            self._set_shared_entry(entry)
+        with self.lock:
+            self.cache_map[key] = entry
+        return entry
+
+    def get_query_cost(
+        self,
+        schema: GraphQLSchema,
+        document: GraphQLDocument,
+        variables: Optional[dict],
+        cost_map: dict[str, dict[str, Any]],
+        maximum_cost: int,
+    ):
+        key = (schema, get_query_hash(document.document_string))
+        cost_key = (get_variables_hash(variables), maximum_cost)
+        with self.lock:
+            entry = self.cache_map.get(key)
+            if entry is not None and entry.document is document:
+                if cost_key in entry.query_costs:
+                    self.stats.cost_hits += 1
+                    return entry.query_costs[cost_key]
+                self.stats.cost_misses += 1
+
+        query_cost, cost_errors = validate_query_cost(
+            schema, document, variables, cost_map, maximum_cost
+        )
+        if entry is None or entry.document is not document:
+            return query_cost, cost_errors
+
+        with self.lock:
+            entry.query_costs[cost_key] = (query_cost, cost_errors)
+        if not cost_errors:
+            self._set_shared_entry(entry)
+        return query_cost, cost_errors
+
+    def _get_shared_entry(
+        self, schema: GraphQLSchema, document_string: str, query_hash: str
+    ) -> Optional[DocumentCacheEntry]:
+        if not self.shared:
+            return None
+        try:
+            data = cache.get(self.get_shared_key(query_hash))
+        except Exception:
+            logger.warning(
+                "Unable to fetch GraphQL document from cache.", exc_info=True
+            )
+            return None
+        if not data:
+            return None
+        document = self.backend.document_from_ast(
+            schema, document_string, data["document_ast"], []
+        )
+        entry = DocumentCacheEntry(document=document, query_hash=query_hash, valid=True)
+        for cost_key, query_cost in data.get("query_costs", {}).items():
+            entry.query_costs[cost_key] = (query_cost, None)
+        return entry
+
+    def _set_shared_entry(self, entry: DocumentCacheEntry):
+        # Only valid documents are shared; invalid ones are cheap to reject again
+        # and their validation errors are not worth serializing.
+        if not self.shared or not entry.valid:
+            return
+        with self.lock:
+            query_costs = {
+                cost_key: query_cost
+                for cost_key, (query_cost, cost_errors) in entry.query_costs.items()
+                if not cost_errors
+            }
+        data = {
+            "document_ast": entry.document.document_ast,
+            "query_costs": query_costs,
+        }
+        try:
+            cache.set(self.get_shared_key(entry.query_hash), data, self.timeout)
+        except Exception:
+            logger.warning("Unable to store GraphQL document in cache.", exc_info=True)
+
+
+def get_document_cache_backend(backend) -> GraphQLDocumentCacheBackend:
+    return GraphQLDocumentCacheBackend(
+        backend,
+        capacity=settings.GRAPHQL_DOCUMENT_CACHE_SIZE,
+        shared=settings.GRAPHQL_DOCUMENT_CACHE_SHARED,
+        timeout=settings.GRAPHQL_DOCUMENT_CACHE_TIMEOUT,
+    )
@@ -9,6 +9,7 @@ from ....core.utils.promo_code import generate_promo_code
 from ....core.utils.validators import is_date_in_future
 from ....giftcard import events, models
 from ....giftcard.error_codes import GiftCardErrorCode
+from ....giftcard.tasks import schedule_gift_cards_search_vector_update
 from ....permission.enums import GiftcardPermissions
 from ....webhook.event_types import WebhookEventAsyncType
 from ....webhook.utils import get_webhooks_for_event
@@ -156,6 +157,7 @@ class GiftCardBulkCreate(BaseMutation):
                 for _ in range(count)
             ]
         )
+        schedule_gift_cards_search_vector_update()
         events.gift_cards_issued_event(gift_cards, info.context.user, app, balance)
         return gift_cards
 
@@ -11,6 +11,7 @@ from ....core.utils.validators import is_date_in_future
 from ....giftcard import events, models
 from ....giftcard.error_codes import GiftCardErrorCode
 from ....giftcard.notifications import send_gift_card_notification
+from ....giftcard.tasks import schedule_gift_cards_search_vector_update
 from ....permission.enums import GiftcardPermissions
 from ....webhook.event_types import WebhookEventAsyncType
 from ...app.dataloaders import get_app_promise
@@ -214,6 +215,7 @@ class GiftCardCreate(ModelMutation):
     def post_save_action(cls, info: ResolveInfo, instance, cleaned_input):
         user = info.context.user
         app = get_app_promise(info.context).get()
+        schedule_gift_cards_search_vector_update()
         events.gift_card_issued_event(
             gift_card=instance,
             user=user,
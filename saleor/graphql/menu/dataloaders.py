@@ -6,6 +6,7 @@ from ..core.dataloaders import DataLoader
 
 class MenuByIdLoader(DataLoader):
     context_key = "menu_by_id"
+    cache_name = "menu"
 
     def batch_load(self, keys):
         menus = Menu.objects.using(self.database_connection_name).in_bulk(keys)
@@ -14,6 +15,7 @@ class MenuByIdLoader(DataLoader):
 
 class MenuItemByIdLoader(DataLoader):
     context_key = "menuitem_by_id"
+    cache_name = "menu"
 
     def batch_load(self, keys):
         menu_items = MenuItem.objects.using(self.database_connection_name).in_bulk(keys)
@@ -22,6 +24,7 @@ class MenuItemByIdLoader(DataLoader):
 
 class MenuItemsByParentMenuLoader(DataLoader):
     context_key = "menuitems_by_parent_menu"
+    cache_name = "menu"
 
     def batch_load(self, keys):
         menu_items = MenuItem.objects.using(self.database_connection_name).filter(
@@ -35,6 +38,7 @@ class MenuItemsByParentMenuLoader(DataLoader):
 
 class MenuItemChildrenLoader(DataLoader):
     context_key = "menuitem_children"
+    cache_name = "menu"
 
     def batch_load(self, keys):
         menu_items = MenuItem.objects.using(self.database_connection_name).filter(
@@ -9,7 +9,11 @@ from ...order import models
 from ...permission.enums import OrderPermissions
 from ...permission.utils import has_one_of_permissions
 from ..core import ResolveInfo
-from ..core.connection import create_connection_slice, filter_connection_queryset
+from ..core.connection import (
+    TotalCountMode,
+    create_connection_slice,
+    filter_connection_queryset,
+)
 from ..core.context import get_database_connection_name
 from ..core.descriptions import ADDED_IN_310, DEPRECATED_IN_3X_FIELD
 from ..core.doc_category import DOC_CATEGORY_ORDERS
@@ -206,7 +210,13 @@ class OrderQueries(graphene.ObjectType):
         qs = filter_connection_queryset(
             qs, kwargs, allow_replica=info.context.allow_replica
         )
-        return create_connection_slice(qs, info, kwargs, OrderCountableConnection)
+        return create_connection_slice(
+            qs,
+            info,
+            kwargs,
+            OrderCountableConnection,
+            total_count_mode=TotalCountMode.ESTIMATED,
+        )
 
     @staticmethod
     def resolve_draft_orders(_root, info: ResolveInfo, **kwargs):
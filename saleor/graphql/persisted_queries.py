@@ -0,0 +1,139 @@
+import hashlib
+import json
+from functools import lru_cache
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from graphql.error import GraphQLError
+
+from .. import __version__ as saleor_version
+
+PERSISTED_QUERY_VERSION = 1
+
+
+class PersistedQueryError(GraphQLError):
+    pass
+
+
+class PersistedQueryNotFound(PersistedQueryError):
+    """Raised when the client should retry the request with the full query text."""
+
+    def __init__(self):
+        super().__init__(
+            "PersistedQueryNotFound",
+            extensions={"code": "PERSISTED_QUERY_NOT_FOUND"},
+        )
+
+
+def get_persisted_query_hash(extensions) -> Optional[str]:
+    if isinstance(extensions, str):
+        try:
+            extensions = json.loads(extensions)
+        except ValueError:
+            raise PersistedQueryError("Invalid extensions format.")
+    if not isinstance(extensions, dict):
+        return None
+    persisted_query = extensions.get("persistedQuery")
+    if not persisted_query:
+        return None
+    if not isinstance(persisted_query, dict):
+        raise PersistedQueryError("Invalid persistedQuery extension.")
+    if persisted_query.get("version", PERSISTED_QUERY_VERSION) != (
+        PERSISTED_QUERY_VERSION
+    ):
+        raise PersistedQueryError(
+            "Unsupported persisted query version.",
+            extensions={"code": "PERSISTED_QUERY_NOT_SUPPORTED"},
+        )
+    query_hash = persisted_query.get("sha256Hash")
+    if not query_hash or not isinstance(query_hash, str):
+        raise PersistedQueryError("Missing sha256Hash in persistedQuery extension.")
+    return query_hash.lower()
+
+
+def hash_query(query: str) -> str:
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+
+def generate_persisted_query_cache_key(query_hash: str) -> str:
+    return f"{saleor_version}-persisted-query-{query_hash}"
+
+
+@lru_cache(maxsize=1)
+def get_persisted_queries_manifest() -> dict[str, str]:
+    """Return the allow-list of persisted queries keyed by their SHA-256 hash.
+
+    The manifest is a JSON file with a `{"<sha256Hash>": "<query>"}` mapping, the
+    same format that is generated by Apollo's persisted queries tooling.
+    """
+    path = settings.GRAPHQL_PERSISTED_QUERIES_MANIFEST
+    if not path:
+        return {}
+    with open(path, encoding="utf-8") as manifest_file:
+        manifest = json.load(manifest_file)
+    return {query_hash.lower(): query for query_hash, query in manifest.items()}
+
+
+def get_persisted_query(query_hash: str) -> Optional[str]:
+    if query := get_persisted_queries_manifest().get(query_hash):
+        return query
+    if settings.GRAPHQL_PERSISTED_QUERIES_ALLOWLIST_ONLY:
+        return None
+    return cache.get(generate_persisted_query_cache_key(query_hash))
+
+
+def save_persisted_query(query_hash: str, query: str):
+    """Store the query, so that subsequent requests can send its hash only.
+
+    The caller stores only queries that passed validation. They are kept for
+    `GRAPHQL_PERSISTED_QUERIES_TIMEOUT` seconds.
+    """
+    if query_hash in get_persisted_queries_manifest():
+        return
+    if hash_query(query) != query_hash:
+        return
+    cache.set(
+        generate_persisted_query_cache_key(query_hash),
+        query,
+        timeout=settings.GRAPHQL_PERSISTED_QUERIES_TIMEOUT,
+    )
+
+
+def resolve_persisted_query(
+    query: Optional[str], extensions
+) -> tuple[Optional[str], Optional[str]]:
+    """Return the query text for the request and the hash to register it under.
+
+    When the request contains only the hash of the query, the query text is taken
+    from the manifest or from the cache. When both the hash and the query are
+    provided, the hash is returned, so that the caller can store the query with
+    `save_persisted_query` once it's validated. In the allow-list only mode, queries
+    that are not part of the manifest are rejected.
+    """
+    if not settings.GRAPHQL_PERSISTED_QUERIES_ENABLED:
+        return query, None
+
+    query_hash = get_persisted_query_hash(extensions)
+    allowlist_only = settings.GRAPHQL_PERSISTED_QUERIES_ALLOWLIST_ONLY
+    if query_hash is None:
+        if allowlist_only and (
+            not isinstance(query, str)
+            or hash_query(query) not in get_persisted_queries_manifest()
+        ):
+            raise PersistedQueryError("Only persisted queries are allowed.")
+        return query, None
+
+    if not query:
+        persisted_query = get_persisted_query(query_hash)
+        if persisted_query is None:
+            raise PersistedQueryNotFound()
+        return persisted_query, None
+
+    if not isinstance(query, str) or hash_query(query) != query_hash:
+        raise PersistedQueryError("Provided sha256Hash does not match query.")
+    if allowlist_only:
+        if query_hash not in get_persisted_queries_manifest():
+            raise PersistedQueryError("Only persisted queries are allowed.")
+        return query, None
+    return query, query_hash
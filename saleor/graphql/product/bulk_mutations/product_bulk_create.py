@@ -20,6 +20,8 @@ from ....permission.enums import ProductPermissions
 from ....product import ProductMediaTypes, models
 from ....product.error_codes import ProductBulkCreateErrorCode
 from ....product.models import CollectionProduct
+from ....product.tasks import schedule_products_search_vector_update
+from ....thumbnail.tasks import schedule_product_media_thumbnails
 from ....thumbnail.utils import get_filename_from_url
 from ....warehouse.models import Warehouse
 from ....webhook.event_types import WebhookEventAsyncType
@@ -765,6 +767,7 @@ class ProductBulkCreate(BaseMutation):
 
         models.Product.objects.bulk_create(products_to_create)
         models.ProductMedia.objects.bulk_create(media_to_create)
+        schedule_product_media_thumbnails(media_to_create)
         models.ProductChannelListing.objects.bulk_create(listings_to_create)
 
         for product, attributes in attributes_to_save:
@@ -880,6 +883,7 @@ class ProductBulkCreate(BaseMutation):
         if products:
             channel_ids = set([channel.id for channel in channels])
             cls.call_event(mark_active_catalogue_promotion_rules_as_dirty, channel_ids)
+            schedule_products_search_vector_update()
 
     @classmethod
     @traced_atomic_transaction()
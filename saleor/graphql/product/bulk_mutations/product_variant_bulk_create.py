@@ -13,6 +13,7 @@ from ....discount.utils.promotion import mark_active_catalogue_promotion_rules_a
 from ....permission.enums import ProductPermissions
 from ....product import models
 from ....product.error_codes import ProductVariantBulkErrorCode
+from ....product.tasks import schedule_products_search_vector_update
 from ....warehouse import models as warehouse_models
 from ....webhook.event_types import WebhookEventAsyncType
 from ....webhook.utils import get_webhooks_for_event
@@ -928,6 +929,7 @@ class ProductVariantBulkCreate(BaseMutation):
 
         product.search_index_dirty = True
         product.save(update_fields=["search_index_dirty"])
+        schedule_products_search_vector_update()
 
         webhooks = get_webhooks_for_event(WebhookEventAsyncType.PRODUCT_VARIANT_CREATED)
         manager = get_plugin_manager_promise(info.context).get()
@@ -12,6 +12,7 @@ from ....discount.utils.promotion import mark_active_catalogue_promotion_rules_a
 from ....permission.enums import ProductPermissions
 from ....product import models
 from ....product.error_codes import ProductErrorCode, ProductVariantBulkErrorCode
+from ....product.tasks import schedule_products_search_vector_update
 from ....warehouse import models as warehouse_models
 from ....webhook.event_types import WebhookEventAsyncType
 from ....webhook.utils import get_webhooks_for_event
@@ -721,6 +722,7 @@ class ProductVariantBulkUpdate(BaseMutation):
         manager = get_plugin_manager_promise(info.context).get()
         product.search_index_dirty = True
         product.save(update_fields=["search_index_dirty"])
+        schedule_products_search_vector_update()
 
         for instance in instances:
             cls.call_event(
@@ -30,6 +30,7 @@ VariantIdAndChannelId = tuple[int, Optional[int]]
 
 class CategoryByIdLoader(DataLoader[int, Category]):
     context_key = "category_by_id"
+    cache_name = "category"
 
     def batch_load(self, keys):
         categories = Category.objects.using(self.database_connection_name).in_bulk(keys)
@@ -10,6 +10,7 @@ from ....core.tracing import traced_atomic_transaction
 from ....permission.enums import ProductPermissions, ProductTypePermissions
 from ....product import models
 from ....product.error_codes import ProductErrorCode
+from ....product.tasks import schedule_products_search_vector_update
 from ...attribute.mutations import (
     BaseReorderAttributesMutation,
     BaseReorderAttributeValuesMutation,
@@ -357,6 +358,7 @@ class ProductAttributeUnassign(BaseMutation):
         cls.save_field_values(product_type, "variant_attributes", attribute_pks)
 
         product_type.products.all().update(search_index_dirty=True)
+        schedule_products_search_vector_update()
 
         return cls(product_type=product_type)
 
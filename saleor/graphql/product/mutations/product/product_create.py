@@ -7,6 +7,7 @@ from .....core.utils.editorjs import clean_editor_js
 from .....permission.enums import ProductPermissions
 from .....product import models
 from .....product.error_codes import ProductErrorCode
+from .....product.tasks import schedule_products_search_vector_update
 from ....attribute.types import AttributeValueInput
 from ....attribute.utils import AttrValuesInput, ProductAttributeAssignmentMixin
 from ....channel import ChannelContext
@@ -206,6 +207,7 @@ class ProductCreate(ModelMutation):
         with traced_atomic_transaction():
             instance.search_index_dirty = True
             instance.save()
+            schedule_products_search_vector_update()
             attributes = cleaned_input.get("attributes")
             if attributes:
                 ProductAttributeAssignmentMixin.save(instance, attributes)
@@ -2,7 +2,10 @@ import graphene
 
 from .....permission.enums import ProductTypePermissions
 from .....product import models
-from .....product.tasks import update_variants_names
+from .....product.tasks import (
+    schedule_products_search_vector_update,
+    update_variants_names,
+)
 from ....core import ResolveInfo
 from ....core.types import ProductError
 from ...types import ProductType
@@ -46,3 +49,4 @@ class ProductTypeUpdate(ProductTypeCreate):
             models.Product.objects.filter(product_type=instance).update(
                 search_index_dirty=True
             )
+            schedule_products_search_vector_update()
@@ -11,6 +11,7 @@ from .....discount.utils.promotion import mark_active_catalogue_promotion_rules_
 from .....permission.enums import ProductPermissions
 from .....product import models
 from .....product.error_codes import ProductErrorCode
+from .....product.tasks import schedule_products_search_vector_update
 from .....product.utils.variants import generate_and_set_variant_name
 from ....attribute.types import AttributeValueInput
 from ....attribute.utils import AttributeAssignmentMixin, AttrValuesInput
@@ -337,6 +338,7 @@ class ProductVariantCreate(ModelMutation):
             manager = get_plugin_manager_promise(info.context).get()
             instance.product.search_index_dirty = True
             instance.product.save(update_fields=["search_index_dirty"])
+            schedule_products_search_vector_update()
             event_to_call = (
                 manager.product_variant_created
                 if new_variant
@@ -13,6 +13,7 @@ from .....order import models as order_models
 from .....order.tasks import recalculate_orders_task
 from .....permission.enums import ProductPermissions
 from .....product import models
+from .....product.tasks import schedule_products_search_vector_update
 from ....app.dataloaders import get_app_promise
 from ....channel import ChannelContext
 from ....core import ResolveInfo
@@ -53,6 +54,7 @@ class ProductVariantDelete(ModelDeleteMutation, ModelWithExtRefMutation):
         product = models.Product.objects.get(id=instance.product_id)
         product.search_index_dirty = True
         product.save(update_fields=["search_index_dirty"])
+        schedule_products_search_vector_update()
         # if the product default variant has been removed set the new one
         if not product.default_variant:
             product.default_variant = product.variants.first()
@@ -0,0 +1,188 @@
+import logging
+from dataclasses import dataclass
+from functools import partial
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.http import HttpRequest
+from graphql import GraphQLDocument
+from graphql.execution import ExecutionResult
+from graphql.language.ast import Field, OperationDefinition
+
+from .. import __version__ as saleor_version
+from ..core.auth import DEFAULT_AUTH_HEADER, get_token_from_request
+from .document_cache import get_query_hash, get_variables_hash
+
+logger = logging.getLogger(__name__)
+
+PRODUCT_SCOPE = "product"
+CATEGORY_SCOPE = "category"
+COLLECTION_SCOPE = "collection"
+MENU_SCOPE = "menu"
+
+# Cached responses of a root field are invalidated when any of its scopes changes.
+# Product data is embedded in categories and collections and the other way around,
+# menus point to categories and collections.
+ROOT_FIELD_SCOPES = {
+    "product": (PRODUCT_SCOPE, CATEGORY_SCOPE, COLLECTION_SCOPE),
+    "products": (PRODUCT_SCOPE, CATEGORY_SCOPE, COLLECTION_SCOPE),
+    "category": (CATEGORY_SCOPE, PRODUCT_SCOPE),
+    "categories": (CATEGORY_SCOPE, PRODUCT_SCOPE),
+    "collection": (COLLECTION_SCOPE, PRODUCT_SCOPE),
+    "collections": (COLLECTION_SCOPE, PRODUCT_SCOPE),
+    "menu": (MENU_SCOPE, CATEGORY_SCOPE, COLLECTION_SCOPE),
+    "menus": (MENU_SCOPE, CATEGORY_SCOPE, COLLECTION_SCOPE),
+}
+
+TYPENAME_FIELD = "__typename"
+
+
+@dataclass
+class ResponseCacheStats:
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def as_dict(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "hit_ratio": self.hit_ratio}
+
+
+stats = ResponseCacheStats()
+
+
+def generate_scope_version_key(scope: str) -> str:
+    return f"graphql-response-cache-version-{scope}"
+
+
+def _bump_scope_version(scope: str):
+    key = generate_scope_version_key(scope)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 1, timeout=None)
+    except Exception:
+        logger.warning("Unable to invalidate GraphQL response cache.", exc_info=True)
+
+
+def invalidate_response_cache(scope: str):
+    """Invalidate all cached responses that depend on the given scope.
+
+    Cached responses are never deleted; bumping the scope version changes the cache
+    keys of all responses depending on it, so the stale entries expire on their own.
+    The version is bumped after the transaction is committed, so other requests
+    can't cache the old data under the new version.
+    """
+    if not settings.GRAPHQL_RESPONSE_CACHE_ENABLED:
+        return
+    transaction.on_commit(partial(_bump_scope_version, scope))
+
+
+def get_root_fields(
+    document: GraphQLDocument, operation_name: Optional[str]
+) -> Optional[list[str]]:
+    """Return names of the root fields of the executed query operation.
+
+    Return `None` when the operation is not a query or its root fields can't be
+    determined without executing it.
+    """
+    operations = [
+        definition
+        for definition in document.document_ast.definitions
+        if isinstance(definition, OperationDefinition)
+    ]
+    if operation_name:
+        operations = [
+            operation
+            for operation in operations
+            if operation.name and operation.name.value == operation_name
+        ]
+    if len(operations) != 1 or operations[0].operation != "query":
+        return None
+    root_fields = []
+    for selection in operations[0].selection_set.selections:
+        if not isinstance(selection, Field):
+            return None
+        root_fields.append(selection.name.value)
+    return root_fields
+
+
+def is_anonymous_request(request: HttpRequest) -> bool:
+    return not get_token_from_request(request) and not request.META.get(
+        DEFAULT_AUTH_HEADER
+    )
+
+
+def get_response_cache_key(
+    request: HttpRequest,
+    document: GraphQLDocument,
+    variables: Optional[dict],
+    operation_name: Optional[str],
+) -> tuple[Optional[str], Optional[int]]:
+    """Return the cache key and TTL for the response, if it can be cached.
+
+    Only anonymous queries whose root fields all have a TTL configured in
+    `GRAPHQL_RESPONSE_CACHE_TTL` are cached. The channel and language of catalog
+    queries are passed as arguments, so they are covered by the query and
+    variables hashes.
+    """
+    if not settings.GRAPHQL_RESPONSE_CACHE_ENABLED or not is_anonymous_request(request):
+        return None, None
+
+    root_fields = get_root_fields(document, operation_name)
+    if not root_fields:
+        return None, None
+    ttls = settings.GRAPHQL_RESPONSE_CACHE_TTL
+    cached_fields = [field for field in root_fields if field != TYPENAME_FIELD]
+    if not cached_fields or any(field not in ttls for field in cached_fields):
+        return None, None
+
+    scopes = sorted(
+        {scope for field in cached_fields for scope in ROOT_FIELD_SCOPES.get(field, ())}
+    )
+    version_keys = [generate_scope_version_key(scope) for scope in scopes]
+    try:
+        versions = cache.get_many(version_keys)
+    except Exception:
+        logger.warning("Unable to fetch GraphQL response cache version.", exc_info=True)
+        return None, None
+    scopes_version = "-".join(str(versions.get(key, 0)) for key in version_keys)
+
+    key = "-".join(
+        [
+            saleor_version,
+            "graphql-response",
+            get_query_hash(document.document_string),
+            get_variables_hash(variables),
+            operation_name or "",
+            scopes_version,
+        ]
+    )
+    return key, min(ttls[field] for field in cached_fields)
+
+
+def get_cached_response(key: str) -> Optional[ExecutionResult]:
+    try:
+        response = cache.get(key)
+    except Exception:
+        logger.warning("Unable to fetch GraphQL response from cache.", exc_info=True)
+        response = None
+    if response is None:
+        stats.misses += 1
+    else:
+        stats.hits += 1
+    return response
+
+
+def cache_response(key: str, response: ExecutionResult, ttl: int):
+    if response.errors or response.invalid:
+        return
+    try:
+        cache.set(key, response, ttl)
+    except Exception:
+        logger.warning("Unable to store GraphQL response in cache.", exc_info=True)
@@ -1,6 +1,7 @@
 import graphene
 from django.core.exceptions import ValidationError
 
+from ....checkout import CheckoutPriceChange
 from ....checkout.fetch import fetch_checkout_info, fetch_checkout_lines
 from ....checkout.models import Checkout
 from ....checkout.utils import invalidate_checkout
@@ -80,11 +81,12 @@ class TaxExemptionManage(BaseMutation):
 
         checkout_info = fetch_checkout_info(checkout, [], manager)
         lines_info, _ = fetch_checkout_lines(checkout)
-        invalidate_checkout(
+        return invalidate_checkout(
             checkout_info,
             lines_info,
             manager,
             save=False,
+            changes=[CheckoutPriceChange.TAX_EXEMPTION],
         )
 
     @classmethod
@@ -94,8 +96,8 @@ class TaxExemptionManage(BaseMutation):
         obj.tax_exemption = data["tax_exemption"]
 
         if isinstance(obj, Checkout):
-            cls._invalidate_checkout(info, obj)
-            obj.save(update_fields=["tax_exemption", "price_expiration", "last_change"])
+            invalidate_prices_updated_fields = cls._invalidate_checkout(info, obj)
+            obj.save(update_fields=["tax_exemption"] + invalidate_prices_updated_fields)
 
         if isinstance(obj, Order):
             cls.validate_order_status(obj)
@@ -0,0 +1,171 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from ..api import SaleorGraphQLBackend, schema
+from ..core.validators.query_cost import validate_query_cost
+from ..document_cache import GraphQLDocumentCacheBackend, get_query_hash
+from ..query_cost_map import COST_MAP
+
+QUERY = """
+    query GetProducts($first: Int) {
+        products(first: $first) {
+            edges {
+                node {
+                    name
+                }
+            }
+        }
+    }
+"""
+
+INVALID_QUERY = "{ products { notExistingField } }"
+
+
+def test_document_from_string_is_cached_in_process():
+    # given
+    backend = GraphQLDocumentCacheBackend(SaleorGraphQLBackend())
+
+    # when
+    first_document = backend.document_from_string(schema, QUERY)
+    second_document = backend.document_from_string(schema, QUERY)
+
+    # then
+    assert first_document is second_document
+    assert backend.stats.misses == 1
+    assert backend.stats.local_hits == 1
+
+
+def test_document_cache_capacity():
+    # given
+    backend = GraphQLDocumentCacheBackend(SaleorGraphQLBackend(), capacity=1)
+    backend.document_from_string(schema, QUERY)
+
+    # when
+    backend.document_from_string(schema, INVALID_QUERY)
+    backend.document_from_string(schema, QUERY)
+
+    # then
+    assert backend.stats.misses == 3
+    assert backend.stats.local_hits == 0
+
+
+def test_document_cache_used_from_many_threads():
+    # given
+    backend = GraphQLDocumentCacheBackend(SaleorGraphQLBackend(), capacity=2)
+    queries = [f"query Shop{i} {{ shop {{ name }} }}" for i in range(4)]
+
+    def get_document(query):
+        document = backend.document_from_string(schema, query)
+        backend.get_query_cost(schema, document, None, COST_MAP, 0)
+        return document
+
+    # when
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        documents = list(executor.map(get_document, queries * 25))
+
+    # then
+    assert len(documents) == 100
+    assert len(backend.cache_map) <= 2
+
+
+def test_invalid_document_is_cached_with_validation_errors():
+    # given
+    backend = GraphQLDocumentCacheBackend(SaleorGraphQLBackend())
+
+    # when
+    document = backend.document_from_string(schema, INVALID_QUERY)
+    result = document.execute()
+
+    # then
+    assert result.invalid
+    assert backend.get_entry(schema, INVALID_QUERY).valid is False
+
+
+@mock.patch("saleor.graphql.document_cache.validate_query_cost", return_value=(5, None))
+def test_query_cost_is_cached_per_variables(validate_query_cost_mock):
+    # given
+    backend = GraphQLDocumentCacheBackend(SaleorGraphQLBackend())
+    document = backend.document_from_string(schema, QUERY)
+
+    # when
+    backend.get_query_cost(schema, document, {"first": 10}, COST_MAP, 50000)
+    backend.get_query_cost(schema, document, {"first": 10}, COST_MAP, 50000)
+    backend.get_query_cost(schema, document, {"first": 20}, COST_MAP, 50000)
+
+    # then
+    assert validate_query_cost_mock.call_count == 2
+    assert backend.stats.cost_hits == 1
+    assert backend.stats.cost_misses == 2
+
+
+def test_query_cost_matches_uncached_cost():
+    # given
+    backend = GraphQLDocumentCacheBackend(SaleorGraphQLBackend())
+    document = backend.document_from_string(schema, QUERY)
+    variables = {"first": 10}
+
+    # when
+    first_cost = backend.get_query_cost(schema, document, variables, COST_MAP, 50000)
+    second_cost = backend.get_query_cost(schema, document, variables, COST_MAP, 50000)
+
+    # then
+    expected_cost = validate_query_cost(schema, document, variables, COST_MAP, 50000)
+    assert first_cost == second_cost == expected_cost
+
+
+@mock.patch("saleor.graphql.document_cache.cache")
+def test_shared_cache_stores_valid_documents(cache_mock):
+    # given
+    cache_mock.get.return_value = None
+    backend = GraphQLDocumentCacheBackend(SaleorGraphQLBackend(), shared=True)
+
+    # when
+    document = backend.document_from_string(schema, QUERY)
+
+    # then
+    key = backend.get_shared_key(get_query_hash(QUERY))
+    cache_mock.get.assert_called_once_with(key)
+    cache_mock.set.assert_called_once_with(
+        key, {"document_ast": document.document_ast, "query_costs": {}}, None
+    )
+
+
+@mock.patch("saleor.graphql.document_cache.cache")
+def test_shared_cache_does_not_store_invalid_documents(cache_mock):
+    # given
+    cache_mock.get.return_value = None
+    backend = GraphQLDocumentCacheBackend(SaleorGraphQLBackend(), shared=True)
+
+    # when
+    backend.document_from_string(schema, INVALID_QUERY)
+
+    # then
+    cache_mock.set.assert_not_called()
+
+
+@mock.patch("saleor.graphql.document_cache.validate_query_cost")
+@mock.patch("saleor.graphql.document_cache.cache")
+def test_shared_cache_hit_skips_parsing_and_cost_analysis(
+    cache_mock, validate_query_cost_mock
+):
+    # given
+    source_backend = GraphQLDocumentCacheBackend(SaleorGraphQLBackend())
+    source_document = source_backend.document_from_string(schema, QUERY)
+    cost_key = ("", 50000)
+    cache_mock.get.return_value = {
+        "document_ast": source_document.document_ast,
+        "query_costs": {cost_key: 7},
+    }
+    wrapped_backend = mock.Mock(wraps=SaleorGraphQLBackend())
+    backend = GraphQLDocumentCacheBackend(wrapped_backend, shared=True)
+
+    # when
+    document = backend.document_from_string(schema, QUERY)
+    cost = backend.get_query_cost(schema, document, None, COST_MAP, 50000)
+
+    # then
+    wrapped_backend.parse_and_validate.assert_not_called()
+    validate_query_cost_mock.assert_not_called()
+    assert document.document_ast is source_document.document_ast
+    assert cost == (7, None)
+    assert backend.stats.shared_hits == 1
@@ -0,0 +1,178 @@
+import hashlib
+import json
+
+import pytest
+from django.core.cache import cache
+
+from ..persisted_queries import (
+    generate_persisted_query_cache_key,
+    get_persisted_queries_manifest,
+)
+from .utils import get_graphql_content, get_graphql_content_from_response
+
+QUERY = "query { shop { name } }"
+QUERY_HASH = hashlib.sha256(QUERY.encode("utf-8")).hexdigest()
+
+
+def _persisted_query_extension(query_hash=QUERY_HASH):
+    return {"persistedQuery": {"version": 1, "sha256Hash": query_hash}}
+
+
+@pytest.fixture
+def persisted_queries_manifest(settings, tmp_path):
+    manifest_path = tmp_path / "persisted-queries.json"
+    manifest_path.write_text(json.dumps({QUERY_HASH: QUERY}))
+    settings.GRAPHQL_PERSISTED_QUERIES_MANIFEST = str(manifest_path)
+    get_persisted_queries_manifest.cache_clear()
+    yield manifest_path
+    get_persisted_queries_manifest.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def _enable_persisted_queries(settings):
+    settings.GRAPHQL_PERSISTED_QUERIES_ENABLED = True
+    cache.delete(generate_persisted_query_cache_key(QUERY_HASH))
+
+
+def test_persisted_query_not_found(api_client):
+    # when
+    response = api_client.post({"extensions": _persisted_query_extension()})
+
+    # then
+    assert response.status_code == 200
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["message"] == "PersistedQueryNotFound"
+    assert content["errors"][0]["extensions"]["code"] == "PERSISTED_QUERY_NOT_FOUND"
+
+
+def test_persisted_query_is_registered_and_reused(api_client, site_settings):
+    # given
+    api_client.post({"query": QUERY, "extensions": _persisted_query_extension()})
+
+    # when
+    response = api_client.post({"extensions": _persisted_query_extension()})
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["shop"]["name"] == site_settings.site.name
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "query { shop { unknownField } }",
+        "query { shop { name }",
+    ],
+)
+def test_persisted_query_not_registered_when_invalid(api_client, query):
+    # given
+    query_hash = hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+    # when
+    response = api_client.post(
+        {"query": query, "extensions": _persisted_query_extension(query_hash)}
+    )
+
+    # then
+    assert response.status_code == 400
+    assert cache.get(generate_persisted_query_cache_key(query_hash)) is None
+
+
+def test_persisted_query_hash_mismatch(api_client):
+    # when
+    response = api_client.post(
+        {"query": QUERY, "extensions": _persisted_query_extension("0" * 64)}
+    )
+
+    # then
+    assert response.status_code == 400
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["message"] == (
+        "Provided sha256Hash does not match query."
+    )
+    assert cache.get(generate_persisted_query_cache_key("0" * 64)) is None
+
+
+def test_persisted_query_unsupported_version(api_client):
+    # given
+    extensions = {"persistedQuery": {"version": 2, "sha256Hash": QUERY_HASH}}
+
+    # when
+    response = api_client.post({"query": QUERY, "extensions": extensions})
+
+    # then
+    assert response.status_code == 400
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["extensions"]["code"] == (
+        "PERSISTED_QUERY_NOT_SUPPORTED"
+    )
+
+
+def test_persisted_queries_disabled(api_client, settings):
+    # given
+    settings.GRAPHQL_PERSISTED_QUERIES_ENABLED = False
+
+    # when
+    response = api_client.post({"extensions": _persisted_query_extension()})
+
+    # then
+    assert response.status_code == 400
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["message"] == "Must provide a query string."
+
+
+def test_persisted_query_from_manifest(
+    api_client, site_settings, persisted_queries_manifest
+):
+    # when
+    response = api_client.post({"extensions": _persisted_query_extension()})
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["shop"]["name"] == site_settings.site.name
+
+
+def test_allowlist_only_rejects_unknown_query(
+    api_client, settings, persisted_queries_manifest
+):
+    # given
+    settings.GRAPHQL_PERSISTED_QUERIES_ALLOWLIST_ONLY = True
+
+    # when
+    response = api_client.post_graphql("query { shop { description } }")
+
+    # then
+    assert response.status_code == 400
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["message"] == "Only persisted queries are allowed."
+
+
+def test_allowlist_only_accepts_query_from_manifest(
+    api_client, settings, site_settings, persisted_queries_manifest
+):
+    # given
+    settings.GRAPHQL_PERSISTED_QUERIES_ALLOWLIST_ONLY = True
+
+    # when
+    response = api_client.post_graphql(QUERY)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["shop"]["name"] == site_settings.site.name
+
+
+def test_allowlist_only_does_not_register_new_queries(
+    api_client, settings, persisted_queries_manifest
+):
+    # given
+    settings.GRAPHQL_PERSISTED_QUERIES_ALLOWLIST_ONLY = True
+    query = "query { shop { description } }"
+    query_hash = hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+    # when
+    api_client.post(
+        {"query": query, "extensions": _persisted_query_extension(query_hash)}
+    )
+
+    # then
+    assert cache.get(generate_persisted_query_cache_key(query_hash)) is None
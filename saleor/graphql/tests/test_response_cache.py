@@ -0,0 +1,198 @@
+from unittest import mock
+
+import pytest
+from django.core.cache import cache
+
+from ...plugins.manager import get_plugins_manager
+from ..api import backend, schema
+from ..response_cache import (
+    PRODUCT_SCOPE,
+    generate_scope_version_key,
+    get_root_fields,
+    invalidate_response_cache,
+    stats,
+)
+from .utils import get_graphql_content
+
+QUERY_PRODUCTS = """
+    query Products($channel: String) {
+        products(first: 10, channel: $channel) {
+            edges {
+                node {
+                    name
+                }
+            }
+        }
+    }
+"""
+
+
+@pytest.fixture
+def response_cache_enabled(settings):
+    settings.GRAPHQL_RESPONSE_CACHE_ENABLED = True
+    cache.clear()
+    stats.hits = 0
+    stats.misses = 0
+    yield
+    cache.clear()
+
+
+def test_get_root_fields():
+    # given
+    document = backend.document_from_string(schema, QUERY_PRODUCTS)
+
+    # when
+    root_fields = get_root_fields(document, None)
+
+    # then
+    assert root_fields == ["products"]
+
+
+def test_get_root_fields_for_mutation():
+    # given
+    document = backend.document_from_string(
+        schema, "mutation { tokenVerify(token: 1) { isValid } }"
+    )
+
+    # when
+    root_fields = get_root_fields(document, None)
+
+    # then
+    assert root_fields is None
+
+
+def test_get_root_fields_with_operation_name():
+    # given
+    query = """
+        query A { shop { name } }
+        query B { categories(first: 1) { totalCount } }
+    """
+    document = backend.document_from_string(schema, query)
+
+    # when
+    root_fields = get_root_fields(document, "B")
+
+    # then
+    assert root_fields == ["categories"]
+
+
+def test_anonymous_catalog_query_is_cached(
+    response_cache_enabled, api_client, product, channel_USD
+):
+    # given
+    variables = {"channel": channel_USD.slug}
+    api_client.post_graphql(QUERY_PRODUCTS, variables)
+    product.name = "New name"
+    product.save(update_fields=["name"])
+
+    # when
+    response = api_client.post_graphql(QUERY_PRODUCTS, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["products"]["edges"][0]["node"]["name"] != "New name"
+    assert stats.hits == 1
+    assert stats.misses == 1
+
+
+def test_cached_response_is_invalidated_by_product_event(
+    response_cache_enabled,
+    api_client,
+    product,
+    channel_USD,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    variables = {"channel": channel_USD.slug}
+    api_client.post_graphql(QUERY_PRODUCTS, variables)
+    product.name = "New name"
+    product.save(update_fields=["name"])
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        get_plugins_manager(allow_replica=False).product_updated(product)
+    response = api_client.post_graphql(QUERY_PRODUCTS, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["products"]["edges"][0]["node"]["name"] == "New name"
+    assert stats.hits == 0
+    assert stats.misses == 2
+
+
+def test_cache_is_not_used_for_authenticated_requests(
+    response_cache_enabled, staff_api_client, product, channel_USD
+):
+    # given
+    variables = {"channel": channel_USD.slug}
+
+    # when
+    staff_api_client.post_graphql(QUERY_PRODUCTS, variables)
+    staff_api_client.post_graphql(QUERY_PRODUCTS, variables)
+
+    # then
+    assert stats.hits == 0
+    assert stats.misses == 0
+
+
+def test_cache_is_not_used_for_not_configured_root_fields(
+    response_cache_enabled, api_client, product, channel_USD
+):
+    # given
+    query = """
+        query Products($channel: String) {
+            products(first: 10, channel: $channel) { totalCount }
+            shop { name }
+        }
+    """
+    variables = {"channel": channel_USD.slug}
+
+    # when
+    api_client.post_graphql(query, variables)
+    api_client.post_graphql(query, variables)
+
+    # then
+    assert stats.hits == 0
+    assert stats.misses == 0
+
+
+def test_cache_is_disabled_by_default(api_client, product, channel_USD):
+    # given
+    variables = {"channel": channel_USD.slug}
+
+    # when
+    with mock.patch("saleor.graphql.views.get_cached_response") as get_cached_mock:
+        api_client.post_graphql(QUERY_PRODUCTS, variables)
+
+    # then
+    get_cached_mock.assert_not_called()
+
+
+def test_invalidate_response_cache(
+    response_cache_enabled, django_capture_on_commit_callbacks
+):
+    # given
+    key = generate_scope_version_key(PRODUCT_SCOPE)
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        invalidate_response_cache(PRODUCT_SCOPE)
+        invalidate_response_cache(PRODUCT_SCOPE)
+
+    # then
+    assert cache.get(key) == 2
+
+
+def test_invalidate_response_cache_after_commit(
+    response_cache_enabled, django_capture_on_commit_callbacks
+):
+    # given
+    key = generate_scope_version_key(PRODUCT_SCOPE)
+
+    # when
+    with django_capture_on_commit_callbacks() as callbacks:
+        invalidate_response_cache(PRODUCT_SCOPE)
+
+    # then
+    assert cache.get(key) is None
+    assert len(callbacks) == 1
@@ -13,6 +13,7 @@ from ..core.dataloaders import DataLoader
 class BaseTranslationByIdAndLanguageCodeLoader(DataLoader):
     model = None
     relation_name = None
+    cache_name = "translation"
 
     def batch_load(self, keys):
         if not self.model:
@@ -1,14 +1,17 @@
+import copy
 import hashlib
 import importlib
 import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from inspect import isclass
-from typing import Any, Optional, Union
+from typing import Any, Optional, Union, cast
 
 import opentracing
 import opentracing.tags
 from django.conf import settings
 from django.core.cache import cache
-from django.db import connection
+from django.db import connection, connections
 from django.db.backends.postgresql.base import DatabaseWrapper
 from django.http import HttpRequest, HttpResponseNotAllowed, JsonResponse
 from django.shortcuts import render
@@ -16,6 +19,7 @@ from django.views.generic import View
 from graphql import GraphQLBackend, GraphQLDocument, GraphQLSchema
 from graphql.error import GraphQLError, GraphQLSyntaxError
 from graphql.execution import ExecutionResult
+from graphql.language.ast import OperationDefinition
 from jwt.exceptions import PyJWTError
 from requests_hardened.ip_filter import InvalidIPAddress
 
@@ -25,8 +29,21 @@ from ..core.utils import is_valid_ipv4, is_valid_ipv6
 from ..webhook import observability
 from .api import API_PATH, schema
 from .context import clear_context, get_context_value
+from .core import SaleorContext
 from .core.validators.query_cost import validate_query_cost
+from .document_cache import GraphQLDocumentCacheBackend
+from .persisted_queries import (
+    PersistedQueryError,
+    PersistedQueryNotFound,
+    resolve_persisted_query,
+    save_persisted_query,
+)
 from .query_cost_map import COST_MAP
+from .response_cache import (
+    cache_response,
+    get_cached_response,
+    get_response_cache_key,
+)
 from .utils import format_error, query_fingerprint, query_identifier
 from .utils.validators import check_if_query_contains_only_schema
 
@@ -138,7 +155,7 @@ class GraphQLView(View):
             )
 
         if isinstance(data, list):
-            responses = [self.get_response(request, entry) for entry in data]
+            responses = self.get_batch_responses(request, data)
             result: Union[list, Optional[dict]] = [
                 response for response, code in responses
             ]
@@ -202,11 +219,74 @@ class GraphQLView(View):
                 api_call.report()
             return response
 
+    def get_batch_responses(
+        self, request: HttpRequest, data: list
+    ) -> list[tuple[Optional[dict[str, list[Any]]], int]]:
+        """Execute all operations of a batched request.
+
+        Read-only batches are executed on a thread pool when
+        `GRAPHQL_BATCH_MAX_WORKERS` is set. Otherwise, operations are executed one
+        after another, sharing the dataloaders so that the same objects are not
+        fetched again by the following operations.
+        """
+        if (
+            settings.GRAPHQL_BATCH_MAX_WORKERS > 1
+            and len(data) > 1
+            and self.is_read_only_batch(data)
+        ):
+            return self.get_parallel_batch_responses(request, data)
+        try:
+            return [
+                self.get_response(request, entry, share_dataloaders=True)
+                for entry in data
+            ]
+        finally:
+            if hasattr(request, "dataloaders"):
+                clear_context(cast(SaleorContext, request))
+
+    def is_read_only_batch(self, data: list) -> bool:
+        for entry in data:
+            if not isinstance(entry, dict):
+                return False
+            query = entry.get("query")
+            try:
+                query, _ = resolve_persisted_query(query, entry.get("extensions"))
+            except PersistedQueryError:
+                return False
+            document, error = self.parse_query(query)
+            if error or document is None or document_contains_mutation(document):
+                return False
+        return True
+
+    def get_parallel_batch_responses(
+        self, request: HttpRequest, data: list
+    ) -> list[tuple[Optional[dict[str, list[Any]]], int]]:
+        with observability.report_api_call(request) as api_call:
+            executor = get_batch_executor()
+            futures = [
+                executor.submit(self._get_response_in_thread, request, entry, api_call)
+                for entry in data
+            ]
+            return [future.result() for future in futures]
+
+    def _get_response_in_thread(self, request: HttpRequest, data: dict, api_call):
+        # Dataloaders are not thread-safe, each operation gets its own context.
+        thread_request = copy.copy(request)
+        thread_request.dataloaders = {}  # type: ignore[attr-defined]
+        thread_request.allow_replica = True  # type: ignore[attr-defined]
+        try:
+            with observability.report_api_call_in_thread(api_call):
+                return self.get_response(thread_request, data)
+        finally:
+            connections.close_all()
+
     def get_response(
-        self, request: HttpRequest, data: dict
+        self, request: HttpRequest, data: dict, share_dataloaders: bool = False
     ) -> tuple[Optional[dict[str, list[Any]]], int]:
         with observability.report_gql_operation() as operation:
-            execution_result = self.execute_graphql_request(request, data)
+            execution_result = self.execute_graphql_request(
+                request, data, share_dataloaders=share_dataloaders
+            )
             status_code = 200
             if execution_result:
                 response = {}
@@ -256,7 +336,9 @@ class GraphQLView(View):
         except (ValueError, GraphQLSyntaxError) as e:
             return None, ExecutionResult(errors=[e], invalid=True)
 
-    def execute_graphql_request(self, request: HttpRequest, data: dict):
+    def execute_graphql_request(
+        self, request: HttpRequest, data: dict, share_dataloaders: bool = False
+    ):
         with opentracing.global_tracer().start_active_span("graphql_query") as scope:
             span = scope.span
             span.set_tag(opentracing.tags.COMPONENT, "graphql")
@@ -266,6 +348,16 @@ class GraphQLView(View):
             )
 
             query, variables, operation_name = self.get_graphql_params(request, data)
+            try:
+                query, persisted_query_hash = resolve_persisted_query(
+                    query, data.get("extensions")
+                )
+            except PersistedQueryError as e:
+                # Apollo clients expect a successful response for a missing
+                # persisted query, so they can retry with the full query text.
+                return ExecutionResult(
+                    errors=[e], invalid=not isinstance(e, PersistedQueryNotFound)
+                )
             document, error = self.parse_query(query)
             with observability.report_gql_operation() as operation:
                 operation.query = document
@@ -285,13 +377,7 @@ class GraphQLView(View):
             except GraphQLError as e:
                 return ExecutionResult(errors=[e], invalid=True)
 
-            query_cost, cost_errors = validate_query_cost(
-                schema,
-                document,
-                variables,
-                COST_MAP,
-                settings.GRAPHQL_QUERY_MAX_COMPLEXITY,
-            )
+            query_cost, cost_errors = self.get_query_cost(document, variables)
             span.set_tag("graphql.query_cost", query_cost)
             if settings.GRAPHQL_QUERY_MAX_COMPLEXITY and cost_errors:
                 result = ExecutionResult(errors=cost_errors, invalid=True)
@@ -305,6 +391,11 @@ class GraphQLView(View):
                 extra_options["executor"] = self.executor
 
             context = get_context_value(request)
+            if share_dataloaders and document_contains_mutation(document):
+                # Mutations can't use objects loaded by the previous operations and
+                # the following ones can't reuse objects loaded before the mutation.
+                clear_context(context)
+                share_dataloaders = False
             if app := getattr(request, "app", None):
                 span.set_tag("app.id", app.id)
                 span.set_tag("app.name", app.name)
@@ -315,9 +406,17 @@ class GraphQLView(View):
                     should_use_cache_for_scheme = query_contains_schema & (
                         not settings.DEBUG
                     )
+                    response_cache_key, response_cache_ttl = None, None
                     if should_use_cache_for_scheme:
                         key = generate_cache_key(raw_query_string)
                         response = cache.get(key)
+                    elif not query_contains_schema:
+                        response_cache_key, response_cache_ttl = get_response_cache_key(
+                            request, document, variables, operation_name
+                        )
+                    if response_cache_key:
+                        response = get_cached_response(response_cache_key)
+                        span.set_tag("graphql.response_cache_hit", bool(response))
 
                     if not response:
                         response = document.execute(
@@ -330,7 +429,14 @@ class GraphQLView(View):
                         )
                         if should_use_cache_for_scheme:
                             cache.set(key, response)
-
+                        elif response_cache_key and response_cache_ttl:
+                            cache_response(
+                                response_cache_key, response, response_cache_ttl
+                            )
+
+                    if persisted_query_hash and not response.invalid:
+                        # Documents failing validation are executed as invalid.
+                        save_persisted_query(persisted_query_hash, raw_query_string)
                     return set_query_cost_on_result(response, query_cost)
             except Exception as e:
                 span.set_tag(opentracing.tags.ERROR, True)
@@ -342,7 +448,27 @@ class GraphQLView(View):
                     e = GraphQLError(str(e))
                 return ExecutionResult(errors=[e], invalid=True)
             finally:
-                clear_context(context)
+                if not share_dataloaders:
+                    clear_context(context)
+
+    def get_query_cost(self, document: GraphQLDocument, variables: Optional[dict]):
+        if isinstance(self.backend, GraphQLDocumentCacheBackend):
+            # Query cost depends only on the document and variables, so it can be
+            # stored together with the cached document.
+            return self.backend.get_query_cost(
+                schema,
+                document,
+                variables,
+                COST_MAP,
+                settings.GRAPHQL_QUERY_MAX_COMPLEXITY,
+            )
+        return validate_query_cost(
+            schema,
+            document,
+            variables,
+            COST_MAP,
+            settings.GRAPHQL_QUERY_MAX_COMPLEXITY,
+        )
 
     @staticmethod
     def parse_body(request: HttpRequest):
@@ -380,6 +506,22 @@ class GraphQLView(View):
         return format_error(error, self.HANDLED_EXCEPTIONS, self._query)
 
 
+def document_contains_mutation(document: GraphQLDocument) -> bool:
+    return any(
+        isinstance(definition, OperationDefinition)
+        and definition.operation == "mutation"
+        for definition in document.document_ast.definitions
+    )
+
+
+@lru_cache(maxsize=1)
+def get_batch_executor() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(
+        max_workers=settings.GRAPHQL_BATCH_MAX_WORKERS,
+        thread_name_prefix="graphql-batch",
+    )
+
+
 def get_key(key):
     try:
         int_key = int(key)
@@ -9,6 +9,7 @@ from typing import (
 )
 from uuid import UUID
 
+from django.conf import settings
 from django.contrib.sites.models import Site
 from django.db.models import Exists, OuterRef, Q, QuerySet
 from django.db.models.aggregates import Sum
@@ -29,6 +30,7 @@ from ...warehouse.models import (
     Warehouse,
 )
 from ...warehouse.reservations import is_reservation_enabled
+from ...warehouse.routing import get_channel_routing, is_warehouse_routing_enabled
 from ..channel.dataloaders import ChannelBySlugLoader
 from ..core.dataloaders import DataLoader
 from ..shipping.dataloaders import (
@@ -111,27 +113,41 @@ class AvailableQuantityByProductVariantIdCountryCodeAndChannelSlugLoader(
             .filter(product_variant_id__in=variant_ids)
         )
 
-        warehouse_shipping_zones = self.get_warehouse_shipping_zones(
-            country_code, channel_slug
+        warehouse_shipping_zones_map: defaultdict[UUID, list[int]] = defaultdict(list)
+        routing = (
+            get_channel_routing(channel_slug)
+            if channel_slug and is_warehouse_routing_enabled()
+            else None
         )
-        cc_warehouses = self.get_click_and_collect_warehouses(
-            channel_slug, country_code
-        )
-
-        warehouse_shipping_zones_map = defaultdict(list)
-        for warehouse_shipping_zone in warehouse_shipping_zones:
-            warehouse_shipping_zones_map[warehouse_shipping_zone.warehouse_id].append(
-                warehouse_shipping_zone.shippingzone_id
+        if routing:
+            warehouse_shipping_zones_map.update(
+                routing.get_warehouse_shipping_zones(country_code)
+            )
+            cc_warehouse_options = (
+                {} if country_code else routing.get_click_and_collect_options()
+            )
+        else:
+            warehouse_shipping_zones = self.get_warehouse_shipping_zones(
+                country_code, channel_slug
+            )
+            for warehouse_shipping_zone in warehouse_shipping_zones:
+                warehouse_shipping_zones_map[
+                    warehouse_shipping_zone.warehouse_id
+                ].append(warehouse_shipping_zone.shippingzone_id)
+            cc_warehouse_options = dict(
+                self.get_click_and_collect_warehouses(
+                    channel_slug, country_code
+                ).values_list("id", "click_and_collect_option")
             )
 
         stocks = stocks.filter(
-            Q(warehouse_id__in=warehouse_shipping_zones_map.keys())
-            | Q(warehouse_id__in=cc_warehouses.values("id"))
+            Q(warehouse_id__in=list(warehouse_shipping_zones_map.keys()))
+            | Q(warehouse_id__in=list(cc_warehouse_options.keys()))
         )
 
         stocks = stocks.annotate_available_quantity().order_by("pk")
 
-        stocks_reservations = self.prepare_stocks_reservations_map(variant_ids)
+        stocks_reservations = self.prepare_stocks_reservations_map(variant_ids, stocks)
 
         # A single country code (or a missing country code) can return results from
         # multiple shipping zones. We want to prepare warehouse by shipping zone map
@@ -142,7 +158,10 @@ class AvailableQuantityByProductVariantIdCountryCodeAndChannelSlugLoader(
             variants_with_global_cc_warehouses,
             available_quantity_by_warehouse_id_and_variant_id,
         ) = self.prepare_warehouse_ids_by_shipping_zone_and_variant_map(
-            stocks, stocks_reservations, warehouse_shipping_zones_map, cc_warehouses
+            stocks,
+            stocks_reservations,
+            warehouse_shipping_zones_map,
+            cc_warehouse_options,
         )
 
         quantity_map = self.prepare_quantity_map(
@@ -237,11 +256,20 @@ class AvailableQuantityByProductVariantIdCountryCodeAndChannelSlugLoader(
             )
         return warehouses
 
-    def prepare_stocks_reservations_map(self, variant_ids):
-        """Prepare stock id to quantity reserved map for provided variant ids."""
+    def prepare_stocks_reservations_map(self, variant_ids, stocks=None):
+        """Prepare stock id to quantity reserved map for provided variant ids.
+
+        With `STOCK_DENORMALIZED_AVAILABILITY_ENABLED` the reserved quantities are
+        read from the given stocks instead of summing the active reservations.
+        """
         stocks_reservations = defaultdict(int)
         site = get_site_promise(self.context).get()
-        if is_reservation_enabled(site.settings):
+        if not is_reservation_enabled(site.settings):
+            return stocks_reservations
+        if settings.STOCK_DENORMALIZED_AVAILABILITY_ENABLED and stocks is not None:
+            for stock in stocks:
+                stocks_reservations[stock.id] = stock.quantity_reserved
+        else:
             # Can't do second annotation on same queryset because it made
             # available_quantity annotated value incorrect thanks to how
             # Django's ORM builds SQLs with annotations
@@ -261,7 +289,7 @@ class AvailableQuantityByProductVariantIdCountryCodeAndChannelSlugLoader(
         stocks: QuerySet[StockWithAvailableQuantity],
         stocks_reservations,
         warehouse_shipping_zones_map,
-        cc_warehouses,
+        cc_warehouse_options,
     ):
         """Combine all quantities within a single zone.
 
@@ -278,7 +306,6 @@ class AvailableQuantityByProductVariantIdCountryCodeAndChannelSlugLoader(
         the shipping zone id. Every stock of the collection point warehouse is treated
         as a magic single-warehouse shipping zone.
         """
-        cc_warehouses_in_bulk = cc_warehouses.in_bulk()
         warehouse_ids_by_shipping_zone_by_variant: defaultdict[
             int, defaultdict[Union[int, UUID], list[UUID]]
         ] = defaultdict(lambda: defaultdict(list))
@@ -304,7 +331,7 @@ class AvailableQuantityByProductVariantIdCountryCodeAndChannelSlugLoader(
                         shipping_zone_id
                     ].append(warehouse_id)
             else:
-                cc_option = cc_warehouses_in_bulk[warehouse_id].click_and_collect_option
+                cc_option = cc_warehouse_options[warehouse_id]
                 # every stock of a collection point warehouse should treat as a magic
                 # single-warehouse shipping zone
                 warehouse_ids_by_shipping_zone_by_variant[variant_id][warehouse_id] = [
@@ -656,6 +683,7 @@ class PreorderQuantityReservedByVariantChannelListingIdLoader(DataLoader[int, in
 
 class WarehouseByIdLoader(DataLoader):
     context_key = "warehouse_by_id"
+    cache_name = "warehouse"
 
     def batch_load(self, keys: Iterable[UUID]) -> list[Optional[Warehouse]]:
         warehouses = (
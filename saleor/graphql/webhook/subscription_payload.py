@@ -1,3 +1,5 @@
+import hashlib
+import threading
 from collections.abc import Iterable
 from datetime import datetime
 from typing import Any, Optional, Union
@@ -7,7 +9,7 @@ from django.conf import settings
 from django.db import models
 from django.utils import timezone
 from django.utils.functional import SimpleLazyObject
-from graphql import get_default_backend, parse
+from graphql import GraphQLDocument
 from graphql.error import GraphQLError
 from promise import Promise
 
@@ -15,6 +17,7 @@ from ...account.models import User
 from ...app.models import App
 from ...core.exceptions import PermissionDenied
 from ...core.utils import get_domain
+from ...core.utils.cache import CacheDict
 from ...webhook.models import Webhook
 from ..core import SaleorContext
 from ..core.dataloaders import DataLoader
@@ -22,6 +25,12 @@ from ..utils import format_error
 
 logger = get_task_logger(__name__)
 
+# Number of compiled subscription documents kept per process.
+SUBSCRIPTION_DOCUMENT_CACHE_SIZE = 1024
+
+_subscription_documents_lock = threading.Lock()
+_subscription_documents: CacheDict = CacheDict(SUBSCRIPTION_DOCUMENT_CACHE_SIZE)
+
 
 def initialize_request(
     requestor=None,
@@ -65,12 +74,60 @@ def get_event_payload(event):
     return event
 
 
+def compile_subscription_document(subscription_query: str) -> GraphQLDocument:
+    """Parse and validate the subscription query against the schema."""
+    from ..api import SaleorGraphQLBackend, schema
+
+    return SaleorGraphQLBackend().document_from_string(schema, subscription_query)
+
+
+def get_subscription_document(
+    subscription_query: str, webhook_id: Optional[int] = None
+) -> GraphQLDocument:
+    """Return the compiled subscription document.
+
+    Documents of saved webhooks are kept in a per-process LRU keyed by the webhook
+    ID and the query hash; ad hoc queries, e.g. from dry runs, are compiled
+    on every call.
+    """
+    if webhook_id is None:
+        return compile_subscription_document(subscription_query)
+
+    query_hash = hashlib.sha256(subscription_query.encode("utf-8")).hexdigest()
+    key = (webhook_id, query_hash)
+    with _subscription_documents_lock:
+        document = _subscription_documents.get(key)
+        if document is not None:
+            _subscription_documents.move_to_end(key)
+            return document
+
+    document = compile_subscription_document(subscription_query)
+    with _subscription_documents_lock:
+        _subscription_documents[key] = document
+    return document
+
+
+def invalidate_subscription_documents(webhook_id: Optional[int] = None):
+    """Drop compiled documents of the given webhook or all of them."""
+    with _subscription_documents_lock:
+        if webhook_id is None:
+            _subscription_documents.clear()
+            return
+        for key in [key for key in _subscription_documents if key[0] == webhook_id]:
+            del _subscription_documents[key]
+
+
+def invalidate_subscription_documents_handler(sender, instance, **kwargs):
+    invalidate_subscription_documents(instance.pk)
+
+
 def generate_payload_from_subscription(
     event_type: str,
     subscribable_object,
     subscription_query: str,
     request: SaleorContext,
     app: Optional[App] = None,
+    webhook_id: Optional[int] = None,
 ) -> Optional[dict[str, Any]]:
     """Generate webhook payload from subscription query.
 
@@ -85,18 +142,13 @@ def generate_payload_from_subscription(
     dataloaders benefits.
     app: the owner of the given payload. Required in case when webhook contains
     protected fields.
+    webhook_id: the webhook the query belongs to; used to reuse the compiled query.
     return: A payload ready to send via webhook. None if the function was not able to
     generate a payload
     """
-    from ..api import schema
     from ..context import get_context_value
 
-    graphql_backend = get_default_backend()
-    ast = parse(subscription_query)
-    document = graphql_backend.document_from_string(
-        schema,
-        ast,
-    )
+    document = get_subscription_document(subscription_query, webhook_id)
     app_id = app.pk if app else None
     request.app = app
     results = document.execute(
@@ -175,6 +227,7 @@ def generate_pre_save_payloads(
                 subscription_query=webhook.subscription_query,
                 request=request,
                 app=webhook.app,
+                webhook_id=webhook.pk,
             )
             key = get_pre_save_payload_key(webhook, instance)
             pre_save_payloads[key] = instance_payload
@@ -3,7 +3,7 @@ from typing import TYPE_CHECKING
 from django.apps import AppConfig
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
-from django.utils.module_loading import import_string
+from django.db.models.signals import post_delete, post_save
 
 if TYPE_CHECKING:
     from .base_plugin import BasePlugin
@@ -14,14 +14,33 @@ class PluginConfig(AppConfig):
     verbose_name = "Plugins"
 
     def ready(self):
+        from ..channel.models import Channel
+        from .configuration_cache import invalidate_plugin_configurations_handler
+        from .models import PluginConfiguration
+
         plugins = getattr(settings, "PLUGINS", [])
 
         for plugin_path in plugins:
             self.load_and_check_plugin(plugin_path)
 
+        for sender in (PluginConfiguration, Channel):
+            name = sender.__name__.lower()
+            post_save.connect(
+                invalidate_plugin_configurations_handler,
+                sender=sender,
+                dispatch_uid=f"invalidate_plugin_configurations_on_{name}_save",
+            )
+            post_delete.connect(
+                invalidate_plugin_configurations_handler,
+                sender=sender,
+                dispatch_uid=f"invalidate_plugin_configurations_on_{name}_delete",
+            )
+
     def load_and_check_plugin(self, plugin_path: str):
+        from .configuration_cache import get_plugin_class
+
         try:
-            plugin = import_string(plugin_path)
+            plugin = get_plugin_class(plugin_path)
         except ImportError as e:
             raise (ImportError(f"Failed to import plugin {plugin_path}: {e}"))
 
@@ -0,0 +1,140 @@
+import copy
+import functools
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+from ..channel.models import Channel
+from ..core.db.connection import allow_writer
+from .models import PluginConfiguration
+
+if TYPE_CHECKING:
+    from .base_plugin import BasePlugin
+
+logger = logging.getLogger(__name__)
+
+PLUGIN_CONFIGURATION_VERSION_KEY = "plugin-configuration-version"
+
+
+@functools.cache
+def get_plugin_class(plugin_path: str) -> type["BasePlugin"]:
+    return import_string(plugin_path)
+
+
+def get_plugin_configuration_version() -> int:
+    try:
+        return cache.get(PLUGIN_CONFIGURATION_VERSION_KEY, 0)
+    except Exception:
+        logger.warning("Unable to fetch plugin configuration version.", exc_info=True)
+        return -1
+
+
+def _bump_plugin_configuration_version():
+    try:
+        cache.incr(PLUGIN_CONFIGURATION_VERSION_KEY)
+    except ValueError:
+        cache.set(PLUGIN_CONFIGURATION_VERSION_KEY, 1, timeout=None)
+    except Exception:
+        logger.warning("Unable to invalidate plugin configurations.", exc_info=True)
+
+
+def invalidate_plugin_configurations():
+    """Mark the plugin configurations cached by all processes as stale.
+
+    The version is bumped after the transaction is committed, so other processes
+    can't store the old configurations under the new version.
+    """
+    plugin_configuration_cache.clear()
+    transaction.on_commit(_bump_plugin_configuration_version)
+
+
+def invalidate_plugin_configurations_handler(sender, **kwargs):
+    invalidate_plugin_configurations()
+
+
+@dataclass
+class ChannelPluginConfigurations:
+    channel: Optional[Channel]
+    configs: dict[str, PluginConfiguration]
+
+
+@dataclass
+class PluginConfigurationCache:
+    """Per-process snapshot of the plugin configurations.
+
+    Entries are keyed by the channel slug; the global configurations are stored
+    under the `None` slug. The snapshot is dropped as soon as the configuration
+    version stored in the cache changes. It's built from the writer, as a lagging
+    replica could return the configurations from before the version was bumped.
+    Returned objects are copies, so plugins can't modify the shared snapshot.
+    """
+
+    version: Optional[int] = None
+    entries: dict[Optional[str], ChannelPluginConfigurations] = field(
+        default_factory=dict
+    )
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def clear(self):
+        with self.lock:
+            self.version = None
+            self.entries = {}
+
+    def get(
+        self,
+        version: int,
+        channel_slug: Optional[str],
+        channel: Optional[Channel] = None,
+    ) -> Optional[ChannelPluginConfigurations]:
+        """Return the channel and its plugin configurations.
+
+        Return `None` when the channel with the given slug doesn't exist.
+        """
+        key = channel_slug
+        with self.lock:
+            if self.version != version:
+                self.version = version
+                self.entries = {}
+            entry = self.entries.get(key)
+
+        if entry is None:
+            with allow_writer():
+                entry = fetch_plugin_configurations(
+                    settings.DATABASE_CONNECTION_DEFAULT_NAME, channel_slug, channel
+                )
+            if entry is None or version < 0:
+                # Don't store the snapshot when the cache is unavailable.
+                return entry
+            with self.lock:
+                if self.version == version:
+                    self.entries[key] = copy.deepcopy(entry)
+            return entry
+        return copy.deepcopy(entry)
+
+
+def fetch_plugin_configurations(
+    database: str,
+    channel_slug: Optional[str],
+    channel: Optional[Channel] = None,
+) -> Optional[ChannelPluginConfigurations]:
+    if channel_slug is not None and channel is None:
+        channel = Channel.objects.using(database).filter(slug=channel_slug).first()
+        if not channel:
+            return None
+    configs = {}
+    for db_config in (
+        PluginConfiguration.objects.using(database).filter(channel=channel).iterator()
+    ):
+        if channel is not None:
+            db_config.channel = channel
+        configs[db_config.identifier] = db_config
+    return ChannelPluginConfigurations(channel=channel, configs=configs)
+
+
+plugin_configuration_cache = PluginConfigurationCache()
@@ -0,0 +1,54 @@
+import threading
+from dataclasses import dataclass
+
+
+@dataclass
+class PluginHookStats:
+    calls: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "calls": self.calls,
+            "total_time": self.total_time,
+            "max_time": self.max_time,
+        }
+
+
+class PluginHookTimings:
+    """Per-process timing counters of plugin hooks, keyed by plugin and hook name.
+
+    Only hooks implemented by a plugin are measured; times are in seconds.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.stats: dict[tuple[str, str], PluginHookStats] = {}
+
+    def record(self, plugin_id: str, method_name: str, duration: float):
+        key = (plugin_id, method_name)
+        with self.lock:
+            stats = self.stats.get(key)
+            if stats is None:
+                stats = self.stats[key] = PluginHookStats()
+            stats.calls += 1
+            stats.total_time += duration
+            stats.max_time = max(stats.max_time, duration)
+
+    def clear(self):
+        with self.lock:
+            self.stats = {}
+
+    def as_list(self) -> list[dict]:
+        """Return the counters sorted by the total time spent in the hook."""
+        with self.lock:
+            items = list(self.stats.items())
+        items.sort(key=lambda item: item[1].total_time, reverse=True)
+        return [
+            {"plugin": plugin_id, "hook": method_name, **stats.as_dict()}
+            for (plugin_id, method_name), stats in items
+        ]
+
+
+hook_timings = PluginHookTimings()
@@ -1,3 +1,4 @@
+import time
 from collections import defaultdict
 from collections.abc import Iterable
 from decimal import Decimal
@@ -6,7 +7,6 @@ from typing import TYPE_CHECKING, Any, Callable, Optional, Union
 import opentracing
 from django.conf import settings
 from django.http import HttpResponse, HttpResponseNotFound
-from django.utils.module_loading import import_string
 from graphene import Mutation
 from graphql import GraphQLError
 from graphql.execution import ExecutionResult
@@ -20,6 +20,13 @@ from ..core.payments import PaymentInterface
 from ..core.prices import quantize_price
 from ..core.taxes import TaxData, TaxType, zero_money, zero_taxed_money
 from ..graphql.core import ResolveInfo, SaleorContext
+from ..graphql.response_cache import (
+    CATEGORY_SCOPE,
+    COLLECTION_SCOPE,
+    MENU_SCOPE,
+    PRODUCT_SCOPE,
+    invalidate_response_cache,
+)
 from ..order import base_calculations as base_order_calculations
 from ..order.base_calculations import (
     base_order_line_total,
@@ -53,6 +60,13 @@ from ..payment.interface import (
 )
 from ..tax.utils import calculate_tax_rate
 from .base_plugin import ExcludedShippingMethod, ExternalAccessTokens
+from .configuration_cache import (
+    fetch_plugin_configurations,
+    get_plugin_class,
+    get_plugin_configuration_version,
+    plugin_configuration_cache,
+)
+from .hook_stats import hook_timings
 from .models import PluginConfiguration
 
 if TYPE_CHECKING:
@@ -143,6 +157,10 @@ class PluginsManager(PaymentInterface):
             self.loaded_channels: set[str] = set()
             self.loaded_global = False
             self.requestor_getter = requestor_getter
+            self._plugin_configuration_version: Optional[int] = None
+            self._plugins_per_method: dict[
+                tuple[Optional[str], str], list[BasePlugin]
+            ] = {}
 
     def __del__(self) -> None:
         # remove references to plugins
@@ -151,16 +169,20 @@ class PluginsManager(PaymentInterface):
         for c in self.plugins_per_channel.values():
             c.clear()
         self.loaded_channels.clear()
+        self._plugins_per_method.clear()
 
     def _ensure_channel_plugins_loaded(
         self, channel_slug: Optional[str], channel: Optional[Channel] = None
     ):
         if channel_slug is None and not self.loaded_global:
-            global_db_config = self._get_db_plugin_configs(None)
+            global_configurations = self._get_plugin_configurations(None)
+            global_db_config = (
+                global_configurations.configs if global_configurations else {}
+            )
 
             for plugin_path in self.plugins:
                 with opentracing.global_tracer().start_active_span(f"{plugin_path}"):
-                    PluginClass = import_string(plugin_path)
+                    PluginClass = get_plugin_class(plugin_path)
                     if not getattr(PluginClass, "CONFIGURATION_PER_CHANNEL", False):
                         plugin = self._load_plugin(
                             PluginClass,
@@ -171,22 +193,20 @@ class PluginsManager(PaymentInterface):
                         self.global_plugins.append(plugin)
                         self.all_plugins.append(plugin)
             self.loaded_global = True
+            self._plugins_per_method.clear()
 
         if channel_slug is not None and channel_slug not in self.loaded_channels:
-            if channel is None:
-                channel = (
-                    Channel.objects.using(self.database)
-                    .filter(slug=channel_slug)
-                    .first()
-                )
-                if not channel:
-                    return
-
-            channel_db_config = self._get_db_plugin_configs(channel)
+            channel_configurations = self._get_plugin_configurations(
+                channel_slug, channel
+            )
+            if not channel_configurations:
+                return
+            channel = channel_configurations.channel
+            channel_db_config = channel_configurations.configs
 
             for plugin_path in self.plugins:
                 with opentracing.global_tracer().start_active_span(f"{plugin_path}"):
-                    PluginClass = import_string(plugin_path)
+                    PluginClass = get_plugin_class(plugin_path)
                     if getattr(PluginClass, "CONFIGURATION_PER_CHANNEL", False):
                         plugin = self._load_plugin(
                             PluginClass,
@@ -201,16 +221,29 @@ class PluginsManager(PaymentInterface):
             self._ensure_channel_plugins_loaded(None)
             self.plugins_per_channel[channel_slug].extend(self.global_plugins)
             self.loaded_channels.add(channel_slug)
+            self._plugins_per_method.clear()
 
-    def _get_db_plugin_configs(self, channel: Optional[Channel]):
-        with opentracing.global_tracer().start_active_span("_get_db_plugin_configs"):
-            plugin_manager_configs = PluginConfiguration.objects.using(
-                self.database
-            ).filter(channel=channel)
-            configs = {}
-            for db_plugin_config in plugin_manager_configs.iterator():
-                configs[db_plugin_config.identifier] = db_plugin_config
-            return configs
+    def _get_plugin_configurations(
+        self, channel_slug: Optional[str], channel: Optional[Channel] = None
+    ):
+        """Return the channel and its plugin configurations.
+
+        When `PLUGINS_CONFIGURATION_CACHE_ENABLED` is set, the configurations are
+        taken from the per-process snapshot. The snapshot version is fetched once per
+        manager, so all channels are loaded from the same version.
+        """
+        with opentracing.global_tracer().start_active_span(
+            "_get_plugin_configurations"
+        ):
+            if not settings.PLUGINS_CONFIGURATION_CACHE_ENABLED:
+                return fetch_plugin_configurations(self.database, channel_slug, channel)
+            if self._plugin_configuration_version is None:
+                self._plugin_configuration_version = get_plugin_configuration_version()
+            return plugin_configuration_cache.get(
+                self._plugin_configuration_version,
+                channel_slug,
+                channel,
+            )
 
     def __run_method_on_plugins(
         self,
@@ -223,17 +256,35 @@ class PluginsManager(PaymentInterface):
     ):
         """Try to run a method with the given name on each declared active plugin."""
         value = default_value
-        plugins = self.get_plugins(
-            channel_slug=channel_slug,
-            active_only=True,
-            plugin_ids=plugin_ids,
-        )
-        for plugin in plugins:
+        for plugin in self._get_plugins_implementing(method_name, channel_slug):
+            if not plugin.active or (plugin_ids and plugin.PLUGIN_ID not in plugin_ids):
+                continue
             value = self.__run_method_on_single_plugin(
                 plugin, method_name, value, *args, **kwargs
             )
         return value
 
+    def _get_plugins_implementing(
+        self, method_name: str, channel_slug: Optional[str]
+    ) -> list["BasePlugin"]:
+        """Return plugins of the channel that implement the given method.
+
+        The result is stored in a dispatch table, so methods that aren't implemented
+        by any plugin don't cost anything on subsequent calls. The table is reset
+        whenever new plugins are loaded.
+        """
+        key = (channel_slug, method_name)
+        if key in self._plugins_per_method:
+            return self._plugins_per_method[key]
+        plugins = [
+            plugin
+            for plugin in self.get_plugins(channel_slug=channel_slug)
+            if getattr(plugin, method_name, NotImplemented) is not NotImplemented
+        ]
+        if channel_slug is None or channel_slug in self.loaded_channels:
+            self._plugins_per_method[key] = plugins
+        return plugins
+
     def __run_method_on_single_plugin(
         self,
         plugin: Optional["BasePlugin"],
@@ -251,7 +302,22 @@ class PluginsManager(PaymentInterface):
         plugin_method = getattr(plugin, method_name, NotImplemented)
         if plugin_method == NotImplemented:
             return previous_value
-        returned_value = plugin_method(*args, **kwargs, previous_value=previous_value)  # type:ignore
+        if settings.PLUGINS_HOOK_TIMING_ENABLED:
+            start = time.perf_counter()
+            try:
+                returned_value = plugin_method(
+                    *args, **kwargs, previous_value=previous_value
+                )
+            finally:
+                hook_timings.record(
+                    plugin.PLUGIN_ID,  # type: ignore[union-attr]
+                    method_name,
+                    time.perf_counter() - start,
+                )
+        else:
+            returned_value = plugin_method(
+                *args, **kwargs, previous_value=previous_value
+            )  # type:ignore
         if returned_value == NotImplemented:
             return previous_value
         return returned_value
@@ -722,18 +788,21 @@ class PluginsManager(PaymentInterface):
 
     def collection_created(self, collection: "Collection"):
         default_value = None
+        invalidate_response_cache(COLLECTION_SCOPE)
         return self.__run_method_on_plugins(
             "collection_created", default_value, collection, channel_slug=None
         )
 
     def collection_updated(self, collection: "Collection"):
         default_value = None
+        invalidate_response_cache(COLLECTION_SCOPE)
         return self.__run_method_on_plugins(
             "collection_updated", default_value, collection, channel_slug=None
         )
 
     def collection_deleted(self, collection: "Collection", webhooks=None):
         default_value = None
+        invalidate_response_cache(COLLECTION_SCOPE)
         return self.__run_method_on_plugins(
             "collection_deleted",
             default_value,
@@ -744,12 +813,14 @@ class PluginsManager(PaymentInterface):
 
     def collection_metadata_updated(self, collection: "Collection"):
         default_value = None
+        invalidate_response_cache(COLLECTION_SCOPE)
         return self.__run_method_on_plugins(
             "collection_metadata_updated", default_value, collection, channel_slug=None
         )
 
     def product_created(self, product: "Product", webhooks=None):
         default_value = None
+        invalidate_response_cache(PRODUCT_SCOPE)
         return self.__run_method_on_plugins(
             "product_created",
             default_value,
@@ -760,6 +831,7 @@ class PluginsManager(PaymentInterface):
 
     def product_updated(self, product: "Product", webhooks=None):
         default_value = None
+        invalidate_response_cache(PRODUCT_SCOPE)
         return self.__run_method_on_plugins(
             "product_updated",
             default_value,
@@ -770,6 +842,7 @@ class PluginsManager(PaymentInterface):
 
     def product_deleted(self, product: "Product", variants: list[int], webhooks=None):
         default_value = None
+        invalidate_response_cache(PRODUCT_SCOPE)
         return self.__run_method_on_plugins(
             "product_deleted",
             default_value,
@@ -781,30 +854,35 @@ class PluginsManager(PaymentInterface):
 
     def product_media_created(self, media: "ProductMedia"):
         default_value = None
+        invalidate_response_cache(PRODUCT_SCOPE)
         return self.__run_method_on_plugins(
             "product_media_created", default_value, media, channel_slug=None
         )
 
     def product_media_updated(self, media: "ProductMedia"):
         default_value = None
+        invalidate_response_cache(PRODUCT_SCOPE)
         return self.__run_method_on_plugins(
             "product_media_updated", default_value, media, channel_slug=None
         )
 
     def product_media_deleted(self, media: "ProductMedia"):
         default_value = None
+        invalidate_response_cache(PRODUCT_SCOPE)
         return self.__run_method_on_plugins(
             "product_media_deleted", default_value, media, channel_slug=None
         )
 
     def product_metadata_updated(self, product: "Product"):
         default_value = None
+        invalidate_response_cache(PRODUCT_SCOPE)
         return self.__run_method_on_plugins(
             "product_metadata_updated", default_value, product, channel_slug=None
         )
 
     def product_variant_created(self, product_variant: "ProductVariant", webhooks=None):
         default_value = None
+        invalidate_response_cache(PRODUCT_SCOPE)
         return self.__run_method_on_plugins(
             "product_variant_created",
             default_value,
@@ -817,6 +895,7 @@ class PluginsManager(PaymentInterface):
         self, product_variant: "ProductVariant", webhooks=None, **kwargs
     ):
         default_value = None
+        invalidate_response_cache(PRODUCT_SCOPE)
         return self.__run_method_on_plugins(
             "product_variant_updated",
             default_value,
@@ -828,6 +907,7 @@ class PluginsManager(PaymentInterface):
 
     def product_variant_deleted(self, product_variant: "ProductVariant", webhooks=None):
         default_value = None
+        invalidate_response_cache(PRODUCT_SCOPE)
         return self.__run_method_on_plugins(
             "product_variant_deleted",
             default_value,
@@ -838,6 +918,7 @@ class PluginsManager(PaymentInterface):
 
     def product_variant_out_of_stock(self, stock: "Stock", webhooks=None):
         default_value = None
+        invalidate_response_cache(PRODUCT_SCOPE)
         self.__run_method_on_plugins(
             "product_variant_out_of_stock",
             default_value,
@@ -848,6 +929,7 @@ class PluginsManager(PaymentInterface):
 
     def product_variant_back_in_stock(self, stock: "Stock", webhooks=None):
         default_value = None
+        invalidate_response_cache(PRODUCT_SCOPE)
         self.__run_method_on_plugins(
             "product_variant_back_in_stock",
             default_value,
@@ -858,6 +940,7 @@ class PluginsManager(PaymentInterface):
 
     def product_variant_stock_updated(self, stock: "Stock", webhooks=None):
         default_value = None
+        invalidate_response_cache(PRODUCT_SCOPE)
         self.__run_method_on_plugins(
             "product_variant_stock_updated",
             default_value,
@@ -868,6 +951,7 @@ class PluginsManager(PaymentInterface):
 
     def product_variant_metadata_updated(self, product_variant: "ProductVariant"):
         default_value = None
+        invalidate_response_cache(PRODUCT_SCOPE)
         self.__run_method_on_plugins(
             "product_variant_metadata_updated",
             default_value,
@@ -1537,18 +1621,21 @@ class PluginsManager(PaymentInterface):
 
     def category_created(self, category: "Category"):
         default_value = None
+        invalidate_response_cache(CATEGORY_SCOPE)
         return self.__run_method_on_plugins(
             "category_created", default_value, category, channel_slug=None
         )
 
     def category_updated(self, category: "Category"):
         default_value = None
+        invalidate_response_cache(CATEGORY_SCOPE)
         return self.__run_method_on_plugins(
             "category_updated", default_value, category, channel_slug=None
         )
 
     def category_deleted(self, category: "Category", webhooks=None):
         default_value = None
+        invalidate_response_cache(CATEGORY_SCOPE)
         return self.__run_method_on_plugins(
             "category_deleted",
             default_value,
@@ -1664,6 +1751,7 @@ class PluginsManager(PaymentInterface):
 
     def menu_created(self, menu: "Menu"):
         default_value = None
+        invalidate_response_cache(MENU_SCOPE)
         return self.__run_method_on_plugins(
             "menu_created",
             default_value,
@@ -1673,6 +1761,7 @@ class PluginsManager(PaymentInterface):
 
     def menu_updated(self, menu: "Menu"):
         default_value = None
+        invalidate_response_cache(MENU_SCOPE)
         return self.__run_method_on_plugins(
             "menu_updated",
             default_value,
@@ -1682,6 +1771,7 @@ class PluginsManager(PaymentInterface):
 
     def menu_deleted(self, menu: "Menu", webhooks=None):
         default_value = None
+        invalidate_response_cache(MENU_SCOPE)
         return self.__run_method_on_plugins(
             "menu_deleted",
             default_value,
@@ -1692,6 +1782,7 @@ class PluginsManager(PaymentInterface):
 
     def menu_item_created(self, menu_item: "MenuItem"):
         default_value = None
+        invalidate_response_cache(MENU_SCOPE)
         return self.__run_method_on_plugins(
             "menu_item_created",
             default_value,
@@ -1701,6 +1792,7 @@ class PluginsManager(PaymentInterface):
 
     def menu_item_updated(self, menu_item: "MenuItem"):
         default_value = None
+        invalidate_response_cache(MENU_SCOPE)
         return self.__run_method_on_plugins(
             "menu_item_updated",
             default_value,
@@ -1710,6 +1802,7 @@ class PluginsManager(PaymentInterface):
 
     def menu_item_deleted(self, menu_item: "MenuItem", webhooks=None):
         default_value = None
+        invalidate_response_cache(MENU_SCOPE)
         return self.__run_method_on_plugins(
             "menu_item_deleted",
             default_value,
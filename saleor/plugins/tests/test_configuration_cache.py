@@ -0,0 +1,93 @@
+from ..configuration_cache import plugin_configuration_cache
+from ..manager import get_plugins_manager
+from ..models import PluginConfiguration
+from .sample_plugins import ChannelPluginSample, PluginSample
+
+
+def test_manager_uses_cached_plugin_configurations(
+    settings, channel_USD, django_assert_num_queries
+):
+    # given
+    settings.PLUGINS_CONFIGURATION_CACHE_ENABLED = True
+    settings.PLUGINS = [
+        "saleor.plugins.tests.sample_plugins.ChannelPluginSample",
+        "saleor.plugins.tests.sample_plugins.PluginSample",
+    ]
+    get_plugins_manager(allow_replica=False).get_plugins(channel_USD.slug)
+
+    # when
+    with django_assert_num_queries(0):
+        plugins = get_plugins_manager(allow_replica=False).get_plugins(channel_USD.slug)
+
+    # then
+    assert {plugin.PLUGIN_ID for plugin in plugins} == {
+        ChannelPluginSample.PLUGIN_ID,
+        PluginSample.PLUGIN_ID,
+    }
+    assert plugins[0].channel == channel_USD
+
+
+def test_cached_plugin_configurations_are_invalidated_on_save(settings):
+    # given
+    settings.PLUGINS_CONFIGURATION_CACHE_ENABLED = True
+    settings.PLUGINS = ["saleor.plugins.tests.sample_plugins.PluginSample"]
+    plugin = get_plugins_manager(allow_replica=False).get_plugin(PluginSample.PLUGIN_ID)
+    assert plugin.active is True
+
+    # when
+    PluginConfiguration.objects.create(
+        identifier=PluginSample.PLUGIN_ID, active=False, configuration=[]
+    )
+
+    # then
+    plugin = get_plugins_manager(allow_replica=False).get_plugin(PluginSample.PLUGIN_ID)
+    assert plugin.active is False
+
+
+def test_cached_plugin_configurations_are_copied(
+    settings, channel_USD, channel_plugin_configurations
+):
+    # given
+    settings.PLUGINS_CONFIGURATION_CACHE_ENABLED = True
+    settings.PLUGINS = ["saleor.plugins.tests.sample_plugins.ChannelPluginSample"]
+    plugin = get_plugins_manager(allow_replica=False).get_plugin(
+        ChannelPluginSample.PLUGIN_ID, channel_USD.slug
+    )
+
+    # when
+    plugin.configuration[0]["value"] = "changed"
+    plugin.channel.name = "changed"
+
+    # then
+    plugin = get_plugins_manager(allow_replica=False).get_plugin(
+        ChannelPluginSample.PLUGIN_ID, channel_USD.slug
+    )
+    assert plugin.configuration[0]["value"] != "changed"
+    assert plugin.channel.name == channel_USD.name
+
+
+def test_plugin_configurations_cache_disabled(
+    settings, channel_USD, django_assert_num_queries
+):
+    # given
+    settings.PLUGINS_CONFIGURATION_CACHE_ENABLED = False
+    settings.PLUGINS = ["saleor.plugins.tests.sample_plugins.ChannelPluginSample"]
+    get_plugins_manager(allow_replica=False).get_plugins(channel_USD.slug)
+
+    # when
+    with django_assert_num_queries(3):
+        get_plugins_manager(allow_replica=False).get_plugins(channel_USD.slug)
+
+    # then
+    assert plugin_configuration_cache.entries == {}
+
+
+def test_manager_for_not_existing_channel(settings):
+    # given
+    settings.PLUGINS = ["saleor.plugins.tests.sample_plugins.ChannelPluginSample"]
+
+    # when
+    plugins = get_plugins_manager(allow_replica=False).get_plugins("not-existing")
+
+    # then
+    assert plugins == []
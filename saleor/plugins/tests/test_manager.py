@@ -1619,3 +1619,73 @@ def test_run_plugin_method_until_first_success_for_active_plugins_only(
     # then
     assert result is None
     assert mock_run_method.call_count == calls
+
+
+def test_manager_dispatch_table_contains_only_implementing_plugins(settings):
+    # given
+    settings.PLUGINS = [
+        "saleor.plugins.tests.sample_plugins.PluginSample",
+        "saleor.plugins.tests.sample_plugins.ActivePlugin",
+    ]
+    manager = get_plugins_manager(allow_replica=False)
+
+    # when
+    manager.promotion_created(mock.Mock())
+    manager.change_user_address(mock.Mock(), None, None)
+
+    # then
+    plugins_per_method = manager._plugins_per_method
+    assert [
+        plugin.PLUGIN_ID for plugin in plugins_per_method[(None, "promotion_created")]
+    ] == [PluginSample.PLUGIN_ID]
+    assert plugins_per_method[(None, "change_user_address")] == []
+
+
+def test_manager_dispatch_table_is_reset_when_channel_plugins_are_loaded(
+    settings, channel_USD
+):
+    # given
+    settings.PLUGINS = ["saleor.plugins.tests.sample_plugins.ChannelPluginSample"]
+    manager = get_plugins_manager(allow_replica=False)
+    manager.promotion_created(mock.Mock())
+    assert manager._plugins_per_method[(None, "promotion_created")] == []
+
+    # when
+    manager.get_plugins(channel_slug=channel_USD.slug)
+
+    # then
+    assert manager._plugins_per_method == {}
+    manager.promotion_created(mock.Mock())
+    assert [
+        plugin.PLUGIN_ID
+        for plugin in manager._plugins_per_method[(None, "promotion_created")]
+    ] == [ChannelPluginSample.PLUGIN_ID]
+
+
+@patch("saleor.plugins.manager.hook_timings")
+def test_manager_records_hook_timings(hook_timings_mock, settings):
+    # given
+    settings.PLUGINS_HOOK_TIMING_ENABLED = True
+    settings.PLUGINS = ["saleor.plugins.tests.sample_plugins.PluginSample"]
+    manager = get_plugins_manager(allow_replica=False)
+
+    # when
+    manager.promotion_created(mock.Mock())
+
+    # then
+    hook_timings_mock.record.assert_called_once_with(
+        PluginSample.PLUGIN_ID, "promotion_created", mock.ANY
+    )
+
+
+@patch("saleor.plugins.manager.hook_timings")
+def test_manager_hook_timings_disabled(hook_timings_mock, settings):
+    # given
+    settings.PLUGINS = ["saleor.plugins.tests.sample_plugins.PluginSample"]
+    manager = get_plugins_manager(allow_replica=False)
+
+    # when
+    manager.promotion_created(mock.Mock())
+
+    # then
+    hook_timings_mock.record.assert_not_called()
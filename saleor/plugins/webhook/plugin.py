@@ -3,7 +3,7 @@ import logging
 from collections import defaultdict
 from collections.abc import Iterable
 from decimal import Decimal
-from functools import partial
+from functools import lru_cache, partial
 from typing import TYPE_CHECKING, Any, Callable, Final, Optional, Union
 
 import graphene
@@ -48,6 +48,7 @@ from ...payment.utils import (
     recalculate_refundable_for_checkout,
 )
 from ...settings import WEBHOOK_SYNC_TIMEOUT
+from ...tax.cache import generate_tax_request_fingerprint, get_or_fetch_tax_data
 from ...thumbnail.models import Thumbnail
 from ...webhook.const import WEBHOOK_CACHE_DEFAULT_TIMEOUT
 from ...webhook.event_types import WebhookEventAsyncType, WebhookEventSyncType
@@ -97,9 +98,12 @@ from ...webhook.transport.shipping import (
     parse_list_shipping_methods_response,
 )
 from ...webhook.transport.synchronous.transport import (
+    generate_subscription_sync_payloads,
     trigger_all_webhooks_sync,
     trigger_webhook_sync,
     trigger_webhook_sync_if_not_cached,
+    trigger_webhooks_sync,
+    trigger_webhooks_sync_if_not_cached,
 )
 from ...webhook.transport.utils import (
     DEFAULT_TAX_CODE,
@@ -2386,9 +2390,10 @@ class WebhookPlugin(BasePlugin):
             return previous_value
 
         event_type = WebhookEventSyncType.STORED_PAYMENT_METHOD_DELETE_REQUESTED
-        webhook = get_webhooks_for_event(
+        webhooks = get_webhooks_for_event(
             event_type, apps_identifier=[app_data.app_identifier]
-        ).first()
+        )
+        webhook = next(iter(webhooks), None)
 
         if not webhook:
             return previous_value
@@ -2502,9 +2507,10 @@ class WebhookPlugin(BasePlugin):
         event_type = (
             WebhookEventSyncType.PAYMENT_GATEWAY_INITIALIZE_TOKENIZATION_SESSION
         )
-        webhook = get_webhooks_for_event(
+        webhooks = get_webhooks_for_event(
             event_type, apps_identifier=[request_data.app_identifier]
-        ).first()
+        )
+        webhook = next(iter(webhooks), None)
 
         if not webhook:
             return previous_value
@@ -2522,9 +2528,8 @@ class WebhookPlugin(BasePlugin):
         previous_value: "PaymentMethodTokenizationResponseData",
         additional_legacy_payload_data: Optional[dict] = None,
     ):
-        webhook = get_webhooks_for_event(
-            event_type, apps_identifier=[app_identifier]
-        ).first()
+        webhooks = get_webhooks_for_event(event_type, apps_identifier=[app_identifier])
+        webhook = next(iter(webhooks), None)
 
         if not webhook:
             return previous_value
@@ -2711,7 +2716,8 @@ class WebhookPlugin(BasePlugin):
             )
 
         for app in apps:
-            webhook = get_webhooks_for_event(event_type, app.webhooks.all()).first()
+            webhooks = get_webhooks_for_event(event_type, app.webhooks.all())
+            webhook = next(iter(webhooks), None)
             if not webhook:
                 raise PaymentError(f"No payment webhook found for event: {event_type}.")
             response_data = trigger_webhook_sync(
@@ -2908,18 +2914,17 @@ class WebhookPlugin(BasePlugin):
             checkout = checkout_info.checkout
         event_type = WebhookEventSyncType.PAYMENT_LIST_GATEWAYS
         webhooks = get_webhooks_for_event(event_type)
-        for webhook in webhooks:
-            if not webhook:
-                raise PaymentError(f"No payment webhook found for event: {event_type}.")
-
-            response_data = trigger_webhook_sync(
+        responses = []
+        if webhooks:
+            responses = trigger_webhooks_sync(
                 event_type=event_type,
                 payload=generate_list_gateways_payload(currency, checkout),
-                webhook=webhook,
+                webhooks=webhooks,
                 allow_replica=False,
                 subscribable_object=checkout,
                 requestor=self.requestor,
             )
+        for webhook, response_data in zip(webhooks, responses):
             if response_data:
                 app_gateways = parse_list_payment_gateways_response(
                     response_data, webhook.app
@@ -3044,29 +3049,102 @@ class WebhookPlugin(BasePlugin):
         if app is None:
             logger.warning("Configured tax app doesn't exists.")
             return None
-        webhook = get_webhooks_for_event(event_type, apps_ids=[app.id]).first()
+        webhooks = get_webhooks_for_event(event_type, apps_ids=[app.id])
+        webhook = next(iter(webhooks), None)
         if webhook is None:
             logger.warning(
                 "Configured tax app's webhook for checkout taxes doesn't exists."
             )
             return None
 
-        request_context = initialize_request(
-            self.requestor,
-            event_type in WebhookEventSyncType.ALL,
-            allow_replica=False,
-            event_type=event_type,
+        payload_gen = lru_cache(maxsize=None)(payload_gen)
+        subscription_payloads_gen = lru_cache(maxsize=None)(
+            partial(
+                generate_subscription_sync_payloads,
+                event_type,
+                subscriptable_object,
+                [webhook],
+                self.requestor,
+            )
         )
-        response = trigger_webhook_sync(
-            event_type=event_type,
-            webhook=webhook,
-            payload=payload_gen(),
-            allow_replica=False,
-            subscribable_object=subscriptable_object,
-            request=request_context,
-            requestor=self.requestor,
+
+        def generate_fingerprint():
+            return generate_tax_request_fingerprint(
+                None if webhook.subscription_query else payload_gen(),
+                subscription_payloads_gen(),
+            )
+
+        def fetch_tax_data():
+            request_context = initialize_request(
+                self.requestor,
+                event_type in WebhookEventSyncType.ALL,
+                allow_replica=False,
+                event_type=event_type,
+            )
+            response = trigger_webhook_sync(
+                event_type=event_type,
+                webhook=webhook,
+                payload=payload_gen(),
+                allow_replica=False,
+                subscribable_object=subscriptable_object,
+                request=request_context,
+                requestor=self.requestor,
+                subscription_payload=subscription_payloads_gen().get(webhook.pk),
+            )
+            return parse_tax_data(response)
+
+        return get_or_fetch_tax_data(
+            event_type, [app.id], generate_fingerprint, fetch_tax_data
+        )
+
+    def __run_all_tax_webhooks(
+        self,
+        event_type: str,
+        payload_gen: Callable,
+        subscriptable_object=None,
+    ):
+        payload_gen = lru_cache(maxsize=None)(payload_gen)
+        webhooks = get_webhooks_for_event(event_type)
+        subscription_payloads_gen = lru_cache(maxsize=None)(
+            partial(
+                generate_subscription_sync_payloads,
+                event_type,
+                subscriptable_object,
+                list(webhooks),
+                self.requestor,
+            )
+        )
+
+        def generate_fingerprint():
+            return generate_tax_request_fingerprint(
+                (
+                    payload_gen()
+                    if any(not webhook.subscription_query for webhook in webhooks)
+                    else None
+                ),
+                subscription_payloads_gen(),
+            )
+
+        def fetch_tax_data():
+            return trigger_all_webhooks_sync(
+                event_type,
+                payload_gen,
+                parse_tax_data,
+                subscriptable_object,
+                self.requestor,
+                # Without the cache, the payloads are generated only for the webhooks
+                # that are called.
+                subscription_payloads=(
+                    subscription_payloads_gen()
+                    if settings.TAX_DATA_CACHE_TIMEOUT
+                    else None
+                ),
+            )
+
+        app_ids = {webhook.app_id for webhook in webhooks}
+        return get_or_fetch_tax_data(
+            event_type, app_ids, generate_fingerprint, fetch_tax_data
         )
-        return parse_tax_data(response)
 
     def get_taxes_for_checkout(
         self, checkout_info, lines, app_identifier, previous_value
@@ -3082,15 +3160,13 @@ class WebhookPlugin(BasePlugin):
                 checkout_info.checkout,
             )
         else:
-            return trigger_all_webhooks_sync(
+            return self.__run_all_tax_webhooks(
                 event_type,
                 lambda: generate_checkout_payload_for_tax_calculation(
                     checkout_info,
                     lines,
                 ),
-                parse_tax_data,
                 checkout_info.checkout,
-                self.requestor,
             )
 
     def get_taxes_for_order(
@@ -3105,12 +3181,10 @@ class WebhookPlugin(BasePlugin):
                 order,
             )
         else:
-            return trigger_all_webhooks_sync(
-                WebhookEventSyncType.ORDER_CALCULATE_TAXES,
+            return self.__run_all_tax_webhooks(
+                event_type,
                 lambda: generate_order_payload_for_tax_calculation(order),
-                parse_tax_data,
                 order,
-                self.requestor,
             )
 
     def get_shipping_methods_for_checkout(
@@ -3122,19 +3196,18 @@ class WebhookPlugin(BasePlugin):
         if webhooks:
             payload = generate_checkout_payload(checkout, self.requestor)
             cache_data = get_cache_data_for_shipping_list_methods_for_checkout(payload)
-            for webhook in webhooks:
-                response_data = trigger_webhook_sync_if_not_cached(
-                    event_type=WebhookEventSyncType.SHIPPING_LIST_METHODS_FOR_CHECKOUT,
-                    payload=payload,
-                    webhook=webhook,
-                    cache_data=cache_data,
-                    allow_replica=self.allow_replica,
-                    subscribable_object=checkout,
-                    request_timeout=WEBHOOK_SYNC_TIMEOUT,
-                    cache_timeout=CACHE_TIME_SHIPPING_LIST_METHODS_FOR_CHECKOUT,
-                    requestor=self.requestor,
-                )
-
+            responses = trigger_webhooks_sync_if_not_cached(
+                event_type=WebhookEventSyncType.SHIPPING_LIST_METHODS_FOR_CHECKOUT,
+                payload=payload,
+                webhooks=webhooks,
+                cache_data=cache_data,
+                allow_replica=self.allow_replica,
+                subscribable_object=checkout,
+                request_timeout=WEBHOOK_SYNC_TIMEOUT,
+                cache_timeout=CACHE_TIME_SHIPPING_LIST_METHODS_FOR_CHECKOUT,
+                requestor=self.requestor,
+            )
+            for webhook, response_data in zip(webhooks, responses):
                 if response_data:
                     shipping_methods = parse_list_shipping_methods_response(
                         response_data, webhook.app
@@ -9,6 +9,10 @@ from freezegun import freeze_time
 
 from .....channel.models import Channel
 from .....giftcard.models import GiftCard
+from .....graphql.webhook.subscription_payload import (
+    generate_payload_from_subscription,
+    get_subscription_document,
+)
 from .....graphql.webhook.subscription_query import SubscriptionQuery
 from .....menu.models import Menu, MenuItem
 from .....product.models import Category
@@ -2922,18 +2926,18 @@ def test_create_deliveries_for_subscriptions_unsubscribable_event(
     assert len(deliveries) == 0
 
 
-@patch("saleor.graphql.webhook.subscription_payload.get_default_backend")
+@patch("saleor.graphql.webhook.subscription_payload.get_subscription_document")
 @patch.object(logger, "info")
 def test_create_deliveries_for_subscriptions_document_executed_with_error(
     mocked_task_logger,
-    mocked_backend,
+    mocked_get_document,
     product,
     subscription_product_updated_webhook,
 ):
     # given
     webhooks = [subscription_product_updated_webhook]
     event_type = WebhookEventAsyncType.ORDER_CREATED
-    mocked_backend.document_from_string.execute.errors = "errors"
+    mocked_get_document.return_value.execute.return_value.errors = "errors"
     # when
     deliveries = create_deliveries_for_subscriptions(event_type, product, webhooks)
     # then
@@ -2943,6 +2947,95 @@ def test_create_deliveries_for_subscriptions_document_executed_with_error(
     assert len(deliveries) == 0
 
 
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.generate_payload_from_subscription",
+    wraps=generate_payload_from_subscription,
+)
+def test_create_deliveries_for_subscriptions_shares_payload_for_identical_queries(
+    mocked_generate_payload, product, subscription_webhook
+):
+    # given
+    event_type = WebhookEventAsyncType.PRODUCT_UPDATED
+    webhooks = [
+        subscription_webhook(subscription_queries.PRODUCT_UPDATED, event_type),
+        subscription_webhook(subscription_queries.PRODUCT_UPDATED, event_type),
+    ]
+
+    # when
+    deliveries = create_deliveries_for_subscriptions(event_type, product, webhooks)
+
+    # then
+    mocked_generate_payload.assert_called_once()
+    assert len(deliveries) == 2
+    assert {delivery.webhook for delivery in deliveries} == set(webhooks)
+    assert deliveries[0].payload_id == deliveries[1].payload_id
+    product_id = graphene.Node.to_global_id("Product", product.id)
+    assert deliveries[0].payload.payload == json.dumps({"product": {"id": product_id}})
+
+
+def test_create_deliveries_for_subscriptions_identical_queries_of_different_apps(
+    product, subscription_webhook, webhook_app, app
+):
+    # given
+    event_type = WebhookEventAsyncType.PRODUCT_UPDATED
+    app.permissions.set(webhook_app.permissions.all())
+    webhooks = [
+        subscription_webhook(subscription_queries.PRODUCT_UPDATED, event_type),
+        subscription_webhook(subscription_queries.PRODUCT_UPDATED, event_type, app=app),
+    ]
+
+    # when
+    deliveries = create_deliveries_for_subscriptions(event_type, product, webhooks)
+
+    # then
+    assert len(deliveries) == 2
+    assert deliveries[0].payload_id != deliveries[1].payload_id
+
+
+def test_get_subscription_document_is_cached_per_webhook(
+    subscription_product_updated_webhook,
+):
+    # given
+    webhook = subscription_product_updated_webhook
+    document = get_subscription_document(webhook.subscription_query, webhook.pk)
+
+    # when
+    cached_document = get_subscription_document(webhook.subscription_query, webhook.pk)
+
+    # then
+    assert cached_document is document
+    assert (
+        get_subscription_document(webhook.subscription_query, webhook.pk + 1)
+        is not document
+    )
+
+
+def test_get_subscription_document_invalidated_on_webhook_save(
+    subscription_product_updated_webhook,
+):
+    # given
+    webhook = subscription_product_updated_webhook
+    document = get_subscription_document(webhook.subscription_query, webhook.pk)
+
+    # when
+    webhook.save(update_fields=["name"])
+
+    # then
+    assert get_subscription_document(webhook.subscription_query, webhook.pk) is not (
+        document
+    )
+
+
+def test_get_subscription_document_without_webhook_is_not_cached():
+    # when
+    document = get_subscription_document(subscription_queries.PRODUCT_UPDATED)
+
+    # then
+    assert (
+        get_subscription_document(subscription_queries.PRODUCT_UPDATED) is not document
+    )
+
+
 def test_validate_subscription_query_valid():
     query = SubscriptionQuery(subscription_queries.TEST_VALID_SUBSCRIPTION_QUERY)
     assert query.is_valid
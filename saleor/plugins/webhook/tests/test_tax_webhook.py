@@ -3,12 +3,14 @@ from unittest import mock
 from unittest.mock import sentinel
 
 import pytest
+from django.core.cache import cache
 from freezegun import freeze_time
 
 from ....checkout.fetch import fetch_checkout_info, fetch_checkout_lines
 from ....core import EventDeliveryStatus
 from ....core.models import EventDelivery, EventPayload
 from ....core.taxes import TaxType
+from ....tax.cache import tax_data_cache_stats
 from ....webhook.event_types import WebhookEventSyncType
 from ....webhook.models import Webhook
 from ....webhook.payloads import generate_order_payload_for_tax_calculation
@@ -238,3 +240,142 @@ def test_get_taxes_for_checkout_with_sync_subscription(
     mock_request.assert_called_once_with(delivery)
     mock_fetch.assert_not_called()
     assert tax_data == parse_tax_data(tax_data_response)
+
+
+@mock.patch("saleor.order.calculations.fetch_order_prices_if_expired")
+@mock.patch("saleor.webhook.transport.synchronous.transport.send_webhook_request_sync")
+def test_get_taxes_for_order_uses_cached_tax_data(
+    mock_request,
+    mock_fetch,
+    settings,
+    permission_handle_taxes,
+    webhook_plugin,
+    tax_order_webhook,
+    tax_data_response,
+    order,
+    tax_app_with_webhooks,
+):
+    # given
+    settings.TAX_DATA_CACHE_TIMEOUT = 60
+    cache.clear()
+    tax_data_cache_stats.clear()
+    mock_request.return_value = tax_data_response
+    plugin = webhook_plugin()
+    first_tax_data = plugin.get_taxes_for_order(order, None, None)
+
+    # when
+    tax_data = plugin.get_taxes_for_order(order, None, None)
+
+    # then
+    mock_request.assert_called_once()
+    assert tax_data == first_tax_data == parse_tax_data(tax_data_response)
+    assert tax_data_cache_stats.as_dict() == {
+        WebhookEventSyncType.ORDER_CALCULATE_TAXES: {"hits": 1, "misses": 1}
+    }
+
+
+@mock.patch("saleor.order.calculations.fetch_order_prices_if_expired")
+@mock.patch("saleor.webhook.transport.synchronous.transport.send_webhook_request_sync")
+def test_get_taxes_for_order_cached_tax_data_invalidated_by_payload_change(
+    mock_request,
+    mock_fetch,
+    settings,
+    permission_handle_taxes,
+    webhook_plugin,
+    tax_order_webhook,
+    tax_data_response,
+    order,
+    tax_app_with_webhooks,
+):
+    # given
+    settings.TAX_DATA_CACHE_TIMEOUT = 60
+    cache.clear()
+    mock_request.return_value = tax_data_response
+    plugin = webhook_plugin()
+    plugin.get_taxes_for_order(order, None, None)
+
+    # when
+    order.shipping_method_name = "Changed"
+    order.save(update_fields=["shipping_method_name"])
+    plugin.get_taxes_for_order(order, None, None)
+
+    # then
+    assert mock_request.call_count == 2
+
+
+@freeze_time()
+@mock.patch("saleor.checkout.calculations.fetch_checkout_data")
+@mock.patch("saleor.webhook.transport.synchronous.transport.send_webhook_request_sync")
+def test_get_taxes_for_checkout_with_sync_subscription_cached(
+    mock_request,
+    mock_fetch,
+    settings,
+    webhook_plugin,
+    tax_data_response,
+    checkout,
+    tax_app,
+):
+    # given
+    settings.TAX_DATA_CACHE_TIMEOUT = 60
+    cache.clear()
+    checkout_info = fetch_checkout_info(
+        checkout, [], get_plugins_manager(allow_replica=False)
+    )
+    mock_request.return_value = tax_data_response
+    plugin = webhook_plugin()
+    webhook = Webhook.objects.create(
+        name="Tax checkout webhook",
+        app=tax_app,
+        target_url="https://localhost:8888/tax-order",
+        subscription_query=(
+            "subscription{event{... on CalculateTaxes{taxBase{currency}}}}"
+        ),
+    )
+    webhook.events.create(event_type=WebhookEventSyncType.CHECKOUT_CALCULATE_TAXES)
+    plugin.get_taxes_for_checkout(checkout_info, [], None, None)
+
+    # when
+    tax_data = plugin.get_taxes_for_checkout(checkout_info, [], None, None)
+
+    # then
+    mock_request.assert_called_once()
+    assert tax_data == parse_tax_data(tax_data_response)
+
+
+@mock.patch("saleor.checkout.calculations.fetch_checkout_data")
+@mock.patch("saleor.webhook.transport.synchronous.transport.send_webhook_request_sync")
+def test_get_taxes_for_checkout_with_sync_subscription_cache_key_uses_payload(
+    mock_request,
+    mock_fetch,
+    settings,
+    webhook_plugin,
+    tax_data_response,
+    checkout,
+    tax_app,
+):
+    # given
+    settings.TAX_DATA_CACHE_TIMEOUT = 60
+    cache.clear()
+    checkout_info = fetch_checkout_info(
+        checkout, [], get_plugins_manager(allow_replica=False)
+    )
+    mock_request.return_value = tax_data_response
+    plugin = webhook_plugin()
+    webhook = Webhook.objects.create(
+        name="Tax checkout webhook",
+        app=tax_app,
+        target_url="https://localhost:8888/tax-order",
+        subscription_query=(
+            "subscription{event{... on CalculateTaxes{taxBase{currency}}}}"
+        ),
+    )
+    webhook.events.create(event_type=WebhookEventSyncType.CHECKOUT_CALCULATE_TAXES)
+    plugin.get_taxes_for_checkout(checkout_info, [], None, None)
+
+    # when
+    checkout.currency = "PLN"
+    checkout.save(update_fields=["currency"])
+    plugin.get_taxes_for_checkout(checkout_info, [], None, None)
+
+    # then
+    assert mock_request.call_count == 2
@@ -1,13 +1,19 @@
+import json
+import threading
 from unittest import mock
 
 import pytest
 
 from ....core import EventDeliveryStatus
-from ....core.models import EventDelivery, EventPayload
+from ....core.models import EventDelivery, EventDeliveryAttempt, EventPayload
 from ....webhook.event_types import WebhookEventSyncType
 from ....webhook.models import Webhook, WebhookEvent
-from ....webhook.transport.synchronous.transport import trigger_all_webhooks_sync
-from ....webhook.transport.utils import parse_tax_data
+from ....webhook.transport.synchronous.transport import (
+    get_sync_webhooks_executor,
+    trigger_all_webhooks_sync,
+    trigger_webhooks_sync,
+)
+from ....webhook.transport.utils import WebhookResponse, parse_tax_data
 
 
 @pytest.fixture
@@ -139,3 +145,159 @@ def test_trigger_tax_webhook_sync_invalid_webhooks(
     # then
     assert mock_request.call_count == len(tax_checkout_webhooks)
     assert tax_data is None
+
+
+@pytest.fixture
+def sync_webhooks_concurrency(settings):
+    settings.WEBHOOK_SYNC_MAX_WORKERS = 3
+    get_sync_webhooks_executor.cache_clear()
+    yield settings
+    get_sync_webhooks_executor().shutdown(wait=True)
+    get_sync_webhooks_executor.cache_clear()
+
+
+@mock.patch("saleor.webhook.transport.synchronous.transport.send_webhook_using_http")
+def test_trigger_tax_webhook_sync_concurrently_uses_first_valid_response(
+    mock_request,
+    sync_webhooks_concurrency,
+    tax_checkout_webhooks,
+    tax_data_response,
+):
+    # given
+    responses = {
+        tax_checkout_webhooks[0].target_url: "{}",
+        tax_checkout_webhooks[1].target_url: json.dumps(tax_data_response),
+        tax_checkout_webhooks[2].target_url: json.dumps(
+            {**tax_data_response, "shipping_tax_rate": 99}
+        ),
+    }
+    mock_request.side_effect = lambda target_url, *args, **kwargs: WebhookResponse(
+        content=responses[target_url], duration=0.1
+    )
+    event_type = WebhookEventSyncType.CHECKOUT_CALCULATE_TAXES
+
+    # when
+    tax_data = trigger_all_webhooks_sync(
+        event_type, lambda: '{"key": "value"}', parse_tax_data
+    )
+
+    # then
+    assert tax_data == parse_tax_data(tax_data_response)
+    assert mock_request.call_count == 3
+    attempts = EventDeliveryAttempt.objects.filter(
+        delivery__webhook=tax_checkout_webhooks[1]
+    )
+    assert attempts.get().duration == 0.1
+
+
+@mock.patch("saleor.webhook.transport.synchronous.transport.send_webhook_using_http")
+def test_trigger_tax_webhook_sync_concurrently_deadline_exceeded(
+    mock_request,
+    sync_webhooks_concurrency,
+    tax_checkout_webhooks,
+    tax_data_response,
+):
+    # given
+    sync_webhooks_concurrency.WEBHOOK_SYNC_DEADLINE = 0
+    response_sent = threading.Event()
+
+    def send_request(*args, **kwargs):
+        response_sent.wait(timeout=5)
+        return WebhookResponse(content=json.dumps(tax_data_response))
+
+    mock_request.side_effect = send_request
+    event_type = WebhookEventSyncType.CHECKOUT_CALCULATE_TAXES
+
+    # when
+    tax_data = trigger_all_webhooks_sync(
+        event_type, lambda: '{"key": "value"}', parse_tax_data
+    )
+    response_sent.set()
+
+    # then
+    assert tax_data is None
+    attempts = EventDeliveryAttempt.objects.all()
+    assert len(attempts) == len(tax_checkout_webhooks)
+    assert all(
+        attempt.status == EventDeliveryStatus.FAILED and attempt.duration is not None
+        for attempt in attempts
+    )
+
+
+@mock.patch("saleor.webhook.transport.synchronous.transport.send_webhook_using_http")
+def test_trigger_webhooks_sync_concurrently_returns_all_responses(
+    mock_request,
+    sync_webhooks_concurrency,
+    tax_checkout_webhooks,
+):
+    # given
+    mock_request.side_effect = lambda target_url, *args, **kwargs: WebhookResponse(
+        content=json.dumps({"url": target_url})
+    )
+    event_type = WebhookEventSyncType.CHECKOUT_CALCULATE_TAXES
+
+    # when
+    responses = trigger_webhooks_sync(
+        event_type, '{"key": "value"}', tax_checkout_webhooks, allow_replica=False
+    )
+
+    # then
+    assert responses == [
+        {"url": webhook.target_url} for webhook in tax_checkout_webhooks
+    ]
+    assert EventDeliveryAttempt.objects.count() == len(tax_checkout_webhooks)
+
+
+@mock.patch(
+    "saleor.webhook.transport.synchronous.transport"
+    ".create_delivery_for_subscription_sync_event"
+)
+@mock.patch("saleor.webhook.transport.synchronous.transport.send_webhook_using_http")
+def test_trigger_tax_webhook_sync_concurrently_skips_failed_subscription_payload(
+    mock_request,
+    mock_create_delivery,
+    sync_webhooks_concurrency,
+    tax_checkout_webhooks,
+    tax_data_response,
+):
+    # given
+    failing_webhook = tax_checkout_webhooks[0]
+    failing_webhook.subscription_query = "subscription { event { __typename } }"
+    failing_webhook.save(update_fields=["subscription_query"])
+    mock_create_delivery.return_value = None
+    mock_request.return_value = WebhookResponse(content=json.dumps(tax_data_response))
+    event_type = WebhookEventSyncType.CHECKOUT_CALCULATE_TAXES
+
+    # when
+    tax_data = trigger_all_webhooks_sync(
+        event_type, lambda: '{"key": "value"}', parse_tax_data
+    )
+
+    # then
+    assert tax_data == parse_tax_data(tax_data_response)
+    assert mock_request.call_count == 2
+    assert not EventDelivery.objects.filter(status=EventDeliveryStatus.PENDING).exists()
+
+
+@mock.patch("saleor.webhook.transport.synchronous.transport.send_webhook_using_http")
+def test_trigger_tax_webhook_sync_concurrently_unknown_scheme(
+    mock_request,
+    sync_webhooks_concurrency,
+    tax_checkout_webhooks,
+):
+    # given
+    invalid_webhook = tax_checkout_webhooks[1]
+    invalid_webhook.target_url = "ftp://www.example.com/tax-checkout"
+    invalid_webhook.save(update_fields=["target_url"])
+    mock_request.return_value = WebhookResponse(content="{}")
+    event_type = WebhookEventSyncType.CHECKOUT_CALCULATE_TAXES
+
+    # when
+    with pytest.raises(ValueError, match="Unknown webhook scheme"):
+        trigger_all_webhooks_sync(
+            event_type, lambda: '{"key": "value"}', parse_tax_data
+        )
+
+    # then
+    assert mock_request.call_count == 1
+    assert not EventDelivery.objects.filter(status=EventDeliveryStatus.PENDING).exists()
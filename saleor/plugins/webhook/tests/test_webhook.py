@@ -2,6 +2,7 @@ import json
 from datetime import datetime
 from decimal import Decimal
 from functools import partial
+from http.client import HTTPMessage
 from unittest import mock
 from unittest.mock import ANY, MagicMock
 from urllib.parse import urlencode
@@ -17,7 +18,8 @@ from django.core.serializers import serialize
 from django.utils import timezone
 from freezegun import freeze_time
 from kombu.asynchronous.aws.sqs.connection import AsyncSQSConnection
-from requests import RequestException
+from requests import Request, RequestException
+from requests.cookies import MockRequest, MockResponse
 from requests_hardened import HTTPSession
 
 from .... import __version__
@@ -49,7 +51,9 @@ from ....webhook.payloads import (
 )
 from ....webhook.transport import signature_for_payload
 from ....webhook.transport.asynchronous.transport import (
+    get_webhook_session,
     send_webhook_request_async,
+    send_webhook_requests_async_batch,
     trigger_webhooks_async,
 )
 from ....webhook.utils import get_webhooks_for_event
@@ -1986,6 +1990,157 @@ def test_send_webhook_request_async_with_custom_headers(
     assert custom_headers in mocked_send_response.call_args[0]
 
 
+@mock.patch("saleor.webhook.transport.asynchronous.transport.send_webhook_using_http")
+def test_send_webhook_requests_async_batch(
+    mocked_send_response, event_payload, webhook, webhook_response
+):
+    # given
+    deliveries = EventDelivery.objects.bulk_create(
+        [
+            EventDelivery(
+                event_type=WebhookEventAsyncType.ANY,
+                payload=event_payload,
+                webhook=webhook,
+            )
+            for _ in range(2)
+        ]
+    )
+    mocked_send_response.return_value = webhook_response
+
+    # when
+    send_webhook_requests_async_batch([delivery.pk for delivery in deliveries])
+
+    # then
+    assert mocked_send_response.call_count == 2
+    session = get_webhook_session("http://www.example.com")
+    for call in mocked_send_response.call_args_list:
+        assert call.kwargs["session"] is session
+    assert not EventDelivery.objects.exists()
+    assert not EventPayload.objects.exists()
+
+
+@mock.patch("saleor.webhook.transport.asynchronous.transport.send_webhook_using_http")
+def test_send_webhook_requests_async_batch_saves_each_delivery(
+    mocked_send_response, event_payload, webhook, webhook_response
+):
+    # given
+    deliveries = EventDelivery.objects.bulk_create(
+        [
+            EventDelivery(
+                event_type=WebhookEventAsyncType.ANY,
+                payload=event_payload,
+                webhook=webhook,
+            )
+            for _ in range(2)
+        ]
+    )
+    mocked_send_response.side_effect = [webhook_response, Exception("Worker lost")]
+
+    # when
+    with pytest.raises(Exception, match="Worker lost"):
+        send_webhook_requests_async_batch([delivery.pk for delivery in deliveries])
+
+    # then
+    assert list(EventDelivery.objects.values_list("pk", flat=True)) == [
+        deliveries[1].pk
+    ]
+
+
+def test_get_webhook_session_does_not_store_cookies():
+    # given
+    session = get_webhook_session("www.example.com")
+    headers = HTTPMessage()
+    headers["Set-Cookie"] = "sessionid=secret; Path=/"
+    request = Request("POST", "https://www.example.com/webhook").prepare()
+
+    # when
+    session.cookies.extract_cookies(MockResponse(headers), MockRequest(request))
+
+    # then
+    assert not session.cookies
+
+
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport"
+    ".send_webhook_request_async.apply_async"
+)
+@mock.patch("saleor.webhook.transport.asynchronous.transport.send_webhook_using_http")
+def test_send_webhook_requests_async_batch_failed_request(
+    mocked_send_response,
+    mocked_send_webhook_request_async,
+    event_delivery,
+    webhook_response_failed,
+    settings,
+):
+    # given
+    mocked_send_response.return_value = webhook_response_failed
+
+    # when
+    send_webhook_requests_async_batch([event_delivery.pk])
+
+    # then
+    event_delivery.refresh_from_db()
+    assert event_delivery.status == EventDeliveryStatus.PENDING
+    attempt = event_delivery.attempts.get()
+    assert attempt.status == EventDeliveryStatus.FAILED
+    assert attempt.response == webhook_response_failed.content
+    assert attempt.duration == webhook_response_failed.duration
+    mocked_send_webhook_request_async.assert_called_once_with(
+        kwargs={"event_delivery_id": event_delivery.pk},
+        queue=settings.WEBHOOK_CELERY_QUEUE_NAME,
+        countdown=send_webhook_request_async.retry_backoff,
+        retries=1,
+    )
+
+
+@mock.patch("saleor.webhook.transport.asynchronous.transport.send_webhook_using_http")
+def test_send_webhook_requests_async_batch_when_webhook_is_disabled(
+    mocked_send_response, event_delivery
+):
+    # given
+    event_delivery.webhook.is_active = False
+    event_delivery.webhook.save(update_fields=["is_active"])
+
+    # when
+    send_webhook_requests_async_batch([event_delivery.pk])
+
+    # then
+    event_delivery.refresh_from_db()
+    assert event_delivery.status == EventDeliveryStatus.FAILED
+    mocked_send_response.assert_not_called()
+
+
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport"
+    ".send_webhook_requests_async_batch.apply_async"
+)
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport"
+    ".send_webhook_request_async.apply_async"
+)
+def test_trigger_webhooks_async_in_batches(
+    mocked_send_webhook_request_async,
+    mocked_send_webhook_requests_async_batch,
+    settings,
+    webhook,
+):
+    # given
+    settings.WEBHOOK_BATCH_SIZE = 10
+
+    # when
+    trigger_webhooks_async(
+        '{"key": "value"}', WebhookEventAsyncType.ORDER_CREATED, [webhook]
+    )
+
+    # then
+    delivery = EventDelivery.objects.get()
+    mocked_send_webhook_request_async.assert_not_called()
+    mocked_send_webhook_requests_async_batch.assert_called_once_with(
+        kwargs={"event_delivery_ids": [delivery.pk], "queue": None},
+        queue=settings.WEBHOOK_CELERY_QUEUE_NAME,
+    )
+
+
 @mock.patch("saleor.webhook.observability.utils.report_event_delivery_attempt")
 @mock.patch("saleor.webhook.transport.utils.clear_successful_delivery")
 def test_send_webhook_request_async_when_webhook_is_disabled(
@@ -4,13 +4,22 @@ from typing import TYPE_CHECKING, Union
 
 from django.conf import settings
 from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db import connections
 from django.db.models import F, Q, Value, prefetch_related_objects
 
 from ..attribute import AttributeInputType
-from ..attribute.models import Attribute
+from ..attribute.models import (
+    AssignedProductAttributeValue,
+    AssignedVariantAttribute,
+    AssignedVariantAttributeValue,
+    Attribute,
+    AttributeProduct,
+    AttributeValue,
+    AttributeVariant,
+)
 from ..core.postgres import FlatConcatSearchVector, NoValidationSearchVector
 from ..core.utils.editorjs import clean_editor_js
-from ..product.models import Product
+from ..product.models import Product, ProductVariant
 
 if TYPE_CHECKING:
     from django.db.models import QuerySet
@@ -28,6 +37,200 @@ PRODUCTS_BATCH_SIZE = 100
 # when testing locally with multiple attributes of different types assigned to product
 # and product variants.
 
+PRODUCTS_SQL_BATCH_SIZE = 1000
+
+# The text of an attribute value indexed for the given input types, following
+# `get_search_vectors_for_values`. Rich text values are indexed in Python.
+ATTRIBUTE_VALUE_TEXT_SQL = """
+    CASE
+        WHEN attribute.input_type IN (%(dropdown)s, %(multiselect)s) THEN value.name
+        WHEN attribute.input_type = %(plain_text)s THEN value.plain_text
+        WHEN attribute.input_type = %(numeric)s THEN
+            CASE
+                WHEN coalesce(attribute.unit, '') <> ''
+                THEN value.name || ' ' || attribute.unit
+                ELSE value.name
+            END
+        WHEN attribute.input_type IN (%(date)s, %(date_time)s) THEN
+            to_char(value.date_time AT TIME ZONE 'UTC', 'YYYY-MM-DD HH24:MI:SS')
+    END
+"""
+
+# Builds the same search vectors as `prepare_product_search_vector_value`: the
+# texts are aggregated per product, in the same order and with the same limits,
+# and written with a single update. Products with indexed rich text values are
+# skipped and returned by the statement.
+UPDATE_PRODUCTS_SEARCH_VECTOR_SQL = """
+WITH products AS (
+    SELECT id, product_type_id FROM {product} WHERE id = ANY(%(product_ids)s)
+),
+product_attributes AS (
+    SELECT
+        products.id AS product_id,
+        attribute_product.attribute_id,
+        row_number() OVER (
+            PARTITION BY products.id
+            ORDER BY attribute_product.sort_order, attribute_product.id
+        ) AS position
+    FROM products
+    JOIN {attribute_product} attribute_product
+        ON attribute_product.product_type_id = products.product_type_id
+),
+product_values AS (
+    SELECT
+        assigned_value.product_id,
+        value.attribute_id,
+        {value_text} AS text,
+        attribute.input_type = %(rich_text)s AS is_rich_text,
+        row_number() OVER (
+            PARTITION BY assigned_value.product_id, value.attribute_id
+            ORDER BY assigned_value.sort_order, assigned_value.id
+        ) AS position
+    FROM {assigned_product_value} assigned_value
+    JOIN {attribute_value} value ON value.id = assigned_value.value_id
+    JOIN {attribute} attribute ON attribute.id = value.attribute_id
+    WHERE assigned_value.product_id = ANY(%(product_ids)s)
+),
+product_attribute_documents AS (
+    SELECT
+        product_attributes.product_id,
+        string_agg(
+            product_values.text,
+            ' '
+            ORDER BY product_attributes.position, product_values.position
+        ) AS document,
+        bool_or(product_values.is_rich_text) AS has_rich_text
+    FROM product_attributes
+    JOIN product_values
+        ON product_values.product_id = product_attributes.product_id
+        AND product_values.attribute_id = product_attributes.attribute_id
+    WHERE
+        product_attributes.position <= %(max_attributes)s
+        AND product_values.position <= %(max_values)s
+    GROUP BY product_attributes.product_id
+),
+variants AS (
+    SELECT
+        variant.id,
+        variant.product_id,
+        CASE
+            WHEN coalesce(variant.sku, '') <> '' THEN variant.sku || ' ' || variant.name
+            ELSE variant.name
+        END AS text,
+        row_number() OVER (
+            PARTITION BY variant.product_id ORDER BY variant.sort_order, variant.sku
+        ) AS position
+    FROM {variant} variant
+    WHERE variant.product_id = ANY(%(product_ids)s)
+),
+indexed_variants AS (
+    SELECT * FROM variants WHERE position <= %(max_variants)s
+),
+variant_documents AS (
+    SELECT
+        product_id,
+        string_agg(text, ' ' ORDER BY position) AS document,
+        bool_or(text <> '') AS has_text
+    FROM indexed_variants
+    GROUP BY product_id
+),
+variant_attributes AS (
+    SELECT
+        assigned_attribute.id,
+        indexed_variants.product_id,
+        indexed_variants.position AS variant_position,
+        attribute_variant.attribute_id,
+        row_number() OVER (
+            PARTITION BY assigned_attribute.variant_id ORDER BY assigned_attribute.id
+        ) AS position
+    FROM indexed_variants
+    JOIN {assigned_variant_attribute} assigned_attribute
+        ON assigned_attribute.variant_id = indexed_variants.id
+    JOIN {attribute_variant} attribute_variant
+        ON attribute_variant.id = assigned_attribute.assignment_id
+),
+variant_values AS (
+    SELECT
+        variant_attributes.product_id,
+        variant_attributes.variant_position,
+        variant_attributes.position AS attribute_position,
+        {value_text} AS text,
+        attribute.input_type = %(rich_text)s AS is_rich_text,
+        row_number() OVER (
+            PARTITION BY variant_attributes.id ORDER BY value.sort_order, value.id
+        ) AS position
+    FROM variant_attributes
+    JOIN {assigned_variant_value} assigned_value
+        ON assigned_value.assignment_id = variant_attributes.id
+    JOIN {attribute_value} value ON value.id = assigned_value.value_id
+    JOIN {attribute} attribute ON attribute.id = variant_attributes.attribute_id
+    WHERE variant_attributes.position <= %(max_attributes)s
+),
+variant_attribute_documents AS (
+    SELECT
+        product_id,
+        string_agg(
+            text, ' ' ORDER BY variant_position, attribute_position, position
+        ) AS document,
+        bool_or(is_rich_text) AS has_rich_text
+    FROM variant_values
+    WHERE position <= %(max_values)s
+    GROUP BY product_id
+),
+documents AS (
+    SELECT
+        products.id,
+        product_attribute_documents.document AS attribute_document,
+        variant_documents.document AS variant_document,
+        CASE
+            WHEN variant_documents.has_text THEN variant_attribute_documents.document
+        END AS variant_attribute_document,
+        coalesce(product_attribute_documents.has_rich_text, false)
+        OR coalesce(
+            variant_documents.has_text AND variant_attribute_documents.has_rich_text,
+            false
+        ) AS has_rich_text
+    FROM products
+    LEFT JOIN product_attribute_documents
+        ON product_attribute_documents.product_id = products.id
+    LEFT JOIN variant_documents ON variant_documents.product_id = products.id
+    LEFT JOIN variant_attribute_documents
+        ON variant_attribute_documents.product_id = products.id
+)
+UPDATE {product} product
+SET
+    search_vector = (
+        setweight(to_tsvector('simple'::regconfig, coalesce(product.name, '')), 'A')
+        || setweight(
+            to_tsvector(
+                'simple'::regconfig, coalesce(product.description_plaintext, '')
+            ),
+            'C'
+        )
+        || setweight(
+            to_tsvector(
+                'simple'::regconfig, coalesce(documents.attribute_document, '')
+            ),
+            'B'
+        )
+        || setweight(
+            to_tsvector('simple'::regconfig, coalesce(documents.variant_document, '')),
+            'A'
+        )
+        || setweight(
+            to_tsvector(
+                'simple'::regconfig,
+                coalesce(documents.variant_attribute_document, '')
+            ),
+            'B'
+        )
+    ),
+    search_index_dirty = false
+FROM documents
+WHERE product.id = documents.id AND NOT documents.has_rich_text
+RETURNING product.id
+"""
+
 
 def _prep_product_search_vector_index(products):
     prefetch_related_objects(products, *PRODUCT_FIELDS_TO_PREFETCH)
@@ -62,8 +265,54 @@ def queryset_in_batches(queryset):
         start_pk = pks[-1]
 
 
+def _update_products_search_vector_in_sql(product_ids: list[int]) -> set[int]:
+    """Update search vectors of the given products and return the updated pks."""
+    sql = UPDATE_PRODUCTS_SEARCH_VECTOR_SQL.format(
+        product=Product._meta.db_table,
+        variant=ProductVariant._meta.db_table,
+        attribute=Attribute._meta.db_table,
+        attribute_value=AttributeValue._meta.db_table,
+        attribute_product=AttributeProduct._meta.db_table,
+        attribute_variant=AttributeVariant._meta.db_table,
+        assigned_product_value=AssignedProductAttributeValue._meta.db_table,
+        assigned_variant_attribute=AssignedVariantAttribute._meta.db_table,
+        assigned_variant_value=AssignedVariantAttributeValue._meta.db_table,
+        value_text=ATTRIBUTE_VALUE_TEXT_SQL,
+    )
+    params = {
+        "dropdown": AttributeInputType.DROPDOWN,
+        "multiselect": AttributeInputType.MULTISELECT,
+        "plain_text": AttributeInputType.PLAIN_TEXT,
+        "numeric": AttributeInputType.NUMERIC,
+        "date": AttributeInputType.DATE,
+        "date_time": AttributeInputType.DATE_TIME,
+        "rich_text": AttributeInputType.RICH_TEXT,
+        "max_attributes": settings.PRODUCT_MAX_INDEXED_ATTRIBUTES,
+        "max_values": settings.PRODUCT_MAX_INDEXED_ATTRIBUTE_VALUES,
+        "max_variants": settings.PRODUCT_MAX_INDEXED_VARIANTS,
+    }
+    updated_pks: set[int] = set()
+    connection = connections[settings.DATABASE_CONNECTION_DEFAULT_NAME]
+    with connection.cursor() as cursor:
+        for index in range(0, len(product_ids), PRODUCTS_SQL_BATCH_SIZE):
+            params["product_ids"] = product_ids[index : index + PRODUCTS_SQL_BATCH_SIZE]
+            cursor.execute(sql, params)
+            updated_pks.update(pk for (pk,) in cursor.fetchall())
+    return updated_pks
+
+
 def update_products_search_vector(product_ids: Iterable[int]):
+    """Update search vectors of the given products.
+
+    With `PRODUCT_SEARCH_VECTOR_SQL_ENABLED`, the vectors are built in SQL and only
+    the products that can't be indexed in SQL are loaded and indexed in Python.
+    """
     product_ids = list(product_ids)
+    if settings.PRODUCT_SEARCH_VECTOR_SQL_ENABLED:
+        updated_pks = _update_products_search_vector_in_sql(product_ids)
+        product_ids = [pk for pk in product_ids if pk not in updated_pks]
+        if not product_ids:
+            return
     products = (
         Product.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
         .filter(pk__in=product_ids)
@@ -15,6 +15,11 @@ from ..attribute.models import Attribute
 from ..celeryconf import app
 from ..core.db.connection import allow_writer
 from ..core.exceptions import PreorderAllocationError
+from ..core.search_index import (
+    log_search_index_update,
+    pop_search_index_update_schedule,
+    schedule_search_index_update,
+)
 from ..discount import PromotionType
 from ..discount.models import Promotion, PromotionRule
 from ..plugins.manager import get_plugins_manager
@@ -296,14 +301,37 @@ def _get_preorder_variants_to_clean():
     expires=settings.BEAT_UPDATE_SEARCH_EXPIRE_AFTER_SEC,
 )
 def update_products_search_vector_task():
-    products = (
-        Product.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
-        .filter(search_index_dirty=True)
-        .order_by("updated_at")[:PRODUCTS_BATCH_SIZE]
-        .values_list("id", flat=True)
+    scheduled_at = pop_search_index_update_schedule(update_products_search_vector_task)
+    dirty_products = Product.objects.using(
+        settings.DATABASE_CONNECTION_REPLICA_NAME
+    ).filter(search_index_dirty=True)
+    product_ids = list(
+        dirty_products.order_by("updated_at")[:PRODUCTS_BATCH_SIZE].values_list(
+            "id", flat=True
+        )
     )
+    if not product_ids:
+        return
     with allow_writer():
-        update_products_search_vector(products)
+        update_products_search_vector(product_ids)
+
+    if settings.SEARCH_INDEX_UPDATE_DEBOUNCE_SEC:
+        log_search_index_update(
+            task_logger,
+            "products",
+            len(product_ids),
+            dirty_products.count(),
+            scheduled_at,
+        )
+        if len(product_ids) == PRODUCTS_BATCH_SIZE:
+            # Keep the debounce, so the replica catches up with the indexed batch
+            # before the remaining products are read from it.
+            schedule_search_index_update(update_products_search_vector_task)
+
+
+def schedule_products_search_vector_update():
+    """Schedule indexing of the products marked as dirty."""
+    schedule_search_index_update(update_products_search_vector_task)
 
 
 @app.task(queue=settings.COLLECTION_PRODUCT_UPDATED_QUEUE_NAME)
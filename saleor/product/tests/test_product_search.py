@@ -1,5 +1,9 @@
+from unittest.mock import patch
+
+import pytest
+
 from ..models import Product
-from ..search import update_products_search_vector
+from ..search import _prep_product_search_vector_index, update_products_search_vector
 
 
 def test_update_products_search_vector(product_list):
@@ -15,3 +19,67 @@ def test_update_products_search_vector(product_list):
     for product in product_list:
         product.refresh_from_db()
         assert product.search_vector
+
+
+def _get_search_vector(product):
+    return Product.objects.values_list("search_vector", flat=True).get(pk=product.pk)
+
+
+@pytest.mark.parametrize(
+    "product_fixture",
+    [
+        "product",
+        "product_with_multiple_values_attributes",
+        "product_with_variant_with_two_attributes",
+        "product_with_two_variants",
+    ],
+)
+def test_update_products_search_vector_in_sql(product_fixture, settings, request):
+    # given
+    product = request.getfixturevalue(product_fixture)
+    update_products_search_vector([product.pk])
+    expected_search_vector = _get_search_vector(product)
+
+    Product.objects.filter(pk=product.pk).update(
+        search_vector=None, search_index_dirty=True
+    )
+    settings.PRODUCT_SEARCH_VECTOR_SQL_ENABLED = True
+
+    # when
+    with patch(
+        "saleor.product.search._prep_product_search_vector_index"
+    ) as prep_index_mock:
+        update_products_search_vector([product.pk])
+
+    # then
+    prep_index_mock.assert_not_called()
+    product.refresh_from_db()
+    assert product.search_index_dirty is False
+    assert _get_search_vector(product) == expected_search_vector
+
+
+def test_update_products_search_vector_in_sql_with_rich_text_values(
+    product_with_rich_text_attribute, settings
+):
+    # given
+    product = product_with_rich_text_attribute[0]
+    update_products_search_vector([product.pk])
+    expected_search_vector = _get_search_vector(product)
+
+    Product.objects.filter(pk=product.pk).update(
+        search_vector=None, search_index_dirty=True
+    )
+    settings.PRODUCT_SEARCH_VECTOR_SQL_ENABLED = True
+
+    # when
+    with patch(
+        "saleor.product.search._prep_product_search_vector_index",
+        wraps=_prep_product_search_vector_index,
+    ) as prep_index_mock:
+        update_products_search_vector([product.pk])
+
+    # then
+    prep_index_mock.assert_called_once()
+    product.refresh_from_db()
+    assert product.search_index_dirty is False
+    assert _get_search_vector(product) == expected_search_vector
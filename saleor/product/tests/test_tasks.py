@@ -4,9 +4,11 @@ from decimal import Decimal
 from unittest.mock import patch
 
 import pytest
+from django.core.cache import cache
 from django.utils import timezone
 from faker import Faker
 
+from ...core.search_index import SEARCH_INDEX_UPDATE_GRACE_SEC
 from ...discount import PromotionType, RewardValueType
 from ...discount.models import Promotion, PromotionRule
 from ..models import Product, ProductChannelListing, ProductVariantChannelListing
@@ -298,6 +300,27 @@ def test_update_products_search_vector_task(product):
     assert product.search_index_dirty is False
 
 
+@patch("saleor.product.tasks.PRODUCTS_BATCH_SIZE", 1)
+@patch("saleor.product.tasks.update_products_search_vector_task.apply_async")
+def test_update_products_search_vector_task_schedules_next_batch(
+    mocked_apply_async, product_list, settings, django_capture_on_commit_callbacks
+):
+    # given
+    settings.SEARCH_INDEX_UPDATE_DEBOUNCE_SEC = 5
+    cache.clear()
+    Product.objects.update(search_index_dirty=True)
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        update_products_search_vector_task()
+
+    # then
+    assert Product.objects.filter(search_index_dirty=True).count() == 2
+    mocked_apply_async.assert_called_once_with(
+        countdown=5, expires=5 + SEARCH_INDEX_UPDATE_GRACE_SEC
+    )
+
+
 @pytest.mark.parametrize("dirty_products_number", [0, 1, 2, 3])
 def test_update_products_search_vector_task_with_static_number_of_queries(
     product, product_list, dirty_products_number, django_assert_num_queries
@@ -550,6 +550,24 @@ EXPORT_FILES_TIMEDELTA = timedelta(
     seconds=parse(os.environ.get("EXPORT_FILES_TIMEDELTA", "30 days"))
 )
 
+# Split product exports into shards of the given number of products, exported by
+# separate Celery tasks and merged into a single file once all of them are done.
+# Sharding requires a Celery result backend. The exports are not sharded when set to 0.
+EXPORT_PRODUCTS_SHARD_SIZE = int(os.environ.get("EXPORT_PRODUCTS_SHARD_SIZE", 0))
+
+# Create thumbnails of uploaded product images in the given sizes (comma-separated,
+# e.g. "256,512,1024") and formats ("original", "webp" or "avif") in a Celery task,
+# instead of on the first request. Thumbnails are created only on request when no
+# sizes are set.
+PRODUCT_MEDIA_THUMBNAIL_SIZES = [
+    int(size)
+    for size in get_list(os.environ.get("PRODUCT_MEDIA_THUMBNAIL_SIZES", ""))
+    if size
+]
+PRODUCT_MEDIA_THUMBNAIL_FORMATS = get_list(
+    os.environ.get("PRODUCT_MEDIA_THUMBNAIL_FORMATS", "original")
+)
+
 # CELERY SETTINGS
 CELERY_TIMEZONE = TIME_ZONE
 CELERY_BROKER_URL = (
@@ -573,6 +591,14 @@ BEAT_UPDATE_SEARCH_SEC = parse(
 )
 BEAT_UPDATE_SEARCH_EXPIRE_AFTER_SEC = BEAT_UPDATE_SEARCH_SEC
 
+# Index products and gift cards the given number of seconds after they are marked as
+# dirty, instead of waiting for the periodic search update. Changes made within that
+# window are indexed in a single batch. The periodic update still indexes whatever
+# was missed. Changes are indexed only periodically when set to 0.
+SEARCH_INDEX_UPDATE_DEBOUNCE_SEC = int(
+    os.environ.get("SEARCH_INDEX_UPDATE_DEBOUNCE_SEC", 0)
+)
+
 BEAT_PRICE_RECALCULATION_SCHEDULE = parse(
     os.environ.get("BEAT_PRICE_RECALCULATION_SCHEDULE", "30 seconds")
 )
@@ -617,6 +643,10 @@ CELERY_BEAT_SCHEDULE = {
         "task": "saleor.warehouse.tasks.update_stocks_quantity_allocated_task",
         "schedule": crontab(hour=0, minute=0),
     },
+    "update-stocks-quantity-reserved": {
+        "task": "saleor.warehouse.tasks.update_stocks_quantity_reserved_task",
+        "schedule": crontab(hour=0, minute=30),
+    },
     "delete-old-export-files": {
         "task": "saleor.csv.tasks.delete_old_export_files",
         "schedule": crontab(hour=1, minute=0),
@@ -747,6 +777,13 @@ def SENTRY_INIT(dsn: str, sentry_opts: dict):
 
 
 GRAPHQL_PAGINATION_LIMIT = 100
+# Connections using the estimated `totalCount` mode count rows exactly up to this
+# limit and use the query planner estimate above it, so `totalCount` becomes
+# approximate. Disabled by default (0), which always counts exactly; set it
+# (e.g. to 10000) to opt in.
+GRAPHQL_TOTAL_COUNT_EXACT_LIMIT = int(
+    os.environ.get("GRAPHQL_TOTAL_COUNT_EXACT_LIMIT", 0)
+)
 GRAPHQL_MIDDLEWARE: list[str] = []
 
 # Set GRAPHQL_QUERY_MAX_COMPLEXITY=0 in env to disable (not recommended)
@@ -754,6 +791,59 @@ GRAPHQL_QUERY_MAX_COMPLEXITY = int(
     os.environ.get("GRAPHQL_QUERY_MAX_COMPLEXITY", 50000)
 )
 
+# Number of parsed and validated GraphQL documents kept in memory by each process.
+GRAPHQL_DOCUMENT_CACHE_SIZE = int(os.environ.get("GRAPHQL_DOCUMENT_CACHE_SIZE", 1000))
+# Share parsed documents and their query costs between processes through the cache
+# backend, so restarted workers do not need to parse and validate them again.
+GRAPHQL_DOCUMENT_CACHE_SHARED = get_bool_from_env(
+    "GRAPHQL_DOCUMENT_CACHE_SHARED", False
+)
+GRAPHQL_DOCUMENT_CACHE_TIMEOUT = parse(
+    os.environ.get("GRAPHQL_DOCUMENT_CACHE_TIMEOUT", "1 day")
+)
+
+# Support for Apollo-style automatic persisted queries, sent as the `sha256Hash` of
+# the query in the `persistedQuery` request extension. Clients can register queries
+# in the shared cache, so it's disabled by default.
+GRAPHQL_PERSISTED_QUERIES_ENABLED = get_bool_from_env(
+    "GRAPHQL_PERSISTED_QUERIES_ENABLED", False
+)
+# Path to a JSON file mapping query hashes to queries, that are always available.
+GRAPHQL_PERSISTED_QUERIES_MANIFEST = os.environ.get(
+    "GRAPHQL_PERSISTED_QUERIES_MANIFEST"
+)
+# Time for which queries registered by clients are kept. Only queries valid against
+# the schema are registered.
+GRAPHQL_PERSISTED_QUERIES_TIMEOUT = parse(
+    os.environ.get("GRAPHQL_PERSISTED_QUERIES_TIMEOUT", "1 day")
+)
+# When enabled, only queries listed in GRAPHQL_PERSISTED_QUERIES_MANIFEST are accepted.
+GRAPHQL_PERSISTED_QUERIES_ALLOWLIST_ONLY = get_bool_from_env(
+    "GRAPHQL_PERSISTED_QUERIES_ALLOWLIST_ONLY", False
+)
+
+# Cache full responses of anonymous catalog queries. Responses are cached only when
+# all root fields of the query have a TTL (in seconds) defined below. Cached entries
+# are invalidated by product, collection, category and menu events.
+GRAPHQL_RESPONSE_CACHE_ENABLED = get_bool_from_env(
+    "GRAPHQL_RESPONSE_CACHE_ENABLED", False
+)
+GRAPHQL_RESPONSE_CACHE_TTL = {
+    "product": 60,
+    "products": 60,
+    "category": 300,
+    "categories": 300,
+    "collection": 300,
+    "collections": 300,
+    "menu": 300,
+    "menus": 300,
+}
+
+# Number of threads used to execute read-only operations of a batched request in
+# parallel. Each operation uses its own dataloaders and a replica connection. When
+# disabled, operations are executed one by one and share the dataloaders.
+GRAPHQL_BATCH_MAX_WORKERS = int(os.environ.get("GRAPHQL_BATCH_MAX_WORKERS", 0))
+
 # Max number entities that can be requested in single query by Apollo Federation
 # Federation protocol implements no securities on its own part - malicious actor
 # may build a query that requests for potentially few thousands of entities.
@@ -791,6 +881,19 @@ for entry_point in installed_plugins:
 
 PLUGINS = BUILTIN_PLUGINS + EXTERNAL_PLUGINS
 
+# Keep a per-process snapshot of the plugin configurations, so plugins managers are
+# built without querying the database. The snapshot is invalidated through a version
+# stored in the cache, bumped whenever plugin configurations or channels are changed.
+# Requires a cache shared by all web and Celery processes, like Redis; other processes
+# don't see the changes otherwise.
+PLUGINS_CONFIGURATION_CACHE_ENABLED = get_bool_from_env(
+    "PLUGINS_CONFIGURATION_CACHE_ENABLED", False
+)
+
+# Measure the time spent in each plugin hook. The per-process counters are available
+# through `saleor.plugins.hook_stats.hook_timings`.
+PLUGINS_HOOK_TIMING_ENABLED = get_bool_from_env("PLUGINS_HOOK_TIMING_ENABLED", False)
+
 # When `True`, HTTP requests made from arbitrary URLs will be rejected (e.g., webhooks).
 # if they try to access private IP address ranges, and loopback ranges (unless
 # `HTTP_IP_FILTER_ALLOW_LOOPBACK_IPS=False`).
@@ -807,6 +910,43 @@ HTTP_IP_FILTER_ALLOW_LOOPBACK_IPS: bool = get_bool_from_env(
 # time of the reservation in seconds.
 RESERVE_DURATION = 45
 
+# Compute stock availability from the denormalized `quantity_allocated` and
+# `quantity_reserved` stock columns instead of summing allocations and reservations.
+# Expired reservations are counted until `delete_expired_reservations_task` removes
+# them, so the task should run more often when this is enabled. `quantity_reserved` is
+# maintained only in this mode; run `update_stocks_quantity_reserved_task` after
+# enabling it.
+STOCK_DENORMALIZED_AVAILABILITY_ENABLED = get_bool_from_env(
+    "STOCK_DENORMALIZED_AVAILABILITY_ENABLED", False
+)
+
+# Cache tax data returned by tax apps for the given number of seconds, keyed by the
+# hash of the tax calculation payload and the apps. The cache is disabled when set to
+# 0. Hits and misses are counted in `saleor.tax.cache.tax_data_cache_stats`.
+TAX_DATA_CACHE_TIMEOUT = int(os.environ.get("TAX_DATA_CACHE_TIMEOUT", 0))
+
+# Keep a per-process table of the warehouses and shipping zones serving each channel,
+# used to select stocks for a channel and country without joining the shipping zone
+# tables. The table is invalidated through a version stored in the cache, bumped
+# whenever channels, warehouses or shipping zones are changed.
+WAREHOUSE_ROUTING_CACHE_ENABLED = get_bool_from_env(
+    "WAREHOUSE_ROUTING_CACHE_ENABLED", False
+)
+WAREHOUSE_ROUTING_VERSION_CHECK_INTERVAL = float(
+    os.environ.get("WAREHOUSE_ROUTING_VERSION_CHECK_INTERVAL", 1)
+)
+
+# Share the objects loaded by data loaders of slow-changing objects, like categories,
+# attributes, channels, warehouses, menus and translations, between requests. Values
+# are kept in a per-process LRU cache of the given size and in the cache, and are
+# invalidated through a version stored in the cache, bumped whenever the objects are
+# saved or deleted. Only objects loaded from the replica database are cached.
+DATALOADER_CACHE_ENABLED = get_bool_from_env("DATALOADER_CACHE_ENABLED", False)
+DATALOADER_CACHE_LOCAL_SIZE = int(os.environ.get("DATALOADER_CACHE_LOCAL_SIZE", 10000))
+DATALOADER_CACHE_VERSION_CHECK_INTERVAL = float(
+    os.environ.get("DATALOADER_CACHE_VERSION_CHECK_INTERVAL", 1)
+)
+
 # Initialize a simple and basic Jaeger Tracing integration
 # for open-tracing if enabled.
 #
@@ -851,10 +991,32 @@ JWT_TTL_REQUEST_EMAIL_CHANGE = timedelta(
     seconds=parse(os.environ.get("JWT_TTL_REQUEST_EMAIL_CHANGE", "1 hour")),
 )
 
+# Keep the payloads of up to the given number of verified tokens in each process
+# until the tokens expire, so their signatures are verified once. The cache is
+# disabled when set to 0.
+JWT_DECODE_CACHE_SIZE = int(os.environ.get("JWT_DECODE_CACHE_SIZE", 0))
+
+# Cache the effective permissions of users for the given number of seconds. Cached
+# permissions are invalidated through a version stored in the cache, bumped whenever
+# user or group permissions are changed. The cache is disabled when set to 0.
+USER_PERMISSIONS_CACHE_TIMEOUT = int(
+    os.environ.get("USER_PERMISSIONS_CACHE_TIMEOUT", 0)
+)
+USER_PERMISSIONS_VERSION_CHECK_INTERVAL = float(
+    os.environ.get("USER_PERMISSIONS_VERSION_CHECK_INTERVAL", 1)
+)
+
 CHECKOUT_PRICES_TTL = timedelta(
     seconds=parse(os.environ.get("CHECKOUT_PRICES_TTL", "1 hour"))
 )
 
+# Record what has changed in a checkout instead of expiring its prices, and
+# recalculate only the affected prices, discounts and taxes. The prices are still
+# fully recalculated once `CHECKOUT_PRICES_TTL` passes.
+CHECKOUT_INCREMENTAL_PRICES_ENABLED = get_bool_from_env(
+    "CHECKOUT_INCREMENTAL_PRICES_ENABLED", False
+)
+
 CHECKOUT_TTL_BEFORE_RELEASING_FUNDS = timedelta(
     seconds=parse(os.environ.get("CHECKOUT_TTL_BEFORE_RELEASING_FUNDS", "6 hours"))
 )
@@ -881,6 +1043,13 @@ PRODUCT_MAX_INDEXED_ATTRIBUTES = 1000
 PRODUCT_MAX_INDEXED_ATTRIBUTE_VALUES = 100
 PRODUCT_MAX_INDEXED_VARIANTS = 1000
 
+# Build product search vectors with a single SQL statement per batch of products,
+# instead of loading the products with their attributes and variants. Products with
+# rich text attribute values are still indexed in Python.
+PRODUCT_SEARCH_VECTOR_SQL_ENABLED = get_bool_from_env(
+    "PRODUCT_SEARCH_VECTOR_SQL_ENABLED", False
+)
+
 
 # Patch SubscriberExecutionContext class from `graphql-core-legacy` package
 # to fix bug causing not returning errors for subscription queries.
@@ -939,6 +1108,12 @@ TOKEN_UPDATE_LAST_LOGIN_THRESHOLD = parse(
     os.environ.get("TOKEN_UPDATE_LAST_LOGIN_THRESHOLD", "5 seconds")
 )
 
+# Remember app tokens verified by requests for the given number of seconds, keyed by
+# an HMAC of the token, so the following requests skip the password hashing. Deleted
+# tokens and deactivated apps are rejected immediately. The cache is disabled when
+# set to 0.
+APP_TOKEN_CACHE_TIMEOUT = int(os.environ.get("APP_TOKEN_CACHE_TIMEOUT", 0))
+
 # Max lock time for checkout processing.
 # It prevents locking checkout when unhandled issue appears.
 CHECKOUT_COMPLETION_LOCK_TIME = parse(
@@ -954,6 +1129,28 @@ COMMON_REQUESTS_TIMEOUT = (REQUESTS_CONN_EST_TIMEOUT, 18)
 WEBHOOK_TIMEOUT = (REQUESTS_CONN_EST_TIMEOUT, 18)
 WEBHOOK_SYNC_TIMEOUT = (REQUESTS_CONN_EST_TIMEOUT, 18)
 
+# Number of threads used to send synchronous webhooks of a single event to all apps
+# at once. When disabled, webhooks are sent one by one.
+WEBHOOK_SYNC_MAX_WORKERS = int(os.environ.get("WEBHOOK_SYNC_MAX_WORKERS", 0))
+# Time (sec) shared by all concurrently sent synchronous webhooks of a single event.
+# Responses received after the deadline are ignored.
+WEBHOOK_SYNC_DEADLINE = int(os.environ.get("WEBHOOK_SYNC_DEADLINE", 20))
+
+# Max number of async HTTP webhooks of a single host sent by one Celery task over a
+# shared keep-alive connection. When disabled, each webhook is sent by its own task.
+WEBHOOK_BATCH_SIZE = int(os.environ.get("WEBHOOK_BATCH_SIZE", 0))
+
+# Keep a per-process map of event types to subscribed webhooks, so checking for
+# webhooks of an event doesn't query the database. The map is invalidated through
+# a version stored in the cache, checked at most once per the interval (sec), and
+# rebuilt at least once per the timeout (sec). Requires a cache shared by all web and
+# Celery processes, like Redis; other processes don't see the changes otherwise.
+WEBHOOK_REGISTRY_ENABLED = get_bool_from_env("WEBHOOK_REGISTRY_ENABLED", False)
+WEBHOOK_REGISTRY_VERSION_CHECK_INTERVAL = float(
+    os.environ.get("WEBHOOK_REGISTRY_VERSION_CHECK_INTERVAL", 1)
+)
+WEBHOOK_REGISTRY_TIMEOUT = int(os.environ.get("WEBHOOK_REGISTRY_TIMEOUT", 60))
+
 # The max number of rules with order_predicate defined
 ORDER_RULES_LIMIT = os.environ.get("ORDER_RULES_LIMIT", 100)
 
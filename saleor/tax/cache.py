@@ -0,0 +1,137 @@
+import hashlib
+import json
+import logging
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Callable, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+from ..core.taxes import TaxData
+
+logger = logging.getLogger(__name__)
+
+TAX_DATA_CACHE_KEY_PREFIX = "tax-data"
+# Fields of subscription payloads that change with every request and don't affect
+# the tax calculation.
+SUBSCRIPTION_PAYLOAD_VOLATILE_FIELDS = ("issuedAt",)
+
+
+@dataclass
+class TaxDataCacheEventStats:
+    hits: int = 0
+    misses: int = 0
+
+    def as_dict(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses}
+
+
+class TaxDataCacheStats:
+    """Per-process hit and miss counters of the tax data cache, keyed by event type."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.stats: dict[str, TaxDataCacheEventStats] = {}
+
+    def record(self, event_type: str, hit: bool):
+        with self.lock:
+            stats = self.stats.get(event_type)
+            if stats is None:
+                stats = self.stats[event_type] = TaxDataCacheEventStats()
+            if hit:
+                stats.hits += 1
+            else:
+                stats.misses += 1
+
+    def clear(self):
+        with self.lock:
+            self.stats = {}
+
+    def as_dict(self) -> dict[str, dict]:
+        with self.lock:
+            return {
+                event_type: stats.as_dict() for event_type, stats in self.stats.items()
+            }
+
+
+tax_data_cache_stats = TaxDataCacheStats()
+
+
+def generate_tax_data_cache_key(
+    event_type: str, app_ids: Iterable[int], payload: str
+) -> str:
+    """Generate the cache key of tax data from the tax calculation payload.
+
+    The payload is re-serialized with sorted keys, so the key doesn't depend on
+    the order of the payload fields.
+    """
+    canonical_payload = json.dumps(
+        json.loads(payload, parse_float=Decimal),
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    payload_hash = hashlib.sha256(canonical_payload.encode("utf-8")).hexdigest()
+    apps = ",".join(str(app_id) for app_id in sorted(app_ids))
+    return f"{TAX_DATA_CACHE_KEY_PREFIX}-{event_type}-{apps}-{payload_hash}"
+
+
+def generate_tax_request_fingerprint(
+    payload: Optional[str], subscription_payloads: dict[int, dict]
+) -> str:
+    """Return the tax calculation payloads sent to the tax apps as a single payload.
+
+    `payload` is the legacy payload, sent to webhooks without a subscription query.
+    The volatile fields are dropped from the subscription payloads.
+    """
+    return json.dumps(
+        {
+            "payload": json.loads(payload, parse_float=Decimal) if payload else None,
+            "subscription_payloads": {
+                str(webhook_id): {
+                    field: value
+                    for field, value in data.items()
+                    if field not in SUBSCRIPTION_PAYLOAD_VOLATILE_FIELDS
+                }
+                for webhook_id, data in subscription_payloads.items()
+            },
+        },
+        default=str,
+    )
+
+
+def get_or_fetch_tax_data(
+    event_type: str,
+    app_ids: Iterable[int],
+    generate_payload: Callable[[], str],
+    fetch_tax_data: Callable[[], Optional[TaxData]],
+) -> Optional[TaxData]:
+    """Return the cached tax data or fetch it from the tax apps.
+
+    The tax data is cached for `TAX_DATA_CACHE_TIMEOUT` seconds; the cache is
+    disabled when the timeout is not set. Empty responses are not cached.
+    """
+    timeout = settings.TAX_DATA_CACHE_TIMEOUT
+    if not timeout:
+        return fetch_tax_data()
+
+    cache_key = generate_tax_data_cache_key(event_type, app_ids, generate_payload())
+    try:
+        tax_data = cache.get(cache_key)
+    except Exception:
+        logger.warning("Unable to fetch cached tax data.", exc_info=True)
+        tax_data = None
+    tax_data_cache_stats.record(event_type, hit=tax_data is not None)
+    if tax_data is not None:
+        return tax_data
+
+    tax_data = fetch_tax_data()
+    if tax_data is not None:
+        try:
+            cache.set(cache_key, tax_data, timeout=timeout)
+        except Exception:
+            logger.warning("Unable to cache tax data.", exc_info=True)
+    return tax_data
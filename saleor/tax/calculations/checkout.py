@@ -26,7 +26,13 @@ def update_checkout_prices_with_flat_rates(
     prices_entered_with_tax: bool,
     address: Optional["Address"] = None,
     database_connection_name: str = settings.DATABASE_CONNECTION_DEFAULT_NAME,
+    line_ids: Optional[set] = None,
 ):
+    """Calculate checkout prices with flat rates.
+
+    When `line_ids` are given, only prices of these lines are calculated; other
+    lines keep their stored prices.
+    """
     country_code = get_active_country(checkout_info.channel, address)
     default_country_rate_obj = (
         TaxClassCountryRate.objects.using(database_connection_name)
@@ -41,6 +47,8 @@ def update_checkout_prices_with_flat_rates(
     # Calculate checkout line totals.
     for line_info in lines:
         line = line_info.line
+        if line_ids is not None and line.pk not in line_ids:
+            continue
         tax_class = line_info.tax_class
         tax_rate = get_tax_rate_for_tax_class(
             tax_class,
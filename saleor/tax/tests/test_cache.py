@@ -0,0 +1,91 @@
+from decimal import Decimal
+from unittest.mock import Mock
+
+from django.core.cache import cache
+
+from ...core.taxes import TaxData
+from ..cache import (
+    generate_tax_data_cache_key,
+    generate_tax_request_fingerprint,
+    get_or_fetch_tax_data,
+)
+
+EVENT_TYPE = "checkout_calculate_taxes"
+
+
+def test_generate_tax_data_cache_key_ignores_order_of_fields():
+    # when
+    key = generate_tax_data_cache_key(EVENT_TYPE, [2, 1], '{"a": 1.10, "b": [1, 2]}')
+    other_key = generate_tax_data_cache_key(
+        EVENT_TYPE, [1, 2], '{"b": [1, 2], "a": 1.10}'
+    )
+
+    # then
+    assert key == other_key
+
+
+def test_generate_tax_request_fingerprint_ignores_volatile_fields():
+    # given
+    data = {"taxBase": {"currency": "USD"}}
+
+    # when
+    fingerprint = generate_tax_request_fingerprint(
+        None, {1: {**data, "issuedAt": "2024-01-01T00:00:00+00:00"}}
+    )
+    other_fingerprint = generate_tax_request_fingerprint(
+        None, {1: {**data, "issuedAt": "2024-01-01T00:00:01+00:00"}}
+    )
+
+    # then
+    assert generate_tax_data_cache_key(
+        EVENT_TYPE, [1], fingerprint
+    ) == generate_tax_data_cache_key(EVENT_TYPE, [1], other_fingerprint)
+
+
+def test_generate_tax_data_cache_key_depends_on_apps():
+    # when
+    key = generate_tax_data_cache_key(EVENT_TYPE, [1], '{"a": 1}')
+    other_key = generate_tax_data_cache_key(EVENT_TYPE, [2], '{"a": 1}')
+
+    # then
+    assert key != other_key
+
+
+def test_get_or_fetch_tax_data_cache_disabled(settings):
+    # given
+    settings.TAX_DATA_CACHE_TIMEOUT = 0
+    generate_payload = Mock(return_value='{"a": 1}')
+    fetch_tax_data = Mock(return_value=None)
+
+    # when
+    get_or_fetch_tax_data(EVENT_TYPE, [1], generate_payload, fetch_tax_data)
+
+    # then
+    generate_payload.assert_not_called()
+    fetch_tax_data.assert_called_once_with()
+
+
+def test_get_or_fetch_tax_data_empty_response_not_cached(settings):
+    # given
+    settings.TAX_DATA_CACHE_TIMEOUT = 60
+    cache.clear()
+    tax_data = TaxData(
+        shipping_price_gross_amount=Decimal("10"),
+        shipping_price_net_amount=Decimal("10"),
+        shipping_tax_rate=Decimal("0"),
+        lines=[],
+    )
+    fetch_tax_data = Mock(side_effect=[None, tax_data])
+
+    # when
+    first = get_or_fetch_tax_data(
+        EVENT_TYPE, [1], lambda: '{"empty": true}', fetch_tax_data
+    )
+    second = get_or_fetch_tax_data(
+        EVENT_TYPE, [1], lambda: '{"empty": true}', fetch_tax_data
+    )
+
+    # then
+    assert first is None
+    assert second == tax_data
+    assert fetch_tax_data.call_count == 2
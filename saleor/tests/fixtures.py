@@ -114,6 +114,7 @@ from ..payment.transaction_item_calculations import recalculate_transaction_amou
 from ..payment.utils import create_manual_adjustment_events
 from ..permission.enums import get_permissions
 from ..permission.models import Permission
+from ..plugins.configuration_cache import plugin_configuration_cache
 from ..plugins.manager import get_plugins_manager
 from ..plugins.webhook.tests.subscription_webhooks import subscription_queries
 from ..product import ProductMediaTypes, ProductTypeKind
@@ -158,9 +159,11 @@ from ..warehouse.models import (
     Stock,
     Warehouse,
 )
+from ..warehouse.routing import warehouse_routing
 from ..webhook.event_types import WebhookEventAsyncType, WebhookEventSyncType
 from ..webhook.models import Webhook, WebhookEvent
 from ..webhook.observability import WebhookData
+from ..webhook.registry import webhook_registry
 from ..webhook.transport.utils import WebhookResponse, to_payment_app_id
 from .utils import dummy_editorjs
 
@@ -375,6 +378,15 @@ def setup_dummy_gateways(settings):
     return settings
 
 
+@pytest.fixture(autouse=True)
+def _clear_process_caches():
+    # The database is rolled back after each test without sending any signals, so
+    # the caches invalidated by them are cleared here.
+    plugin_configuration_cache.clear()
+    webhook_registry.clear()
+    warehouse_routing.clear()
+
+
 @pytest.fixture
 def _sample_gateway(settings):
     settings.PLUGINS += [
@@ -0,0 +1,136 @@
+import logging
+import time
+from collections.abc import Iterable
+from typing import Optional
+
+from django.core.cache import cache
+from django.db.models import Model
+
+from ..core.db.connection import allow_writer
+from ..core.utils.events import call_event
+from ..plugins.manager import get_plugins_manager
+from .models import Thumbnail
+from .utils import ProcessedImage, prepare_thumbnail_file_name
+
+logger = logging.getLogger(__name__)
+
+THUMBNAIL_LOCK_KEY_PREFIX = "thumbnail-lock"
+# Release the lock of a process that died while creating the thumbnail.
+THUMBNAIL_LOCK_TIMEOUT = 60
+# How long to wait for a thumbnail being created by another process.
+THUMBNAIL_LOCK_WAIT_TIMEOUT = 10
+THUMBNAIL_LOCK_POLL_INTERVAL = 0.2
+
+
+def get_thumbnail_lock_key(
+    thumbnail_field: str, instance_pk, size: int, format: Optional[str]
+) -> str:
+    format = format or "original"
+    return (
+        f"{THUMBNAIL_LOCK_KEY_PREFIX}-{thumbnail_field}-{instance_pk}-{size}-{format}"
+    )
+
+
+def acquire_thumbnail_lock(key: str) -> bool:
+    """Return whether the calling process should create the thumbnail.
+
+    The thumbnail is created without the lock when the cache is unavailable.
+    """
+    try:
+        return cache.add(key, 1, timeout=THUMBNAIL_LOCK_TIMEOUT)
+    except Exception:
+        logger.warning("Unable to acquire the thumbnail lock.", exc_info=True)
+        return True
+
+
+def release_thumbnail_lock(key: str):
+    try:
+        cache.delete(key)
+    except Exception:
+        logger.warning("Unable to release the thumbnail lock.", exc_info=True)
+
+
+def wait_for_thumbnail(key: str, lookup: dict) -> Optional[Thumbnail]:
+    """Wait for the thumbnail created by the process holding the lock.
+
+    Return `None` when the lock is released without creating the thumbnail or
+    the thumbnail isn't created in `THUMBNAIL_LOCK_WAIT_TIMEOUT` seconds.
+    """
+    deadline = time.monotonic() + THUMBNAIL_LOCK_WAIT_TIMEOUT
+    while time.monotonic() < deadline:
+        time.sleep(THUMBNAIL_LOCK_POLL_INTERVAL)
+        with allow_writer():
+            thumbnail = Thumbnail.objects.filter(**lookup).first()
+        if thumbnail:
+            return thumbnail
+        try:
+            locked = cache.get(key) is not None
+        except Exception:
+            locked = False
+        if not locked:
+            return None
+    return None
+
+
+def save_thumbnail(
+    instance: Model,
+    thumbnail_field: str,
+    image_name: str,
+    size: int,
+    format: Optional[str],
+    thumbnail_file,
+) -> Thumbnail:
+    thumbnail_file_name = prepare_thumbnail_file_name(image_name, size, format)
+    with allow_writer():
+        thumbnail = Thumbnail(size=size, format=format, **{thumbnail_field: instance})
+        thumbnail.image.save(thumbnail_file_name, thumbnail_file)
+        thumbnail.save()
+
+        # set additional `instance` attribute, to easily get instance data
+        # for ThumbnailCreated subscription type
+        setattr(thumbnail, "instance", instance)
+        manager = get_plugins_manager(allow_replica=False)
+        call_event(manager.thumbnail_created, thumbnail)
+    return thumbnail
+
+
+def create_thumbnails(
+    instance: Model,
+    thumbnail_field: str,
+    image_name: str,
+    sizes: Iterable[int],
+    format: Optional[str],
+    processed_image_class: type[ProcessedImage] = ProcessedImage,
+) -> list[Thumbnail]:
+    """Create the missing thumbnails of the instance image in the given sizes.
+
+    The image is decoded once for all sizes. Sizes being created by another
+    process are skipped.
+    """
+    sizes = set(sizes)
+    with allow_writer():
+        existing_sizes = set(
+            Thumbnail.objects.filter(
+                format=format, size__in=sizes, **{thumbnail_field: instance}
+            ).values_list("size", flat=True)
+        )
+    lock_keys = {}
+    for size in sizes - existing_sizes:
+        key = get_thumbnail_lock_key(thumbnail_field, instance.pk, size, format)
+        if acquire_thumbnail_lock(key):
+            lock_keys[size] = key
+    if not lock_keys:
+        return []
+
+    try:
+        processed_image = processed_image_class(image_name, max(lock_keys), format)
+        thumbnail_files = processed_image.create_thumbnails(lock_keys)
+        return [
+            save_thumbnail(
+                instance, thumbnail_field, image_name, size, format, thumbnail_file
+            )
+            for size, (thumbnail_file, _) in thumbnail_files.items()
+        ]
+    finally:
+        for key in lock_keys.values():
+            release_thumbnail_lock(key)
@@ -0,0 +1,50 @@
+from collections.abc import Iterable
+
+from celery.utils.log import get_task_logger
+from django.conf import settings
+from django.db import transaction
+
+from ..celeryconf import app
+from ..core.db.connection import allow_writer
+from ..product.models import ProductMedia
+from .generation import create_thumbnails
+from .utils import get_thumbnail_format, get_thumbnail_size
+
+task_logger = get_task_logger(__name__)
+
+
+@app.task
+@allow_writer()
+def create_product_media_thumbnails_task(product_media_id: int):
+    """Create the thumbnails of the product media in `PRODUCT_MEDIA_THUMBNAIL_SIZES`."""
+    media = ProductMedia.objects.filter(pk=product_media_id).first()
+    if not media or not media.image:
+        return
+    sizes = {
+        get_thumbnail_size(size) for size in settings.PRODUCT_MEDIA_THUMBNAIL_SIZES
+    }
+    formats = {
+        get_thumbnail_format(format)
+        for format in settings.PRODUCT_MEDIA_THUMBNAIL_FORMATS
+    }
+    for format in formats:
+        try:
+            create_thumbnails(media, "product_media", media.image.name, sizes, format)
+        except (FileNotFoundError, ValueError) as error:
+            task_logger.info(
+                "Unable to create thumbnails of product media %s: %s",
+                product_media_id,
+                error,
+            )
+            return
+
+
+def schedule_product_media_thumbnails(media: Iterable[ProductMedia]):
+    """Create the thumbnails of the uploaded product images in the background."""
+    if not settings.PRODUCT_MEDIA_THUMBNAIL_SIZES:
+        return
+    for media_obj in media:
+        if media_obj.image:
+            transaction.on_commit(
+                lambda pk=media_obj.pk: create_product_media_thumbnails_task.delay(pk)
+            )
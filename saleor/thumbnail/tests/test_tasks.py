@@ -0,0 +1,64 @@
+from unittest.mock import patch
+
+from ..models import Thumbnail
+from ..tasks import (
+    create_product_media_thumbnails_task,
+    schedule_product_media_thumbnails,
+)
+
+
+def test_create_product_media_thumbnails_task(product_with_image, settings):
+    # given
+    settings.PRODUCT_MEDIA_THUMBNAIL_SIZES = [250, 512, 1024]
+    settings.PRODUCT_MEDIA_THUMBNAIL_FORMATS = ["original", "webp"]
+    product_media = product_with_image.media.first()
+    Thumbnail.objects.create(
+        product_media=product_media, size=512, image=product_media.image
+    )
+
+    # when
+    create_product_media_thumbnails_task(product_media.pk)
+
+    # then
+    thumbnails = Thumbnail.objects.filter(product_media=product_media)
+    assert thumbnails.count() == 6
+    assert set(thumbnails.values_list("size", "format")) == {
+        (256, None),
+        (512, None),
+        (1024, None),
+        (256, "webp"),
+        (512, "webp"),
+        (1024, "webp"),
+    }
+
+
+@patch("saleor.thumbnail.tasks.create_product_media_thumbnails_task.delay")
+def test_schedule_product_media_thumbnails(
+    mocked_delay, product_with_image, settings, django_capture_on_commit_callbacks
+):
+    # given
+    settings.PRODUCT_MEDIA_THUMBNAIL_SIZES = [512]
+    product_media = product_with_image.media.first()
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        schedule_product_media_thumbnails([product_media])
+
+    # then
+    mocked_delay.assert_called_once_with(product_media.pk)
+
+
+@patch("saleor.thumbnail.tasks.create_product_media_thumbnails_task.delay")
+def test_schedule_product_media_thumbnails_disabled(
+    mocked_delay, product_with_image, settings, django_capture_on_commit_callbacks
+):
+    # given
+    settings.PRODUCT_MEDIA_THUMBNAIL_SIZES = []
+    product_media = product_with_image.media.first()
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        schedule_product_media_thumbnails([product_media])
+
+    # then
+    mocked_delay.assert_not_called()
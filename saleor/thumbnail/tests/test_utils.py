@@ -4,6 +4,7 @@ from unittest.mock import MagicMock
 import graphene
 import pytest
 from django.core.files import File
+from PIL import Image
 from PIL.JpegImagePlugin import JpegImageFile
 
 from .. import FILE_NAME_MAX_LENGTH, ThumbnailFormat
@@ -185,3 +186,23 @@ def test_get_filename_from_url_with_short_name_is_not_trimmed():
     assert result.endswith(file_format)
     assert result != f"{file_name}.{file_format}"
     assert len(result.split("_")[0]) < FILE_NAME_MAX_LENGTH
+
+
+def test_processed_image_create_thumbnails(category_with_image):
+    # given
+    image_path = category_with_image.background_image.name
+    processed_image = ProcessedImage(image_path, 128, ThumbnailFormat.WEBP)
+
+    # when
+    with mock.patch.object(
+        processed_image, "retrieve_image", wraps=processed_image.retrieve_image
+    ) as retrieve_image_mock:
+        thumbnails = processed_image.create_thumbnails([64, 128, 32])
+
+    # then
+    retrieve_image_mock.assert_called_once_with(draft_size=128)
+    assert set(thumbnails) == {32, 64, 128}
+    for size, (thumbnail_file, thumbnail_format) in thumbnails.items():
+        assert thumbnail_format == "WEBP"
+        with Image.open(thumbnail_file) as thumbnail_image:
+            assert max(thumbnail_image.size) <= size
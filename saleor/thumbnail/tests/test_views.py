@@ -1,9 +1,11 @@
 from unittest.mock import patch
 
 import graphene
+from django.core.cache import cache
 from PIL import Image
 
 from .. import IconThumbnailFormat, ThumbnailFormat
+from ..generation import get_thumbnail_lock_key
 from ..models import Thumbnail
 
 
@@ -112,6 +114,49 @@ def test_handle_thumbnail_view_for_product_media(
     assert Thumbnail.objects.count() == thumbnail_count + 1
 
 
+def test_handle_thumbnail_view_waits_for_thumbnail_created_by_another_request(
+    client, product_with_image, image, media_root
+):
+    # given
+    product_media = product_with_image.media.first()
+    product_media_id = graphene.Node.to_global_id("ProductMedia", product_media.id)
+    lock_key = get_thumbnail_lock_key("product_media", product_media.id, 512, None)
+    cache.add(lock_key, 1)
+    thumbnails = []
+
+    def create_thumbnail_by_another_request(_seconds):
+        thumbnails.append(
+            Thumbnail.objects.create(product_media=product_media, size=512, image=image)
+        )
+
+    # when
+    with patch(
+        "saleor.thumbnail.generation.time.sleep",
+        side_effect=create_thumbnail_by_another_request,
+    ):
+        response = client.get(f"/thumbnail/{product_media_id}/500/")
+
+    # then
+    assert response.status_code == 302
+    assert response.url == thumbnails[0].image.url
+    assert Thumbnail.objects.count() == 1
+    cache.delete(lock_key)
+
+
+def test_handle_thumbnail_view_releases_lock(client, product_with_image):
+    # given
+    product_media = product_with_image.media.first()
+    product_media_id = graphene.Node.to_global_id("ProductMedia", product_media.id)
+    lock_key = get_thumbnail_lock_key("product_media", product_media.id, 512, None)
+
+    # when
+    response = client.get(f"/thumbnail/{product_media_id}/500/")
+
+    # then
+    assert response.status_code == 302
+    assert cache.get(lock_key) is None
+
+
 def test_handle_thumbnail_view_for_category_thumbnail_already_exist(
     client, category, settings, image, media_root
 ):
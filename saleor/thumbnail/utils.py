@@ -1,5 +1,6 @@
 import os
 import secrets
+from collections.abc import Iterable
 from io import BytesIO
 from typing import TYPE_CHECKING, Optional, Union
 
@@ -103,6 +104,8 @@ class ProcessedImage:
     # https://pillow.readthedocs.io/en/latest/handbook/image-file-formats.html#webp
     WEBP_QUAL = 70
     AVIF_QUAL = 70
+    # How many times larger than the thumbnail JPEG images are decoded.
+    DRAFT_REDUCING_GAP = 2
 
     def __init__(
         self,
@@ -117,7 +120,7 @@ class ProcessedImage:
         self.storage = storage
 
     def create_thumbnail(self):
-        image, image_format = self.retrieve_image()
+        image, image_format = self.retrieve_image(draft_size=self.size)
         image, save_kwargs = self.preprocess(image, image_format)
         image_file, thumbnail_format = self.process_image(
             image=image,
@@ -125,13 +128,39 @@ class ProcessedImage:
         )
         return image_file, thumbnail_format
 
-    def retrieve_image(self):
-        """Return a PIL Image instance stored at `image_source`."""
+    def create_thumbnails(self, sizes: Iterable[int]) -> dict[int, tuple[BytesIO, str]]:
+        """Create thumbnails in all given sizes from a single decode of the image.
+
+        The thumbnails are created from the largest to the smallest, each one
+        downscaled from the previous one.
+        """
+        sizes = sorted(set(sizes), reverse=True)
+        image, image_format = self.retrieve_image(draft_size=sizes[0])
+        image, save_kwargs = self.preprocess(image, image_format)
+        thumbnails = {}
+        for size in sizes:
+            thumbnails[size] = self.process_image(
+                image=image, save_kwargs=save_kwargs, size=size
+            )
+        return thumbnails
+
+    def retrieve_image(self, draft_size: Optional[int] = None):
+        """Return a PIL Image instance stored at `image_source`.
+
+        When `draft_size` is given, JPEG images are decoded at the smallest scale
+        that is still twice as large as the requested size, the same reducing gap
+        as `Image.thumbnail` uses.
+        """
         image = self.image_source
         if isinstance(self.image_source, str):
             image = self.storage.open(self.image_source, "rb")
         image_format = self.get_image_metadata_from_file(image)
-        return (Image.open(image), image_format)
+        pil_image = Image.open(image)
+        if draft_size:
+            # no-op for formats other than JPEG
+            reduced_size = draft_size * self.DRAFT_REDUCING_GAP
+            pil_image.draft(None, (reduced_size, reduced_size))
+        return (pil_image, image_format)
 
     @classmethod
     def get_image_metadata_from_file(cls, file_like):
@@ -236,14 +265,15 @@ class ProcessedImage:
 
         return (image, save_kwargs)
 
-    def process_image(self, image, save_kwargs):
+    def process_image(self, image, save_kwargs, size: Optional[int] = None):
         """Return a BytesIO instance of `image` that fits in a bounding box.
 
-        Bounding box dimensions are `width`x`height`.
+        Bounding box dimensions are `width`x`height`. The image is resized in place.
         """
+        size = size or self.size
         image_file = BytesIO()
         image.thumbnail(
-            (self.size, self.size),
+            (size, size),
         )
         image.save(image_file, **save_kwargs)
         image_file.seek(0)
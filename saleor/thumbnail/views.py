@@ -14,18 +14,18 @@ from graphql.error import GraphQLError
 from ..account.models import User
 from ..app.models import App, AppInstallation
 from ..core.db.connection import allow_writer
-from ..core.utils.events import call_event
 from ..graphql.core.utils import from_global_id_or_error
-from ..plugins.manager import get_plugins_manager
 from ..product.models import Category, Collection, ProductMedia
 from ..thumbnail.models import Thumbnail
 from . import ALLOWED_ICON_THUMBNAIL_FORMATS, ALLOWED_THUMBNAIL_FORMATS
-from .utils import (
-    ProcessedIconImage,
-    ProcessedImage,
-    get_thumbnail_size,
-    prepare_thumbnail_file_name,
+from .generation import (
+    acquire_thumbnail_lock,
+    get_thumbnail_lock_key,
+    release_thumbnail_lock,
+    save_thumbnail,
+    wait_for_thumbnail,
 )
+from .utils import ProcessedIconImage, ProcessedImage, get_thumbnail_size
 
 logger = logging.getLogger(__name__)
 
@@ -107,13 +107,34 @@ def handle_thumbnail(
     if not bool(image):
         return HttpResponseNotFound("There is no image for provided instance.")
 
-    # prepare thumbnail
+    lock_key = get_thumbnail_lock_key(
+        model_data.thumbnail_field, instance.pk, size_px, format
+    )
+    thumbnail_lookup = {"format": format, "size": size_px, instance_id_lookup: pk}
+    if not acquire_thumbnail_lock(lock_key):
+        # another request is creating the same thumbnail, wait for it instead of
+        # creating it again
+        if thumbnail := wait_for_thumbnail(lock_key, thumbnail_lookup):
+            return HttpResponseRedirect(thumbnail.image.url)
+        return _create_thumbnail(object_type, instance, image, size_px, format)
+
+    try:
+        # the thumbnail might have been created before the lock was acquired
+        with allow_writer():
+            thumbnail = Thumbnail.objects.filter(**thumbnail_lookup).first()
+        if thumbnail:
+            return HttpResponseRedirect(thumbnail.image.url)
+        return _create_thumbnail(object_type, instance, image, size_px, format)
+    finally:
+        release_thumbnail_lock(lock_key)
+
+
+def _create_thumbnail(object_type: str, instance, image, size: int, format):
+    model_data = TYPE_TO_MODEL_DATA_MAPPING[object_type]
     if object_type in ICON_TYPE_TO_MODEL_DATA_MAPPING:
-        processed_image: ProcessedImage = ProcessedIconImage(
-            image.name, size_px, format
-        )
+        processed_image: ProcessedImage = ProcessedIconImage(image.name, size, format)
     else:
-        processed_image = ProcessedImage(image.name, size_px, format)
+        processed_image = ProcessedImage(image.name, size, format)
     try:
         thumbnail_file, _ = processed_image.create_thumbnail()
     except FileNotFoundError as error:
@@ -123,20 +144,7 @@ def handle_thumbnail(
         logger.info(str(error))
         return HttpResponseBadRequest("Invalid image.")
 
-    thumbnail_file_name = prepare_thumbnail_file_name(image.name, size_px, format)
-
-    # save image thumbnail
-    with allow_writer():
-        thumbnail = Thumbnail(
-            size=size_px, format=format, **{model_data.thumbnail_field: instance}
-        )
-        thumbnail.image.save(thumbnail_file_name, thumbnail_file)
-        thumbnail.save()
-
-        # set additional `instance` attribute, to easily get instance data
-        # for ThumbnailCreated subscription type
-        setattr(thumbnail, "instance", instance)
-        manager = get_plugins_manager(allow_replica=False)
-        call_event(manager.thumbnail_created, thumbnail)
-
+    thumbnail = save_thumbnail(
+        instance, model_data.thumbnail_field, image.name, size, format, thumbnail_file
+    )
     return HttpResponseRedirect(thumbnail.image.url)
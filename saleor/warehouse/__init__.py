@@ -1,3 +1,6 @@
+default_app_config = "saleor.warehouse.app.WarehouseAppConfig"
+
+
 class WarehouseClickAndCollectOption:
     DISABLED = "disabled"
     LOCAL_STOCK = "local"
@@ -0,0 +1,53 @@
+from django.apps import AppConfig
+from django.conf import settings
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+
+class WarehouseAppConfig(AppConfig):
+    name = "saleor.warehouse"
+
+    def ready(self):
+        from ..channel.models import Channel
+        from ..shipping.models import ShippingZone
+        from .models import ChannelWarehouse, Reservation, Warehouse
+        from .routing import invalidate_warehouse_routing_handler
+        from .signals import decrease_stock_quantity_reserved
+
+        # preventing duplicate signals
+        if settings.STOCK_DENORMALIZED_AVAILABILITY_ENABLED:
+            post_delete.connect(
+                decrease_stock_quantity_reserved,
+                sender=Reservation,
+                dispatch_uid="decrease_stock_quantity_reserved",
+            )
+        for sender in (
+            Channel,
+            ChannelWarehouse,
+            ShippingZone,
+            ShippingZone.channels.through,
+            Warehouse,
+            Warehouse.shipping_zones.through,
+        ):
+            name = sender.__name__.lower()
+            post_save.connect(
+                invalidate_warehouse_routing_handler,
+                sender=sender,
+                dispatch_uid=f"invalidate_warehouse_routing_on_{name}_save",
+            )
+            post_delete.connect(
+                invalidate_warehouse_routing_handler,
+                sender=sender,
+                dispatch_uid=f"invalidate_warehouse_routing_on_{name}_delete",
+            )
+        for sender in (
+            ChannelWarehouse,
+            ShippingZone.channels.through,
+            Warehouse.shipping_zones.through,
+        ):
+            m2m_changed.connect(
+                invalidate_warehouse_routing_handler,
+                sender=sender,
+                dispatch_uid=(
+                    f"invalidate_warehouse_routing_on_{sender.__name__.lower()}_change"
+                ),
+            )
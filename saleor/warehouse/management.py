@@ -1,9 +1,11 @@
 import math
 from collections import defaultdict, namedtuple
 from collections.abc import Iterable
+from functools import partial
 from typing import TYPE_CHECKING, Any, Optional, cast
 from uuid import UUID
 
+from django.conf import settings
 from django.db import transaction
 from django.db.models import F, Sum
 from django.db.models.expressions import Exists, OuterRef
@@ -32,6 +34,7 @@ from .models import (
     Stock,
     Warehouse,
 )
+from .routing import get_channel_routing, is_warehouse_routing_enabled
 
 if TYPE_CHECKING:
     from ..channel.models import Channel
@@ -87,27 +90,22 @@ def allocate_stocks(
         stocks.select_for_update(of=("self",))
         .filter(**filter_lookup)
         .order_by("pk")
-        .values("id", "product_variant", "pk", "quantity", "warehouse_id")
+        .values(
+            "id",
+            "product_variant",
+            "pk",
+            "quantity",
+            "quantity_allocated",
+            "warehouse_id",
+        )
     )
-    stocks_id = (stock.pop("id") for stock in stocks)
+    stocks_id = [stock.pop("id") for stock in stocks]
 
     quantity_reservation_for_stocks: dict = _prepare_stock_to_reserved_quantity_map(
         checkout_lines, check_reservations, stocks_id
     )
 
-    quantity_allocation_list = list(
-        Allocation.objects.filter(
-            stock_id__in=stocks_id,
-            quantity_allocated__gt=0,
-        )
-        .values("stock")
-        .annotate(quantity_allocated_sum=Sum("quantity_allocated"))
-    )
-    quantity_allocation_for_stocks: dict = defaultdict(int)
-    for allocation_data in quantity_allocation_list:
-        quantity_allocation_for_stocks[allocation_data["stock"]] += allocation_data[
-            "quantity_allocated_sum"
-        ]
+    quantity_allocation_for_stocks = get_stock_to_allocated_quantity_map(stocks)
 
     stocks = sort_stocks(
         channel.allocation_strategy,
@@ -140,28 +138,76 @@ def allocate_stocks(
         raise InsufficientStock(insufficient_stock)
 
     if allocations:
-        stocks_to_update = []
-        for alloc in Allocation.objects.bulk_create(allocations):
-            stock = alloc.stock
-            stock.quantity_allocated = (
-                F("quantity_allocated") + alloc.quantity_allocated
-            )
-            stocks_to_update.append(stock)
-        Stock.objects.bulk_update(stocks_to_update, ["quantity_allocated"])
+        Allocation.objects.bulk_create(allocations)
 
+        quantity_allocated_per_stock: dict[int, int] = defaultdict(int)
         for allocation in allocations:
-            allocated_stock = (
-                Allocation.objects.filter(stock_id=allocation.stock_id).aggregate(
-                    Sum("quantity_allocated")
-                )["quantity_allocated__sum"]
-                or 0
+            quantity_allocated_per_stock[allocation.stock_id] += (
+                allocation.quantity_allocated
             )
-            if not max(allocation.stock.quantity - allocated_stock, 0):
+        Stock.objects.bulk_update(
+            [
+                Stock(
+                    pk=stock_id,
+                    quantity_allocated=F("quantity_allocated") + quantity_allocated,
+                )
+                for stock_id, quantity_allocated in quantity_allocated_per_stock.items()
+            ],
+            ["quantity_allocated"],
+        )
+
+        # The stocks are locked, so their availability after the allocation
+        # is known without querying the allocations again.
+        stocks_quantity = {
+            stock_data.pk: stock_data.quantity
+            for variant_stocks in variant_to_stocks.values()
+            for stock_data in variant_stocks
+        }
+        out_of_stock_ids = [
+            stock_id
+            for stock_id, quantity_allocated in quantity_allocated_per_stock.items()
+            if stocks_quantity[stock_id]
+            - quantity_allocation_for_stocks[stock_id]
+            - quantity_allocated
+            <= 0
+        ]
+        if out_of_stock_ids:
+            for stock in Stock.objects.filter(pk__in=out_of_stock_ids):
                 transaction.on_commit(
-                    lambda: manager.product_variant_out_of_stock(allocation.stock)
+                    partial(manager.product_variant_out_of_stock, stock)
                 )
 
 
+def get_stock_to_allocated_quantity_map(stocks: list[dict]) -> dict[int, int]:
+    """Prepare stock id to quantity allocated map for provided stocks.
+
+    Pops `quantity_allocated` from the stocks data. With
+    `STOCK_DENORMALIZED_AVAILABILITY_ENABLED` the denormalized value of the locked
+    stock rows is used instead of summing the allocations.
+    """
+    quantity_allocation_for_stocks: dict[int, int] = defaultdict(int)
+    stocks_quantity_allocated = {
+        stock_data["pk"]: stock_data.pop("quantity_allocated") for stock_data in stocks
+    }
+    if settings.STOCK_DENORMALIZED_AVAILABILITY_ENABLED:
+        quantity_allocation_for_stocks.update(stocks_quantity_allocated)
+        return quantity_allocation_for_stocks
+
+    quantity_allocation_list = (
+        Allocation.objects.filter(
+            stock_id__in=stocks_quantity_allocated.keys(),
+            quantity_allocated__gt=0,
+        )
+        .values("stock")
+        .annotate(quantity_allocated_sum=Sum("quantity_allocated"))
+    )
+    for allocation_data in quantity_allocation_list:
+        quantity_allocation_for_stocks[allocation_data["stock"]] += allocation_data[
+            "quantity_allocated_sum"
+        ]
+    return quantity_allocation_for_stocks
+
+
 def _prepare_stock_to_reserved_quantity_map(
     checkout_lines, check_reservations, stocks_id
 ):
@@ -195,9 +241,17 @@ def sort_stocks(
     collection_point_pk: Optional[UUID] = None,
 ):
     warehouse_ids = [stock_data["warehouse_id"] for stock_data in stocks]
-    channel_warehouse_ids = ChannelWarehouse.objects.filter(
-        channel_id=channel.id, warehouse_id__in=warehouse_ids
-    ).values_list("warehouse_id", flat=True)
+    routing = (
+        get_channel_routing(channel.slug) if is_warehouse_routing_enabled() else None
+    )
+    if routing:
+        channel_warehouse_ids = routing.warehouse_ids
+    else:
+        channel_warehouse_ids = list(
+            ChannelWarehouse.objects.filter(
+                channel_id=channel.id, warehouse_id__in=warehouse_ids
+            ).values_list("warehouse_id", flat=True)
+        )
 
     def sort_stocks_by_highest_stocks(stock_data):
         """Sort the stocks by the highest quantity available."""
@@ -211,15 +265,12 @@ def sort_stocks(
 
     def sort_stocks_by_warehouse_sorting_order(stock_data):
         """Sort the stocks based on the warehouse within channel order."""
-        # get the sort order for stocks warehouses within the channel
-        sorted_warehouse_list = list(channel_warehouse_ids)
-
         warehouse_id = stock_data.pop("warehouse_id")
         # in case of click and collect order we should allocate stocks from
         # collection point warehouse at the first place
         if warehouse_id == collection_point_pk:
             return -math.inf
-        return sorted_warehouse_list.index(warehouse_id)
+        return channel_warehouse_ids.index(warehouse_id)
 
     allocation_strategy_to_sort_method_and_reverse_option = {
         AllocationStrategy.PRIORITIZE_HIGH_STOCK: (sort_stocks_by_highest_stocks, True),
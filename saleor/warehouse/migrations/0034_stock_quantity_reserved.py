@@ -0,0 +1,30 @@
+# Generated by Django 3.2.25 on 2026-10-17 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("warehouse", "0033_warehouse_external_reference"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="stock",
+            name="quantity_reserved",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunSQL(
+            sql="""
+            UPDATE warehouse_stock
+            SET quantity_reserved = reservations.quantity_reserved
+            FROM (
+                SELECT stock_id, SUM(quantity_reserved) AS quantity_reserved
+                FROM warehouse_reservation
+                GROUP BY stock_id
+            ) AS reservations
+            WHERE warehouse_stock.id = reservations.stock_id;
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
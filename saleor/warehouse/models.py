@@ -10,6 +10,7 @@ from typing import (
     cast,
 )
 
+from django.conf import settings
 from django.db import models
 from django.db.models import Count, Exists, F, OuterRef, Prefetch, Q, Sum
 from django.db.models.expressions import Subquery
@@ -232,6 +233,18 @@ class Warehouse(ModelWithMetadata, ModelWithExternalReference):
 
 class StockQuerySet(models.QuerySet["Stock"]):
     def annotate_available_quantity(self) -> QuerySet[StockWithAvailableQuantity]:
+        """Annotate the quantity which is not allocated to orders.
+
+        With `STOCK_DENORMALIZED_AVAILABILITY_ENABLED` the denormalized
+        `quantity_allocated` column is used instead of summing the allocations.
+        """
+        if settings.STOCK_DENORMALIZED_AVAILABILITY_ENABLED:
+            return cast(
+                QuerySet[StockWithAvailableQuantity],
+                self.annotate(
+                    available_quantity=F("quantity") - F("quantity_allocated")
+                ),
+            )
         return cast(
             QuerySet[StockWithAvailableQuantity],
             self.annotate(
@@ -263,6 +276,15 @@ class StockQuerySet(models.QuerySet["Stock"]):
         The click and collect warehouses don't have to be assigned to the shipping zones
         so all stocks for a given channel are returned.
         """
+        from .routing import get_channel_routing, is_warehouse_routing_enabled
+
+        if is_warehouse_routing_enabled():
+            routing = get_channel_routing(channel_slug)
+            warehouse_ids = routing.warehouse_ids if routing else []
+            return self.select_related("product_variant").filter(
+                warehouse_id__in=warehouse_ids
+            )
+
         WarehouseChannel = Channel.warehouses.through
 
         channels = Channel.objects.filter(slug=channel_slug).values("pk")
@@ -288,7 +310,23 @@ class StockQuerySet(models.QuerySet["Stock"]):
         When the country_code is not provided or include_cc_warehouses is set to True,
         also the stocks from collection point warehouses allowed in given channel are
         returned.
+
+        With `WAREHOUSE_ROUTING_CACHE_ENABLED` the warehouses are taken from
+        the per-process routing table of the channel.
         """
+        from .routing import get_channel_routing, is_warehouse_routing_enabled
+
+        if is_warehouse_routing_enabled():
+            routing = get_channel_routing(channel_slug)
+            warehouse_ids = (
+                routing.get_warehouse_ids(country_code, include_cc_warehouses)
+                if routing
+                else []
+            )
+            return self.select_related("product_variant").filter(
+                warehouse_id__in=warehouse_ids
+            )
+
         ShippingZoneChannel = Channel.shipping_zones.through
         WarehouseShippingZone = ShippingZone.warehouses.through
         WarehouseChannel = Channel.warehouses.through
@@ -381,6 +419,9 @@ class Stock(models.Model):
     )
     quantity = models.IntegerField(default=0)
     quantity_allocated = models.IntegerField(default=0)
+    # Sum of all existing reservations of the stock, including expired ones
+    # which were not deleted yet.
+    quantity_reserved = models.IntegerField(default=0)
 
     objects = StockManager()
 
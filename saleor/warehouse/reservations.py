@@ -4,15 +4,15 @@ from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Optional
 
 from django.conf import settings
-from django.db.models import F, Sum
+from django.db.models import F, QuerySet, Sum
 from django.db.models.functions import Coalesce
 from django.utils import timezone
 
 from ..core.exceptions import InsufficientStock, InsufficientStockData
 from ..core.tracing import traced_atomic_transaction
 from ..product.models import ProductVariant, ProductVariantChannelListing
-from .management import sort_stocks
-from .models import Allocation, PreorderReservation, Reservation, Stock
+from .management import get_stock_to_allocated_quantity_map, sort_stocks
+from .models import PreorderReservation, Reservation, Stock
 
 if TYPE_CHECKING:
     from ..channel.models import Channel
@@ -106,23 +106,18 @@ def reserve_stocks(
         Stock.objects.select_for_update(of=("self",))
         .get_variants_stocks_for_country(country_code, channel.slug, variants)
         .order_by("pk")
-        .values("id", "product_variant", "pk", "quantity", "warehouse_id")
+        .values(
+            "id",
+            "product_variant",
+            "pk",
+            "quantity",
+            "quantity_allocated",
+            "warehouse_id",
+        )
     )
     stocks_id = [stock.pop("id") for stock in stocks]
 
-    quantity_allocation_list = list(
-        Allocation.objects.filter(
-            stock_id__in=stocks_id,
-            quantity_allocated__gt=0,
-        )
-        .values("stock")
-        .annotate(quantity_allocated_sum=Sum("quantity_allocated"))
-    )
-    quantity_allocation_for_stocks: dict = defaultdict(int)
-    for allocation in quantity_allocation_list:
-        quantity_allocation_for_stocks[allocation["stock"]] += allocation[
-            "quantity_allocated_sum"
-        ]
+    quantity_allocation_for_stocks = get_stock_to_allocated_quantity_map(stocks)
 
     quantity_reservation_list = list(
         Reservation.objects.filter(
@@ -172,8 +167,81 @@ def reserve_stocks(
 
     if reservations:
         if replace:
-            Reservation.objects.filter(checkout_line__in=checkout_lines).delete()
+            delete_stock_reservations(
+                Reservation.objects.filter(checkout_line__in=checkout_lines)
+            )
         Reservation.objects.bulk_create(reservations)
+        increase_stocks_quantity_reserved(reservations)
+
+
+def increase_stocks_quantity_reserved(reservations: Iterable[Reservation]):
+    """Add the quantities of the created reservations to their stocks.
+
+    The denormalized quantity is maintained only with
+    `STOCK_DENORMALIZED_AVAILABILITY_ENABLED`.
+    """
+    if not settings.STOCK_DENORMALIZED_AVAILABILITY_ENABLED:
+        return
+    quantity_reserved_per_stock: dict[int, int] = defaultdict(int)
+    for reservation in reservations:
+        quantity_reserved_per_stock[reservation.stock_id] += (
+            reservation.quantity_reserved
+        )
+    _change_stocks_quantity_reserved(quantity_reserved_per_stock)
+
+
+def delete_stock_reservations(reservations: QuerySet[Reservation]) -> int:
+    """Delete the reservations and subtract their quantities from their stocks.
+
+    With `STOCK_DENORMALIZED_AVAILABILITY_ENABLED` the stocks are locked in primary
+    key order, like in `allocate_stocks`, and updated with a single query.
+    Reservations locked by a concurrent delete are skipped; the `post_delete`
+    handler of that delete subtracts them.
+    """
+    if not settings.STOCK_DENORMALIZED_AVAILABILITY_ENABLED:
+        count, _ = reservations.delete()
+        return count
+
+    with traced_atomic_transaction():
+        stock_ids = list(
+            Stock.objects.select_for_update(of=("self",))
+            .filter(pk__in=reservations.values("stock_id"))
+            .order_by("pk")
+            .values_list("pk", flat=True)
+        )
+        locked_reservations = list(
+            reservations.filter(stock_id__in=stock_ids)
+            .select_for_update(of=("self",), skip_locked=True)
+            .values_list("pk", "stock_id", "quantity_reserved")
+        )
+        if not locked_reservations:
+            return 0
+
+        quantity_reserved_per_stock: dict[int, int] = defaultdict(int)
+        for _, stock_id, quantity_reserved in locked_reservations:
+            quantity_reserved_per_stock[stock_id] -= quantity_reserved
+        # raw delete doesn't send the `post_delete` signal
+        to_delete = Reservation.objects.filter(
+            pk__in=[pk for pk, _, _ in locked_reservations]
+        )
+        to_delete._raw_delete(to_delete.db)  # type: ignore[attr-defined] # raw access # noqa: E501
+        _change_stocks_quantity_reserved(quantity_reserved_per_stock)
+    return len(locked_reservations)
+
+
+def _change_stocks_quantity_reserved(quantity_reserved_per_stock: dict[int, int]):
+    Stock.objects.bulk_update(
+        [
+            Stock(
+                pk=stock_id,
+                quantity_reserved=F("quantity_reserved") + quantity_reserved,
+            )
+            for stock_id, quantity_reserved in sorted(
+                quantity_reserved_per_stock.items()
+            )
+        ],
+        ["quantity_reserved"],
+    )
 
 
 def _create_stock_reservations(
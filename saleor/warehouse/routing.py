@@ -0,0 +1,232 @@
+import logging
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Optional
+from uuid import UUID
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from ..channel.models import Channel
+from ..core.db.connection import allow_writer
+from ..shipping.models import ShippingZone
+from . import WarehouseClickAndCollectOption
+from .models import ChannelWarehouse, Warehouse
+
+logger = logging.getLogger(__name__)
+
+WAREHOUSE_ROUTING_VERSION_KEY = "warehouse-routing-version"
+
+CLICK_AND_COLLECT_OPTIONS = (
+    WarehouseClickAndCollectOption.LOCAL_STOCK,
+    WarehouseClickAndCollectOption.ALL_WAREHOUSES,
+)
+
+
+def get_warehouse_routing_version() -> int:
+    try:
+        return cache.get(WAREHOUSE_ROUTING_VERSION_KEY, 0)
+    except Exception:
+        logger.warning("Unable to fetch warehouse routing version.", exc_info=True)
+        return -1
+
+
+def _bump_warehouse_routing_version():
+    try:
+        cache.incr(WAREHOUSE_ROUTING_VERSION_KEY)
+    except ValueError:
+        cache.set(WAREHOUSE_ROUTING_VERSION_KEY, 1, timeout=None)
+    except Exception:
+        logger.warning("Unable to invalidate warehouse routing.", exc_info=True)
+
+
+def invalidate_warehouse_routing():
+    """Mark the warehouse routing tables of all processes as stale.
+
+    The version is bumped after the transaction is committed, so other processes
+    can't store the old routing under the new version.
+    """
+    warehouse_routing.clear()
+    transaction.on_commit(_bump_warehouse_routing_version)
+
+
+def invalidate_warehouse_routing_handler(sender, **kwargs):
+    action = kwargs.get("action")
+    if action is None or action in ("post_add", "post_remove", "post_clear"):
+        invalidate_warehouse_routing()
+
+
+def is_warehouse_routing_enabled() -> bool:
+    return settings.WAREHOUSE_ROUTING_CACHE_ENABLED
+
+
+@dataclass
+class ChannelRouting:
+    """Warehouses serving a channel, with the shipping zones they ship through.
+
+    `warehouse_ids` follow the warehouse sorting order within the channel. Only
+    shipping zones available in the channel are included.
+    """
+
+    channel_id: int
+    allocation_strategy: str
+    warehouse_ids: list[UUID]
+    click_and_collect_options: dict[UUID, str]
+    shipping_zone_ids_by_warehouse: dict[UUID, list[int]]
+    countries_by_shipping_zone: dict[int, frozenset[str]]
+
+    def get_warehouse_shipping_zones(
+        self, country_code: Optional[str] = None
+    ) -> dict[UUID, list[int]]:
+        """Map warehouses to their shipping zones supporting the given country."""
+        warehouse_shipping_zones = {}
+        for warehouse_id, zone_ids in self.shipping_zone_ids_by_warehouse.items():
+            if country_code:
+                zone_ids = [
+                    zone_id
+                    for zone_id in zone_ids
+                    if country_code in self.countries_by_shipping_zone[zone_id]
+                ]
+            if zone_ids:
+                warehouse_shipping_zones[warehouse_id] = list(zone_ids)
+        return warehouse_shipping_zones
+
+    def get_click_and_collect_options(self) -> dict[UUID, str]:
+        return dict(self.click_and_collect_options)
+
+    def get_warehouse_ids(
+        self, country_code: Optional[str] = None, include_cc_warehouses: bool = False
+    ) -> list[UUID]:
+        """Return the warehouses that can ship to the given country.
+
+        Follows the rules of `StockQuerySet.for_channel_and_country`.
+        """
+        warehouse_ids = set(self.get_warehouse_shipping_zones(country_code))
+        if not country_code or include_cc_warehouses:
+            warehouse_ids.update(self.click_and_collect_options)
+        return [
+            warehouse_id
+            for warehouse_id in self.warehouse_ids
+            if warehouse_id in warehouse_ids
+        ]
+
+
+def build_channel_routing(database: str, channel_slug: str) -> Optional[ChannelRouting]:
+    channel = (
+        Channel.objects.using(database)
+        .filter(slug=channel_slug)
+        .values("id", "allocation_strategy")
+        .first()
+    )
+    if not channel:
+        return None
+    channel_id = channel["id"]
+
+    warehouse_ids = []
+    click_and_collect_options = {}
+    for warehouse_id, click_and_collect_option in (
+        ChannelWarehouse.objects.using(database)
+        .filter(channel_id=channel_id)
+        .values_list("warehouse_id", "warehouse__click_and_collect_option")
+    ):
+        warehouse_ids.append(warehouse_id)
+        if click_and_collect_option in CLICK_AND_COLLECT_OPTIONS:
+            click_and_collect_options[warehouse_id] = click_and_collect_option
+
+    countries_by_shipping_zone = {
+        zone.pk: frozenset(country.code for country in zone.countries)
+        for zone in ShippingZone.objects.using(database)
+        .filter(channels__id=channel_id)
+        .only("id", "countries")
+    }
+
+    WarehouseShippingZone = Warehouse.shipping_zones.through
+    shipping_zone_ids_by_warehouse: dict[UUID, list[int]] = defaultdict(list)
+    for warehouse_id, shipping_zone_id in (
+        WarehouseShippingZone.objects.using(database)
+        .filter(
+            warehouse_id__in=warehouse_ids,
+            shippingzone_id__in=countries_by_shipping_zone.keys(),
+        )
+        .order_by("pk")
+        .values_list("warehouse_id", "shippingzone_id")
+    ):
+        shipping_zone_ids_by_warehouse[warehouse_id].append(shipping_zone_id)
+
+    return ChannelRouting(
+        channel_id=channel_id,
+        allocation_strategy=channel["allocation_strategy"],
+        warehouse_ids=warehouse_ids,
+        click_and_collect_options=click_and_collect_options,
+        shipping_zone_ids_by_warehouse=dict(shipping_zone_ids_by_warehouse),
+        countries_by_shipping_zone=countries_by_shipping_zone,
+    )
+
+
+@dataclass
+class WarehouseRouting:
+    """Per-process routing tables of channels, keyed by the channel slug.
+
+    The tables are dropped as soon as the routing version stored in the cache
+    changes. The version is checked at most once per
+    `WAREHOUSE_ROUTING_VERSION_CHECK_INTERVAL` seconds. The tables are built from
+    the writer, as a lagging replica could return the routing from before the
+    version was bumped.
+    """
+
+    version: Optional[int] = None
+    checked_at: float = 0.0
+    generation: int = 0
+    entries: dict[str, Optional[ChannelRouting]] = field(default_factory=dict)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def clear(self):
+        with self.lock:
+            self.version = None
+            self.entries = {}
+            self.generation += 1
+
+    def get(self, channel_slug: str) -> Optional[ChannelRouting]:
+        """Return the routing of a channel or `None` if the channel doesn't exist."""
+        key = channel_slug
+        version = self._get_version()
+        with self.lock:
+            if self.version != version:
+                self.version = version
+                self.entries = {}
+            if key in self.entries:
+                return self.entries[key]
+            generation = self.generation
+
+        with allow_writer():
+            routing = build_channel_routing(
+                settings.DATABASE_CONNECTION_DEFAULT_NAME, channel_slug
+            )
+        if version < 0:
+            # Don't store the routing when the cache is unavailable.
+            return routing
+        with self.lock:
+            if self.generation == generation and self.version == version:
+                self.entries[key] = routing
+        return routing
+
+    def _get_version(self) -> int:
+        now = time.monotonic()
+        check_interval = settings.WAREHOUSE_ROUTING_VERSION_CHECK_INTERVAL
+        with self.lock:
+            if self.version is not None and now - self.checked_at < check_interval:
+                return self.version
+        version = get_warehouse_routing_version()
+        with self.lock:
+            self.checked_at = now
+        return version
+
+
+warehouse_routing = WarehouseRouting()
+
+
+def get_channel_routing(channel_slug: str) -> Optional[ChannelRouting]:
+    return warehouse_routing.get(channel_slug)
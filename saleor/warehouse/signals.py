@@ -0,0 +1,15 @@
+from django.db.models import F
+
+from .models import Stock
+
+
+def decrease_stock_quantity_reserved(sender, instance, **kwargs):
+    """Subtract the quantity of a reservation deleted by a cascade delete.
+
+    Connected only with `STOCK_DENORMALIZED_AVAILABILITY_ENABLED`, as the receiver
+    disables fast deletes of reservations. Reservations deleted directly go through
+    `delete_stock_reservations`, which doesn't send the signal.
+    """
+    Stock.objects.filter(pk=instance.stock_id).update(
+        quantity_reserved=F("quantity_reserved") - instance.quantity_reserved
+    )
@@ -1,4 +1,5 @@
 from celery.utils.log import get_task_logger
+from django.conf import settings
 from django.db.models import F, Sum
 from django.db.models.functions import Coalesce
 from django.utils import timezone
@@ -6,9 +7,13 @@ from django.utils import timezone
 from ..celeryconf import app
 from ..core.db.connection import allow_writer
 from .models import Allocation, PreorderReservation, Reservation, Stock
+from .reservations import delete_stock_reservations
 
 task_logger = get_task_logger(__name__)
 
+# Each batch locks the stocks of at most that many reservations in one transaction.
+DELETE_EXPIRED_RESERVATIONS_BATCH_SIZE = 1000
+
 
 @app.task
 @allow_writer()
@@ -21,11 +26,20 @@ def delete_empty_allocations_task():
 @app.task
 @allow_writer()
 def delete_expired_reservations_task():
-    stock_reservations, _ = Reservation.objects.filter(
-        reserved_until__lt=timezone.now()
-    ).delete()
+    now = timezone.now()
+    expired_reservations = Reservation.objects.filter(reserved_until__lt=now)
+    reservation_ids = list(
+        expired_reservations.values_list("pk", flat=True)[
+            :DELETE_EXPIRED_RESERVATIONS_BATCH_SIZE
+        ]
+    )
+    stock_reservations = 0
+    if reservation_ids:
+        stock_reservations = delete_stock_reservations(
+            Reservation.objects.filter(pk__in=reservation_ids)
+        )
     preorder_reservations, _ = PreorderReservation.objects.filter(
-        reserved_until__lt=timezone.now()
+        reserved_until__lt=now
     ).delete()
 
     if stock_reservations or preorder_reservations:
@@ -35,29 +49,45 @@ def delete_expired_reservations_task():
             preorder_reservations,
         )
 
+    batch_full = len(reservation_ids) == DELETE_EXPIRED_RESERVATIONS_BATCH_SIZE
+    if stock_reservations and batch_full:
+        delete_expired_reservations_task.delay()
 
-@app.task
-@allow_writer()
-def update_stocks_quantity_allocated_task():
+
+def _reconcile_stocks_quantity(field: str, lookup: str):
+    """Set the denormalized stock `field` to the sum of the related `lookup`."""
     stocks_to_update = []
     for mismatched_stock in Stock.objects.annotate(
-        allocations_allocated=Coalesce(Sum("allocations__quantity_allocated"), 0)
-    ).exclude(quantity_allocated=F("allocations_allocated")):
-        allocations_allocated = getattr(
-            mismatched_stock, "allocations_allocated"
-        )  # annotation
+        expected_quantity=Coalesce(Sum(lookup), 0)
+    ).exclude(**{field: F("expected_quantity")}):
+        expected_quantity = getattr(mismatched_stock, "expected_quantity")  # annotation
         task_logger.info(
-            "Mismatch updating quantity_allocated: stock %d had "
-            "%d allocated, but should have %d.",
+            "Mismatch updating %s: stock %d had %d, but should have %d.",
+            field,
             mismatched_stock.pk,
-            mismatched_stock.quantity_allocated,
-            allocations_allocated,
+            getattr(mismatched_stock, field),
+            expected_quantity,
         )
-        mismatched_stock.quantity_allocated = allocations_allocated
+        setattr(mismatched_stock, field, expected_quantity)
         stocks_to_update.append(mismatched_stock)
 
-    Stock.objects.bulk_update(stocks_to_update, ["quantity_allocated"])
+    Stock.objects.bulk_update(stocks_to_update, [field])
     task_logger.info(
-        "Finished updating quantity_allocated on stocks, %d were corrected.",
+        "Finished updating %s on stocks, %d were corrected.",
+        field,
         len(stocks_to_update),
     )
+
+
+@app.task
+@allow_writer()
+def update_stocks_quantity_allocated_task():
+    _reconcile_stocks_quantity("quantity_allocated", "allocations__quantity_allocated")
+
+
+@app.task
+@allow_writer()
+def update_stocks_quantity_reserved_task():
+    if not settings.STOCK_DENORMALIZED_AVAILABILITY_ENABLED:
+        return
+    _reconcile_stocks_quantity("quantity_reserved", "reservations__quantity_reserved")
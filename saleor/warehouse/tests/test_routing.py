@@ -0,0 +1,104 @@
+from ..models import ChannelWarehouse, Stock
+from ..routing import get_channel_routing, warehouse_routing
+
+COUNTRY_CODE = "US"
+
+
+def test_channel_routing(warehouse, warehouse_for_cc, shipping_zone, channel_USD):
+    # when
+    routing = get_channel_routing(channel_USD.slug)
+
+    # then
+    assert routing.channel_id == channel_USD.pk
+    assert routing.allocation_strategy == channel_USD.allocation_strategy
+    assert set(routing.warehouse_ids) == {warehouse.pk, warehouse_for_cc.pk}
+    assert routing.get_warehouse_shipping_zones(COUNTRY_CODE) == {
+        warehouse.pk: [shipping_zone.pk]
+    }
+    assert routing.get_warehouse_ids(COUNTRY_CODE) == [warehouse.pk]
+    assert set(routing.get_warehouse_ids()) == {warehouse.pk, warehouse_for_cc.pk}
+    assert routing.get_click_and_collect_options() == {
+        warehouse_for_cc.pk: warehouse_for_cc.click_and_collect_option
+    }
+
+
+def test_channel_routing_for_not_existing_channel(db):
+    # when
+    routing = get_channel_routing("not-existing")
+
+    # then
+    assert routing is None
+
+
+def test_channel_routing_warehouses_sorted_by_channel_order(
+    warehouse, warehouse_for_cc, channel_USD
+):
+    # given
+    ChannelWarehouse.objects.filter(
+        channel=channel_USD, warehouse=warehouse_for_cc
+    ).update(sort_order=0)
+    ChannelWarehouse.objects.filter(channel=channel_USD, warehouse=warehouse).update(
+        sort_order=1
+    )
+
+    # when
+    routing = get_channel_routing(channel_USD.slug)
+
+    # then
+    assert routing.warehouse_ids == [warehouse_for_cc.pk, warehouse.pk]
+
+
+def test_stocks_for_country_use_cached_routing(
+    settings, variant_with_many_stocks, channel_USD, django_assert_num_queries
+):
+    # given
+    settings.WAREHOUSE_ROUTING_CACHE_ENABLED = True
+    list(Stock.objects.for_channel_and_country(channel_USD.slug, COUNTRY_CODE))
+
+    # when
+    with django_assert_num_queries(1):
+        stocks = list(
+            Stock.objects.filter(
+                product_variant=variant_with_many_stocks
+            ).for_channel_and_country(channel_USD.slug, COUNTRY_CODE)
+        )
+
+    # then
+    assert {stock.quantity for stock in stocks} == {4, 3}
+
+
+def test_stocks_for_country_routing_invalidated_on_shipping_zone_change(
+    settings, variant_with_many_stocks, channel_USD
+):
+    # given
+    settings.WAREHOUSE_ROUTING_CACHE_ENABLED = True
+    stocks = Stock.objects.for_channel_and_country(channel_USD.slug, COUNTRY_CODE)
+    assert stocks.exists()
+
+    # when
+    for warehouse in channel_USD.warehouses.all():
+        for shipping_zone in warehouse.shipping_zones.all():
+            shipping_zone.countries = ["PL"]
+            shipping_zone.save(update_fields=["countries"])
+
+    # then
+    assert warehouse_routing.entries == {}
+    stocks = Stock.objects.for_channel_and_country(channel_USD.slug, COUNTRY_CODE)
+    assert not stocks.exists()
+
+
+def test_stocks_for_country_routing_invalidated_on_warehouse_unassign(
+    settings, variant_with_many_stocks, channel_USD
+):
+    # given
+    settings.WAREHOUSE_ROUTING_CACHE_ENABLED = True
+    stocks = Stock.objects.for_channel_and_country(channel_USD.slug, COUNTRY_CODE)
+    assert stocks.exists()
+
+    # when
+    for warehouse in channel_USD.warehouses.all():
+        warehouse.shipping_zones.clear()
+
+    # then
+    stocks = Stock.objects.for_channel_and_country(channel_USD.slug, COUNTRY_CODE)
+    assert not stocks.exists()
@@ -45,6 +45,81 @@ def test_allocate_stocks(order_line, stock, channel_USD):
     assert allocation.quantity_allocated == stock.quantity_allocated == 50
 
 
+@mock.patch("saleor.plugins.manager.PluginsManager.product_variant_out_of_stock")
+def test_allocate_stocks_with_out_of_stock_webhook_triggered(
+    product_variant_out_of_stock_webhook_mock, order_line, stock, channel_USD
+):
+    # given
+    stock.quantity = 50
+    stock.save(update_fields=["quantity"])
+    line_data = OrderLineInfo(line=order_line, variant=order_line.variant, quantity=50)
+
+    # when
+    allocate_stocks(
+        [line_data],
+        COUNTRY_CODE,
+        channel_USD,
+        manager=get_plugins_manager(allow_replica=False),
+    )
+    flush_post_commit_hooks()
+
+    # then
+    product_variant_out_of_stock_webhook_mock.assert_called_once_with(stock)
+
+
+@mock.patch("saleor.plugins.manager.PluginsManager.product_variant_out_of_stock")
+def test_allocate_stocks_with_existing_allocation_out_of_stock_webhook_triggered(
+    product_variant_out_of_stock_webhook_mock, allocation, order_line, channel_USD
+):
+    # given
+    stock = allocation.stock
+    stock.quantity = 50
+    stock.quantity_allocated = 20
+    stock.save(update_fields=["quantity", "quantity_allocated"])
+    allocation.quantity_allocated = 20
+    allocation.save(update_fields=["quantity_allocated"])
+    new_line = OrderLine.objects.get(pk=order_line.pk)
+    new_line.pk = None
+    new_line.save()
+    line_data = OrderLineInfo(line=new_line, variant=new_line.variant, quantity=30)
+
+    # when
+    allocate_stocks(
+        [line_data],
+        COUNTRY_CODE,
+        channel_USD,
+        manager=get_plugins_manager(allow_replica=False),
+    )
+    flush_post_commit_hooks()
+
+    # then
+    stock.refresh_from_db()
+    assert stock.quantity_allocated == 50
+    product_variant_out_of_stock_webhook_mock.assert_called_once_with(stock)
+
+
+@mock.patch("saleor.plugins.manager.PluginsManager.product_variant_out_of_stock")
+def test_allocate_stocks_with_stock_left_out_of_stock_webhook_not_triggered(
+    product_variant_out_of_stock_webhook_mock, order_line, stock, channel_USD
+):
+    # given
+    stock.quantity = 100
+    stock.save(update_fields=["quantity"])
+    line_data = OrderLineInfo(line=order_line, variant=order_line.variant, quantity=50)
+
+    # when
+    allocate_stocks(
+        [line_data],
+        COUNTRY_CODE,
+        channel_USD,
+        manager=get_plugins_manager(allow_replica=False),
+    )
+    flush_post_commit_hooks()
+
+    # then
+    product_variant_out_of_stock_webhook_mock.assert_not_called()
+
+
 def test_allocate_stocks_multiple_lines_the_highest_stock_strategy(
     order_line, order, product, stock, channel_USD
 ):
@@ -1,6 +1,7 @@
 from datetime import timedelta
 
 import pytest
+from django.db.models.signals import post_delete
 from django.utils import timezone
 
 from ...channel import AllocationStrategy
@@ -8,11 +9,26 @@ from ...checkout.models import Checkout
 from ...core.exceptions import InsufficientStock
 from ..models import ChannelWarehouse, Reservation, Stock, Warehouse
 from ..reservations import reserve_stocks
+from ..signals import decrease_stock_quantity_reserved
 
 COUNTRY_CODE = "US"
 RESERVATION_LENGTH = 5
 
 
+@pytest.fixture
+def denormalized_availability(settings):
+    settings.STOCK_DENORMALIZED_AVAILABILITY_ENABLED = True
+    post_delete.connect(
+        decrease_stock_quantity_reserved,
+        sender=Reservation,
+        dispatch_uid="decrease_stock_quantity_reserved",
+    )
+    yield
+    post_delete.disconnect(
+        sender=Reservation, dispatch_uid="decrease_stock_quantity_reserved"
+    )
+
+
 def test_reserve_stocks(checkout_line, channel_USD):
     checkout_line.quantity = 5
     checkout_line.save()
@@ -36,6 +52,78 @@ def test_reserve_stocks(checkout_line, channel_USD):
     assert reservation.reserved_until > timezone.now() + timedelta(minutes=1)
 
 
+def test_reserve_stocks_updates_stock_quantity_reserved(
+    denormalized_availability, checkout_line, channel_USD
+):
+    # given
+    checkout_line.quantity = 5
+    checkout_line.save()
+    stock = Stock.objects.get(product_variant=checkout_line.variant)
+    stock.quantity = 10
+    stock.save(update_fields=["quantity"])
+
+    # when
+    reserve_stocks(
+        [checkout_line],
+        [checkout_line.variant],
+        COUNTRY_CODE,
+        channel_USD,
+        timezone.now() + timedelta(minutes=RESERVATION_LENGTH),
+    )
+
+    # then
+    stock.refresh_from_db()
+    assert stock.quantity_reserved == 5
+
+    # when
+    checkout_line.quantity = 3
+    checkout_line.save()
+    reserve_stocks(
+        [checkout_line],
+        [checkout_line.variant],
+        COUNTRY_CODE,
+        channel_USD,
+        timezone.now() + timedelta(minutes=RESERVATION_LENGTH),
+    )
+
+    # then
+    stock.refresh_from_db()
+    assert stock.quantity_reserved == 3
+
+    # when
+    checkout_line.delete()
+
+    # then
+    stock.refresh_from_db()
+    assert stock.quantity_reserved == 0
+
+
+def test_reserve_stocks_with_denormalized_availability(
+    settings, checkout_line, channel_USD
+):
+    # given
+    settings.STOCK_DENORMALIZED_AVAILABILITY_ENABLED = True
+    checkout_line.quantity = 5
+    checkout_line.save()
+    stock = Stock.objects.get(product_variant=checkout_line.variant)
+    stock.quantity = 10
+    stock.quantity_allocated = 6
+    stock.save(update_fields=["quantity", "quantity_allocated"])
+
+    # when
+    with pytest.raises(InsufficientStock):
+        reserve_stocks(
+            [checkout_line],
+            [checkout_line.variant],
+            COUNTRY_CODE,
+            channel_USD,
+            timezone.now() + timedelta(minutes=RESERVATION_LENGTH),
+        )
+
+    # then
+    assert not Reservation.objects.exists()
+
+
 def test_stocks_reservation_skips_prev_reservation_delete_if_replace_is_disabled(
     checkout_line, assert_num_queries, channel_USD
 ):
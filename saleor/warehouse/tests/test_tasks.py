@@ -1,12 +1,14 @@
 from datetime import timedelta
+from unittest.mock import patch
 
 import pytest
 from django.utils import timezone
 
-from ..models import PreorderReservation, Reservation
+from ..models import PreorderReservation, Reservation, Stock
 from ..tasks import (
     delete_expired_reservations_task,
     update_stocks_quantity_allocated_task,
+    update_stocks_quantity_reserved_task,
 )
 
 
@@ -18,6 +20,23 @@ def test_delete_expired_reservations_task_deletes_expired_stock_reservations(
     assert not Reservation.objects.exists()
 
 
+@patch("saleor.warehouse.tasks.delete_expired_reservations_task.delay")
+@patch("saleor.warehouse.tasks.DELETE_EXPIRED_RESERVATIONS_BATCH_SIZE", 1)
+def test_delete_expired_reservations_task_deletes_in_batches(
+    mocked_delay, checkout_line_with_reservation_in_many_stocks
+):
+    # given
+    reservations_count = Reservation.objects.count()
+    Reservation.objects.update(reserved_until=timezone.now() - timedelta(seconds=1))
+
+    # when
+    delete_expired_reservations_task()
+
+    # then
+    assert Reservation.objects.count() == reservations_count - 1
+    mocked_delay.assert_called_once_with()
+
+
 def test_delete_expired_reservations_task_skips_active_stock_reservations(
     checkout_line_with_reservation_in_many_stocks,
 ):
@@ -85,3 +104,52 @@ def test_update_stocks_quantity_allocated_task_stock_without_allocations(stock):
 
     stock.refresh_from_db()
     assert stock.quantity_allocated == 0
+
+
+def test_update_stocks_quantity_reserved_task(
+    checkout_line_with_reservation_in_many_stocks, settings
+):
+    # given
+    settings.STOCK_DENORMALIZED_AVAILABILITY_ENABLED = True
+    reservations = Reservation.objects.all()
+    stocks = [reservation.stock for reservation in reservations]
+    for stock in stocks:
+        stock.quantity_reserved = 100
+    Stock.objects.bulk_update(stocks, ["quantity_reserved"])
+
+    # when
+    update_stocks_quantity_reserved_task()
+
+    # then
+    for reservation in reservations:
+        reservation.stock.refresh_from_db()
+        assert reservation.stock.quantity_reserved == reservation.quantity_reserved
+
+
+def test_update_stocks_quantity_reserved_task_disabled(
+    checkout_line_with_reservation_in_many_stocks, settings
+):
+    # given
+    settings.STOCK_DENORMALIZED_AVAILABILITY_ENABLED = False
+    Stock.objects.update(quantity_reserved=100)
+
+    # when
+    update_stocks_quantity_reserved_task()
+
+    # then
+    assert not Stock.objects.exclude(quantity_reserved=100).exists()
+
+
+def test_delete_expired_reservations_task_updates_stock_quantity_reserved(
+    checkout_line_with_reservation_in_many_stocks, settings
+):
+    # given
+    settings.STOCK_DENORMALIZED_AVAILABILITY_ENABLED = True
+    update_stocks_quantity_reserved_task()
+    Reservation.objects.update(reserved_until=timezone.now() - timedelta(seconds=1))
+
+    # when
+    delete_expired_reservations_task()
+
+    # then
+    assert not Stock.objects.exclude(quantity_reserved=0).exists()
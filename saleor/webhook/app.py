@@ -0,0 +1,43 @@
+from django.apps import AppConfig
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+
+class WebhookAppConfig(AppConfig):
+    name = "saleor.webhook"
+
+    def ready(self):
+        from ..app.models import App
+        from ..graphql.webhook.subscription_payload import (
+            invalidate_subscription_documents_handler,
+        )
+        from .models import Webhook, WebhookEvent
+        from .registry import invalidate_webhook_registry_handler
+
+        # preventing duplicate signals
+        post_save.connect(
+            invalidate_subscription_documents_handler,
+            sender=Webhook,
+            dispatch_uid="invalidate_subscription_documents_on_webhook_save",
+        )
+        post_delete.connect(
+            invalidate_subscription_documents_handler,
+            sender=Webhook,
+            dispatch_uid="invalidate_subscription_documents_on_webhook_delete",
+        )
+        for sender in (Webhook, WebhookEvent, App):
+            name = sender.__name__.lower()
+            post_save.connect(
+                invalidate_webhook_registry_handler,
+                sender=sender,
+                dispatch_uid=f"invalidate_webhook_registry_on_{name}_save",
+            )
+            post_delete.connect(
+                invalidate_webhook_registry_handler,
+                sender=sender,
+                dispatch_uid=f"invalidate_webhook_registry_on_{name}_delete",
+            )
+        m2m_changed.connect(
+            invalidate_webhook_registry_handler,
+            sender=App.permissions.through,
+            dispatch_uid="invalidate_webhook_registry_on_app_permissions_change",
+        )
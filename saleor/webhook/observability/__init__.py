@@ -8,6 +8,7 @@ from .utils import (
     get_webhooks,
     pop_events_with_remaining_size,
     report_api_call,
+    report_api_call_in_thread,
     report_event_delivery_attempt,
     report_gql_operation,
     report_view,
@@ -23,6 +24,7 @@ __all__ = [
     "get_buffer_name",
     "get_webhooks",
     "report_api_call",
+    "report_api_call_in_thread",
     "report_gql_operation",
     "report_event_delivery_attempt",
     "task_next_retry_date",
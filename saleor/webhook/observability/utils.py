@@ -164,6 +164,16 @@ def report_api_call(request: "HttpRequest") -> Generator[ApiCall, None, None]:
         del _context.api_call
 
 
+@contextmanager
+def report_api_call_in_thread(api_call: ApiCall) -> Generator[ApiCall, None, None]:
+    """Attach GraphQL operations executed in a worker thread to the given API call."""
+    _context.api_call = api_call
+    try:
+        yield api_call
+    finally:
+        del _context.api_call
+
+
 @contextmanager
 def report_gql_operation() -> Generator[GraphQLOperationResponse, None, None]:
     root = False
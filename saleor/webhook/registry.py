@@ -0,0 +1,164 @@
+import copy
+import logging
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from ..core.db.connection import allow_writer
+from .event_types import WebhookEventAsyncType, WebhookEventSyncType
+from .models import Webhook
+
+logger = logging.getLogger(__name__)
+
+WEBHOOK_REGISTRY_VERSION_KEY = "webhook-registry-version"
+
+
+def get_webhook_registry_version() -> int:
+    try:
+        return cache.get(WEBHOOK_REGISTRY_VERSION_KEY, 0)
+    except Exception:
+        logger.warning("Unable to fetch webhook registry version.", exc_info=True)
+        return -1
+
+
+def _bump_webhook_registry_version():
+    try:
+        cache.incr(WEBHOOK_REGISTRY_VERSION_KEY)
+    except ValueError:
+        cache.set(WEBHOOK_REGISTRY_VERSION_KEY, 1, timeout=None)
+    except Exception:
+        logger.warning("Unable to invalidate webhook registry.", exc_info=True)
+
+
+def invalidate_webhook_registry():
+    """Mark the webhook registries of all processes as stale.
+
+    The version is bumped after the transaction is committed, so other processes
+    can't store the old webhooks under the new version.
+    """
+    webhook_registry.clear()
+    transaction.on_commit(_bump_webhook_registry_version)
+
+
+def invalidate_webhook_registry_handler(sender, **kwargs):
+    action = kwargs.get("action")
+    if action is None or action in ("post_add", "post_remove", "post_clear"):
+        invalidate_webhook_registry()
+
+
+def _get_required_permission(event_type: str) -> Optional[tuple[str, str]]:
+    required_permission = WebhookEventAsyncType.PERMISSIONS.get(
+        event_type, WebhookEventSyncType.PERMISSIONS.get(event_type)
+    )
+    if not required_permission:
+        return None
+    app_label, codename = required_permission.value.split(".")
+    return app_label, codename
+
+
+def build_webhook_registry() -> dict[str, list[Webhook]]:
+    """Map event types to the active webhooks allowed to receive them.
+
+    Follows the rules of `get_filter_for_single_webhook_event`: the app has to be
+    active, not marked as removed (except for `APP_DELETED`) and has to have the
+    permission required by the event.
+
+    The webhooks are fetched from the writer database; the registry is rebuilt
+    right after the version is bumped, when a replica may still return the old
+    webhooks.
+    """
+    with allow_writer():
+        webhooks = list(
+            Webhook.objects.using(settings.DATABASE_CONNECTION_DEFAULT_NAME)
+            .filter(is_active=True, app__is_active=True)
+            .select_related("app")
+            .prefetch_related("events", "app__permissions__content_type")
+        )
+    registry: dict[str, list[Webhook]] = defaultdict(list)
+    for webhook in webhooks:
+        event_types = {event.event_type for event in webhook.events.all()}
+        if WebhookEventAsyncType.ANY in event_types:
+            event_types.update(WebhookEventAsyncType.ALL)
+        app = webhook.app
+        app_permissions = {
+            (permission.content_type.app_label, permission.codename)
+            for permission in app.permissions.all()
+        }
+        for event_type in event_types:
+            if (
+                app.removed_at is not None
+                and event_type != WebhookEventAsyncType.APP_DELETED
+            ):
+                continue
+            required_permission = _get_required_permission(event_type)
+            if required_permission and required_permission not in app_permissions:
+                continue
+            registry[event_type].append(webhook)
+    return dict(registry)
+
+
+@dataclass
+class WebhookRegistry:
+    """Per-process map of event types to the webhooks subscribed to them.
+
+    The map is rebuilt lazily, when the registry version stored in the cache
+    changes or the map is older than `WEBHOOK_REGISTRY_TIMEOUT` seconds. The
+    version is checked at most once per `WEBHOOK_REGISTRY_VERSION_CHECK_INTERVAL`
+    seconds. Returned webhooks are copies, so callers can't modify the shared map.
+    """
+
+    version: Optional[int] = None
+    checked_at: float = 0.0
+    built_at: float = 0.0
+    generation: int = 0
+    webhooks: Optional[dict[str, list[Webhook]]] = None
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def clear(self):
+        with self.lock:
+            self.version = None
+            self.webhooks = None
+            self.generation += 1
+
+    def get_webhooks(self, event_type: str) -> list[Webhook]:
+        webhooks = self._get_registry().get(event_type)
+        if not webhooks:
+            return []
+        return [copy.copy(webhook) for webhook in webhooks]
+
+    def _get_registry(self) -> dict[str, list[Webhook]]:
+        now = time.monotonic()
+        check_interval = settings.WEBHOOK_REGISTRY_VERSION_CHECK_INTERVAL
+        with self.lock:
+            if now - self.built_at >= settings.WEBHOOK_REGISTRY_TIMEOUT:
+                self.webhooks = None
+            if self.webhooks is not None and now - self.checked_at < check_interval:
+                return self.webhooks
+
+        version = get_webhook_registry_version()
+        with self.lock:
+            if self.webhooks is not None and self.version == version:
+                self.checked_at = now
+                return self.webhooks
+            generation = self.generation
+
+        registry = build_webhook_registry()
+        if version < 0:
+            # Don't store the registry when the cache is unavailable.
+            return registry
+        with self.lock:
+            if self.generation == generation:
+                self.version = version
+                self.checked_at = now
+                self.built_at = now
+                self.webhooks = registry
+        return registry
+
+
+webhook_registry = WebhookRegistry()
@@ -1,14 +1,16 @@
 import pytest
+from django.utils import timezone
 
 from ...app.models import App
 from ..event_types import WebhookEventAsyncType, WebhookEventSyncType
-from ..models import Webhook
+from ..models import Webhook, WebhookEvent
 from ..observability.exceptions import (
     ApiCallTruncationError,
     EventDeliveryAttemptTruncationError,
     TruncationError,
 )
 from ..observability.payload_schema import ObservabilityEventTypes
+from ..registry import webhook_registry
 from ..utils import get_webhooks_for_event, get_webhooks_for_multiple_events
 
 
@@ -100,7 +102,7 @@ def test_get_webhook_for_event_no_duplicates(async_app_factory, async_type):
 
     webhooks = get_webhooks_for_event(async_type)
 
-    assert webhooks.count() == 1
+    assert len(webhooks) == 1
 
 
 def test_get_webhook_for_event_not_returning_any_webhook_for_sync_event_types(
@@ -114,6 +116,106 @@ def test_get_webhook_for_event_not_returning_any_webhook_for_sync_event_types(
     assert set(webhooks) == {sync_webhook}
 
 
+def test_get_webhooks_for_event_uses_registry(
+    settings, async_app_factory, async_type, django_assert_num_queries
+):
+    # given
+    settings.WEBHOOK_REGISTRY_ENABLED = True
+    _, async_webhook = async_app_factory()
+    get_webhooks_for_event(async_type)
+
+    # when
+    with django_assert_num_queries(0):
+        webhooks = get_webhooks_for_event(async_type)
+        no_webhooks = get_webhooks_for_event(WebhookEventAsyncType.PRODUCT_CREATED)
+
+    # then
+    assert webhooks == [async_webhook]
+    assert no_webhooks == []
+
+
+def test_get_webhooks_for_event_registry_invalidated_on_change(
+    settings, async_app_factory, async_type
+):
+    # given
+    settings.WEBHOOK_REGISTRY_ENABLED = True
+    app, async_webhook = async_app_factory()
+    assert get_webhooks_for_event(WebhookEventAsyncType.PRODUCT_CREATED) == []
+
+    # when
+    async_webhook.events.create(event_type=WebhookEventAsyncType.PRODUCT_CREATED)
+
+    # then
+    assert get_webhooks_for_event(WebhookEventAsyncType.PRODUCT_CREATED) == [
+        async_webhook
+    ]
+
+    # when
+    app.permissions.clear()
+
+    # then
+    assert get_webhooks_for_event(async_type) == []
+
+
+def test_get_webhooks_for_event_registry_with_removed_app(
+    settings, async_app_factory, async_type
+):
+    # given
+    settings.WEBHOOK_REGISTRY_ENABLED = True
+    app, async_webhook = async_app_factory()
+    async_webhook.events.create(event_type=WebhookEventAsyncType.APP_DELETED)
+    app.removed_at = timezone.now()
+    app.save(update_fields=["removed_at"])
+
+    # when
+    webhooks = get_webhooks_for_event(async_type)
+    app_deleted_webhooks = get_webhooks_for_event(WebhookEventAsyncType.APP_DELETED)
+
+    # then
+    assert webhooks == []
+    assert app_deleted_webhooks == [async_webhook]
+
+
+def test_get_webhooks_for_event_registry_rebuilt_after_timeout(
+    settings, async_app_factory, async_type
+):
+    # given
+    settings.WEBHOOK_REGISTRY_ENABLED = True
+    settings.WEBHOOK_REGISTRY_TIMEOUT = 0
+    _, async_webhook = async_app_factory()
+    assert get_webhooks_for_event(WebhookEventAsyncType.PRODUCT_CREATED) == []
+
+    # when
+    # Changes made without signals are only picked up once the registry expires.
+    WebhookEvent.objects.bulk_create(
+        [
+            WebhookEvent(
+                webhook=async_webhook,
+                event_type=WebhookEventAsyncType.PRODUCT_CREATED,
+            )
+        ]
+    )
+    webhooks = get_webhooks_for_event(WebhookEventAsyncType.PRODUCT_CREATED)
+
+    # then
+    assert webhooks == [async_webhook]
+
+
+def test_get_webhooks_for_event_registry_disabled(
+    settings, async_app_factory, async_type
+):
+    # given
+    settings.WEBHOOK_REGISTRY_ENABLED = False
+    _, async_webhook = async_app_factory()
+
+    # when
+    webhooks = get_webhooks_for_event(async_type)
+
+    # then
+    assert list(webhooks) == [async_webhook]
+    assert webhook_registry.webhooks is None
+
+
 @pytest.mark.parametrize(
     ("error", "event_type"),
     [
@@ -1,7 +1,10 @@
 import datetime
 import json
 import logging
+from collections import defaultdict
 from collections.abc import Sequence
+from functools import lru_cache
+from http.cookiejar import DefaultCookiePolicy
 from typing import TYPE_CHECKING, Optional
 from urllib.parse import urlparse
 
@@ -12,6 +15,7 @@ from django.conf import settings
 from ....celeryconf import app
 from ....core import EventDeliveryStatus
 from ....core.db.connection import allow_writer
+from ....core.http_client import HTTPClient
 from ....core.models import EventDelivery, EventPayload
 from ....core.tracing import webhooks_opentracing_trace
 from ....core.utils import get_domain
@@ -25,6 +29,7 @@ from ....graphql.webhook.subscription_types import WEBHOOK_TYPES_MAP
 from ... import observability
 from ...event_types import WebhookEventAsyncType, WebhookEventSyncType
 from ...observability import WebhookData
+from .. import signature_for_payload
 from ..utils import (
     WebhookResponse,
     WebhookSchemes,
@@ -34,6 +39,7 @@ from ..utils import (
     delivery_update,
     get_delivery_for_webhook,
     handle_webhook_retry,
+    send_webhook_using_http,
     send_webhook_using_scheme_method,
 )
 
@@ -91,13 +97,20 @@ def create_deliveries_for_subscriptions(
         dataloaders=dataloaders,
     )
 
+    # Webhooks of the same app with identical subscription queries get the same
+    # payload, so it is generated and stored only once per group.
+    webhooks_by_query: dict[tuple[str, int], list[Webhook]] = defaultdict(list)
     for webhook in webhooks:
+        webhooks_by_query[(webhook.subscription_query, webhook.app_id)].append(webhook)
+
+    for (subscription_query, _app_id), query_webhooks in webhooks_by_query.items():
         data = generate_payload_from_subscription(
             event_type=event_type,
             subscribable_object=subscribable_object,
-            subscription_query=webhook.subscription_query,
+            subscription_query=subscription_query,
             request=request,
-            app=webhook.app,
+            app=query_webhooks[0].app,
+            webhook_id=query_webhooks[0].pk,
         )
 
         if not data:
@@ -106,31 +119,35 @@ def create_deliveries_for_subscriptions(
             )
             continue
 
-        if (
-            settings.ENABLE_LIMITING_WEBHOOKS_FOR_IDENTICAL_PAYLOADS
-            and pre_save_payloads
-        ):
-            key = get_pre_save_payload_key(webhook, subscribable_object)
-            pre_save_payload = pre_save_payloads.get(key)
-            if pre_save_payload and pre_save_payload == data:
-                logger.info(
-                    "[Webhook ID:%r] No data changes for event %r, skip delivery to %r",
-                    webhook.id,
-                    event_type,
-                    webhook.target_url,
+        event_payload = None
+        for webhook in query_webhooks:
+            if (
+                settings.ENABLE_LIMITING_WEBHOOKS_FOR_IDENTICAL_PAYLOADS
+                and pre_save_payloads
+            ):
+                key = get_pre_save_payload_key(webhook, subscribable_object)
+                pre_save_payload = pre_save_payloads.get(key)
+                if pre_save_payload and pre_save_payload == data:
+                    logger.info(
+                        "[Webhook ID:%r] No data changes for event %r, "
+                        "skip delivery to %r",
+                        webhook.id,
+                        event_type,
+                        webhook.target_url,
+                    )
+                    continue
+
+            if event_payload is None:
+                event_payload = EventPayload(payload=json.dumps({**data}))
+                event_payloads.append(event_payload)
+            event_deliveries.append(
+                EventDelivery(
+                    status=EventDeliveryStatus.PENDING,
+                    event_type=event_type,
+                    payload=event_payload,
+                    webhook=webhook,
                 )
-                continue
-
-        event_payload = EventPayload(payload=json.dumps({**data}))
-        event_payloads.append(event_payload)
-        event_deliveries.append(
-            EventDelivery(
-                status=EventDeliveryStatus.PENDING,
-                event_type=event_type,
-                payload=event_payload,
-                webhook=webhook,
             )
-        )
 
     with allow_writer():
         EventPayload.objects.bulk_create(event_payloads)
@@ -228,6 +245,8 @@ def trigger_webhooks_async(
                 request_time=request_time,
             )
         )
+    if settings.WEBHOOK_BATCH_SIZE > 1:
+        deliveries = send_webhook_requests_in_batches(deliveries, queue)
     for delivery in deliveries:
         send_webhook_request_async.apply_async(
             kwargs={"event_delivery_id": delivery.id},
@@ -241,6 +260,43 @@ def trigger_webhooks_async(
         )
 
 
+def get_webhook_host(webhook: "Webhook") -> Optional[str]:
+    """Return the host of HTTP webhooks, which can be delivered in batches."""
+    parts = urlparse(webhook.target_url)
+    if parts.scheme.lower() not in [WebhookSchemes.HTTP, WebhookSchemes.HTTPS]:
+        return None
+    return f"{parts.scheme.lower()}://{parts.netloc.lower()}"
+
+
+def send_webhook_requests_in_batches(
+    deliveries: list[EventDelivery], queue: Optional[str]
+) -> list[EventDelivery]:
+    """Schedule batched delivery of HTTP webhooks, grouped by the target host.
+
+    Return deliveries that can't be batched and need to be sent one by one.
+    """
+    deliveries_per_host: dict[str, list[EventDelivery]] = defaultdict(list)
+    not_batched = []
+    for delivery in deliveries:
+        if host := get_webhook_host(delivery.webhook):
+            deliveries_per_host[host].append(delivery)
+        else:
+            not_batched.append(delivery)
+
+    batch_size = settings.WEBHOOK_BATCH_SIZE
+    for host_deliveries in deliveries_per_host.values():
+        for chunk_start in range(0, len(host_deliveries), batch_size):
+            chunk = host_deliveries[chunk_start : chunk_start + batch_size]
+            send_webhook_requests_async_batch.apply_async(
+                kwargs={
+                    "event_delivery_ids": [delivery.id for delivery in chunk],
+                    "queue": queue,
+                },
+                queue=queue or settings.WEBHOOK_CELERY_QUEUE_NAME,
+            )
+    return not_batched
+
+
 @app.task(
     queue=settings.WEBHOOK_CELERY_QUEUE_NAME,
     bind=True,
@@ -294,6 +350,94 @@ def send_webhook_request_async(self, event_delivery_id):
     clear_successful_delivery(delivery)
 
 
+@lru_cache(maxsize=128)
+def get_webhook_session(host: str):
+    """Return a keep-alive HTTP session for the host, reused by the worker process.
+
+    The session is shared by all apps on the host, so it doesn't store cookies.
+    """
+    session = HTTPClient.get_session()
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    return session
+
+
+def _should_retry_webhook_request(response: WebhookResponse) -> bool:
+    # do not retry for 30x and 40x status codes, same as `handle_webhook_retry`
+    return not (
+        response.response_status_code and 300 <= response.response_status_code < 500
+    )
+
+
+@app.task(queue=settings.WEBHOOK_CELERY_QUEUE_NAME, bind=True)
+@allow_writer()
+def send_webhook_requests_async_batch(self, event_delivery_ids, queue=None):
+    """Send pending HTTP webhooks of a single host over a shared keep-alive session.
+
+    Each delivery is saved as soon as its request is done, so an interrupted batch
+    doesn't send it again. Failed deliveries are retried one by one with
+    `send_webhook_request_async`, counting the batch request as the first attempt.
+    """
+    deliveries = (
+        EventDelivery.objects.filter(
+            id__in=event_delivery_ids, status=EventDeliveryStatus.PENDING
+        )
+        .select_related("payload", "webhook__app")
+        .order_by("pk")
+    )
+    domain = get_domain()
+    for delivery in deliveries:
+        webhook = delivery.webhook
+        if not webhook.is_active:
+            delivery_update(delivery=delivery, status=EventDeliveryStatus.FAILED)
+            logger.info("Event delivery id: %r webhook is disabled.", delivery.id)
+            continue
+
+        attempt = create_attempt(delivery, self.request.id)
+        if not delivery.payload:
+            response = WebhookResponse(
+                content=f"Event delivery id: {delivery.id} has no payload.",
+                status=EventDeliveryStatus.FAILED,
+            )
+        else:
+            message = delivery.payload.payload.encode("utf-8")
+            with webhooks_opentracing_trace(
+                delivery.event_type, domain, app=webhook.app
+            ):
+                response = send_webhook_using_http(
+                    webhook.target_url,
+                    message,
+                    domain,
+                    signature_for_payload(message, webhook.secret_key),
+                    delivery.event_type,
+                    custom_headers=webhook.custom_headers,
+                    session=get_webhook_session(get_webhook_host(webhook)),
+                )
+        attempt_update(attempt, response)
+
+        delivery_status = response.status
+        if response.status == EventDeliveryStatus.FAILED:
+            task_logger.info(
+                "[Webhook ID: %r] Failed request to %r: %r for event: %r."
+                " Delivery attempt id: %r",
+                webhook.id,
+                webhook.target_url,
+                response.content,
+                delivery.event_type,
+                attempt.id,
+            )
+            if delivery.payload and _should_retry_webhook_request(response):
+                delivery_status = EventDeliveryStatus.PENDING
+                send_webhook_request_async.apply_async(
+                    kwargs={"event_delivery_id": delivery.id},
+                    queue=queue or settings.WEBHOOK_CELERY_QUEUE_NAME,
+                    countdown=send_webhook_request_async.retry_backoff,
+                    retries=1,
+                )
+        delivery_update(delivery, delivery_status)
+        observability.report_event_delivery_attempt(attempt)
+        clear_successful_delivery(delivery)
+
+
 def send_observability_events(webhooks: list[WebhookData], events: list[bytes]):
     event_type = WebhookEventAsyncType.OBSERVABILITY
     for webhook in webhooks:
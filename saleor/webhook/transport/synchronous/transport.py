@@ -1,5 +1,11 @@
 import json
 import logging
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from contextlib import closing
+from functools import lru_cache
 from json import JSONDecodeError
 from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar
 from urllib.parse import urlparse
@@ -84,31 +90,32 @@ def handle_transaction_request_task(self, delivery_id, request_event_id):
     )
 
 
-def _send_webhook_request_sync(
-    delivery, timeout=settings.WEBHOOK_SYNC_TIMEOUT, attempt=None
-) -> tuple[WebhookResponse, Optional[dict[Any, Any]]]:
-    event_payload = delivery.payload
-    data = event_payload.payload
+def _prepare_webhook_request(delivery) -> tuple[bytes, str, str]:
     webhook = delivery.webhook
     parts = urlparse(webhook.target_url)
-    domain = get_domain()
-    message = data.encode("utf-8")
-    signature = signature_for_payload(message, webhook.secret_key)
-
     if parts.scheme.lower() not in [WebhookSchemes.HTTP, WebhookSchemes.HTTPS]:
         delivery_update(delivery, EventDeliveryStatus.FAILED)
         raise ValueError(f"Unknown webhook scheme: {parts.scheme!r}")
+    message = delivery.payload.payload.encode("utf-8")
+    signature = signature_for_payload(message, webhook.secret_key)
+    return message, signature, get_domain()
+
 
+def _send_webhook_request(
+    delivery, message: bytes, signature: str, domain: str, timeout
+) -> tuple[WebhookResponse, Optional[dict[Any, Any]]]:
+    """Send the webhook request and parse its response.
+
+    Doesn't touch the database, so it can be used outside of the request thread.
+    """
+    webhook = delivery.webhook
     logger.debug(
         "[Webhook] Sending payload to %r for event %r.",
         webhook.target_url,
         delivery.event_type,
     )
-    if attempt is None:
-        attempt = create_attempt(delivery=delivery, task_id=None)
     response = WebhookResponse(content="")
     response_data = None
-
     try:
         with webhooks_opentracing_trace(
             delivery.event_type, domain, sync=True, app=webhook.app
@@ -123,40 +130,154 @@ def _send_webhook_request_sync(
                 custom_headers=webhook.custom_headers,
             )
             response_data = json.loads(response.content)
-
     except JSONDecodeError as e:
         logger.info(
-            "[Webhook] Failed parsing JSON response from %r: %r."
-            "ID of failed DeliveryAttempt: %r . ",
+            "[Webhook] Failed parsing JSON response from %r: %r.",
             webhook.target_url,
             e,
-            attempt.id,
         )
         response.status = EventDeliveryStatus.FAILED
-    else:
-        if response.status == EventDeliveryStatus.FAILED:
-            logger.info(
-                "[Webhook] Failed request to %r: %r. "
-                "ID of failed DeliveryAttempt: %r . ",
-                webhook.target_url,
-                response.content,
-                attempt.id,
-            )
-        if response.status == EventDeliveryStatus.SUCCESS:
-            logger.debug(
-                "[Webhook] Success response from %r."
-                "Successful DeliveryAttempt id: %r",
-                webhook.target_url,
-                attempt.id,
-            )
+    return response, response_data
+
+
+def _record_webhook_response(delivery, attempt, response: WebhookResponse):
+    webhook = delivery.webhook
+    if response.status == EventDeliveryStatus.FAILED:
+        logger.info(
+            "[Webhook] Failed request to %r: %r. ID of failed DeliveryAttempt: %r . ",
+            webhook.target_url,
+            response.content,
+            attempt.id,
+        )
+    if response.status == EventDeliveryStatus.SUCCESS:
+        logger.debug(
+            "[Webhook] Success response from %r.Successful DeliveryAttempt id: %r",
+            webhook.target_url,
+            attempt.id,
+        )
 
     attempt_update(attempt, response)
     delivery_update(delivery, response.status)
     observability.report_event_delivery_attempt(attempt)
     clear_successful_delivery(delivery)
+
+
+def _send_webhook_request_sync(
+    delivery, timeout=settings.WEBHOOK_SYNC_TIMEOUT, attempt=None
+) -> tuple[WebhookResponse, Optional[dict[Any, Any]]]:
+    message, signature, domain = _prepare_webhook_request(delivery)
+    if attempt is None:
+        attempt = create_attempt(delivery=delivery, task_id=None)
+    response, response_data = _send_webhook_request(
+        delivery, message, signature, domain, timeout
+    )
+    _record_webhook_response(delivery, attempt, response)
     return response, response_data
 
 
+@lru_cache(maxsize=1)
+def get_sync_webhooks_executor() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(
+        max_workers=settings.WEBHOOK_SYNC_MAX_WORKERS,
+        thread_name_prefix="sync-webhooks",
+    )
+
+
+def _send_webhook_request_in_thread(delivery, message, signature, domain, timeout):
+    start = time.monotonic()
+    response, response_data = _send_webhook_request(
+        delivery, message, signature, domain, timeout
+    )
+    if not response.duration:
+        response.duration = time.monotonic() - start
+    return response, response_data
+
+
+def send_webhook_requests_sync_concurrently(
+    deliveries: list[EventDelivery],
+    timeout=settings.WEBHOOK_SYNC_TIMEOUT,
+    deadline: Optional[float] = None,
+) -> Iterator[tuple[EventDelivery, Optional[dict[Any, Any]]]]:
+    """Send synchronous webhook requests at once and yield their responses.
+
+    Responses are yielded in the order of the deliveries, so the caller can stop at
+    the first expected response as if the requests were sent sequentially, or merge
+    all of them. Requests which are not completed when the caller stops or when the
+    shared deadline (`WEBHOOK_SYNC_DEADLINE` by default) passes are abandoned and
+    their attempts are marked as failed. All database writes happen in the calling
+    thread, worker threads only send the HTTP requests.
+
+    A delivery with an unknown webhook scheme raises `ValueError` once the responses
+    of the preceding deliveries are yielded, as when sending them sequentially; the
+    following deliveries are not sent.
+    """
+    if deadline is None:
+        deadline = settings.WEBHOOK_SYNC_DEADLINE
+    start = time.monotonic()
+    executor = get_sync_webhooks_executor()
+    pending = []
+    scheme_error: Optional[ValueError] = None
+    for index, delivery in enumerate(deliveries):
+        try:
+            message, signature, domain = _prepare_webhook_request(delivery)
+        except ValueError as e:
+            scheme_error = e
+            for not_sent_delivery in deliveries[index + 1 :]:
+                delivery_update(not_sent_delivery, EventDeliveryStatus.FAILED)
+            break
+        # Fetch the app in the calling thread; it's used for tracing.
+        delivery.webhook.app  # noqa: B018
+        attempt = create_attempt(delivery=delivery, task_id=None)
+        future = executor.submit(
+            _send_webhook_request_in_thread,
+            delivery,
+            message,
+            signature,
+            domain,
+            timeout,
+        )
+        pending.append((delivery, attempt, future))
+
+    try:
+        while pending:
+            delivery, attempt, future = pending[0]
+            try:
+                response, response_data = future.result(
+                    timeout=max(deadline - (time.monotonic() - start), 0)
+                )
+            except FutureTimeoutError:
+                break
+            except Exception as e:
+                response = WebhookResponse(
+                    content=str(e),
+                    status=EventDeliveryStatus.FAILED,
+                    duration=time.monotonic() - start,
+                )
+                response_data = None
+            pending.pop(0)
+            _record_webhook_response(delivery, attempt, response)
+            yield (
+                delivery,
+                (
+                    response_data
+                    if response.status == EventDeliveryStatus.SUCCESS
+                    else None
+                ),
+            )
+        if scheme_error:
+            raise scheme_error
+    finally:
+        for delivery, attempt, future in pending:
+            future.cancel()
+            response = WebhookResponse(
+                content="Request abandoned: response was not needed or deadline "
+                "exceeded.",
+                status=EventDeliveryStatus.FAILED,
+                duration=time.monotonic() - start,
+            )
+            _record_webhook_response(delivery, attempt, response)
+
+
 def send_webhook_request_sync(
     delivery, timeout=settings.WEBHOOK_SYNC_TIMEOUT
 ) -> Optional[dict[Any, Any]]:
@@ -206,26 +327,18 @@ def trigger_webhook_sync_if_not_cached(
     return response_data
 
 
-def create_delivery_for_subscription_sync_event(
+def generate_subscription_sync_payload(
     event_type,
     subscribable_object,
     webhook,
     requestor=None,
     request=None,
     allow_replica=False,
-) -> Optional[EventDelivery]:
-    """Generate webhook payload based on subscription query and create delivery object.
-
-    It uses a defined subscription query, defined for webhook to explicitly determine
-    what fields should be included in the payload.
+) -> Optional[dict]:
+    """Generate the webhook payload based on its subscription query.
 
-    :param event_type: event type which should be triggered.
-    :param subscribable_object: subscribable object to process via subscription query.
-    :param webhook: webhook object for which delivery will be created.
-    :param requestor: used in subscription webhooks to generate meta data for payload.
-    :param request: used to share context between sync event calls
-    :return: List of event deliveries to send via webhook tasks.
-    :param allow_replica: use replica database.
+    Return `None` when the event is not subscribable or the subscription query
+    returns no data.
     """
     if event_type not in WEBHOOK_TYPES_MAP:
         logger.info(
@@ -246,11 +359,84 @@ def create_delivery_for_subscription_sync_event(
         subscription_query=webhook.subscription_query,
         request=request,
         app=webhook.app,
+        webhook_id=webhook.pk,
     )
     if not data:
         logger.info(
             "No payload was generated with subscription for event: %s", event_type
         )
+        return None
+    return data
+
+
+def generate_subscription_sync_payloads(
+    event_type,
+    subscribable_object,
+    webhooks: list["Webhook"],
+    requestor=None,
+    allow_replica=False,
+) -> dict[int, dict]:
+    """Generate the payloads of the subscription webhooks, keyed by the webhook id.
+
+    Webhooks without a subscription query or without a payload are skipped.
+    """
+    request = None
+    payloads = {}
+    for webhook in webhooks:
+        if not webhook.subscription_query:
+            continue
+        if request is None:
+            request = initialize_request(
+                requestor,
+                event_type in WebhookEventSyncType.ALL,
+                allow_replica,
+                event_type=event_type,
+            )
+        data = generate_subscription_sync_payload(
+            event_type,
+            subscribable_object,
+            webhook,
+            requestor=requestor,
+            request=request,
+            allow_replica=allow_replica,
+        )
+        if data:
+            payloads[webhook.pk] = data
+    return payloads
+
+
+def create_delivery_for_subscription_sync_event(
+    event_type,
+    subscribable_object,
+    webhook,
+    requestor=None,
+    request=None,
+    allow_replica=False,
+    payload: Optional[dict] = None,
+) -> Optional[EventDelivery]:
+    """Generate webhook payload based on subscription query and create delivery object.
+
+    It uses a defined subscription query, defined for webhook to explicitly determine
+    what fields should be included in the payload.
+
+    :param event_type: event type which should be triggered.
+    :param subscribable_object: subscribable object to process via subscription query.
+    :param webhook: webhook object for which delivery will be created.
+    :param requestor: used in subscription webhooks to generate meta data for payload.
+    :param request: used to share context between sync event calls
+    :return: List of event deliveries to send via webhook tasks.
+    :param allow_replica: use replica database.
+    :param payload: payload already generated for the webhook.
+    """
+    data = payload or generate_subscription_sync_payload(
+        event_type,
+        subscribable_object,
+        webhook,
+        requestor=requestor,
+        request=request,
+        allow_replica=allow_replica,
+    )
+    if not data:
         # Return None so if subscription query returns no data Saleor will not crash but
         # log the issue and continue without creating a delivery.
         return None
@@ -275,34 +461,187 @@ def trigger_webhook_sync(
     timeout=None,
     request=None,
     requestor=None,
+    subscription_payload: Optional[dict] = None,
 ) -> Optional[dict[Any, Any]]:
-    """Send a synchronous webhook request."""
+    """Send a synchronous webhook request.
+
+    `subscription_payload` is the payload already generated for a subscription
+    webhook.
+    """
+    delivery = _create_delivery_for_sync_event(
+        event_type,
+        payload,
+        webhook,
+        allow_replica,
+        subscribable_object=subscribable_object,
+        request=request,
+        requestor=requestor,
+        subscription_payload=subscription_payload,
+    )
+    if not delivery:
+        return None
+
+    kwargs = {}
+    if timeout:
+        kwargs = {"timeout": timeout}
+
+    return send_webhook_request_sync(delivery, **kwargs)
+
+
+def _create_delivery_for_sync_event(
+    event_type: str,
+    payload: str,
+    webhook: "Webhook",
+    allow_replica,
+    subscribable_object=None,
+    request=None,
+    requestor=None,
+    subscription_payload: Optional[dict] = None,
+) -> Optional[EventDelivery]:
     if webhook.subscription_query:
-        delivery = create_delivery_for_subscription_sync_event(
+        return create_delivery_for_subscription_sync_event(
             event_type=event_type,
             subscribable_object=subscribable_object,
             webhook=webhook,
             requestor=requestor,
             request=request,
             allow_replica=allow_replica,
+            payload=subscription_payload,
         )
-        if not delivery:
-            return None
-    else:
-        with allow_writer():
-            event_payload = EventPayload.objects.create(payload=payload)
-            delivery = EventDelivery.objects.create(
-                status=EventDeliveryStatus.PENDING,
-                event_type=event_type,
-                payload=event_payload,
-                webhook=webhook,
+    with allow_writer():
+        event_payload = EventPayload.objects.create(payload=payload)
+        return EventDelivery.objects.create(
+            status=EventDeliveryStatus.PENDING,
+            event_type=event_type,
+            payload=event_payload,
+            webhook=webhook,
+        )
+
+
+def _send_sync_webhooks_concurrently(webhooks: list["Webhook"]) -> bool:
+    return settings.WEBHOOK_SYNC_MAX_WORKERS > 1 and len(webhooks) > 1
+
+
+def trigger_webhooks_sync(
+    event_type: str,
+    payload: str,
+    webhooks: list["Webhook"],
+    allow_replica,
+    subscribable_object=None,
+    timeout=None,
+    requestor=None,
+) -> list[Optional[dict[Any, Any]]]:
+    """Send a synchronous webhook request to each of the webhooks.
+
+    Return the responses in the order of the webhooks. When
+    `WEBHOOK_SYNC_MAX_WORKERS` is set, the requests are sent at once.
+    """
+    if not _send_sync_webhooks_concurrently(webhooks):
+        return [
+            trigger_webhook_sync(
+                event_type,
+                payload,
+                webhook,
+                allow_replica,
+                subscribable_object=subscribable_object,
+                timeout=timeout,
+                requestor=requestor,
             )
+            for webhook in webhooks
+        ]
 
+    request_context = initialize_request(
+        requestor,
+        event_type in WebhookEventSyncType.ALL,
+        allow_replica,
+        event_type=event_type,
+    )
+    deliveries = [
+        _create_delivery_for_sync_event(
+            event_type,
+            payload,
+            webhook,
+            allow_replica,
+            subscribable_object=subscribable_object,
+            request=request_context,
+            requestor=requestor,
+        )
+        for webhook in webhooks
+    ]
     kwargs = {}
     if timeout:
         kwargs = {"timeout": timeout}
+    responses = {
+        delivery.pk: response_data
+        for delivery, response_data in send_webhook_requests_sync_concurrently(
+            [delivery for delivery in deliveries if delivery], **kwargs
+        )
+    }
+    return [responses.get(delivery.pk) if delivery else None for delivery in deliveries]
 
-    return send_webhook_request_sync(delivery, **kwargs)
+
+def trigger_webhooks_sync_if_not_cached(
+    event_type: str,
+    payload: str,
+    webhooks: list["Webhook"],
+    cache_data: dict,
+    allow_replica: bool,
+    subscribable_object=None,
+    request_timeout=None,
+    cache_timeout=None,
+    requestor=None,
+) -> list[Optional[dict]]:
+    """Get responses of synchronous webhooks, in the order of the webhooks.
+
+    Responses are fetched from cache when still valid; the requests to the
+    remaining webhooks are sent at once when `WEBHOOK_SYNC_MAX_WORKERS` is set.
+    """
+    if not _send_sync_webhooks_concurrently(webhooks):
+        return [
+            trigger_webhook_sync_if_not_cached(
+                event_type,
+                payload,
+                webhook,
+                cache_data,
+                allow_replica,
+                subscribable_object=subscribable_object,
+                request_timeout=request_timeout,
+                cache_timeout=cache_timeout,
+                requestor=requestor,
+            )
+            for webhook in webhooks
+        ]
+
+    cache_keys = [
+        generate_cache_key_for_webhook(
+            cache_data, webhook.target_url, event_type, webhook.app_id
+        )
+        for webhook in webhooks
+    ]
+    cached_responses = cache.get_many(cache_keys)
+    not_cached = [
+        (webhook, cache_key)
+        for webhook, cache_key in zip(webhooks, cache_keys)
+        if cache_key not in cached_responses
+    ]
+    responses = trigger_webhooks_sync(
+        event_type,
+        payload,
+        [webhook for webhook, _cache_key in not_cached],
+        allow_replica,
+        subscribable_object=subscribable_object,
+        timeout=request_timeout,
+        requestor=requestor,
+    )
+    for (_webhook, cache_key), response_data in zip(not_cached, responses):
+        if response_data is not None:
+            cached_responses[cache_key] = response_data
+            cache.set(
+                cache_key,
+                response_data,
+                timeout=cache_timeout or WEBHOOK_CACHE_DEFAULT_TIMEOUT,
+            )
+    return [cached_responses.get(cache_key) for cache_key in cache_keys]
 
 
 def trigger_all_webhooks_sync(
@@ -312,6 +651,7 @@ def trigger_all_webhooks_sync(
     subscribable_object=None,
     requestor=None,
     allow_replica=False,
+    subscription_payloads: Optional[dict[int, dict]] = None,
 ) -> Optional[R]:
     """Send all synchronous webhook request for given event type.
 
@@ -320,10 +660,20 @@ def trigger_all_webhooks_sync(
     the next one is send.
     If no webhook responds with expected response,
     this function returns None.
+
+    When `WEBHOOK_SYNC_MAX_WORKERS` is set, requests to all webhooks are sent at
+    once and the response of the first webhook in order that returns the expected
+    response is used. Webhooks whose subscription payload can't be generated are
+    skipped.
+
+    `subscription_payloads` are the payloads already generated for the subscription
+    webhooks, keyed by the webhook id.
     """
     webhooks = get_webhooks_for_event(event_type)
     request_context = None
     event_payload = None
+    concurrent = settings.WEBHOOK_SYNC_MAX_WORKERS > 1 and len(webhooks) > 1
+    deliveries = []
     for webhook in webhooks:
         if webhook.subscription_query:
             if request_context is None:
@@ -340,8 +690,11 @@ def trigger_all_webhooks_sync(
                 webhook=webhook,
                 request=request_context,
                 requestor=requestor,
+                payload=(subscription_payloads or {}).get(webhook.pk),
             )
             if not delivery:
+                if concurrent:
+                    continue
                 return None
         else:
             with allow_writer():
@@ -356,7 +709,16 @@ def trigger_all_webhooks_sync(
                     webhook=webhook,
                 )
 
+        if concurrent:
+            deliveries.append(delivery)
+            continue
         response_data = send_webhook_request_sync(delivery)
         if parsed_response := parse_response(response_data):
             return parsed_response
+
+    if deliveries:
+        with closing(send_webhook_requests_sync_concurrently(deliveries)) as responses:
+            for _delivery, response_data in responses:
+                if parsed_response := parse_response(response_data):
+                    return parsed_response
     return None
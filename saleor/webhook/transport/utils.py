@@ -109,6 +109,7 @@ def send_webhook_using_http(
     event_type,
     timeout=settings.WEBHOOK_TIMEOUT,
     custom_headers: Optional[dict[str, str]] = None,
+    session=None,
 ) -> WebhookResponse:
     """Send a webhook request using http / https protocol.
 
@@ -119,6 +120,8 @@ def send_webhook_using_http(
     :param event_type: Webhook event type.
     :param timeout: Request timeout.
     :param custom_headers: Custom headers which will be added to request headers.
+    :param session: HTTP session used to send the request; allows reusing
+        connections between requests. A new session is used when not provided.
 
     :return: WebhookResponse object.
     """
@@ -137,8 +140,9 @@ def send_webhook_using_http(
     if custom_headers:
         headers.update(custom_headers)
 
+    send_request = session.request if session else HTTPClient.send_request
     try:
-        response = HTTPClient.send_request(
+        response = send_request(
             "POST",
             target_url,
             data=message,
@@ -455,9 +459,10 @@ def trigger_transaction_request(
             transaction_data.transaction, transaction_data.event
         )
         return None
-    webhook = get_webhooks_for_event(
+    webhooks = get_webhooks_for_event(
         event_type, apps_ids=[transaction_data.transaction_app_owner.pk]
-    ).first()
+    )
+    webhook = next(iter(webhooks), None)
     if not webhook:
         create_failed_transaction_event(
             transaction_data.event,
@@ -1,6 +1,6 @@
 from collections import defaultdict
 from collections.abc import Iterable
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Optional, Union
 
 from django.conf import settings
 from django.db.models import Q
@@ -9,6 +9,7 @@ from django.db.models.expressions import Exists, OuterRef
 from ..app.models import App
 from .event_types import WebhookEventAsyncType, WebhookEventSyncType
 from .models import Webhook, WebhookEvent
+from .registry import webhook_registry
 
 if TYPE_CHECKING:
     from django.db.models import QuerySet
@@ -61,8 +62,19 @@ def get_webhooks_for_event(
     webhooks: Optional["QuerySet[Webhook]"] = None,
     apps_ids: Optional["list[int]"] = None,
     apps_identifier: Optional[list[str]] = None,
-) -> "QuerySet[Webhook]":
-    """Get active webhooks from the database for an event."""
+) -> Union["QuerySet[Webhook]", list[Webhook]]:
+    """Get active webhooks for an event.
+
+    Unless the webhooks or apps are narrowed down, they are taken from the
+    per-process webhook registry instead of the database.
+    """
+    if (
+        webhooks is None
+        and not apps_ids
+        and not apps_identifier
+        and settings.WEBHOOK_REGISTRY_ENABLED
+    ):
+        return webhook_registry.get_webhooks(event_type)
 
     if webhooks is None:
         # For this QS replica usage is applied later, as this QS could be also passed